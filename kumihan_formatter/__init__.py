@@ -1,16 +1,44 @@
 """Kumihan-Formatter - テキストファイルをHTMLに自動組版するCLIツール
 
 最小限実装版 - 基本インポートのみ対応
+
+公開APIは初回アクセス時に読み込む（モジュール __getattr__ による遅延インポート）。
+`import kumihan_formatter` や `kumihan --version` では変換系のサブシステム
+（Manager群・パーサー・レンダラー）を読み込まない。
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 __version__ = "0.9.0-alpha.8"
 
-# 基本API公開
-from .unified_api import KumihanFormatter
-from .core.utilities.api_utils import quick_convert, quick_parse
+if TYPE_CHECKING:
+    from .core.utilities.api_utils import quick_convert, quick_parse
+    from .unified_api import KumihanFormatter
+
+# 公開名 → 定義モジュール
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "KumihanFormatter": ".unified_api",
+    "quick_convert": ".core.utilities.api_utils",
+    "quick_parse": ".core.utilities.api_utils",
+}
 
 __all__ = [
     "KumihanFormatter",
     "quick_convert",
     "quick_parse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """公開APIの遅延インポート"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # 2回目以降は通常の属性参照
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
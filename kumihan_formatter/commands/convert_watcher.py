@@ -8,8 +8,12 @@ Issue #319対応 - convert.py から分離
 import sys
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+from ..core.io.operations import FileOperations
+from ..core.processing.incremental_converter import IncrementalConverter
+from ..core.syntax import SyntaxReporter
 from ..ui.console_ui import get_console_ui
+from .watch_scheduler import DebouncedScheduler
 
 
 class ConvertWatcher:
@@ -18,14 +22,27 @@ class ConvertWatcher:
     責任: ファイル変更の監視とリアルタイム変換
     """
 
-    def __init__(self, processor: Any, validator: Any) -> None:
+    def __init__(
+        self,
+        processor: Any,
+        validator: Any,
+        incremental: bool = True,
+        debounce_seconds: float = 0.3,
+    ) -> None:
         """
         Args:
             processor: ConvertProcessor インスタンス
             validator: ConvertValidator インスタンス
+            incremental: 変更ブロックのみ再変換する差分更新を使用するか
+            debounce_seconds: 最後の変更イベントから変換開始までの待機時間
         """
         self.processor = processor
         self.validator = validator
+        self.incremental = incremental
+        self.debounce_seconds = debounce_seconds
+        # 入力ファイルごとの差分変換状態（ディレクトリ監視時は複数）
+        self._incremental_converters: dict[Path, IncrementalConverter] = {}
+        self._file_ops = FileOperations()
 
     def start_watch_mode(
         self,
@@ -36,8 +53,15 @@ class ConvertWatcher:
         template_name: str | None,
         include_source: bool,
         syntax_check: bool = True,
+        recursive: bool = False,
     ) -> None:
-        """ファイル監視モードを開始"""
+        """ファイル監視モードを開始
+
+        input_file にディレクトリを指定した場合は配下の .txt ファイルを監視する
+        （recursive=True でサブディレクトリも対象）。変更イベントはパスごとに
+        デバウンスされ、単一のバックグラウンドワーカーで変換される。
+        ディレクトリ監視は変更ファイル単位で変換する差分更新でのみ対応する。
+        """
         try:
             from watchdog.observers import Observer
         except ImportError:
@@ -48,8 +72,8 @@ class ConvertWatcher:
         input_path = Path(input_file)
         get_console_ui().watch_start(str(input_path))
 
-        # ファイル変更ハンドラーを作成
-        handler = self._create_file_handler(
+        # ファイル変更ハンドラーとスケジューラーを作成
+        handler_config = self._build_handler_config(
             input_file,
             output,
             config_obj,
@@ -58,10 +82,22 @@ class ConvertWatcher:
             include_source,
             syntax_check,
         )
+        if input_path.is_dir() and not self.supports_incremental(handler_config):
+            get_console_ui().error(
+                "ディレクトリ監視は差分更新でのみ対応しています"
+                "（設定ファイル・ソース表示・テストケース表示とは併用できません）"
+            )
+            sys.exit(1)
+        scheduler = self.create_scheduler(handler_config)
+        handler = self._create_file_handler(handler_config, scheduler)
 
         # 監視を開始
         observer = Observer()
-        observer.schedule(handler, str(input_path.parent), recursive=False)
+        if input_path.is_dir():
+            observer.schedule(handler, str(input_path), recursive=recursive)
+        else:
+            observer.schedule(handler, str(input_path.parent), recursive=False)
+        scheduler.start()
         observer.start()
 
         try:
@@ -71,8 +107,122 @@ class ConvertWatcher:
             get_console_ui().watch_stopped()
             observer.stop()
         observer.join()
+        scheduler.stop()
 
-    def _create_file_handler(
+    def create_scheduler(self, config: dict[str, Any]) -> DebouncedScheduler:
+        """変更イベントを集約して変換するスケジューラーを作成"""
+        return DebouncedScheduler(
+            lambda path, is_obsolete: self.process_change(path, is_obsolete, config),
+            debounce_seconds=self.debounce_seconds,
+            error_handler=self.processor.handle_error,
+        )
+
+    def process_change(
+        self, path: Path, is_obsolete: Callable[[], bool], config: dict[str, Any]
+    ) -> None:
+        """デバウンス後の変更を1件変換（スケジューラーのワーカーから呼ばれる）"""
+        if not self.supports_incremental(config):
+            # processor は設定済みの入力ファイルのみ変換するため、
+            # ディレクトリ監視では変更ファイルを変換できない
+            input_root = config.get("input_file")
+            if input_root is not None and input_root.is_dir():
+                raise ValueError(
+                    f"ディレクトリ監視では差分更新を使用できない設定です: {path}"
+                )
+            self.processor.process_file_change()
+            return
+
+        start = time.perf_counter()
+        output_path = self.convert_changed_file(
+            path,
+            self._output_dir_for(path, config),
+            config["template_name"],
+            is_obsolete,
+            syntax_check=bool(config.get("syntax_check")),
+        )
+        if output_path is not None:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            get_console_ui().watch_updated(str(output_path), elapsed_ms)
+
+    def supports_incremental(self, config: dict[str, Any]) -> bool:
+        """差分更新を適用できる設定か判定
+
+        ソース表示・テストケース表示は出力構造が変わり、設定ファイルは
+        差分更新では反映されないため、通常の変換処理を使う。
+        構文チェックは差分更新でも変換前に文書全体へ適用する。
+        """
+        return (
+            self.incremental
+            and not config.get("include_source")
+            and not config.get("show_test_cases")
+            and config.get("config") is None
+        )
+
+    def convert_changed_file(
+        self,
+        input_file: Path,
+        output: str,
+        template_name: str | None,
+        is_obsolete: Callable[[], bool] | None = None,
+        syntax_check: bool = False,
+    ) -> Path | None:
+        """変更ファイルを差分更新で変換し出力
+
+        前回の変換結果から変更のあったブロックのみ再解析・再レンダリングする。
+        変換中により新しい変更イベントが届いた場合は出力を省略する
+        （後続の変換が最新内容で書き出す）。
+        syntax_check=True の場合は文書全体の構文を検証して問題を報告する
+        （プレビューを最新に保つため出力は省略しない）。
+
+        Returns:
+            出力したHTMLファイルのパス（省略時はNone）
+        """
+        converter = self._incremental_converters.get(input_file)
+        if converter is None:
+            converter = IncrementalConverter()
+            self._incremental_converters[input_file] = converter
+
+        text = self._file_ops.read_text(input_file)
+        if syntax_check:
+            self._report_syntax_errors(input_file, text)
+        html = converter.convert(text, {"template": template_name or "default"})
+        if is_obsolete is not None and is_obsolete():
+            return None
+
+        output_path = Path(output) / f"{input_file.stem}.html"
+        self._file_ops.write_text(output_path, html)
+        return output_path
+
+    def _report_syntax_errors(self, input_file: Path, text: str) -> None:
+        """文書全体の構文チェック結果を報告"""
+        errors = SyntaxReporter.check_text(text)
+        if not errors:
+            return
+        results = {str(input_file): errors}
+        counts = SyntaxReporter.get_error_counts(results)
+        get_console_ui().warning(
+            "構文チェック",
+            f"{input_file}: エラー {counts['ERROR']}, 警告 {counts['WARNING']}",
+        )
+        get_console_ui().dim(SyntaxReporter.format_error_report(results))
+
+    def _output_dir_for(self, path: Path, config: dict[str, Any]) -> str:
+        """出力先ディレクトリ（ディレクトリ監視時は入力の相対構造を維持）"""
+        input_root: Path = config["input_file"]
+        if input_root.is_dir():
+            return str(Path(config["output"]) / path.parent.relative_to(input_root))
+        return str(config["output"])
+
+    def _is_watch_target(self, event: Any, config: dict[str, Any]) -> bool:
+        """監視対象のイベントか判定"""
+        if getattr(event, "is_directory", False):
+            return False
+        input_root: Path = config["input_file"]
+        if input_root.is_dir() and Path(event.src_path).suffix != ".txt":
+            return False
+        return not self.processor.should_skip_event(event)
+
+    def _build_handler_config(
         self,
         input_file: str,
         output: str,
@@ -81,12 +231,9 @@ class ConvertWatcher:
         template_name: str | None,
         include_source: bool,
         syntax_check: bool,
-    ) -> Any:
-        """ファイル変更ハンドラーを作成"""
-        from watchdog.events import FileSystemEventHandler
-
-        # 設定を辞書にまとめる
-        handler_config = {
+    ) -> dict[str, Any]:
+        """ハンドラー設定を辞書にまとめる"""
+        return {
             "input_file": Path(input_file),
             "output": output,
             "config": config_obj,
@@ -96,7 +243,17 @@ class ConvertWatcher:
             "syntax_check": syntax_check,
         }
 
-        # ファイル処理ロジックを内部クラスで実装
+    def _create_file_handler(
+        self, handler_config: dict[str, Any], scheduler: DebouncedScheduler
+    ) -> Any:
+        """ファイル変更ハンドラーを作成
+
+        ハンドラーはイベントをスケジューラーへ登録するだけで、変換は
+        スケジューラーのワーカースレッドで行う。
+        """
+        from watchdog.events import FileSystemEventHandler
+
+        watcher = self
 
         class SimpleEventHandler(FileSystemEventHandler):
             def __init__(self, validator: Any, processor: Any, config: Any) -> None:
@@ -106,16 +263,16 @@ class ConvertWatcher:
                 self.config = config
 
             def on_modified(self, event: Any) -> None:
-                if self.processor.should_skip_event(event):
+                if not watcher._is_watch_target(event, self.config):
                     return
 
                 # ファイル変更通知
                 modified_path = Path(event.src_path)
                 get_console_ui().watch_file_changed(str(modified_path))
 
-                try:
-                    self.processor.process_file_change()
-                except Exception as e:
-                    self.processor.handle_error(e)
+                # 単一ファイル監視では入力ファイル単位で集約
+                input_root: Path = self.config["input_file"]
+                target = modified_path if input_root.is_dir() else input_root
+                scheduler.schedule(target)
 
         return SimpleEventHandler(self.validator, self.processor, handler_config)
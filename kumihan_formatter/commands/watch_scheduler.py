@@ -0,0 +1,150 @@
+"""
+変換コマンド - 監視イベントスケジューラー
+
+ファイル変更イベントをパス単位でデバウンス・集約し、単一のバックグラウンド
+ワーカーで順に処理する。エディタの保存で連続発生するイベントは1回の変換に
+まとめられ、実行中の変換より新しいイベントが届いた場合はその変換を
+「陳腐化」として扱い、呼び出し側が結果の書き込みを省略できる。
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+# 変換コールバック: (対象パス, 陳腐化判定関数) を受け取る
+ChangeCallback = Callable[[Path, Callable[[], bool]], None]
+
+
+class DebouncedScheduler:
+    """パス単位デバウンス付きの単一ワーカー変換スケジューラー
+
+    Args:
+        callback: デバウンス期間経過後に呼び出す変換処理
+        debounce_seconds: 最後のイベントから変換開始までの待機時間
+        error_handler: 変換処理の例外を受け取る関数（省略時はログ出力のみ）
+    """
+
+    def __init__(
+        self,
+        callback: ChangeCallback,
+        debounce_seconds: float = 0.3,
+        error_handler: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.callback = callback
+        self.debounce_seconds = debounce_seconds
+        self.error_handler = error_handler
+
+        self._condition = threading.Condition()
+        # パス → 変換開始予定時刻（monotonic）
+        self._pending: Dict[Path, float] = {}
+        # パス → 受信イベント世代（陳腐化判定用）
+        self._generations: Dict[Path, int] = {}
+        self._running: Optional[Path] = None
+        self._stopped = False
+        self._worker: Optional[threading.Thread] = None
+        self._stats = {"events": 0, "coalesced": 0, "runs": 0, "obsolete": 0}
+
+    def start(self) -> None:
+        """バックグラウンドワーカーを開始"""
+        with self._condition:
+            if self._worker is not None:
+                return
+            self._stopped = False
+            self._worker = threading.Thread(
+                target=self._run, name="kumihan-watch-worker", daemon=True
+            )
+            self._worker.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """ワーカーを停止（未処理のイベントは破棄）"""
+        with self._condition:
+            self._stopped = True
+            self._pending.clear()
+            self._condition.notify_all()
+            worker = self._worker
+            self._worker = None
+        if worker is not None:
+            worker.join(timeout)
+
+    def schedule(self, path: Path) -> None:
+        """変更イベントを登録（同一パスの未処理イベントは1件に集約）"""
+        with self._condition:
+            self._stats["events"] += 1
+            if path in self._pending:
+                self._stats["coalesced"] += 1
+            self._pending[path] = time.monotonic() + self.debounce_seconds
+            self._generations[path] = self._generations.get(path, 0) + 1
+            self._condition.notify_all()
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """未処理・実行中の変換が無くなるまで待機
+
+        Returns:
+            タイムアウト前にアイドルになった場合True
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._pending or self._running is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """スケジューラー統計を取得"""
+        with self._condition:
+            return {**self._stats, "pending": len(self._pending)}
+
+    def _run(self) -> None:
+        """ワーカーループ: 期限到来したパスを1件ずつ処理"""
+        while True:
+            with self._condition:
+                path = self._next_due_path()
+                if path is None:
+                    return
+                generation = self._generations[path]
+                self._running = path
+
+            def is_obsolete(path: Path = path, generation: int = generation) -> bool:
+                with self._condition:
+                    return self._generations.get(path) != generation
+
+            try:
+                self.callback(path, is_obsolete)
+            except Exception as e:
+                if self.error_handler is not None:
+                    self.error_handler(e)
+                else:
+                    self.logger.error(f"Watch conversion failed: {path}, {e}")
+            finally:
+                with self._condition:
+                    self._stats["runs"] += 1
+                    if self._generations.get(path) != generation:
+                        self._stats["obsolete"] += 1
+                    self._running = None
+                    self._condition.notify_all()
+
+    def _next_due_path(self) -> Optional[Path]:
+        """期限到来したパスを待機して取り出す（停止時はNone）
+
+        呼び出し時に _condition を保持していること。
+        """
+        while not self._stopped:
+            if not self._pending:
+                self._condition.wait()
+                continue
+
+            path, due = min(self._pending.items(), key=lambda item: item[1])
+            remaining = due - time.monotonic()
+            if remaining > 0:
+                self._condition.wait(remaining)
+                continue
+
+            del self._pending[path]
+            return path
+
+        return None
@@ -8,16 +8,48 @@ KumihanFormatterの責任を明確に分離:
 2. FormatterCore - コアロジック
 3. FormatterAPI - ユーザーインターフェース
 4. ManagerCoordinator - Manager間の調整
+5. BatchConverter - 複数ファイル一括変換
+
+各クラスは初回アクセス時に読み込む（遅延インポート）。
 """
 
-from .formatter_config import FormatterConfig
-from .formatter_core import FormatterCore
-from .formatter_api import FormatterAPI
-from .manager_coordinator import ManagerCoordinator
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .batch_converter import BatchConverter
+    from .formatter_api import FormatterAPI
+    from .formatter_config import FormatterConfig
+    from .formatter_core import FormatterCore
+    from .manager_coordinator import ManagerCoordinator
+
+# 公開名 → 定義モジュール
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "FormatterConfig": ".formatter_config",
+    "FormatterCore": ".formatter_core",
+    "FormatterAPI": ".formatter_api",
+    "ManagerCoordinator": ".manager_coordinator",
+    "BatchConverter": ".batch_converter",
+}
 
 __all__ = [
     "FormatterConfig",
     "FormatterCore",
     "FormatterAPI",
     "ManagerCoordinator",
+    "BatchConverter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """API構成クラスの遅延インポート"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
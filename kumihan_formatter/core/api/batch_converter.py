@@ -0,0 +1,209 @@
+"""
+BatchConverter - 複数ファイル一括変換クラス
+
+ProcessPoolExecutor でファイル群を並列変換する。各ワーカープロセスは
+FormatterAPI（パーサー・レンダラー）を初期化時に1回だけ生成し、
+チャンク単位で投入されたファイルを順に変換する。結果はチャンクの完了順に
+逐次返す。
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import logging
+import os
+
+from .formatter_core import FormatterCore
+
+# (入力パス, 出力パス, テンプレート名, 変換オプション)
+_BatchTask = Tuple[str, str, str, Optional[Dict[str, Any]]]
+
+# ワーカープロセス内で再利用するAPIインスタンス
+_worker_api: Any = None
+
+
+def _init_worker(
+    config_path: Optional[str], performance_mode: str, cache_dir: Optional[str]
+) -> None:
+    """ワーカープロセス初期化（FormatterAPIを1回だけ生成）"""
+    global _worker_api
+    from .formatter_api import FormatterAPI
+
+    _worker_api = FormatterAPI(config_path, performance_mode, cache_dir)
+
+
+def _convert_chunk(tasks: List[_BatchTask]) -> List[Dict[str, Any]]:
+    """ワーカープロセスでチャンク内のファイルを順に変換"""
+    return [
+        _with_output_path(
+            _worker_api.convert(input_file, output_file, template, options),
+            output_file,
+        )
+        for input_file, output_file, template, options in tasks
+    ]
+
+
+def _with_output_path(result: Dict[str, Any], output_file: str) -> Dict[str, Any]:
+    """成功結果の output_file を実際に書き出したパスにする
+
+    convert 結果の output_file は表示用に tmp/ 配下へ置き換えられるため、
+    一括変換ではタスクの出力パスで上書きする。
+    """
+    if result.get("status") == "success":
+        result["output_file"] = output_file
+    return result
+
+
+class BatchConverter:
+    """複数ファイル一括変換クラス
+
+    Args:
+        config_path: ワーカーで読み込む設定ファイルパス
+        performance_mode: ワーカーのパフォーマンスモード
+        cache_dir: 永続レンダリングキャッシュディレクトリ
+        local_core: workers=1 の場合に使用する呼び出し元のFormatterCore
+    """
+
+    def __init__(
+        self,
+        config_path: Optional[Union[str, Path]] = None,
+        performance_mode: str = "standard",
+        cache_dir: Optional[Union[str, Path]] = None,
+        local_core: Optional[FormatterCore] = None,
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.config_path = str(config_path) if config_path else None
+        self.performance_mode = performance_mode
+        self.cache_dir = str(cache_dir) if cache_dir else None
+        self.local_core = local_core
+
+    def convert(
+        self,
+        input_files: Sequence[Union[str, Path]],
+        output_dir: Optional[Union[str, Path]] = None,
+        template: str = "default",
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """ファイル群を変換し、完了したものから結果を返す
+
+        Args:
+            input_files: 入力ファイルパス一覧
+            output_dir: 出力ディレクトリ（省略時は各入力と同じ場所の .html）。
+                入力群に共通する親ディレクトリからの相対構造を保って出力する
+                （a/intro.txt と b/intro.txt は a/intro.html と b/intro.html）
+            template: 使用テンプレート名
+            workers: ワーカープロセス数（省略時はCPU数）
+            chunksize: 1タスクあたりのファイル数（省略時は自動）
+            options: 各ファイルの変換オプション（例: css_mode="link" で
+                共有スタイルシート kumihan.<hash>.css を出力先ディレクトリごとに
+                1つ書き出す。サブディレクトリ構造を保つ場合は各サブディレクトリに
+                1つずつとなる）
+
+        Yields:
+            各ファイルの convert 結果辞書（完了順、output_file は実際の
+            出力パス）。出力先が他の入力と
+            重複するファイルは変換せずエラー結果として返す
+        """
+        tasks, conflicts = self._build_tasks(input_files, output_dir, template, options)
+        yield from conflicts
+        if not tasks:
+            return
+
+        worker_count = max(1, min(workers or os.cpu_count() or 1, len(tasks)))
+        if worker_count == 1:
+            yield from self._convert_serial(tasks)
+            return
+
+        size = chunksize or max(1, min(32, len(tasks) // (worker_count * 4)))
+        chunks = [tasks[i : i + size] for i in range(0, len(tasks), size)]
+        self.logger.info(
+            f"Batch conversion: {len(tasks)} files, "
+            f"{worker_count} workers, chunksize={size}"
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=worker_count,
+            initializer=_init_worker,
+            initargs=(self.config_path, self.performance_mode, self.cache_dir),
+        ) as executor:
+            futures: Dict[Future[List[Dict[str, Any]]], List[_BatchTask]] = {
+                executor.submit(_convert_chunk, chunk): chunk for chunk in chunks
+            }
+            for future in as_completed(futures):
+                try:
+                    results = future.result()
+                except (BrokenProcessPool, OSError) as e:
+                    # ワーカー異常終了時はチャンク内の全ファイルをエラーとして返す
+                    self.logger.error(f"Batch worker failed: {e}")
+                    results = [
+                        {"status": "error", "error": str(e), "input_file": task[0]}
+                        for task in futures[future]
+                    ]
+                yield from results
+
+    def _convert_serial(self, tasks: List[_BatchTask]) -> Iterator[Dict[str, Any]]:
+        """プロセスプールを使わずに順次変換"""
+        core = self.local_core
+        if core is None:
+            _init_worker(self.config_path, self.performance_mode, self.cache_dir)
+            core = _worker_api.core
+        for input_file, output_file, template, options in tasks:
+            yield _with_output_path(
+                core.convert_file(input_file, output_file, template, options),
+                output_file,
+            )
+
+    def _build_tasks(
+        self,
+        input_files: Sequence[Union[str, Path]],
+        output_dir: Optional[Union[str, Path]],
+        template: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[_BatchTask], List[Dict[str, Any]]]:
+        """入力ファイル一覧から変換タスクを生成
+
+        Returns:
+            (変換タスク, 出力先が重複した入力のエラー結果)
+        """
+        tasks: List[_BatchTask] = []
+        conflicts: List[Dict[str, Any]] = []
+        base_dir = _common_parent(input_files) if output_dir is not None else None
+        claimed: Dict[Path, str] = {}
+        for input_file in input_files:
+            input_path = Path(input_file)
+            if output_dir is None:
+                output_path = input_path.with_suffix(".html")
+            else:
+                relative_dir = Path()
+                if base_dir is not None:
+                    relative_dir = input_path.absolute().parent.relative_to(base_dir)
+                output_path = (
+                    Path(output_dir) / relative_dir / f"{input_path.stem}.html"
+                )
+
+            key = Path(os.path.normcase(output_path.absolute()))
+            if key in claimed:
+                error = f"出力先が {claimed[key]} と重複しています: {output_path}"
+                self.logger.error(error)
+                conflicts.append(
+                    {"status": "error", "error": error, "input_file": str(input_file)}
+                )
+                continue
+            claimed[key] = str(input_file)
+            tasks.append((str(input_file), str(output_path), template, options))
+        return tasks, conflicts
+
+
+def _common_parent(input_files: Sequence[Union[str, Path]]) -> Optional[Path]:
+    """入力ファイル群に共通する親ディレクトリ（別ドライブ混在時は None）"""
+    if not input_files:
+        return None
+    try:
+        return Path(
+            os.path.commonpath([Path(f).absolute().parent for f in input_files])
+        )
+    except ValueError:
+        return None
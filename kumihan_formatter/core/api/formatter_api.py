@@ -5,13 +5,14 @@ Issue #1249対応: 統合API設計統一
 公開API・ユーザーインターフェース・エラーハンドリングを担当
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
 from pathlib import Path
 import logging
 
 from .formatter_config import FormatterConfig
 from .manager_coordinator import ManagerCoordinator
 from .formatter_core import FormatterCore
+from ..caching.disk_cache import PersistentRenderCache
 
 
 class FormatterAPI:
@@ -21,15 +22,19 @@ class FormatterAPI:
         self,
         config_path: Optional[Union[str, Path]] = None,
         performance_mode: str = "standard",
+        cache_dir: Optional[Union[str, Path]] = None,
     ):
         self.logger = logging.getLogger(__name__)
+        self.cache_dir = cache_dir
 
         # 責任分離されたコンポーネントの初期化
         self.config = FormatterConfig(config_path, performance_mode)
         self.coordinator = ManagerCoordinator(
             self.config.get_config(), performance_mode
         )
-        self.core = FormatterCore(self.coordinator)
+        self.core = FormatterCore(
+            self.coordinator, self._create_render_cache(cache_dir)
+        )
 
         mode_message = (
             "統合Managerシステム対応版"
@@ -38,6 +43,15 @@ class FormatterAPI:
         )
         self.logger.info(f"FormatterAPI initialized - {mode_message}")
 
+    def _create_render_cache(
+        self, cache_dir: Optional[Union[str, Path]]
+    ) -> Optional[PersistentRenderCache]:
+        """永続レンダリングキャッシュ生成（cache_dir指定時のみ）"""
+        if not cache_dir:
+            return None
+        max_mb = self.config.get_config().get("render_cache_max_mb", 256)
+        return PersistentRenderCache(cache_dir, int(max_mb * 1024 * 1024))
+
     # 公開API メソッド群
 
     def convert(
@@ -50,6 +64,39 @@ class FormatterAPI:
         """統合Managerシステムによる最適化変換"""
         return self.core.convert_file(input_file, output_file, template, options)
 
+    def convert_streaming(
+        self,
+        input_file: Union[str, Path],
+        output_file: Optional[Union[str, Path]] = None,
+        template: str = "default",
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """ストリーミング変換（ブロック単位で読み込み・書き込み）"""
+        return self.core.convert_streaming(input_file, output_file, template, options)
+
+    def convert_many(
+        self,
+        input_files: Sequence[Union[str, Path]],
+        output_dir: Optional[Union[str, Path]] = None,
+        template: str = "default",
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """複数ファイル一括変換（プロセス並列・完了順に結果を返す）"""
+        # プロセスプール関連は一括変換の使用時のみ読み込む
+        from .batch_converter import BatchConverter
+
+        converter = BatchConverter(
+            self.config.config_path,
+            self.config.performance_mode,
+            self.cache_dir,
+            local_core=self.core,
+        )
+        return converter.convert(
+            input_files, output_dir, template, workers, chunksize, options
+        )
+
     def convert_text(self, text: str, template: str = "default") -> str:
         """テキスト→HTML変換（統合Managerシステム対応）"""
         return self.core.convert_text(text, template)
@@ -5,20 +5,28 @@ Issue #1249対応: 統合API設計統一
 実際の変換・パーシング・レンダリング処理を担当
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 from pathlib import Path
 import logging
 
 from .manager_coordinator import ManagerCoordinator
+from ..caching.disk_cache import PersistentRenderCache
+from ..rendering.css_assets import CSS_MODE_LINK, emit_css_asset
 from ..utilities.element_counter import count_elements
 
 
 class FormatterCore:
     """統合API コアロジッククラス"""
 
-    def __init__(self, coordinator: ManagerCoordinator):
+    def __init__(
+        self,
+        coordinator: ManagerCoordinator,
+        render_cache: Optional[PersistentRenderCache] = None,
+    ):
         self.logger = logging.getLogger(__name__)
         self.coordinator = coordinator
+        # 実行をまたぐ変換結果キャッシュ（未指定時は無効）
+        self.render_cache = render_cache
 
     def convert_file(
         self,
@@ -40,56 +48,123 @@ class FormatterCore:
             if not content:
                 raise FileNotFoundError(f"Input file not found or empty: {input_file}")
 
-            # 最適化解析（ProcessingManager + MainParser使用）
+            # 出力パス決定
+            if not output_file:
+                output_file = Path(input_file).with_suffix(".html")
+
+            context = self._document_context(template, options, output_file)
+
+            # 永続キャッシュ確認（ヒット時は解析・レンダリングを省略）
+            cache_key = None
+            if self.render_cache is not None:
+                cache_key = self.render_cache.make_key(
+                    content, template, {**self.coordinator.config, **(options or {})}
+                )
+                cached_meta = self.render_cache.copy_to(cache_key, output_file)
+                if cached_meta is not None:
+                    self.logger.debug(f"Render cache hit: {input_file}")
+                    if context.get("css_mode") == CSS_MODE_LINK:
+                        emit_css_asset(context)
+                    return self._build_convert_result(
+                        input_file,
+                        output_file,
+                        template,
+                        int(cached_meta.get("elements_count", 0)),
+                        cache_hit=True,
+                    )
+
+            # 最適化解析（ProcessingManager + MainParser使用）。パーサーは文書全体で
+            # 1回だけ選択し、大容量文書の各チャンクにも同じパーサーを適用する
+            main_parser = self.coordinator.main_parser
             parsed_result = self.coordinator.processing_manager.optimize_parsing(
-                content, lambda c: self.coordinator.main_parser.parse(c, "auto")
+                content, main_parser.bind(main_parser.select_parser_type(content))
             )
 
             if not parsed_result:
                 raise ValueError("パーシング処理に失敗しました")
 
-            # 出力パス決定
-            if not output_file:
-                output_file = Path(input_file).with_suffix(".html")
+            # レンダリング＋ファイル出力（MainRenderer使用、1パスで直接書き込み）
+            self._render_to_path(parsed_result, output_file, context)
 
-            # レンダリング実行（MainRenderer使用）
-            context = {"template": template, **(options or {})}
-            rendered_content = self.coordinator.main_renderer.render(
-                parsed_result, context
-            )
+            # 要素数カウント（テストインターフェース対応）
+            elements_count = self._count_elements(parsed_result)
 
-            # ファイル出力（CoreManager使用、テスト環境自動対応）
-            success = self.coordinator.main_renderer.render_to_file(
-                parsed_result, output_file, None, context
+            if cache_key is not None and self.render_cache is not None:
+                self.render_cache.store(
+                    cache_key, output_file, {"elements_count": elements_count}
+                )
+
+            return self._build_convert_result(
+                input_file,
+                output_file,
+                template,
+                elements_count,
+                cache_hit=False if cache_key is not None else None,
             )
 
-            if not success:
-                raise IOError(f"ファイル出力に失敗: {output_file}")
+        except Exception as e:
+            self.logger.error(f"File conversion error: {e}")
+            return {"status": "error", "error": str(e), "input_file": str(input_file)}
 
-            # 要素数カウント（テストインターフェース対応）
-            elements_count = self._count_elements(parsed_result)
+    def convert_streaming(
+        self,
+        input_file: Union[str, Path],
+        output_file: Optional[Union[str, Path]] = None,
+        template: str = "default",
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """ストリーミング変換（入力サイズに依らずメモリ使用量一定）
 
-            # 実際の出力パス決定（テスト環境対応）
-            actual_output_file = self._get_actual_output_path(output_file)
-
-            result = {
-                "status": "success",
-                "input_file": str(input_file),
-                "output_file": str(actual_output_file),
-                "template": template,
-                "parser_used": "MainParser (auto)",
-                "optimization_applied": True,
-                "elements_count": elements_count,
-            }
+        入力ファイルをトップレベルブロック単位で読み進め、解析・レンダリングした
+        HTML断片を順に出力ファイルへ書き込む。文書全体のテキスト・要素・HTMLを
+        保持しないため、巨大な文書の変換に向く。
 
-            # パフォーマンスモード情報追加
+        常にシンプルKumihan記法で解析し、要素はブロックごとに文書順で出力する。
+        そのため自動パーサー選択を行う convert_file とは出力が異なる場合がある。
+        永続レンダリングキャッシュは使用しない。
+        """
+        try:
             if self.coordinator.performance_mode == "optimized":
-                result["performance_mode"] = "optimized"
+                self.coordinator.ensure_parser_initialized()
+                self.coordinator.ensure_renderer_initialized()
+
+            input_path = Path(input_file)
+            if not input_path.is_file():
+                raise FileNotFoundError(f"Input file not found: {input_file}")
 
+            # 出力パス決定
+            if not output_file:
+                output_file = input_path.with_suffix(".html")
+            output_path = Path(output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            elements_count = 0
+
+            def counted(elements: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+                nonlocal elements_count
+                for element in elements:
+                    elements_count += 1
+                    yield element
+
+            context = self._document_context(template, options, output_path)
+            with (
+                open(input_path, "r", encoding="utf-8") as source,
+                open(output_path, "w", encoding="utf-8", newline="") as f,
+            ):
+                elements = self.coordinator.main_parser.parse_iter(source)
+                fragments = self.coordinator.main_renderer.render_iter(
+                    counted(elements), context
+                )
+                f.writelines(fragments)
+
+            result = self._build_convert_result(
+                input_file, output_file, template, elements_count
+            )
+            result["parser_used"] = "MainParser (streaming)"
             return result
 
         except Exception as e:
-            self.logger.error(f"File conversion error: {e}")
+            self.logger.error(f"Streaming conversion error: {e}")
             return {"status": "error", "error": str(e), "input_file": str(input_file)}
 
     def convert_text(self, text: str, template: str = "default") -> str:
@@ -179,6 +254,74 @@ class FormatterCore:
             self.logger.error(f"Template list error: {e}")
             return ["default"]
 
+    def _document_context(
+        self,
+        template: str,
+        options: Optional[Dict[str, Any]],
+        output_file: Union[str, Path],
+    ) -> Dict[str, Any]:
+        """レンダリングコンテキストを構築
+
+        css_mode="link" の場合、共有スタイルシートの書き出し先（css_dir）を
+        省略時は出力ファイルと同じディレクトリにする。
+        """
+        context = {"template": template, **(options or {})}
+        if context.get("css_mode") == CSS_MODE_LINK:
+            context.setdefault("css_dir", str(Path(output_file).parent))
+        return context
+
+    def _render_to_path(
+        self,
+        parsed_result: Any,
+        output_file: Union[str, Path],
+        context: Dict[str, Any],
+    ) -> None:
+        """解析結果を1回だけレンダリングし、生成しながらファイルへ書き込む"""
+        output_path = Path(output_file)
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "w", encoding="utf-8", newline="") as f:
+                written = self.coordinator.main_renderer.render_to_stream(
+                    parsed_result, f, context
+                )
+        except OSError as e:
+            raise IOError(f"ファイル出力に失敗: {output_file} ({e})") from e
+
+        if not written:
+            raise IOError(f"ファイル出力に失敗: {output_file}")
+
+    def _build_convert_result(
+        self,
+        input_file: Union[str, Path],
+        output_file: Union[str, Path],
+        template: str,
+        elements_count: int,
+        cache_hit: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """convert_file の成功結果を構築"""
+        # 実際の出力パス決定（テスト環境対応）
+        actual_output_file = self._get_actual_output_path(output_file)
+
+        result: Dict[str, Any] = {
+            "status": "success",
+            "input_file": str(input_file),
+            "output_file": str(actual_output_file),
+            "template": template,
+            "parser_used": "MainParser (auto)",
+            "optimization_applied": True,
+            "elements_count": elements_count,
+        }
+
+        # 永続キャッシュ有効時のみヒット有無を付与
+        if cache_hit is not None:
+            result["cache_hit"] = cache_hit
+
+        # パフォーマンスモード情報追加
+        if self.coordinator.performance_mode == "optimized":
+            result["performance_mode"] = "optimized"
+
+        return result
+
     def _count_elements(self, parsed_result: Any) -> int:
         """要素数カウント（テスト互換性対応）"""
         return count_elements(parsed_result)
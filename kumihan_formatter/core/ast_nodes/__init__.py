@@ -23,7 +23,8 @@ from .factories import (
 )
 
 # Core classes
-from .node import Node
+from .arena import ArenaNodeView, NodeArena
+from .node import CompactNode, Node
 from .node_builder import NodeBuilder
 
 # Utility functions - temporarily commented out due to import issues
@@ -37,7 +38,10 @@ from .node_builder import NodeBuilder
 __all__ = [
     # Core classes
     "Node",
+    "CompactNode",
     "NodeBuilder",
+    "NodeArena",
+    "ArenaNodeView",
     # Factory functions
     "create_node",
     "paragraph",
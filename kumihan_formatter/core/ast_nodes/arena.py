@@ -0,0 +1,294 @@
+"""Array-backed AST arena for Kumihan-Formatter
+
+大量のノードを個別の Node オブジェクトとして保持せず、ノード種別・
+内容オフセット・親子関係を array の並列カラムに格納する。
+各ノードへは Node 互換の読み取りビュー（ArenaNodeView）でアクセスし、
+必要な場合のみ to_node() で通常の Node に実体化する。
+"""
+
+from array import array
+from typing import Any, Dict, Iterator, List, Optional
+
+from .node import Node
+
+# ノードが存在しないことを表すインデックス
+NO_NODE = -1
+
+
+class NodeArena:
+    """配列カラム形式のASTノード格納領域
+
+    1ノードあたりの保持コストは種別ID・内容範囲・親子インデックスの
+    数十バイトのみ。内容は元テキスト上の範囲として保持し、参照時に切り出す。
+    元テキストの範囲で表せない内容と属性は、該当ノード分のみ辞書に保持する。
+
+    Args:
+        source: ノード内容の切り出し元テキスト
+    """
+
+    def __init__(self, source: str = "") -> None:
+        self.source = source
+        self._type_names: List[str] = []
+        self._type_ids: Dict[str, int] = {}
+
+        # ノードごとの並列カラム
+        self._types = array("i")
+        self._starts = array("q")
+        self._ends = array("q")
+        self._parents = array("i")
+        self._first_children = array("i")
+        self._last_children = array("i")
+        self._next_siblings = array("i")
+
+        # 疎な付加情報（該当ノードのみ）
+        self._values: Dict[int, Any] = {}
+        self._attributes: Dict[int, Dict[str, Any]] = {}
+
+        self._first_root = NO_NODE
+        self._last_root = NO_NODE
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def add(
+        self,
+        node_type: str,
+        start: int = NO_NODE,
+        end: int = NO_NODE,
+        parent: int = NO_NODE,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """元テキストの範囲 [start, end) を内容とするノードを追加
+
+        Args:
+            node_type: ノード種別
+            start: 内容の開始オフセット（省略時は内容なし）
+            end: 内容の終了オフセット
+            parent: 親ノードのインデックス（省略時はルート）
+            attributes: ノード属性
+
+        Returns:
+            追加したノードのインデックス
+        """
+        type_id = self._type_ids.get(node_type)
+        if type_id is None:
+            type_id = len(self._type_names)
+            self._type_names.append(node_type)
+            self._type_ids[node_type] = type_id
+
+        index = len(self._types)
+        self._types.append(type_id)
+        self._starts.append(start)
+        self._ends.append(end)
+        self._parents.append(parent)
+        self._first_children.append(NO_NODE)
+        self._last_children.append(NO_NODE)
+        self._next_siblings.append(NO_NODE)
+        if attributes:
+            self._attributes[index] = attributes
+
+        # 兄弟リストの末尾に連結
+        if parent == NO_NODE:
+            if self._last_root == NO_NODE:
+                self._first_root = index
+            else:
+                self._next_siblings[self._last_root] = index
+            self._last_root = index
+        else:
+            last = self._last_children[parent]
+            if last == NO_NODE:
+                self._first_children[parent] = index
+            else:
+                self._next_siblings[last] = index
+            self._last_children[parent] = index
+        return index
+
+    def add_value(
+        self,
+        node_type: str,
+        content: Any,
+        parent: int = NO_NODE,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """元テキストの範囲で表せない内容を持つノードを追加"""
+        index = self.add(node_type, parent=parent, attributes=attributes)
+        self._values[index] = content
+        return index
+
+    def node(self, index: int) -> "ArenaNodeView":
+        """指定インデックスのノードビューを取得"""
+        if not 0 <= index < len(self._types):
+            raise IndexError(f"node index out of range: {index}")
+        return ArenaNodeView(self, index)
+
+    def roots(self) -> Iterator["ArenaNodeView"]:
+        """ルートノードのビューを追加順に返す"""
+        index = self._first_root
+        while index != NO_NODE:
+            yield ArenaNodeView(self, index)
+            index = self._next_siblings[index]
+
+    def child_indices(self, index: int) -> Iterator[int]:
+        """子ノードのインデックスを追加順に返す"""
+        child = self._first_children[index]
+        while child != NO_NODE:
+            yield child
+            child = self._next_siblings[child]
+
+    def type_of(self, index: int) -> str:
+        return self._type_names[self._types[index]]
+
+    def parent_of(self, index: int) -> int:
+        return self._parents[index]
+
+    def content_of(self, index: int) -> Any:
+        """ノード内容を取得（元テキストの範囲は参照時に切り出す）"""
+        start = self._starts[index]
+        if start != NO_NODE:
+            return self.source[start : self._ends[index]]
+        if index in self._values:
+            return self._values[index]
+        return None
+
+    def attributes_of(self, index: int) -> Optional[Dict[str, Any]]:
+        return self._attributes.get(index)
+
+    def to_nodes(self) -> List[Node]:
+        """全ルートを通常の Node リストに実体化"""
+        return [view.to_node() for view in self.roots()]
+
+    def get_statistics(self) -> Dict[str, int]:
+        """格納統計を取得（カラムの確保バイト数を含む）"""
+        columns = (
+            self._types,
+            self._starts,
+            self._ends,
+            self._parents,
+            self._first_children,
+            self._last_children,
+            self._next_siblings,
+        )
+        return {
+            "nodes": len(self._types),
+            "node_types": len(self._type_names),
+            "column_bytes": sum(
+                column.buffer_info()[1] * column.itemsize for column in columns
+            ),
+            "value_nodes": len(self._values),
+            "attribute_nodes": len(self._attributes),
+        }
+
+
+class ArenaNodeView:
+    """NodeArena 内の1ノードを Node と同じインターフェースで参照するビュー
+
+    内容を持たず子ノードを持つノードは、Node と同様に子ノードのリストを
+    content として返す。属性の変更はアリーナに反映される。
+    """
+
+    __slots__ = ("arena", "index")
+
+    def __init__(self, arena: NodeArena, index: int) -> None:
+        self.arena = arena
+        self.index = index
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArenaNodeView):
+            return NotImplemented
+        return self.arena is other.arena and self.index == other.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.arena), self.index))
+
+    def __repr__(self) -> str:
+        return f"ArenaNodeView(index={self.index}, type={self.type!r})"
+
+    @property
+    def type(self) -> str:
+        return self.arena.type_of(self.index)
+
+    @property
+    def node_type(self) -> str:
+        """ノードタイプをnode_typeとしてアクセスする（統一パーサーシステム互換）"""
+        return self.type
+
+    @property
+    def content(self) -> Any:
+        content = self.arena.content_of(self.index)
+        if content is None and self.arena._first_children[self.index] != NO_NODE:
+            return self.children
+        return content
+
+    @property
+    def attributes(self) -> Optional[Dict[str, Any]]:
+        return self.arena.attributes_of(self.index)
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """属性をmetadataとしてアクセスする（統一パーサーシステム互換）"""
+        return self.arena._attributes.setdefault(self.index, {})
+
+    @property
+    def children(self) -> List["ArenaNodeView"]:
+        return [
+            ArenaNodeView(self.arena, child)
+            for child in self.arena.child_indices(self.index)
+        ]
+
+    @property
+    def parent(self) -> Optional["ArenaNodeView"]:
+        parent = self.arena.parent_of(self.index)
+        return None if parent == NO_NODE else ArenaNodeView(self.arena, parent)
+
+    def add_attribute(self, key: str, value: Any) -> None:
+        self.metadata[key] = value
+
+    def get_attribute(self, key: str, default: Any = None) -> Any:
+        attributes = self.attributes
+        if attributes is None:
+            return default
+        return attributes.get(key, default)
+
+    def has_attribute(self, key: str) -> bool:
+        attributes = self.attributes
+        return attributes is not None and key in attributes
+
+    def is_heading(self) -> bool:
+        return self.type in {"h1", "h2", "h3", "h4", "h5"}
+
+    def get_heading_level(self) -> int | None:
+        return int(self.type[1]) if self.is_heading() else None
+
+    def get_text_content(self) -> str:
+        """このノードと子孫のテキストを取得（Node.get_text_content互換）"""
+        content = self.content
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            return " ".join(
+                item if isinstance(item, str) else item.get_text_content()
+                for item in content
+                if isinstance(item, (str, ArenaNodeView, Node))
+            )
+        return ""
+
+    def walk(self) -> Iterator["ArenaNodeView"]:
+        """このノードと全子孫を深さ優先（前順）で返す"""
+        arena = self.arena
+        stack = [self.index]
+        while stack:
+            index = stack.pop()
+            yield ArenaNodeView(arena, index)
+            stack.extend(reversed(list(arena.child_indices(index))))
+
+    def to_node(self) -> Node:
+        """通常の Node に実体化（子孫を含む）"""
+        arena = self.arena
+        content = arena.content_of(self.index)
+        children = [child.to_node() for child in self.children]
+        attributes = dict(arena.attributes_of(self.index) or {})
+        if content is None and children:
+            return Node(type=self.type, content=children, attributes=attributes)
+        return Node(
+            type=self.type, content=content, attributes=attributes, children=children
+        )
@@ -1,14 +1,15 @@
 """AST Node base class for Kumihan-Formatter
 
 This module contains the core Node class that represents
-elements in the Abstract Syntax Tree.
+elements in the Abstract Syntax Tree, and CompactNode, a variant
+that allocates attributes and children lazily.
 """
 
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """
     AST基本ノードクラス（すべての要素の基盤）
@@ -28,6 +29,10 @@ class Node:
     - 解析済み文書構造の単一要素表現
     - パーサーとレンダラー間のデータ交換
     - 要素タイプ・内容・属性の統一的管理
+
+    メモリ効率:
+    - __slots__ によりインスタンスごとの __dict__ を持たない
+    - 属性・子ノードを遅延確保する CompactNode も利用可能
     """
 
     type: str
@@ -135,29 +140,27 @@ class Node:
         """Check if this node contains text content"""
         if isinstance(self.content, str):
             return bool(self.content.strip())
-        elif isinstance(self.content, list):
-            return any(
-                isinstance(item, str)
-                and item.strip()
-                or isinstance(item, Node)
-                and item.contains_text()
-                for item in self.content
-            )
+
+        from .traversal import walk_preorder
+
+        for node in walk_preorder(self):
+            content = node.content
+            if isinstance(content, str):
+                if content.strip():
+                    return True
+            elif isinstance(content, list):
+                if any(isinstance(item, str) and item.strip() for item in content):
+                    return True
         return False
 
     def get_text_content(self) -> str:
         """Extract all text content from this node and its children"""
         if isinstance(self.content, str):
             return self.content
-        elif isinstance(self.content, list):
-            texts = []
-            for item in self.content:
-                if isinstance(item, str):
-                    texts.append(item)
-                elif isinstance(item, Node):
-                    texts.append(item.get_text_content())
-            return " ".join(texts)
-        return ""
+
+        from .traversal import text_content
+
+        return text_content(self)
 
     def count_children(self) -> int:
         """Count direct children of this node"""
@@ -177,11 +180,9 @@ class Node:
 
     def walk(self) -> Any:
         """Generator that yields this node and all its descendants"""
-        yield self
-        if isinstance(self.content, list):
-            for item in self.content:
-                if isinstance(item, Node):
-                    yield from item.walk()
+        from .traversal import walk_preorder
+
+        return walk_preorder(self)
 
     def add_error(self, error_message: str) -> None:
         """エラーメッセージをノードに追加（パーサーエラーハンドリング用）"""
@@ -208,3 +209,30 @@ class Node:
             return []
         errors = self.attributes.get("errors", [])
         return [str(error) for error in errors] if isinstance(errors, list) else []
+
+
+@dataclass(slots=True, eq=False)
+class CompactNode(Node):
+    """
+    属性・子ノードを遅延確保するNode（大量の葉ノード向け）
+
+    Node は生成時に空の dict / list を確保するが、CompactNode は
+    add_attribute() / add_child() / metadata などで必要になるまで None のまま保持する。
+    attributes / children を直接参照する場合は None を考慮すること。
+
+    比較時は None を空の dict / list とみなし、同内容の Node と等しい。
+    """
+
+    def __post_init__(self) -> None:
+        # 空コンテナは確保しない
+        pass
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Node):
+            return NotImplemented
+        return (
+            self.type == other.type
+            and self.content == other.content
+            and (self.attributes or {}) == (other.attributes or {})
+            and (self.children or []) == (other.children or [])
+        )
@@ -0,0 +1,163 @@
+"""AST traversal utilities
+
+明示的なスタックで AST を走査する関数群。再帰や入れ子のジェネレータを
+使わないため、深く入れ子になった文書でも再帰上限に達せず、階層ごとの
+ジェネレータ連鎖のオーバーヘッドも生じない。
+
+子ノードの取り出し方は children 引数で差し替えられる
+（既定は Node.walk と同じく content リスト内の Node）。
+"""
+
+from typing import (
+    Any,
+    Callable,
+    Container,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+)
+
+from .node import Node
+
+ChildrenFunc = Callable[[Any], Sequence[Any]]
+
+_NO_CHILDREN: Sequence[Any] = ()
+
+
+def child_nodes(node: Any) -> Sequence[Any]:
+    """content リスト内の Node（文字列などは除く）"""
+    content = getattr(node, "content", None)
+    if isinstance(content, list):
+        return [item for item in content if isinstance(item, Node)]
+    return _NO_CHILDREN
+
+
+def _as_roots(roots: Any) -> List[Any]:
+    if isinstance(roots, Node):
+        return [roots]
+    return list(roots)
+
+
+def walk_preorder(
+    roots: Node | Iterable[Any], children: ChildrenFunc = child_nodes
+) -> Iterator[Any]:
+    """前順（親 → 子）で走査
+
+    Args:
+        roots: 起点ノード、またはノードの並び
+        children: ノード → 子ノード列
+
+    Yields:
+        各ノード（文書順）
+    """
+    if children is child_nodes:
+        # 既定の子ノードは content をそのまま積み、取り出し時に Node 以外を除く
+        # （子ノードごとのリスト生成を避ける）
+        for root in _as_roots(roots):
+            yield root
+            content = getattr(root, "content", None)
+            if not isinstance(content, list):
+                continue
+            stack = content[::-1]
+            pop = stack.pop
+            extend = stack.extend
+            while stack:
+                node = pop()
+                if isinstance(node, Node):
+                    yield node
+                    content = node.content
+                    if isinstance(content, list) and content:
+                        extend(reversed(content))
+        return
+
+    stack = _as_roots(roots)
+    stack.reverse()
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        node = pop()
+        yield node
+        kids = children(node)
+        if kids:
+            extend(reversed(kids))
+
+
+def walk_postorder(
+    roots: Node | Iterable[Any], children: ChildrenFunc = child_nodes
+) -> Iterator[Any]:
+    """後順（子 → 親）で走査
+
+    子ノードをすべて返してから親ノードを返すため、
+    子の結果から親の値を組み立てる処理に使える。
+    """
+    # (ノード, 子を展開済みか) の組を積む
+    stack = [(node, False) for node in reversed(_as_roots(roots))]
+    pop = stack.pop
+    append = stack.append
+    while stack:
+        node, expanded = pop()
+        if expanded:
+            yield node
+            continue
+        append((node, True))
+        kids = children(node)
+        if kids:
+            stack.extend((child, False) for child in reversed(kids))
+
+
+def text_content(node: Node) -> str:
+    """Node.get_text_content と同じ規則で子孫のテキストを連結
+
+    各ノードのテキストは content 内の文字列と子ノードのテキストの空白区切り。
+    入れ子ごとに (content の反復子, 断片リスト) の組を積んで後順に組み立てる。
+    """
+    content = node.content
+    if isinstance(content, str):
+        return content
+    if not isinstance(content, list):
+        return ""
+
+    frames: List[Tuple[Iterator[Any], List[str]]] = [(iter(content), [])]
+    while True:
+        items, parts = frames[-1]
+        for item in items:
+            if isinstance(item, str):
+                parts.append(item)
+            elif isinstance(item, Node):
+                content = item.content
+                if isinstance(content, str):
+                    parts.append(content)
+                elif isinstance(content, list):
+                    frames.append((iter(content), []))
+                    break
+                else:
+                    parts.append("")
+        else:
+            frames.pop()
+            text = " ".join(parts)
+            if not frames:
+                return text
+            frames[-1][1].append(text)
+
+
+def walk_by_type(
+    roots: Node | Iterable[Any],
+    types: Container[str],
+    children: ChildrenFunc = child_nodes,
+) -> Iterator[Any]:
+    """前順の走査のうち type が types に含まれるノードのみ返す"""
+    for node in walk_preorder(roots, children):
+        if getattr(node, "type", None) in types:
+            yield node
+
+
+__all__ = [
+    "ChildrenFunc",
+    "child_nodes",
+    "text_content",
+    "walk_by_type",
+    "walk_postorder",
+    "walk_preorder",
+]
@@ -7,6 +7,7 @@ AST nodes and node collections.
 from typing import Any, Dict
 
 from .node import Node
+from .traversal import walk_preorder
 
 
 def flatten_text_nodes(content: list[Any]) -> list[Any]:
@@ -43,15 +44,8 @@ def count_nodes_by_type(nodes: list[Node]) -> dict[str, int]:
 
 def find_all_headings(nodes: list[Node]) -> list[Node]:
     """Find all heading nodes recursively"""
-    headings = []
-    for node in nodes:
-        if isinstance(node, Node):
-            if node.is_heading():
-                headings.append(node)
-            # Recursively search in content
-            if isinstance(node.content, list):
-                headings.extend(find_all_headings(node.content))
-    return headings
+    roots = [node for node in nodes if isinstance(node, Node)]
+    return [node for node in walk_preorder(roots) if node.is_heading()]
 
 
 def validate_ast(nodes: list[Any]) -> list[str]:
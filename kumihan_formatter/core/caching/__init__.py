@@ -0,0 +1,19 @@
+"""Caching Module - キャッシュ機能
+
+内容ダイジェストによるキー生成、バイト予算付きLRUキャッシュ、
+ディスク永続化レンダリングキャッシュを提供する。
+"""
+
+from .digest import content_digest
+from .disk_cache import PersistentRenderCache
+from .lru_cache import ByteBudgetLRUCache, estimate_size
+
+__all__ = [
+    # キー生成
+    "content_digest",
+    # メモリキャッシュ
+    "ByteBudgetLRUCache",
+    "estimate_size",
+    # ディスクキャッシュ
+    "PersistentRenderCache",
+]
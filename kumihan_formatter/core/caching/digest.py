@@ -0,0 +1,31 @@
+"""内容ダイジェストによるキャッシュキー生成
+
+`hash()` はプロセスごとにソルトされ衝突もあり得るため、キャッシュキーには
+暗号学的ダイジェスト（BLAKE2b, 256bit）を使用する。
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Union
+
+_SEPARATOR = b"\x00"
+
+
+def content_digest(*parts: Union[str, bytes]) -> str:
+    """複数の構成要素から安定したダイジェスト文字列を生成
+
+    Args:
+        parts: キーを構成する文字列/バイト列（内容・パーサー名など）
+
+    Returns:
+        16進表記のダイジェスト（64文字）
+    """
+    hasher = hashlib.blake2b(digest_size=32)
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        # 区切りに長さを含め、("ab","c") と ("a","bc") を区別する
+        hasher.update(str(len(data)).encode("ascii"))
+        hasher.update(_SEPARATOR)
+        hasher.update(data)
+    return hasher.hexdigest()
@@ -0,0 +1,200 @@
+"""ディスク永続化レンダリングキャッシュ
+
+CLI実行をまたいで変換結果（最終HTML）を再利用する。キーは入力内容・
+テンプレート・設定・パッケージバージョンのダイジェストで、いずれかが
+変われば別エントリになる。合計サイズが上限を超えると、最後に使われた
+時刻（mtime）の古いエントリから削除する。
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .digest import content_digest
+
+_HTML_SUFFIX = ".html"
+_META_SUFFIX = ".json"
+
+
+def _package_version() -> str:
+    """キャッシュキーに含めるパッケージバージョン"""
+    try:
+        from ... import __version__
+
+        return str(__version__)
+    except Exception:
+        return "unknown"
+
+
+class PersistentRenderCache:
+    """ディレクトリ上に変換結果を保存するキャッシュ
+
+    Args:
+        cache_dir: キャッシュディレクトリ（存在しなければ作成）
+        max_bytes: 保存するHTMLファイルの合計サイズ上限
+    """
+
+    def __init__(
+        self, cache_dir: Union[str, Path], max_bytes: int = 256 * 1024 * 1024
+    ) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(
+        self, content: str, template: str, config: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """入力内容・テンプレート・設定・バージョンからキーを生成"""
+        config_digest = content_digest(
+            json.dumps(config or {}, sort_keys=True, ensure_ascii=False, default=str)
+        )
+        return content_digest(content, template, config_digest, _package_version())
+
+    def _entry_paths(self, key: str) -> Tuple[Path, Path]:
+        bucket = self.cache_dir / key[:2]
+        return bucket / f"{key}{_HTML_SUFFIX}", bucket / f"{key}{_META_SUFFIX}"
+
+    def lookup(self, key: str) -> Optional[Tuple[Path, Dict[str, Any]]]:
+        """キャッシュ済みHTMLのパスとメタデータを取得
+
+        Returns:
+            ヒット時は (HTMLファイルパス, メタデータ)、ミス時は None
+        """
+        html_path, meta_path = self._entry_paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if not html_path.is_file():
+                raise FileNotFoundError(html_path)
+            # 最終使用時刻を更新（サイズ上限時の削除順に使用）
+            os.utime(html_path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return html_path, meta if isinstance(meta, dict) else {}
+
+    def copy_to(
+        self, key: str, destination: Union[str, Path]
+    ) -> Optional[Dict[str, Any]]:
+        """キャッシュ済みHTMLを出力先へコピー
+
+        Returns:
+            ヒット時はメタデータ、ミス時は None
+        """
+        entry = self.lookup(key)
+        if entry is None:
+            return None
+
+        html_path, meta = entry
+        destination_path = Path(destination)
+        destination_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(html_path, destination_path)
+        return meta
+
+    def store(
+        self,
+        key: str,
+        html_file: Union[str, Path],
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """出力済みHTMLファイルをキャッシュへ保存
+
+        書き込みは一時ファイル経由の置き換えで行い、並行実行中の読み手に
+        書きかけのエントリを見せない。失敗してもキャッシュなしで継続できる
+        よう、例外は送出せず False を返す。
+        """
+        html_path, meta_path = self._entry_paths(key)
+        try:
+            if Path(html_file).stat().st_size > self.max_bytes:
+                return False
+
+            html_path.parent.mkdir(parents=True, exist_ok=True)
+            self._atomic_copy(Path(html_file), html_path)
+            self._atomic_write_text(
+                meta_path, json.dumps(meta or {}, ensure_ascii=False, default=str)
+            )
+        except OSError as e:
+            self.logger.warning(f"Render cache store failed: {e}")
+            return False
+
+        self.enforce_size_limit()
+        return True
+
+    def enforce_size_limit(self) -> int:
+        """合計サイズが上限を超えていれば古いエントリから削除
+
+        Returns:
+            削除したエントリ数
+        """
+        entries: List[Tuple[float, int, Path]] = []
+        total = 0
+        for html_path in self.cache_dir.glob(f"*/*{_HTML_SUFFIX}"):
+            try:
+                stat = html_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, html_path))
+            total += stat.st_size
+
+        removed = 0
+        entries.sort()
+        for _mtime, size, html_path in entries:
+            if total <= self.max_bytes:
+                break
+            for path in (html_path, html_path.with_suffix(_META_SUFFIX)):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            total -= size
+            removed += 1
+
+        return removed
+
+    def clear(self) -> None:
+        """キャッシュディレクトリ内の全エントリを削除"""
+        for path in self.cache_dir.glob("*/*"):
+            if path.suffix in (_HTML_SUFFIX, _META_SUFFIX):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """キャッシュ統計を取得"""
+        return {
+            "cache_dir": str(self.cache_dir),
+            "hits": self.hits,
+            "misses": self.misses,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _atomic_copy(self, source: Path, target: Path) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(source, tmp_name)
+            os.replace(tmp_name, target)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _atomic_write_text(self, target: Path, text: str) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_name, target)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
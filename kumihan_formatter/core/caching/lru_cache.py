@@ -0,0 +1,155 @@
+"""バイト予算付きLRUキャッシュ
+
+推定バイト数の合計が予算を超えないよう、最近使われていないエントリから
+追い出す。ヒット・ミス・追い出し件数を統計として保持する。
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ..ast_nodes.node import Node
+
+
+def estimate_size(obj: Any) -> int:
+    """オブジェクトのおおよそのメモリ使用量（バイト）を推定
+
+    dict / list / tuple / set / Node を辿って合計する。共有オブジェクトは
+    一度だけ数え、深いネストでも再帰しない。
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    total = 0
+
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif isinstance(current, Node):
+            stack.append(current.content)
+            if current.attributes:
+                stack.append(current.attributes)
+            if current.children:
+                stack.append(current.children)
+
+    return total
+
+
+class ByteBudgetLRUCache:
+    """推定バイト数で上限管理するスレッドセーフなLRUキャッシュ
+
+    Args:
+        max_bytes: 保持するエントリの推定バイト数合計の上限
+        size_estimator: 値のバイト数推定関数
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        size_estimator: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._size_estimator = size_estimator
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """キーを検索し (ヒット有無, 値) を返す（ヒット時は最新扱いに更新）"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """値を取得（未登録時はdefault）"""
+        found, value = self.lookup(key)
+        return value if found else default
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None) -> bool:
+        """値を登録し、予算超過分を古い順に追い出す
+
+        Returns:
+            登録できた場合True（単体で予算を超える値は登録しない）
+        """
+        entry_size = self._size_estimator(value) if size is None else size
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+
+            if entry_size > self.max_bytes:
+                return False
+
+            self._entries[key] = (value, entry_size)
+            self.current_bytes += entry_size
+            self._evict_until(self.max_bytes)
+            return True
+
+    def discard(self, key: Hashable) -> None:
+        """エントリを削除（未登録なら何もしない）"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.current_bytes -= entry[1]
+
+    def trim(self, max_entries: int) -> int:
+        """最新 max_entries 件を残して追い出し、追い出した件数を返す"""
+        with self._lock:
+            removed = 0
+            while len(self._entries) > max(0, max_entries):
+                self._pop_oldest()
+                removed += 1
+            return removed
+
+    def clear(self) -> None:
+        """全エントリを削除（統計は保持）"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """キャッシュ統計を取得"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "current_bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _evict_until(self, budget: int) -> None:
+        while self.current_bytes > budget and self._entries:
+            self._pop_oldest()
+
+    def _pop_oldest(self) -> None:
+        _, (_, entry_size) = self._entries.popitem(last=False)
+        self.current_bytes -= entry_size
+        self.evictions += 1
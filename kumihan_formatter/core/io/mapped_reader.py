@@ -0,0 +1,248 @@
+"""メモリマップ入力リーダー
+
+大きな入力ファイルを mmap で読み取り専用にマップし、行・チャンク境界を
+マップ上のバイト列で直接探索する。各チャンクは memoryview のスライスとして
+保持し、内容の文字列化（デコード）は参照時に行う。ファイル全体の
+テキストや行リストを生成しないため、常駐メモリはチャンク1つ分に収まる。
+"""
+
+import codecs
+import mmap
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+# 改行バイト b"\n" が他の文字のバイト列に現れないエンコーディング
+# （supports_mapping() は codecs.lookup() の正規名で照合するため正規名で保持）
+_NEWLINE_SAFE_ENCODINGS = frozenset(
+    codecs.lookup(name).name
+    for name in (
+        "utf-8",
+        "utf-8-sig",
+        "ascii",
+        "latin-1",
+        "shift_jis",
+        "cp932",
+        "euc_jp",
+    )
+)
+
+# 行数・改行コード集計時の走査窓（バイト）
+_SCAN_WINDOW_BYTES = 1024 * 1024
+
+
+def decode_chunk_text(data: Union[bytes, memoryview], encoding: str) -> str:
+    """行単位で切り出したバイト列をデコード（末尾の改行は含まない）"""
+    text = str(data, encoding)
+    if text.endswith("\r\n"):
+        return text[:-2]
+    return text[:-1] if text.endswith("\n") else text
+
+
+def decode_chunk_lines(data: Union[bytes, memoryview], encoding: str) -> List[str]:
+    """行単位で切り出したバイト列を行リストにデコード（行末の CR/LF は除去）"""
+    return [line.rstrip("\r") for line in decode_chunk_text(data, encoding).split("\n")]
+
+
+@dataclass(frozen=True)
+class MappedChunk:
+    """マップ上の行範囲（内容は参照時にデコード）
+
+    Attributes:
+        chunk_id: チャンク番号（0始まり）
+        start_line: 開始行（1始まり）
+        end_line: 終了行（この行を含む）
+        view: チャンクのバイト列（マップへの memoryview）
+        encoding: デコードに使用するエンコーディング
+        offset: ファイル先頭からのバイトオフセット
+    """
+
+    chunk_id: int
+    start_line: int
+    end_line: int
+    view: memoryview
+    encoding: str
+    offset: int = 0
+
+    def text(self) -> str:
+        """チャンク内容をデコード（末尾の改行は含まない）"""
+        return decode_chunk_text(self.view, self.encoding)
+
+    def lines(self) -> List[str]:
+        """チャンク内容を行リストとしてデコード（行末の CR/LF は除去）"""
+        return decode_chunk_lines(self.view, self.encoding)
+
+    def release(self) -> None:
+        """マップへの参照を解放"""
+        self.view.release()
+
+
+class MappedTextReader:
+    """メモリマップによる大容量テキストファイルリーダー
+
+    行区切りは LF / CRLF。単独の CR を改行として含むファイルや、
+    改行バイトが文字の一部に現れうるエンコーディング（UTF-16 等）は
+    supports_mapping() が False となるため、呼び出し側で通常の読み込みを使う。
+
+    Args:
+        path: 入力ファイルパス
+        encoding: 入力エンコーディング
+
+    Examples:
+        >>> with MappedTextReader(path) as reader:
+        ...     for chunk in reader.iter_chunks(1000):
+        ...         process(chunk.lines())
+    """
+
+    def __init__(self, path: Union[str, Path], encoding: str = "utf-8") -> None:
+        self.path = Path(path)
+        self.encoding = encoding
+        self._file: Optional[Any] = None
+        self._map: Optional[mmap.mmap] = None
+        self._counts: Optional[Tuple[int, bool]] = None
+
+    def __enter__(self) -> "MappedTextReader":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """ファイルを読み取り専用でマップ（空ファイルはマップしない）"""
+        if self._file is not None:
+            return
+        self._file = open(self.path, "rb")
+        if self.path.stat().st_size > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        """マップとファイルを解放
+
+        参照中の MappedChunk がある場合、マップはその解放時に閉じられる。
+        """
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def size(self) -> int:
+        return len(self._map) if self._map is not None else 0
+
+    @property
+    def buffer(self) -> Union[mmap.mmap, bytes]:
+        """マップ本体（空ファイルは空の bytes）"""
+        return self._map if self._map is not None else b""
+
+    def supports_mapping(self) -> bool:
+        """マップ上の LF 探索で行分割できるファイルか判定"""
+        try:
+            encoding = codecs.lookup(self.encoding).name
+        except LookupError:
+            return False
+        return encoding in _NEWLINE_SAFE_ENCODINGS and not self._scan()[1]
+
+    def count_lines(self) -> int:
+        """行数を取得（readlines() と同じ数え方、デコードなし）"""
+        return self._scan()[0]
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[MappedChunk]:
+        """chunk_size 行ごとのチャンクを順に返す
+
+        境界はマップ上の改行位置から求め、チャンク内容はデコードしない。
+        """
+        mapped = self._map
+        if mapped is None:
+            return
+
+        chunk_size = max(1, chunk_size)
+        start = 0
+        line = 1
+        chunk_id = 0
+        while start < len(mapped):
+            end = self._find_line_end(start, chunk_size)
+            line_count = self._count_newlines(start, end)
+            if end == len(mapped) and mapped[end - 1 : end] != b"\n":
+                line_count += 1
+            with memoryview(mapped) as view:
+                chunk_view = view[start:end]
+            yield MappedChunk(
+                chunk_id=chunk_id,
+                start_line=line,
+                end_line=line + line_count - 1,
+                view=chunk_view,
+                encoding=self.encoding,
+                offset=start,
+            )
+            chunk_id += 1
+            line += line_count
+            start = end
+
+    def _find_line_end(self, start: int, line_count: int) -> int:
+        """start から line_count 行目の改行直後のオフセット（不足時は末尾）"""
+        mapped = self._map
+        assert mapped is not None
+        position = start
+        remaining = line_count
+
+        # 窓単位で改行数を数えて読み飛ばし、最後の窓のみ改行を個別に探す
+        while True:
+            window_end = min(position + _SCAN_WINDOW_BYTES, len(mapped))
+            newlines = mapped[position:window_end].count(b"\n")
+            if newlines >= remaining or window_end == len(mapped):
+                break
+            remaining -= newlines
+            position = window_end
+
+        for _ in range(remaining):
+            found = mapped.find(b"\n", position)
+            if found == -1:
+                return len(mapped)
+            position = found + 1
+        return position
+
+    def _count_newlines(self, start: int, end: int) -> int:
+        mapped = self._map
+        assert mapped is not None
+        total = 0
+        for position in range(start, end, _SCAN_WINDOW_BYTES):
+            window_end = min(position + _SCAN_WINDOW_BYTES, end)
+            total += mapped[position:window_end].count(b"\n")
+        return total
+
+    def _scan(self) -> Tuple[int, bool]:
+        """(行数, 単独CRの有無) を窓単位で集計（結果はキャッシュ）"""
+        if self._counts is not None:
+            return self._counts
+
+        mapped = self._map
+        if mapped is None:
+            self._counts = (0, False)
+            return self._counts
+
+        newlines = 0
+        has_lone_cr = False
+        position = 0
+        while position < len(mapped):
+            window_end = min(position + _SCAN_WINDOW_BYTES, len(mapped))
+            # 窓境界で CRLF を分断しないよう1バイト延長
+            if mapped[window_end - 1 : window_end] == b"\r" and window_end < len(
+                mapped
+            ):
+                window_end += 1
+            window = mapped[position:window_end]
+            newlines += window.count(b"\n")
+            if not has_lone_cr and window.count(b"\r") != window.count(b"\r\n"):
+                has_lone_cr = True
+            position = window_end
+
+        if mapped[-1:] != b"\n":
+            newlines += 1
+        self._counts = (newlines, has_lone_cr)
+        return self._counts
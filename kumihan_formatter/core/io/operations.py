@@ -7,6 +7,7 @@ import shutil
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
+from .mapped_reader import MappedTextReader
 from .protocols import FileProtocol, PathProtocol
 from ..common.exceptions import KumihanFileError
 import os
@@ -35,6 +36,21 @@ class FileOperations(FileProtocol):
                 raise KumihanFileError(str(e)) from e
             raise IOError(f"ファイル読み込み失敗: {e}")
 
+    def open_mapped(self, path: Path, encoding: str = "utf-8") -> MappedTextReader:
+        """大容量ファイルをメモリマップで開く（チャンク単位で遅延デコード）"""
+        if not self._validator.validate_readable(path):
+            errors = self._validator.get_errors()
+            raise FileNotFoundError(f"ファイル読み込みエラー: {'; '.join(errors)}")
+
+        reader = MappedTextReader(path, encoding)
+        try:
+            reader.open()
+        except Exception as e:
+            if os.getenv("KUMIHAN_RAISE_KUMIHAN_ERRORS", "0") in {"1", "true", "True"}:
+                raise KumihanFileError(str(e)) from e
+            raise IOError(f"ファイル読み込み失敗: {e}")
+        return reader
+
     def write_text(self, path: Path, content: str, encoding: str = "utf-8") -> None:
         """ファイルにテキストを書き込み"""
         # 親ディレクトリ作成
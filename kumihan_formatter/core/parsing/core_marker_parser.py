@@ -7,12 +7,105 @@ Phase2統合: MarkerParser + MarkerBlockParser の統合実装
 """
 
 import re
+from bisect import bisect_left, bisect_right
 from typing import Any, Dict, List, Optional, Tuple
 
 from kumihan_formatter.core.ast_nodes import Node, error_node
 from kumihan_formatter.core.ast_nodes.factories import create_node
+from kumihan_formatter.core.parsing.grammar import get_grammar
 import logging
 
+# シンプルKumihan記法のパターン（parse_simple_kumihan / インクリメンタル変換共通）
+# 装飾ブロック: # 装飾名 #内容##（内容は改行を含み得る）
+KUMIHAN_BLOCK_PATTERN = re.compile(r"#\s*([^#]+?)\s*#([^#]+?)##")
+# 見出し: 行頭の # 〜 ######
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+# 行要素・インライン装飾
+_UNORDERED_LIST_PATTERN = re.compile(r"^\s*[-*+]\s+(.+)$")
+_ORDERED_LIST_PATTERN = re.compile(r"^\s*\d+\.\s+(.+)$")
+_BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_PATTERN = re.compile(r"\*(.+?)\*")
+
+# parse_simple_kumihan の結果の parser 値
+SIMPLE_PARSER_NAME = "CoreMarkerParser-SimpleMode"
+# parse_simple_kumihan の要素区分数（0=装飾ブロック, 1=見出し, 2=行要素）
+SIMPLE_CATEGORY_COUNT = 3
+
+
+def simple_element_category(element: Dict[str, Any]) -> int:
+    """parse_simple_kumihan の要素区分（出力は区分順に並ぶ）"""
+    element_type = str(element.get("type", ""))
+    if element_type == "kumihan_block":
+        return 0
+    if element_type.startswith("heading_"):
+        return 1
+    return 2
+
+
+def simple_segments_independent(text: str, segment_texts: List[str]) -> bool:
+    """改行区切りの分割ごとの parse_simple_kumihan 結果を結合できるか検証
+
+    分割ごとの解析結果を区分順に結合して一括解析と一致させるため、
+    装飾ブロック・見出しのマッチがいずれも1分割内に収まることを確認する。
+
+    Args:
+        text: 文書全体のテキスト
+        segment_texts: text を改行位置で分割した各部分（"\n" で結合すると text）
+    """
+    starts: List[int] = []
+    position = 0
+    for segment_text in segment_texts:
+        starts.append(position)
+        position += len(segment_text) + 1
+
+    def segment_of(offset: int) -> int:
+        return bisect_right(starts, offset) - 1
+
+    block_ranges: List[Tuple[int, int]] = []
+    for match in KUMIHAN_BLOCK_PATTERN.finditer(text):
+        if segment_of(match.start()) != segment_of(match.end() - 1):
+            return False
+        block_ranges.append((match.start(), match.end()))
+
+    block_starts = [start for start, _end in block_ranges]
+    for match in HEADING_PATTERN.finditer(text):
+        if segment_of(match.start()) == segment_of(match.end() - 1):
+            continue
+        # 装飾ブロック内から始まる見出しマッチはどちらの解析でも除外される。
+        # ただしマッチが次の分割の先頭行を消費するため、その行が単独で
+        # 見出しになる場合は結果が変わる
+        index = bisect_right(block_starts, match.start()) - 1
+        inside_block = index >= 0 and match.start() < block_ranges[index][1]
+        next_start = starts[segment_of(match.end() - 1)]
+        if inside_block and not HEADING_PATTERN.match(text, next_start):
+            continue
+        return False
+
+    return True
+
+
+class _RangeIndex:
+    """開始位置の昇順に追加される、互いに重ならない処理済み範囲の集合"""
+
+    def __init__(self) -> None:
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+
+    def append(self, start: int, end: int) -> None:
+        self._starts.append(start)
+        self._ends.append(end)
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """start または end が既存範囲に含まれるか
+
+        判定条件は従来の `s <= start < e or s < end <= e` と同一。
+        """
+        index = bisect_right(self._starts, start) - 1
+        if index >= 0 and start < self._ends[index]:
+            return True
+        index = bisect_left(self._starts, end) - 1
+        return index >= 0 and end <= self._ends[index]
+
 
 class CoreMarkerParser:
     """統合マーカーパーサー - Phase3最適化版
@@ -59,10 +152,8 @@ class CoreMarkerParser:
 
     def _initialize_patterns(self) -> None:
         """基本パターンを初期化（プロセッサーに委譲済み）"""
-        # 基本マーカーパターンのみ保持
-        self.marker_pattern = re.compile(
-            r"# ?([^#]+) ?#([^#]*)##", re.MULTILINE | re.DOTALL
-        )
+        # 基本マーカーパターンのみ保持（共有レジストリのコンパイル済みパターン）
+        self.marker_pattern = get_grammar().marker
 
         # その他のパターンはプロセッサーに委譲済み
 
@@ -181,116 +272,65 @@ class CoreMarkerParser:
             }
 
     def parse_simple_kumihan(self, text: str) -> Dict[str, Any]:
-        """シンプルKumihan記法の解析（SimpleKumihanParserとの互換性確保）"""
+        """シンプルKumihan記法の解析（SimpleKumihanParserとの互換性確保）
+
+        装飾ブロック・見出しは正規表現の走査で、その他は各行を1回だけ分類する。
+        処理済み範囲との重なり判定は開始位置順の範囲リストを二分探索するため、
+        全体で行数に対してほぼ線形時間となる。
+        """
         try:
             elements: List[Dict[str, Any]] = []
-            processed_ranges = []
 
             # Kumihan装飾ブロックの解析 - よりゆるいパターンを使用
             # パターン: # 装飾名 #内容##
-            kumihan_pattern = re.compile(r"#\s*([^#]+?)\s*#([^#]+?)##")
-            decorated_matches = list(kumihan_pattern.finditer(text))
-
-            for match in decorated_matches:
-                decoration = match.group(1).strip()
-                content = match.group(2).strip()
-
+            block_ranges = _RangeIndex()
+            for match in KUMIHAN_BLOCK_PATTERN.finditer(text):
                 elements.append(
                     {
                         "type": "kumihan_block",
-                        "content": content,
-                        "attributes": {"decoration": decoration},
+                        "content": match.group(2).strip(),
+                        "attributes": {"decoration": match.group(1).strip()},
                         "children": [],
                     }
                 )
-                processed_ranges.append((match.start(), match.end()))
+                block_ranges.append(match.start(), match.end())
 
             # 見出しの解析（処理済み範囲を除外）
-            heading_pattern = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
-            for match in heading_pattern.finditer(text):
-                is_overlapping = any(
-                    start <= match.start() < end or start < match.end() <= end
-                    for start, end in processed_ranges
-                )
-
-                if not is_overlapping:
-                    level = len(match.group(1))
-                    title = match.group(2).strip()
-
-                    elements.append(
-                        {
-                            "type": f"heading_{level}",
-                            "content": title,
-                            "attributes": {"level": str(level)},
-                            "children": [],
-                        }
-                    )
-                    processed_ranges.append((match.start(), match.end()))
-
-            # 基本的なマークダウン要素の処理
-            lines = text.split("\n")
-            current_position = 0
-
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    current_position += 1
+            # finditer のマッチ同士は重ならないため、装飾ブロックとのみ判定
+            heading_ranges = _RangeIndex()
+            for match in HEADING_PATTERN.finditer(text):
+                if block_ranges.overlaps(match.start(), match.end()):
                     continue
 
-                # この行がすでに処理済みかチェック
-                line_start = text.find(line, current_position)
-                line_end = line_start + len(line)
-
-                is_processed = any(
-                    start <= line_start < end or start < line_end <= end
-                    for start, end in processed_ranges
+                level = len(match.group(1))
+                elements.append(
+                    {
+                        "type": f"heading_{level}",
+                        "content": match.group(2).strip(),
+                        "attributes": {"level": str(level)},
+                        "children": [],
+                    }
                 )
-
-                if not is_processed:
-                    # リストアイテム
-                    list_pattern = re.compile(r"^\s*[-*+]\s+(.+)$")
-                    list_match = list_pattern.match(line)
-                    if list_match:
-                        elements.append(
-                            {
-                                "type": "list_item",
-                                "content": list_match.group(1).strip(),
-                                "attributes": {"list_type": "unordered"},
-                                "children": [],
-                            }
-                        )
-                    # 番号付きリスト
-                    else:
-                        numbered_pattern = re.compile(r"^\s*\d+\.\s+(.+)$")
-                        numbered_match = numbered_pattern.match(line)
-                        if numbered_match:
-                            elements.append(
-                                {
-                                    "type": "list_item",
-                                    "content": numbered_match.group(1).strip(),
-                                    "attributes": {"list_type": "ordered"},
-                                    "children": [],
-                                }
-                            )
-                        # 通常のテキスト
-                        else:
-                            # インライン装飾の処理
-                            processed_content = self._process_inline_formatting(line)
-                            elements.append(
-                                {
-                                    "type": "paragraph",
-                                    "content": processed_content,
-                                    "attributes": {},
-                                    "children": [],
-                                }
-                            )
-
-                current_position = line_end + 1
+                heading_ranges.append(match.start(), match.end())
+
+            # 基本的なマークダウン要素の処理（各行を1回だけ分類）
+            line_offset = 0
+            for raw_line in text.split("\n"):
+                line = raw_line.strip()
+                if line:
+                    # 行内の内容開始位置（前後空白を除いた位置）で処理済み判定
+                    line_start = line_offset + len(raw_line) - len(raw_line.lstrip())
+                    line_end = line_start + len(line)
+                    if not block_ranges.overlaps(
+                        line_start, line_end
+                    ) and not heading_ranges.overlaps(line_start, line_end):
+                        elements.append(self._classify_simple_line(line))
+                line_offset += len(raw_line) + 1
 
             return {
                 "status": "success",
                 "elements": elements,
-                "parser": "CoreMarkerParser-SimpleMode",
+                "parser": SIMPLE_PARSER_NAME,
                 "total_elements": len(elements),
             }
 
@@ -300,9 +340,39 @@ class CoreMarkerParser:
                 "status": "error",
                 "error": str(e),
                 "elements": [],
-                "parser": "CoreMarkerParser-SimpleMode",
+                "parser": SIMPLE_PARSER_NAME,
+            }
+
+    def _classify_simple_line(self, line: str) -> Dict[str, Any]:
+        """前後空白を除いた1行をリスト項目・段落のいずれかに分類"""
+        # リストアイテム
+        list_match = _UNORDERED_LIST_PATTERN.match(line)
+        if list_match:
+            return {
+                "type": "list_item",
+                "content": list_match.group(1).strip(),
+                "attributes": {"list_type": "unordered"},
+                "children": [],
             }
 
+        # 番号付きリスト
+        numbered_match = _ORDERED_LIST_PATTERN.match(line)
+        if numbered_match:
+            return {
+                "type": "list_item",
+                "content": numbered_match.group(1).strip(),
+                "attributes": {"list_type": "ordered"},
+                "children": [],
+            }
+
+        # 通常のテキスト（インライン装飾の処理）
+        return {
+            "type": "paragraph",
+            "content": self._process_inline_formatting(line),
+            "attributes": {},
+            "children": [],
+        }
+
     def validate(self, text: str) -> List[str]:
         """基本的な構文検証（SimpleKumihanParser互換）"""
         errors = []
@@ -320,11 +390,9 @@ class CoreMarkerParser:
     def _process_inline_formatting(self, text: str) -> str:
         """インライン装飾の処理（SimpleKumihanParser互換）"""
         # 太字
-        bold_pattern = re.compile(r"\*\*(.+?)\*\*")
-        text = bold_pattern.sub(r"<strong>\1</strong>", text)
+        text = _BOLD_PATTERN.sub(r"<strong>\1</strong>", text)
         # イタリック
-        italic_pattern = re.compile(r"\*(.+?)\*")
-        text = italic_pattern.sub(r"<em>\1</em>", text)
+        text = _ITALIC_PATTERN.sub(r"<em>\1</em>", text)
         return text
 
     # === プロセッサーへの委譲メソッド（後方互換性） ===
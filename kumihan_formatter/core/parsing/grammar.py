@@ -0,0 +1,180 @@
+"""Grammar Registry - 記法定義の共有レジストリ
+
+パーサー・プロセッサーが使用するコンパイル済み正規表現、有効キーワード集合、
+装飾名 → CSSクラスの対応表をプロセス全体で1度だけ構築して共有する。
+各パーサーはインスタンス生成時にパターンをコンパイルせず、
+get_grammar() の結果を参照する。
+
+レジストリは不変（MappingProxyType / frozenset）であり、スレッド間で共有できる。
+"""
+
+import functools
+import re
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Pattern
+
+from ..syntax.syntax_rules import SyntaxRules
+
+
+@dataclass(frozen=True)
+class Grammar:
+    """記法定義（不変）
+
+    Attributes:
+        new_format: NewFormatProcessor 用パターン
+        ruby: RubyFormatProcessor 用パターン
+        inline: InlineMarkerProcessor 用パターン
+        markdown: UnifiedMarkdownParser 用パターン
+        marker: CoreMarkerParser の基本マーカーパターン
+        valid_keywords: 有効なキーワード
+        color_keywords: color属性を受け付けるキーワード
+        heading_keywords: 見出しキーワード
+        keyword_aliases: 新記法キーワードの正規化（日本語 → 英語名）
+        keyword_classes: キーワード → CSSクラス名（HTMLCSSProcessor）
+        decoration_classes: 装飾名 → ブロックのCSSクラス（MainRenderer）
+        simple_decoration_classes: 装飾名 → CSSクラス（SimpleCompatRenderer）
+    """
+
+    new_format: Mapping[str, Pattern[str]]
+    ruby: Mapping[str, Pattern[str]]
+    inline: Mapping[str, Pattern[str]]
+    markdown: Mapping[str, Pattern[str]]
+    marker: Pattern[str]
+    valid_keywords: frozenset[str]
+    color_keywords: frozenset[str]
+    heading_keywords: frozenset[str]
+    keyword_aliases: Mapping[str, str]
+    keyword_classes: Mapping[str, str]
+    decoration_classes: Mapping[str, str]
+    simple_decoration_classes: Mapping[str, str]
+
+    def is_valid_keyword(self, keyword: str) -> bool:
+        """キーワードが有効か判定"""
+        return keyword in self.valid_keywords
+
+
+@functools.lru_cache(maxsize=None)
+def get_grammar() -> Grammar:
+    """共有の記法定義を取得（初回呼び出し時に構築）
+
+    Returns:
+        Grammar: プロセス内で共有される記法定義
+    """
+    return Grammar(
+        new_format=MappingProxyType(
+            {
+                "marker": re.compile(
+                    r"# (?P<keyword>[^#]+) #(?P<content>[^#]*)##",
+                    re.MULTILINE | re.DOTALL,
+                ),
+                "compound_keyword": re.compile(r"[,+&]"),
+                "attribute": re.compile(r'(\w+)=(["\']?)([^"\'\s]*)\2'),
+                "color": re.compile(r"(?:color|色)[:=]\s*([#\w]+)", re.IGNORECASE),
+            }
+        ),
+        ruby=MappingProxyType(
+            {
+                # 基本ルビ: 漢字(ひらがな)
+                "basic": re.compile(r"([^\s\(\)]+)\(([^\)]+)\)", re.UNICODE),
+                # 複雑なルビ: |漢字《ひらがな》
+                "complex": re.compile(r"\|([^《]+)《([^》]+)》", re.UNICODE),
+                # 英語ルビ: word(pronunciation)
+                "english": re.compile(
+                    r"([a-zA-Z]+)\(([a-zA-Z\s\/\-\.]+)\)", re.IGNORECASE
+                ),
+                # HTMLルビ: <ruby>漢字<rt>ひらがな</rt></ruby>
+                "html": re.compile(
+                    r"<ruby>([^<]+)<rt>([^<]+)</rt></ruby>", re.IGNORECASE
+                ),
+                # ひらがな、カタカナ、漢字
+                "japanese": re.compile(r"[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]"),
+            }
+        ),
+        inline=MappingProxyType(
+            {
+                "strong": re.compile(r"\*\*(.*?)\*\*"),
+                "emphasis": re.compile(r"\*(.*?)\*"),
+                "code": re.compile(r"`(.*?)`"),
+                "link": re.compile(r"\[([^\]]*)\]\(([^)]+)\)"),
+                "marker": re.compile(r"#([^#\s]+)#([^#]*?)##"),
+            }
+        ),
+        markdown=MappingProxyType(
+            {
+                "heading": re.compile(r"^(#{1,6})\s+(.+)$"),
+                "bold": re.compile(r"\*\*([^*]+)\*\*"),
+                "italic": re.compile(r"\*([^*]+)\*"),
+                "code": re.compile(r"`([^`]+)`"),
+                "list_item": re.compile(r"^[\s]*[-*+]\s+(.+)$"),
+                "numbered_list": re.compile(r"^[\s]*\d+\.\s+(.+)$"),
+                "link": re.compile(r"\[([^\]]+)\]\(([^)]+)\)"),
+                "image": re.compile(r"!\[([^\]]*)\]\(([^)]+)\)"),
+            }
+        ),
+        marker=re.compile(r"# ?([^#]+) ?#([^#]*)##", re.MULTILINE | re.DOTALL),
+        valid_keywords=SyntaxRules.VALID_KEYWORDS,
+        color_keywords=SyntaxRules.COLOR_KEYWORDS,
+        heading_keywords=SyntaxRules.HEADING_KEYWORDS,
+        keyword_aliases=MappingProxyType(
+            {
+                "太字": "bold",
+                "イタリック": "italic",
+                "見出し": "heading",
+                "脚注": "footnote",
+                "リンク": "link",
+                "画像": "image",
+                "引用": "quote",
+                "コード": "code",
+            }
+        ),
+        keyword_classes=MappingProxyType(
+            {
+                "太字": "bold",
+                "ボールド": "bold",
+                "イタリック": "italic",
+                "斜体": "italic",
+                "見出し": "heading",
+                "ヘッダー": "header",
+                "タイトル": "title",
+                "脚注": "footnote",
+                "注釈": "annotation",
+                "リンク": "link",
+                "画像": "image",
+                "図": "figure",
+                "コード": "code",
+                "引用": "quote",
+                "リスト": "list",
+                "テーブル": "table",
+                "表": "table",
+            }
+        ),
+        decoration_classes=MappingProxyType(
+            {
+                "重要": "important",
+                "情報": "info",
+                "注意": "warning",
+                "注目": "warning",
+                "メモ": "note",
+                "覚書": "note",
+                # 英語版
+                "important": "important",
+                "info": "info",
+                "warning": "warning",
+                "note": "note",
+            }
+        ),
+        simple_decoration_classes=MappingProxyType(
+            {
+                "重要": "important",
+                "注意": "warning",
+                "情報": "info",
+                "引用": "quote",
+                "コード": "code",
+                "例": "example",
+            }
+        ),
+    )
+
+
+__all__ = ["Grammar", "get_grammar"]
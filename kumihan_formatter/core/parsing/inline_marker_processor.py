@@ -4,11 +4,11 @@ core_marker_parser.py分割により抽出 (Phase3最適化)
 インラインマーカー処理関連の機能をすべて統合
 """
 
-import re
 from typing import Any, Dict, List, Match, Optional
 import logging
 
 from ..ast_nodes import Node, create_node, error_node
+from .grammar import get_grammar
 
 
 class InlineMarkerProcessor:
@@ -18,14 +18,8 @@ class InlineMarkerProcessor:
         """インラインマーカープロセッサーを初期化"""
         self.logger = logging.getLogger(__name__)
 
-        # インライン記法パターン
-        self.inline_patterns = {
-            "strong": re.compile(r"\*\*(.*?)\*\*"),
-            "emphasis": re.compile(r"\*(.*?)\*"),
-            "code": re.compile(r"`(.*?)`"),
-            "link": re.compile(r"\[([^\]]*)\]\(([^)]+)\)"),
-            "marker": re.compile(r"#([^#\s]+)#([^#]*?)##"),
-        }
+        # インライン記法パターン（共有レジストリのコンパイル済みパターン）
+        self.inline_patterns = get_grammar().inline
 
     def process_inline_markers(self, text: str) -> List[Node]:
         """インラインマーカーを処理してノードリストを生成
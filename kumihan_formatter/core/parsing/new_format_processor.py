@@ -8,6 +8,7 @@ import re
 from typing import Any, Dict, List, Optional, TYPE_CHECKING, Tuple
 
 from ..ast_nodes import Node, create_node, error_node
+from .grammar import get_grammar
 import logging
 
 if TYPE_CHECKING:
@@ -22,20 +23,20 @@ class NewFormatProcessor:
         self._initialize_patterns()
 
     def _initialize_patterns(self) -> None:
-        """新記法パターンを初期化"""
+        """新記法パターンを初期化（共有レジストリのコンパイル済みパターンを参照）"""
+        patterns = get_grammar().new_format
+
         # 新記法のパターン定義
-        self.new_format_pattern = re.compile(
-            r"# (?P<keyword>[^#]+) #(?P<content>[^#]*)##", re.MULTILINE | re.DOTALL
-        )
+        self.new_format_pattern = patterns["marker"]
 
         # 複合キーワードパターン
-        self.compound_keyword_pattern = re.compile(r"[,+&]")
+        self.compound_keyword_pattern = patterns["compound_keyword"]
 
         # 属性パターン
-        self.attribute_pattern = re.compile(r'(\w+)=(["\']?)([^"\'\s]*)\2')
+        self.attribute_pattern = patterns["attribute"]
 
         # 色属性パターン
-        self.color_pattern = re.compile(r"(?:color|色)[:=]\s*([#\w]+)", re.IGNORECASE)
+        self.color_pattern = patterns["color"]
 
     def parse_new_format_marker(
         self, text: str, start_index: int = 0
@@ -232,20 +233,8 @@ class NewFormatProcessor:
         # 前後の空白除去
         normalized = keyword.strip()
 
-        # 日本語キーワードマッピング
-        jp_mappings = {
-            "太字": "bold",
-            "イタリック": "italic",
-            "見出し": "heading",
-            "脚注": "footnote",
-            "リンク": "link",
-            "画像": "image",
-            "引用": "quote",
-            "コード": "code",
-        }
-
-        # マッピングが存在すれば適用
-        return jp_mappings.get(normalized, normalized.lower())
+        # 日本語キーワードマッピングが存在すれば適用
+        return get_grammar().keyword_aliases.get(normalized, normalized.lower())
 
     def create_new_format_node(
         self, keyword: str, content: str, attributes: Optional[Dict[str, Any]] = None
@@ -0,0 +1,161 @@
+"""並列行解析 - ParallelProcessingConfig に基づくチャンク並列実行
+
+Parser の並列解析パスの共通実装。行リストを
+ParallelProcessingConfig.calculate_chunk_size() の大きさに分割し、
+チャンク順のリオーダーバッファ（iter_ordered_results）で並列処理する。
+
+- chunk_timeout_seconds: 先頭チャンクの完了待ち上限
+- processing_timeout_seconds: 解析全体の上限（完了待ちの途中でも打ち切り、
+  ParallelProcessingError を送出）
+- memory_warning_threshold_mb / memory_critical_threshold_mb:
+  MemoryAdmissionController による投入制御（警告で並列度を半減、限界で逐次化）
+- キャンセル: is_cancelled() が True になると未着手チャンクを取り消して終了
+- バックエンド: 既定はスレッド。ワーカープロセスは呼び出し側が "process" または
+  "auto" を指定した場合のみ使う（起動・pickle のコストを回収できるのは
+  1行あたりの処理が重いチャンク関数に限られ、プロセス起動には
+  ``if __name__ == "__main__":`` ガードも必要なため）
+"""
+
+import functools
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ..processing.memory_admission import MemoryAdmissionController
+from ..processing.process_backend import (
+    BACKEND_AUTO,
+    BACKEND_THREAD,
+    iter_ordered_results,
+    run_chunk,
+    select_backend,
+)
+from ..types import ChunkInfo
+
+
+@dataclass
+class ParallelParseMetrics:
+    """並列解析の実行メトリクス（直近の1回分）"""
+
+    mode: str = "sequential"
+    backend: str = BACKEND_THREAD
+    workers: int = 0
+    chunk_size: int = 0
+    total_lines: int = 0
+    total_chunks: int = 0
+    completed_chunks: int = 0
+    failed_chunks: int = 0
+    timed_out_chunks: int = 0
+    cancelled: bool = False
+    memory_throttled: int = 0
+    peak_memory_mb: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def lines_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total_lines / self.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        metrics = asdict(self)
+        metrics["lines_per_second"] = round(self.lines_per_second, 1)
+        return metrics
+
+
+def iter_parallel_chunks(
+    lines: Sequence[str],
+    chunk_func: Callable[[ChunkInfo], Any],
+    config: Any,
+    metrics: ParallelParseMetrics,
+    is_cancelled: Callable[[], bool] = lambda: False,
+    max_workers: Optional[int] = None,
+    admission: Optional[MemoryAdmissionController] = None,
+    backend: str = BACKEND_THREAD,
+) -> Iterator[Tuple[ChunkInfo, List[Any], Optional[Exception]]]:
+    """行リストをチャンク並列で処理し、チャンク順に結果を返す
+
+    Args:
+        lines: 解析対象の行リスト
+        chunk_func: 1チャンクを処理する関数（結果はリスト化される）
+        config: ParallelProcessingConfig
+        metrics: 実行メトリクスの記録先
+        is_cancelled: キャンセル判定
+        max_workers: ワーカー数（省略時は CPU 数）
+        admission: メモリ予算による投入制御（省略時は config の
+            memory_warning_threshold_mb / memory_critical_threshold_mb から作成）
+        backend: "thread"（既定）/ "process" / "auto"（処理量と chunk_func の
+            pickle 可否から select_backend で選択）
+
+    Yields:
+        (チャンク, 結果リスト, 例外 or None)
+
+    Raises:
+        ParallelProcessingError: processing_timeout_seconds を超過した場合
+    """
+    from .parser_core import ParallelProcessingError
+
+    start_time = time.perf_counter()
+    workers = max_workers or os.cpu_count() or 1
+    chunk_size = config.calculate_chunk_size(len(lines), workers)
+    chunks = [
+        ChunkInfo(
+            chunk_id=chunk_id,
+            start_line=start + 1,
+            end_line=min(start + chunk_size, len(lines)),
+            lines=list(lines[start : start + chunk_size]),
+            file_position=start,
+        )
+        for chunk_id, start in enumerate(range(0, len(lines), chunk_size))
+    ]
+    if backend == BACKEND_AUTO:
+        backend = select_backend(len(lines), len(chunks), workers, chunk_func)
+
+    metrics.mode = "parallel"
+    metrics.backend = backend
+    metrics.workers = workers
+    metrics.chunk_size = chunk_size
+    metrics.total_lines = len(lines)
+    metrics.total_chunks = len(chunks)
+
+    worker = functools.partial(run_chunk, processing_func=chunk_func)
+    deadline = start_time + config.processing_timeout_seconds
+    if admission is None and config.enable_memory_monitoring:
+        admission = MemoryAdmissionController(
+            limit_mb=config.memory_critical_threshold_mb,
+            warning_mb=config.memory_warning_threshold_mb,
+        )
+
+    stream = iter_ordered_results(
+        chunks,
+        worker,
+        workers,
+        backend,
+        timeout=config.chunk_timeout_seconds,
+        admission=admission,
+        deadline=deadline,
+    )
+    try:
+        for chunk, results, error in stream:
+            if isinstance(error, TimeoutError):
+                metrics.timed_out_chunks += 1
+            elif error is not None:
+                metrics.failed_chunks += 1
+            else:
+                metrics.completed_chunks += 1
+            yield chunk, results, error
+
+            if is_cancelled():
+                metrics.cancelled = True
+                return
+            if time.perf_counter() > deadline:
+                raise ParallelProcessingError(
+                    f"並列解析がタイムアウトしました "
+                    f"({config.processing_timeout_seconds}秒)"
+                )
+    finally:
+        stream.close()
+        metrics.elapsed_seconds = time.perf_counter() - start_time
+        if admission is not None:
+            metrics.memory_throttled = admission.throttled
+            metrics.peak_memory_mb = round(admission.peak_mb, 1)
@@ -4,13 +4,25 @@ parser.py分割により抽出 (Phase3最適化)
 メインParserクラスの実装
 """
 
+import os
 import threading
 import time
 from typing import Any, Dict, List, Optional
 
-from ..ast_nodes import Node, error_node
+from ..ast_nodes import CompactNode, Node, NodeArena, error_node
+from ..processing.process_backend import (
+    BACKEND_AUTO,
+    BACKEND_PROCESS,
+    BACKEND_THREAD,
+    select_backend,
+)
+from ..types import ChunkInfo
+from .parallel_parsing import ParallelParseMetrics, iter_parallel_chunks
 import logging
 
+# str.splitlines() が行区切りとみなす文字
+_LINE_BREAK_CHARS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
 
 # 統合最適化後：削除されたモジュールからの局所定義
 class ParallelProcessingError(Exception):
@@ -79,6 +91,12 @@ class ParallelProcessingConfig:
         self.processing_timeout_seconds = 300  # 5分
         self.chunk_timeout_seconds = 30  # 30秒
 
+        # 実行バックエンド（"thread" / "process" / "auto"）
+        # 行単位の解析は GIL を保持したままの純Python処理のため、スレッドでは
+        # 速くならず、プロセスでは転送コストを回収できない。Parser.parse は
+        # "process" / "auto"（プロセスが選ばれる場合）のみ並列解析する
+        self.backend = BACKEND_THREAD
+
         # パフォーマンス設定
         self.enable_progress_callbacks = True
         self.progress_update_interval = 100  # 行数
@@ -98,8 +116,11 @@ class ParallelProcessingConfig:
         Environment Variables:
             KUMIHAN_PARALLEL_THRESHOLD_LINES: 並列処理開始行数しきい値
             KUMIHAN_PARALLEL_THRESHOLD_SIZE: 並列処理開始サイズしきい値
+            KUMIHAN_PARALLEL_CHUNKS_PER_CORE: CPUコアあたりのチャンク数
+            KUMIHAN_PARALLEL_CHUNK_TIMEOUT: チャンク処理タイムアウト値（秒）
             KUMIHAN_MEMORY_LIMIT_MB: メモリ制限値（MB）
             KUMIHAN_PROCESSING_TIMEOUT: 処理タイムアウト値（秒）
+            KUMIHAN_PARALLEL_BACKEND: 実行バックエンド（thread / process / auto）
         """
         import os
 
@@ -118,6 +139,18 @@ class ParallelProcessingConfig:
             except ValueError:
                 pass
 
+        if chunks_per_core := os.getenv("KUMIHAN_PARALLEL_CHUNKS_PER_CORE"):
+            try:
+                config.target_chunks_per_core = int(chunks_per_core)
+            except ValueError:
+                pass
+
+        if chunk_timeout := os.getenv("KUMIHAN_PARALLEL_CHUNK_TIMEOUT"):
+            try:
+                config.chunk_timeout_seconds = int(chunk_timeout)
+            except ValueError:
+                pass
+
         if memory_limit := os.getenv("KUMIHAN_MEMORY_LIMIT_MB"):
             try:
                 memory_limit_int = int(memory_limit)
@@ -132,6 +165,10 @@ class ParallelProcessingConfig:
             except ValueError:
                 pass
 
+        backend = os.getenv("KUMIHAN_PARALLEL_BACKEND", "").strip().lower()
+        if backend in (BACKEND_THREAD, BACKEND_PROCESS, BACKEND_AUTO):
+            config.backend = backend
+
         return config
 
     def validate(self) -> bool:
@@ -148,6 +185,7 @@ class ParallelProcessingConfig:
             - チャンクサイズの最小値 < 最大値
             - メモリ警告値 < クリティカル値
             - タイムアウト値が正の値
+            - バックエンドが thread / process / auto のいずれか
         """
         try:
             assert self.parallel_threshold_lines > 0
@@ -157,10 +195,53 @@ class ParallelProcessingConfig:
             assert self.memory_warning_threshold_mb > 0
             assert self.memory_critical_threshold_mb > self.memory_warning_threshold_mb
             assert self.processing_timeout_seconds > 0
+            assert self.backend in (BACKEND_THREAD, BACKEND_PROCESS, BACKEND_AUTO)
             return True
         except AssertionError:
             return False
 
+    def should_use_parallel_processing(
+        self, line_count: int, content_size: int
+    ) -> bool:
+        """並列処理を使用するべきかの判定
+
+        Args:
+            line_count: 行数
+            content_size: テキストサイズ（文字数）
+
+        Returns:
+            bool: 行数・サイズのいずれかがしきい値以上の場合True
+        """
+        return (
+            line_count >= self.parallel_threshold_lines
+            or content_size >= self.parallel_threshold_size
+        )
+
+    def calculate_chunk_size(self, total_lines: int, core_count: int = 1) -> int:
+        """最適なチャンクサイズを計算
+
+        コアあたり target_chunks_per_core 個のチャンクになるよう分割し、
+        min_chunk_size〜max_chunk_size の範囲に収める。
+
+        Args:
+            total_lines: 総行数
+            core_count: ワーカー数
+
+        Returns:
+            int: チャンクあたりの行数
+        """
+        target_chunks = max(core_count * self.target_chunks_per_core, 1)
+        ideal_chunk_size = max(total_lines // target_chunks, self.min_chunk_size)
+        return min(ideal_chunk_size, self.max_chunk_size)
+
+
+def _parse_chunk_lines(chunk: ChunkInfo) -> List[Node]:
+    """チャンク内の行をテキストノードに変換（ワーカースレッド・プロセスで実行可能）
+
+    Parser._parse_line と同じく空行を除いた各行をテキストノードにする。
+    """
+    return [CompactNode("text", line) for line in chunk.lines if line.strip()]
+
 
 from ...parsers.unified_keyword_parser import (
     UnifiedKeywordParser as KeywordParser,
@@ -208,8 +289,9 @@ class Parser:
         self.graceful_errors: List[str] = []
         self.graceful_syntax_errors: List[str] = []
 
-        # 並列処理設定
-        self.parallel_config = ParallelProcessingConfig()
+        # 並列処理設定（KUMIHAN_PARALLEL_* 等の環境変数を反映）
+        self.parallel_config = ParallelProcessingConfig.from_environment()
+        self.parallel_metrics = ParallelParseMetrics()
 
         # パーサー初期化（統合最適化後：利用可能なもののみ）
         try:
@@ -217,7 +299,6 @@ class Parser:
         except Exception:
             self.keyword_parser = None
 
-        # 統合最適化後: 並列処理は無効化（簡素化のため）
         self.parallel_processor = None
 
         # しきい値設定
@@ -248,7 +329,9 @@ class Parser:
         Args:
             content (str): 解析対象のKumihan記法テキスト
             use_parallel (bool, optional): 並列処理使用フラグ。Defaults to True.
-                （注：統合最適化後は逐次処理のみ使用）
+                行数・サイズが parallel_config のしきい値以上で、かつ
+                parallel_config.backend がワーカープロセスを使う場合に並列解析する
+                （スレッドでは速くならないため逐次解析する）
 
         Returns:
             List[Node]: 解析されたASTノードのリスト
@@ -269,8 +352,16 @@ class Parser:
         self._cancelled = False
 
         try:
-            # 統合最適化後：逐次処理のみ（並列処理は無効化）
-            result = self.parse_streaming_from_text(content)
+            backend = (
+                self._resolve_parallel_backend(len(self.lines), len(content))
+                if use_parallel
+                else None
+            )
+            if backend is not None:
+                result = self.parse_parallel_streaming(content, backend)
+            else:
+                self.parallel_metrics = ParallelParseMetrics()
+                result = self.parse_streaming_from_text(content)
 
             # パフォーマンス統計記録
             processing_time = time.time() - start_time
@@ -285,6 +376,25 @@ class Parser:
             self.add_error(f"解析エラー: {str(e)}")
             return [error_node(f"解析エラー: {str(e)}")]
 
+    def _resolve_parallel_backend(
+        self, line_count: int, content_size: int
+    ) -> Optional[str]:
+        """Parser.parse で並列解析に使うバックエンド（逐次解析なら None）"""
+        config = self.parallel_config
+        if config.backend == BACKEND_THREAD:
+            return None
+        if not config.should_use_parallel_processing(line_count, content_size):
+            return None
+        if config.backend == BACKEND_AUTO:
+            workers = self.config.get("max_workers") or os.cpu_count() or 1
+            chunk_size = config.calculate_chunk_size(line_count, workers)
+            chunk_count = -(-line_count // chunk_size)
+            backend = select_backend(
+                line_count, chunk_count, workers, _parse_chunk_lines
+            )
+            return backend if backend == BACKEND_PROCESS else None
+        return BACKEND_PROCESS
+
     def parse_optimized(self, content: str) -> List[Node]:
         """最適化された解析（シンプル版）
 
@@ -370,20 +480,81 @@ class Parser:
 
         return results
 
-    def parse_parallel_streaming(self, content: str) -> List[Node]:
-        """並列ストリーミング解析（統合アーキテクチャ対応）
+    def parse_to_arena(self, content: str) -> NodeArena:
+        """省メモリ解析（アリーナ形式）
+
+        parse() と同じ行単位のテキストノードを、個別の Node ではなく
+        NodeArena の配列カラムに格納する。各ノードの内容は元テキスト上の
+        オフセットとして保持し、行リストも保持しない。
+
+        Args:
+            content (str): 解析対象テキスト
+
+        Returns:
+            NodeArena: 解析結果（roots() で Node 互換ビューを取得）
+        """
+        arena = NodeArena(content)
+        self.lines = []
+        self.current = 0
+        self.errors = []
+        self._cancelled = False
+
+        offset = 0
+        for i, raw_line in enumerate(content.splitlines(keepends=True)):
+            if self._cancelled:
+                break
+
+            self.current = i
+            line = raw_line.rstrip(_LINE_BREAK_CHARS)
+            if line.strip():
+                arena.add("text", offset, offset + len(line))
+            offset += len(raw_line)
 
-        統合最適化後は逐次処理をメインとし、必要時のみ並列化。
-        現在の実装では逐次処理にフォールバック。
+        return arena
+
+    def parse_parallel_streaming(
+        self, content: str, backend: Optional[str] = None
+    ) -> List[Node]:
+        """並列ストリーミング解析
+
+        行リストを parallel_config に基づくチャンクに分割して並列に解析し、
+        チャンク順に結合する。結果は parse_streaming_from_text() と同一。
+        処理できなかったチャンクはエラーノードとして結果に含める。
+        Parser.parse からは parallel_config.backend（KUMIHAN_PARALLEL_BACKEND）に
+        "process" / "auto" を指定した場合のみ呼ばれる。
 
         Args:
             content (str): 解析対象テキスト
+            backend (Optional[str]): 実行バックエンド（省略時は parallel_config.backend）
 
         Returns:
             List[Node]: 解析結果のASTノードリスト
+
+        Raises:
+            ParallelProcessingError: processing_timeout_seconds を超過した場合
         """
-        # 統合最適化後は逐次処理をメインとし、必要時のみ並列化
-        return self.parse_streaming_from_text(content)
+        self.lines = content.splitlines()
+        self.parallel_metrics = ParallelParseMetrics()
+
+        results: List[Node] = []
+        for chunk, nodes, error in iter_parallel_chunks(
+            self.lines,
+            _parse_chunk_lines,
+            self.parallel_config,
+            self.parallel_metrics,
+            is_cancelled=lambda: self._cancelled,
+            max_workers=self.config.get("max_workers"),
+            backend=backend or self.parallel_config.backend,
+        ):
+            self.current = chunk.end_line - 1
+            if error is not None:
+                error_msg = f"行 {chunk.start_line}-{chunk.end_line}: {error!r}"
+                self.add_error(error_msg)
+                results.append(error_node(error_msg))
+                continue
+            results.extend(nodes)
+
+        return results
 
     def cancel_parsing(self) -> None:
         """解析をキャンセル
@@ -417,13 +588,26 @@ class Parser:
     def get_parallel_processing_metrics(self) -> Dict[str, Any]:
         """並列処理のメトリクスを取得
 
-        統合アーキテクチャでは並列処理を無効化しているため、
-        無効状態の情報を返す。
+        並列解析のしきい値と、直近の解析の実行状況
+        （チャンク数・ワーカー数・タイムアウト・処理速度等）を返す。
 
         Returns:
             Dict[str, Any]: 並列処理メトリクス辞書
         """
-        return {"parallel_processing": "disabled", "architecture": "unified"}
+        config = self.parallel_config
+        return {
+            "parallel_processing": "enabled",
+            "architecture": "unified",
+            "thresholds": {
+                "parallel_threshold_lines": config.parallel_threshold_lines,
+                "parallel_threshold_size": config.parallel_threshold_size,
+                "target_chunks_per_core": config.target_chunks_per_core,
+                "chunk_timeout_seconds": config.chunk_timeout_seconds,
+                "memory_critical_threshold_mb": config.memory_critical_threshold_mb,
+                "backend": config.backend,
+            },
+            "last_run": self.parallel_metrics.to_dict(),
+        }
 
     def _parse_line(self, line: str) -> Optional[Node]:
         """単一行の解析（統合最適化後）
@@ -442,11 +626,8 @@ class Parser:
 
         # 統合パーサーアーキテクチャを使用
         try:
-            # create_nodeのインポートを使用
-            from ..ast_nodes import create_node
-
-            # シンプルなテキストノード作成（統合最適化後）
-            return create_node("text", line)
+            # シンプルなテキストノード作成（属性は遅延確保）
+            return CompactNode("text", line)
 
         except Exception as e:
             self.logger.error(f"行解析エラー: {e}")
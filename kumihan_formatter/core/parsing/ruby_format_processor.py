@@ -4,11 +4,12 @@ core_marker_parser.py分割により抽出 (Phase3最適化)
 ルビ記法処理関連の機能をすべて統合
 """
 
-import re
 from typing import Any, Dict, List, Optional
 
 import logging
 
+from .grammar import get_grammar
+
 
 class RubyFormatProcessor:
     """ルビ記法処理専用クラス"""
@@ -18,22 +19,20 @@ class RubyFormatProcessor:
         self._initialize_patterns()
 
     def _initialize_patterns(self) -> None:
-        """ルビ記法パターンを初期化"""
+        """ルビ記法パターンを初期化（共有レジストリのコンパイル済みパターンを参照）"""
+        patterns = get_grammar().ruby
+
         # 基本ルビパターン: 漢字(ひらがな)
-        self.ruby_pattern = re.compile(r"([^\s\(\)]+)\(([^\)]+)\)", re.UNICODE)
+        self.ruby_pattern = patterns["basic"]
 
         # 複雑なルビパターン: |漢字《ひらがな》
-        self.complex_ruby_pattern = re.compile(r"\|([^《]+)《([^》]+)》", re.UNICODE)
+        self.complex_ruby_pattern = patterns["complex"]
 
         # 英語ルビパターン: word(pronunciation)
-        self.english_ruby_pattern = re.compile(
-            r"([a-zA-Z]+)\(([a-zA-Z\s\/\-\.]+)\)", re.IGNORECASE
-        )
+        self.english_ruby_pattern = patterns["english"]
 
         # HTMLルビパターン: <ruby>漢字<rt>ひらがな</rt></ruby>
-        self.html_ruby_pattern = re.compile(
-            r"<ruby>([^<]+)<rt>([^<]+)</rt></ruby>", re.IGNORECASE
-        )
+        self.html_ruby_pattern = patterns["html"]
 
     def parse_ruby_content(self, content: str) -> Optional[Dict[str, Any]]:
         """ルビコンテンツを解析
@@ -205,8 +204,7 @@ class RubyFormatProcessor:
             return False
 
         # ひらがな、カタカナ、漢字の範囲
-        japanese_pattern = re.compile(r"[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]")
-        return bool(japanese_pattern.search(text))
+        return bool(get_grammar().ruby["japanese"].search(text))
 
     def convert_to_html_ruby(self, content: str) -> str:
         """コンテンツをHTMLルビ形式に変換
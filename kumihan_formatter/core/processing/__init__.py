@@ -18,6 +18,8 @@ __all__ = [
     "SimpleMarkdownConverter",
     # 解析調整
     "ParsingCoordinator",
+    # インクリメンタル変換
+    "IncrementalConverter",
     # 文書分類
     "DocumentClassifier",
     "build_classification_rules",
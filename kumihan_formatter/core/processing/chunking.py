@@ -6,7 +6,16 @@ ProcessingManager. Behavior matches previous ad-hoc implementation.
 
 from __future__ import annotations
 
-from typing import Iterable, List
+import re
+from typing import Iterable, Iterator, List
+
+from ..types import ChunkInfo
+
+# Block notation (SPEC.md): opening line ``#keyword#`` ... closing line ``##``.
+# A line that opens with ``#keyword#`` but does not itself end with ``##``
+# leaves the block open until a line ending with ``##``.
+_BLOCK_OPEN_PATTERN = re.compile(r"^[#＃]\s*[^#＃\s][^#＃]*[#＃]")
+_BLOCK_CLOSE_SUFFIXES = ("##", "＃＃")
 
 
 class Chunker:
@@ -27,5 +36,123 @@ class Chunker:
             line_list[i : i + chunk_size] for i in range(0, len(line_list), chunk_size)
         ]
 
+    def create_block_aligned_chunks(
+        self, lines: Iterable[str], chunk_size: int
+    ) -> List[ChunkInfo]:
+        """Create chunks that never split a ``#keyword#`` ... ``##`` block.
+
+        A chunk is closed once it holds at least ``chunk_size`` lines, the
+        scanner is outside a block, and the last line is blank (a paragraph
+        boundary). If no blank line shows up before ``2 * chunk_size`` lines,
+        the chunk is closed at the next line outside a block instead.
+
+        Returns ``ChunkInfo`` objects whose ``start_line``/``end_line`` are
+        1-based and whose ``file_position`` is the 0-based line offset of the
+        chunk in the original document.
+        """
+        line_list = list(lines)
+        if chunk_size <= 0 or len(line_list) <= chunk_size:
+            return [ChunkInfo(0, 1, len(line_list), line_list, 0)] if line_list else []
+
+        chunks: List[ChunkInfo] = []
+        start = 0
+        in_block = False
+
+        for index, line in enumerate(line_list):
+            stripped = line.strip()
+            if in_block:
+                if stripped.endswith(_BLOCK_CLOSE_SUFFIXES):
+                    in_block = False
+            elif _BLOCK_OPEN_PATTERN.match(stripped) and not stripped.endswith(
+                _BLOCK_CLOSE_SUFFIXES
+            ):
+                in_block = True
+
+            size = index + 1 - start
+            if in_block or size < chunk_size:
+                continue
+            if stripped and size < chunk_size * 2:
+                continue
+
+            chunks.append(
+                ChunkInfo(
+                    chunk_id=len(chunks),
+                    start_line=start + 1,
+                    end_line=index + 1,
+                    lines=line_list[start : index + 1],
+                    file_position=start,
+                )
+            )
+            start = index + 1
+
+        if start < len(line_list):
+            chunks.append(
+                ChunkInfo(
+                    chunk_id=len(chunks),
+                    start_line=start + 1,
+                    end_line=len(line_list),
+                    lines=line_list[start:],
+                    file_position=start,
+                )
+            )
+
+        return chunks
+
+    def create_top_level_segments(self, lines: Iterable[str]) -> List[ChunkInfo]:
+        """Split a document into its top-level blocks.
+
+        A segment ends after a run of blank lines that is outside any
+        ``#keyword#`` ... ``##`` block, so each segment is one paragraph,
+        heading group, list or block plus its trailing blank lines.
+        Positions follow the same conventions as ``create_block_aligned_chunks``.
+        """
+        return list(self.iter_top_level_segments(lines))
+
+    def iter_top_level_segments(self, lines: Iterable[str]) -> Iterator[ChunkInfo]:
+        """Lazily yield the segments of ``create_top_level_segments``.
+
+        Only the lines of the current segment are held, so ``lines`` may be an
+        open file or any other stream of arbitrary length.
+        """
+        buffer: List[str] = []
+        start = 0
+        chunk_id = 0
+        in_block = False
+        after_blank = False
+
+        for line in lines:
+            stripped = line.strip()
+            # The first non-blank line after a blank run starts a new segment
+            if after_blank and stripped:
+                yield ChunkInfo(
+                    chunk_id=chunk_id,
+                    start_line=start + 1,
+                    end_line=start + len(buffer),
+                    lines=buffer,
+                    file_position=start,
+                )
+                chunk_id += 1
+                start += len(buffer)
+                buffer = []
+
+            buffer.append(line)
+            if in_block:
+                if stripped.endswith(_BLOCK_CLOSE_SUFFIXES):
+                    in_block = False
+            elif _BLOCK_OPEN_PATTERN.match(stripped) and not stripped.endswith(
+                _BLOCK_CLOSE_SUFFIXES
+            ):
+                in_block = True
+            after_blank = not in_block and not stripped
+
+        if buffer:
+            yield ChunkInfo(
+                chunk_id=chunk_id,
+                start_line=start + 1,
+                end_line=start + len(buffer),
+                lines=buffer,
+                file_position=start,
+            )
+
 
 __all__ = ["Chunker"]
@@ -0,0 +1,173 @@
+"""インクリメンタル変換 - ウォッチモード向け差分再変換
+
+文書をトップレベルブロック（装飾ブロック・見出し・段落など、空行区切り）に
+分割し、前回の内容と一致するブロックは解析結果・HTML断片を再利用する。
+変更のあったブロックだけを再解析・再レンダリングし、文書全体へ組み込む。
+
+parse_simple_kumihan は要素を「装飾ブロック → 見出し → 行要素」の順に
+出力するため、ブロックごとの結果も同じ区分順で結合する。ブロック境界を
+またぐ記法が含まれる場合や、文書全体がシンプルKumihan記法として扱われない
+場合は一括変換にフォールバックし、出力は常に一括変換と同一になる。
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from ..parsing.core_marker_parser import (
+    SIMPLE_CATEGORY_COUNT,
+    simple_element_category,
+    simple_segments_independent,
+)
+from .chunking import Chunker
+
+
+@dataclass
+class _Segment:
+    """トップレベルブロック1つ分の解析・レンダリング結果（区分別）"""
+
+    elements: Tuple[List[Dict[str, Any]], ...]
+    fragments: Tuple[List[str], ...]
+
+
+class IncrementalConverter:
+    """前回変換結果を保持し、変更ブロックのみ再変換するコンバーター
+
+    Args:
+        parser: MainParser インスタンス（省略時は生成）
+        renderer: MainRenderer インスタンス（省略時は生成）
+    """
+
+    def __init__(self, parser: Any = None, renderer: Any = None) -> None:
+        self.logger = logging.getLogger(__name__)
+        if parser is None:
+            from ...parsers.main_parser import MainParser
+
+            parser = MainParser()
+        if renderer is None:
+            from ..rendering.main_renderer import MainRenderer
+
+            renderer = MainRenderer()
+        self.parser = parser
+        self.renderer = renderer
+        self.chunker = Chunker()
+
+        self._segments: Dict[str, _Segment] = {}
+        self._elements: List[Dict[str, Any]] = []
+        self._stats = {
+            "updates": 0,
+            "incremental_updates": 0,
+            "full_conversions": 0,
+            "segments_reparsed": 0,
+            "segments_reused": 0,
+        }
+
+    @property
+    def elements(self) -> List[Dict[str, Any]]:
+        """直近の変換結果の要素リスト（インクリメンタル変換時のみ）"""
+        return self._elements
+
+    def convert(self, text: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """テキストをHTMLに変換（前回から変更のあったブロックのみ再処理）
+
+        Args:
+            text: 文書全体のテキスト
+            context: レンダリングコンテキスト（render() と同じ）
+
+        Returns:
+            完全なHTML文書（一括変換と同一の出力）
+        """
+        self._stats["updates"] += 1
+        try:
+            html = self._convert_incrementally(text, context)
+            if html is not None:
+                self._stats["incremental_updates"] += 1
+                return html
+        except Exception as e:
+            self.logger.warning(f"Incremental conversion failed, falling back: {e}")
+
+        return self._convert_full(text, context)
+
+    def reset(self) -> None:
+        """保持しているブロックキャッシュを破棄"""
+        self._segments.clear()
+        self._elements = []
+
+    def get_statistics(self) -> Dict[str, int]:
+        """変換統計を取得"""
+        return dict(self._stats)
+
+    def _convert_incrementally(
+        self, text: str, context: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        """ブロック単位で再利用して変換（適用できない場合はNone）"""
+        # 一括変換でシンプルKumihan記法が選ばれる文書のみ対象
+        if "##" not in text or "#" not in text:
+            return None
+
+        chunks = self.chunker.create_top_level_segments(text.split("\n"))
+        segment_texts = ["\n".join(chunk.lines) for chunk in chunks]
+        if not simple_segments_independent(text, segment_texts):
+            return None
+
+        segments: Dict[str, _Segment] = {}
+        ordered: List[_Segment] = []
+        for segment_text in segment_texts:
+            segment = segments.get(segment_text) or self._segments.get(segment_text)
+            if segment is None:
+                segment = self._parse_segment(segment_text)
+                if segment is None:
+                    return None
+                self._stats["segments_reparsed"] += 1
+            else:
+                self._stats["segments_reused"] += 1
+            segments[segment_text] = segment
+            ordered.append(segment)
+
+        elements = [
+            element
+            for category in range(SIMPLE_CATEGORY_COUNT)
+            for segment in ordered
+            for element in segment.elements[category]
+        ]
+        # 装飾ブロックが無い文書は一括変換で別パーサーが選ばれる
+        if not any(segment.elements[0] for segment in ordered):
+            return None
+
+        fragments = (
+            fragment
+            for category in range(SIMPLE_CATEGORY_COUNT)
+            for segment in ordered
+            for fragment in segment.fragments[category]
+        )
+        html = str(self.renderer.assemble_kumihan_document(fragments, context))
+
+        # 現在の文書に含まれるブロックのみ保持（古いブロックは破棄）
+        self._segments = segments
+        self._elements = elements
+        return html
+
+    def _parse_segment(self, segment_text: str) -> Optional[_Segment]:
+        """1ブロックを解析・レンダリングし区分別に保持"""
+        result = self.parser.marker_parser.parse_simple_kumihan(segment_text)
+        if not isinstance(result, dict) or result.get("status") != "success":
+            return None
+
+        elements: Tuple[List[Dict[str, Any]], ...] = tuple(
+            [] for _ in range(SIMPLE_CATEGORY_COUNT)
+        )
+        fragments: Tuple[List[str], ...] = tuple(
+            [] for _ in range(SIMPLE_CATEGORY_COUNT)
+        )
+        for element in result.get("elements", []):
+            category = simple_element_category(element)
+            elements[category].append(element)
+            fragments[category].append(self.renderer.render_element(element))
+        return _Segment(elements, fragments)
+
+    def _convert_full(self, text: str, context: Optional[Dict[str, Any]]) -> str:
+        """一括変換（ブロックキャッシュは破棄）"""
+        self._stats["full_conversions"] += 1
+        self.reset()
+        parsed_result = self.parser.parse(text, "auto")
+        return str(self.renderer.render(parsed_result, context))
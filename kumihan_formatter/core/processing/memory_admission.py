@@ -0,0 +1,255 @@
+"""
+メモリ予算に基づくチャンク投入制御（アドミッションコントロール）
+
+並列処理中のプロセス（親＋ワーカープロセス）の常駐メモリを計測し、
+設定された予算に近づくと新規チャンクの投入を絞る。
+
+- 通常: 投入制限なし（呼び出し側のウィンドウのみ）
+- 警告（warning_mb 以上）: 同時処理数をワーカー数の半分に制限し、
+  未返却の結果は SpilledResults により一時ファイルへ退避する
+- 限界（limit_mb 以上）: 処理中のチャンクがなくなるまで投入しない
+  （常に1チャンクずつ処理し、予算を超えて並列度を上げない）
+
+常駐メモリは psutil、/proc/<pid>/statm、resource.getrusage の順に取得する。
+"""
+
+import gc
+import logging
+import multiprocessing
+import os
+import pickle
+import tempfile
+import threading
+import time
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
+
+STATE_OK = "ok"
+STATE_WARNING = "warning"
+STATE_CRITICAL = "critical"
+
+# ワーカー1つあたりのメモリ見積り（ワーカープロセスを計測できない場合）
+DEFAULT_WORKER_MEMORY_MB = 32.0
+
+logger = logging.getLogger(__name__)
+
+
+def read_rss_mb(pid: Optional[int] = None) -> Optional[float]:
+    """プロセスの常駐メモリ（MB）を取得
+
+    Args:
+        pid: プロセスID（省略時は自プロセス）
+
+    Returns:
+        常駐メモリ（MB）。取得できない場合None
+    """
+    try:
+        import psutil
+
+        return float(psutil.Process(pid).memory_info().rss) / (1024 * 1024)
+    except ImportError:
+        pass  # psutil未利用環境では /proc を参照
+    except Exception:
+        return None
+
+    try:
+        with open(f"/proc/{pid or 'self'}/statm", "rb") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if pid is not None and pid != os.getpid():
+        return None
+    try:
+        import resource
+        import sys
+
+        # 最大常駐メモリ（Linux は KB、macOS は bytes 単位）
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+        return float(max_rss) / divisor
+    except (ImportError, OSError):
+        return None
+
+
+class MemoryAdmissionController:
+    """メモリ予算に基づくチャンク投入制御
+
+    Args:
+        limit_mb: メモリ予算（MB）。親プロセスと全ワーカープロセスの合計
+        warning_mb: 投入を絞り始める使用量（省略時は予算の80%）
+        sample_interval: 計測結果を再利用する秒数
+        probe: 常駐メモリ取得関数（pid → MB）
+
+    Examples:
+        >>> controller = MemoryAdmissionController(limit_mb=512)
+        >>> if controller.admit(in_flight=3, capacity=4):
+        ...     executor.submit(...)
+    """
+
+    def __init__(
+        self,
+        limit_mb: float,
+        warning_mb: Optional[float] = None,
+        sample_interval: float = 0.05,
+        probe: Optional[Callable[[Optional[int]], Optional[float]]] = None,
+    ) -> None:
+        self.limit_mb = float(limit_mb)
+        self.warning_mb = float(
+            warning_mb if warning_mb is not None else limit_mb * 0.8
+        )
+        self.sample_interval = sample_interval
+        self._probe = probe or read_rss_mb
+        self._lock = threading.Lock()
+        self._sampled_at = 0.0
+        self._usage_mb = 0.0
+        self._worker_mb: List[float] = []
+
+        self.peak_mb = 0.0
+        self.throttled = 0
+        self.serialized = 0
+        self.spilled_chunks = 0
+
+    def usage_mb(self) -> float:
+        """親プロセスとワーカープロセスの常駐メモリ合計（MB）"""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._sampled_at < self.sample_interval:
+                return self._usage_mb
+
+            worker_mb = []
+            for child in multiprocessing.active_children():
+                child_mb = self._probe(child.pid)
+                if child_mb is not None:
+                    worker_mb.append(child_mb)
+
+            self._worker_mb = worker_mb
+            self._usage_mb = (self._probe(None) or 0.0) + sum(worker_mb)
+            self._sampled_at = now
+            self.peak_mb = max(self.peak_mb, self._usage_mb)
+            return self._usage_mb
+
+    def state(self) -> str:
+        """現在の使用量の段階（ok / warning / critical）"""
+        usage = self.usage_mb()
+        if usage >= self.limit_mb:
+            return STATE_CRITICAL
+        if usage >= self.warning_mb:
+            return STATE_WARNING
+        return STATE_OK
+
+    def admit(self, in_flight: int, capacity: int) -> bool:
+        """新しいチャンクを投入してよいか判定
+
+        Args:
+            in_flight: 処理中（未返却）のチャンク数
+            capacity: 通常時の同時処理数
+
+        Returns:
+            bool: 投入可能な場合True。False の場合は処理中チャンクの完了を待つ
+        """
+        state = self.state()
+        if state == STATE_OK:
+            return True
+
+        if state == STATE_WARNING:
+            if in_flight < max(1, capacity // 2):
+                return True
+            self.throttled += 1
+            return False
+
+        if in_flight == 0:
+            # 限界超過でも処理は止めず、1チャンクずつ進める
+            gc.collect()
+            self.serialized += 1
+            return True
+        self.throttled += 1
+        return False
+
+    def should_spill(self) -> bool:
+        """未返却の結果を一時ファイルへ退避すべきか"""
+        return self.state() != STATE_OK
+
+    def recommended_workers(self, requested: int) -> int:
+        """予算の残りに収まるワーカー数
+
+        計測済みのワーカープロセスの平均常駐メモリ（未計測時は
+        DEFAULT_WORKER_MEMORY_MB）から、残り予算で動かせる数を求める。
+        """
+        headroom = self.limit_mb - self.usage_mb()
+        per_worker = (
+            sum(self._worker_mb) / len(self._worker_mb)
+            if self._worker_mb
+            else DEFAULT_WORKER_MEMORY_MB
+        )
+        affordable = int(headroom // max(per_worker, 1.0))
+        return max(1, min(requested, affordable))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """投入制御の統計"""
+        return {
+            "limit_mb": self.limit_mb,
+            "warning_mb": self.warning_mb,
+            "usage_mb": round(self._usage_mb, 1),
+            "peak_mb": round(self.peak_mb, 1),
+            "worker_count": len(self._worker_mb),
+            "throttled": self.throttled,
+            "serialized": self.serialized,
+            "spilled_chunks": self.spilled_chunks,
+        }
+
+
+class SpilledResults:
+    """チャンクID → 結果リストの保持領域
+
+    メモリ予算の警告段階以降に格納された結果は pickle して一時ファイルへ
+    退避し、取り出し時に読み戻す。pickle できない結果はメモリに保持する。
+
+    Args:
+        controller: 退避判定に使う投入制御（None の場合は常にメモリ保持）
+    """
+
+    def __init__(self, controller: Optional[MemoryAdmissionController]) -> None:
+        self.controller = controller
+        self._memory: Dict[int, List[Any]] = {}
+        self._spilled: Dict[int, Tuple[int, int]] = {}
+        self._file: Optional[IO[bytes]] = None
+
+    def __contains__(self, chunk_id: object) -> bool:
+        return chunk_id in self._memory or chunk_id in self._spilled
+
+    def __len__(self) -> int:
+        return len(self._memory) + len(self._spilled)
+
+    def put(self, chunk_id: int, results: List[Any]) -> None:
+        if results and self.controller is not None and self.controller.should_spill():
+            try:
+                data = pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                self._memory[chunk_id] = results
+                return
+            if self._file is None:
+                self._file = tempfile.TemporaryFile(prefix="kumihan_spill_")
+            offset = self._file.seek(0, os.SEEK_END)
+            self._file.write(data)
+            self._spilled[chunk_id] = (offset, len(data))
+            self.controller.spilled_chunks += 1
+            return
+        self._memory[chunk_id] = results
+
+    def pop(self, chunk_id: int) -> List[Any]:
+        if chunk_id in self._memory:
+            return self._memory.pop(chunk_id)
+        offset, length = self._spilled.pop(chunk_id)
+        assert self._file is not None
+        self._file.seek(offset)
+        results: List[Any] = pickle.loads(self._file.read(length))
+        return results
+
+    def close(self) -> None:
+        """一時ファイルを削除"""
+        self._memory.clear()
+        self._spilled.clear()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -8,6 +8,15 @@ Issue #616対応 - CI/CDテスト修正用の基本実装
 from typing import Any, Dict, List, Optional, Union
 
 import logging
+import re
+
+# 自動判定で走査する先頭行数の既定値（0以下で全行）
+DEFAULT_SAMPLE_LINES = 200
+
+_LIST_MARKER_PATTERN = re.compile(r"^[#＃]\s*リスト\s*[#＃]")
+_INLINE_KEYWORD_PATTERN = re.compile(r"[#＃][^#＃]+[#＃]")
+_BLOCK_START_PATTERN = re.compile(r"^[#＃]\s*[^#＃\s]+\s*[#＃]$")
+_KEYWORD_PREFIX_PATTERN = re.compile(r"^[#＃]\s*[^#＃\s]+\s*[#＃]")
 
 
 class ParsingCoordinator:
@@ -95,6 +104,38 @@ class ParsingCoordinator:
             self.logger.error(f"文書解析中にエラーが発生: {e}")
             return None
 
+    def recommend_parser(
+        self, content: Union[List[str], str], sample_lines: Optional[int] = None
+    ) -> str:
+        """
+        先頭行のサンプルのみで推奨パーサーを判定する
+
+        文字列入力も先頭のサンプル分だけ分割するため、文書サイズに依らず
+        一定コストで判定できる。
+
+        Args:
+            content: 解析対象の文書内容（行リストまたは文字列）
+            sample_lines: 走査する先頭行数（省略時は設定値 auto_detect_sample_lines）
+
+        Returns:
+            推奨パーサー名（parse_document の parser_type と同じ値）
+        """
+        limit = (
+            sample_lines
+            if sample_lines is not None
+            else int(self.config.get("auto_detect_sample_lines", DEFAULT_SAMPLE_LINES))
+        )
+        if isinstance(content, str):
+            lines = (
+                content.split("\n", limit)[:limit] if limit > 0 else content.split("\n")
+            )
+        else:
+            lines = content[:limit] if limit > 0 else content
+
+        if not lines:
+            return "empty"
+        return self._determine_optimal_parser(lines)
+
     def _determine_optimal_parser(self, content_lines: List[str]) -> str:
         """
         最適なパーサーを決定する
@@ -130,18 +171,16 @@ class ParsingCoordinator:
             line_content: 解析対象の行内容（トリム済み）
             parser_scores: 更新対象のパーサースコア辞書
         """
-        import re
-
         # 新記法 # リスト # の検出
-        if re.match(r"^[#＃]\s*リスト\s*[#＃]", line_content):
+        if _LIST_MARKER_PATTERN.match(line_content):
             parser_scores["list"] += 5  # 高スコア
 
         # 新記法インライン形式の検出 # キーワード # 内容
-        if re.search(r"[#＃][^#＃]+[#＃]", line_content):
+        if _INLINE_KEYWORD_PATTERN.search(line_content):
             parser_scores["keyword"] += 3
 
         # 新記法ブロック開始の検出 # キーワード #
-        if re.match(r"^[#＃]\s*[^#＃\s]+\s*[#＃]$", line_content):
+        if _BLOCK_START_PATTERN.match(line_content):
             parser_scores["block"] += 4
 
         # ブロック終了マーカーの検出
@@ -149,8 +188,8 @@ class ParsingCoordinator:
             parser_scores["block"] += 2
 
         # Markdown記法の検出（互換性維持）
-        if line_content.startswith("#") and not re.match(
-            r"^[#＃]\s*[^#＃\s]+\s*[#＃]", line_content
+        if line_content.startswith("#") and not _KEYWORD_PREFIX_PATTERN.match(
+            line_content
         ):
             parser_scores["markdown"] += 2
         elif "**" in line_content or "*" in line_content:
@@ -0,0 +1,454 @@
+"""
+プロセスプール並列処理バックエンド
+
+チャンク処理（純Pythonの正規表現・文字列処理）は GIL によりスレッドでは
+並列化されないため、CPU律速の大きな入力はワーカープロセスで処理する。
+ワーカーへはチャンクの行リストを複製せず、共有メモリまたはメモリマップした
+入力ファイル上の範囲を示す ChunkDescriptor だけを渡し、各ワーカーが該当範囲を
+読み出して ChunkInfo を復元する。
+
+iter_ordered_results はスレッド / プロセス共通の順序付きストリーミング処理で、
+処理中チャンク数を上限付きウィンドウに抑えつつチャンク順に結果を返す。
+"""
+
+import concurrent.futures
+import functools
+import multiprocessing
+import pickle
+import time
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, Iterator, List
+from typing import Optional, Sequence, Tuple, TypeVar, Union
+
+from ..io.mapped_reader import MappedTextReader, decode_chunk_lines
+from ..types import ChunkInfo
+from .memory_admission import MemoryAdmissionController
+
+BACKEND_AUTO = "auto"
+BACKEND_THREAD = "thread"
+BACKEND_PROCESS = "process"
+
+# プロセス起動・結果転送のコストを回収できる最小の処理量
+DEFAULT_PROCESS_MIN_LINES = 20000
+DEFAULT_PROCESS_MIN_CHUNK_LINES = 1000
+
+_T = TypeVar("_T")
+
+# ChunkDescriptor.source_kind
+SOURCE_SHARED_MEMORY = "shm"
+SOURCE_FILE = "file"
+
+
+@dataclass(frozen=True)
+class ChunkDescriptor:
+    """ワーカープロセスへ渡すチャンク記述子（行データを含まない）
+
+    Attributes:
+        chunk_id: チャンクID
+        start_line: 開始行（1始まり）
+        end_line: 終了行
+        file_position: ChunkInfo.file_position
+        line_count: 行数
+        offset: 共有バッファ上のバイトオフセット
+        length: バイト長
+        source: 共有メモリ名またはファイルパス
+        source_kind: "shm" または "file"
+        encoding: デコードに使用するエンコーディング
+    """
+
+    chunk_id: int
+    start_line: int
+    end_line: int
+    file_position: int
+    line_count: int
+    offset: int
+    length: int
+    source: str
+    source_kind: str
+    encoding: str = "utf-8"
+
+
+def select_backend(
+    total_lines: int,
+    chunk_count: int,
+    workers: int,
+    processing_func: Callable[..., Any],
+    min_total_lines: int = DEFAULT_PROCESS_MIN_LINES,
+    min_chunk_lines: int = DEFAULT_PROCESS_MIN_CHUNK_LINES,
+) -> str:
+    """処理量に応じてスレッド / プロセスを選択
+
+    入力が小さい場合やチャンクが細かい場合はプロセス起動と結果転送の
+    コストが上回るためスレッドを選ぶ。処理関数がpickleできない場合
+    （ラムダ・ローカル関数等）もスレッドを選ぶ。
+    """
+    if workers <= 1 or chunk_count <= 1:
+        return BACKEND_THREAD
+    if total_lines < min_total_lines:
+        return BACKEND_THREAD
+    if total_lines // chunk_count < min_chunk_lines:
+        return BACKEND_THREAD
+    if not is_picklable(processing_func):
+        return BACKEND_THREAD
+    return BACKEND_PROCESS
+
+
+def is_picklable(obj: Any) -> bool:
+    """ワーカープロセスへ渡せるか判定"""
+    try:
+        pickle.dumps(obj)
+        return True
+    except Exception:
+        return False
+
+
+class SharedChunkBuffer:
+    """チャンク群の行を1つの共有メモリに格納し、記述子を提供する
+
+    行に改行文字を含むチャンクは復元できないため ValueError を送出する。
+
+    Examples:
+        >>> with SharedChunkBuffer(chunks) as buffer:
+        ...     for descriptor in buffer.descriptors: ...
+    """
+
+    def __init__(self, chunks: Sequence[ChunkInfo], encoding: str = "utf-8"):
+        encoded: List[bytes] = []
+        for chunk in chunks:
+            text = "\n".join(chunk.lines)
+            if text.count("\n") != max(len(chunk.lines) - 1, 0):
+                raise ValueError(f"chunk {chunk.chunk_id} has embedded newlines")
+            encoded.append(text.encode(encoding))
+
+        total = sum(len(data) for data in encoded)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(total, 1))
+        buffer = self._shm.buf
+        assert buffer is not None
+        self.descriptors: List[ChunkDescriptor] = []
+        offset = 0
+        for chunk, data in zip(chunks, encoded):
+            buffer[offset : offset + len(data)] = data
+            self.descriptors.append(
+                ChunkDescriptor(
+                    chunk_id=chunk.chunk_id,
+                    start_line=chunk.start_line,
+                    end_line=chunk.end_line,
+                    file_position=chunk.file_position,
+                    line_count=len(chunk.lines),
+                    offset=offset,
+                    length=len(data),
+                    source=self._shm.name,
+                    source_kind=SOURCE_SHARED_MEMORY,
+                    encoding=encoding,
+                )
+            )
+            offset += len(data)
+
+    def __enter__(self) -> "SharedChunkBuffer":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """共有メモリを解放"""
+        self._shm.close()
+        self._shm.unlink()
+
+
+def describe_file_chunks(
+    file_path: Union[str, Path], chunk_size: int, encoding: str = "utf-8"
+) -> Tuple[List[ChunkDescriptor], int]:
+    """入力ファイルをメモリマップし、chunk_size 行ごとの記述子を作成
+
+    行内容はデコードせず、境界のオフセットのみ求める。
+
+    Returns:
+        (記述子リスト, 総行数)
+
+    Raises:
+        ValueError: メモリマップ上で行分割できないファイルの場合
+    """
+    descriptors: List[ChunkDescriptor] = []
+    with MappedTextReader(file_path, encoding) as reader:
+        if not reader.supports_mapping():
+            raise ValueError(f"file cannot be split on the mapped buffer: {file_path}")
+        total_lines = reader.count_lines()
+        for chunk in reader.iter_chunks(chunk_size):
+            descriptors.append(
+                ChunkDescriptor(
+                    chunk_id=chunk.chunk_id,
+                    start_line=chunk.start_line,
+                    end_line=chunk.end_line,
+                    file_position=chunk.start_line - 1,
+                    line_count=chunk.end_line - chunk.start_line + 1,
+                    offset=chunk.offset,
+                    length=len(chunk.view),
+                    source=str(Path(file_path).resolve()),
+                    source_kind=SOURCE_FILE,
+                    encoding=encoding,
+                )
+            )
+            chunk.release()
+    return descriptors, total_lines
+
+
+def iter_process_results(
+    descriptors: Sequence[ChunkDescriptor],
+    processing_func: Callable[[ChunkInfo], Any],
+    max_workers: int,
+    drop_empty: bool = False,
+    admission: Optional[MemoryAdmissionController] = None,
+) -> Iterator[Tuple[ChunkDescriptor, Optional[List[Any]], Optional[Exception]]]:
+    """記述子をワーカープロセスで処理し、完了順に結果を返す
+
+    Yields:
+        (記述子, 結果リスト or None, 例外 or None)
+    """
+    worker = functools.partial(
+        _process_descriptor, processing_func=processing_func, drop_empty=drop_empty
+    )
+    with _process_pool(max_workers) as executor:
+        yield from iter_as_completed(
+            executor, descriptors, worker, admission, max_workers
+        )
+
+
+def iter_as_completed(
+    executor: concurrent.futures.Executor,
+    items: Iterable[_T],
+    worker: Callable[[_T], List[Any]],
+    admission: Optional[MemoryAdmissionController] = None,
+    capacity: int = 1,
+) -> Iterator[Tuple[_T, Optional[List[Any]], Optional[Exception]]]:
+    """items を executor に投入し、完了順に結果を返す
+
+    admission 指定時はメモリ予算に余裕がない間は新規投入を止め、
+    処理中の項目の完了を待つ。
+
+    Args:
+        executor: 実行に使う Executor
+        items: 処理対象
+        worker: 1項目の結果リストを返す関数
+        admission: メモリ予算による投入制御
+        capacity: 通常時の同時処理数（ワーカー数）
+
+    Yields:
+        (項目, 結果リスト or None, 例外 or None)
+    """
+    in_flight: Dict["concurrent.futures.Future[List[Any]]", _T] = {}
+
+    def wait_completed() -> (
+        Iterator[Tuple[_T, Optional[List[Any]], Optional[Exception]]]
+    ):
+        done, _ = concurrent.futures.wait(
+            in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            item = in_flight.pop(future)
+            try:
+                yield item, future.result(), None
+            except Exception as e:
+                yield item, None, e
+
+    for item in items:
+        while (
+            in_flight
+            and admission is not None
+            and not admission.admit(len(in_flight), capacity)
+        ):
+            yield from wait_completed()
+        in_flight[executor.submit(worker, item)] = item
+
+    while in_flight:
+        yield from wait_completed()
+
+
+def iter_ordered_results(
+    chunks: Iterable[ChunkInfo],
+    worker: Callable[[ChunkInfo], List[Any]],
+    max_workers: int,
+    backend: str = BACKEND_THREAD,
+    window: Optional[int] = None,
+    timeout: Optional[float] = None,
+    admission: Optional[MemoryAdmissionController] = None,
+    deadline: Optional[float] = None,
+) -> Generator[Tuple[ChunkInfo, List[Any], Optional[Exception]], None, None]:
+    """チャンクを並列処理し、チャンク順に結果を返す（リオーダーバッファ）
+
+    先頭から連続して完了したチャンクはすぐに返す。投入済みで未返却の
+    チャンクが window 個に達すると先頭の完了を待ってから次を投入するため
+    （背圧）、保持する結果・チャンクは入力全体ではなく window 個分に収まる。
+    chunks はジェネレータでもよく、必要な分だけ読み進める。
+
+    Args:
+        chunks: 処理対象チャンク（チャンク順）
+        worker: 1チャンクの結果リストを返す関数。process では pickle 可能であること
+        max_workers: ワーカー数
+        backend: "thread" または "process"
+        window: 未返却チャンク数の上限（省略時は max_workers の2倍）
+        timeout: 先頭チャンクの完了待ちの上限秒数。超過したチャンクは
+            TimeoutError として返し、その完了は待たない。process では
+            終了時にワーカープロセスを強制終了する（スレッドは停止できないため
+            処理が戻るまで残る）
+        admission: メモリ予算による投入制御。予算に余裕がない間は
+            先頭チャンクの完了を待ってから次を投入する
+        deadline: 全体の期限（time.perf_counter() 基準）。完了待ちは
+            timeout と期限までの残り時間の短い方で打ち切る
+
+    Yields:
+        (チャンク, 結果リスト, 例外 or None)
+    """
+    window = max(1, window or max_workers * 2)
+    pending: Deque[Tuple[ChunkInfo, "concurrent.futures.Future[List[Any]]"]]
+    pending = deque()
+    timed_out = False
+
+    executor: concurrent.futures.Executor = (
+        _process_pool(max_workers)
+        if backend == BACKEND_PROCESS
+        else concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    )
+    try:
+        for chunk in chunks:
+            while (
+                pending
+                and admission is not None
+                and not admission.admit(len(pending), max_workers)
+            ):
+                result = _pop_ordered(pending, timeout, deadline)
+                timed_out = timed_out or isinstance(result[2], TimeoutError)
+                yield result
+            pending.append((chunk, executor.submit(worker, chunk)))
+            while pending and (len(pending) >= window or pending[0][1].done()):
+                result = _pop_ordered(pending, timeout, deadline)
+                timed_out = timed_out or isinstance(result[2], TimeoutError)
+                yield result
+        while pending:
+            result = _pop_ordered(pending, timeout, deadline)
+            timed_out = timed_out or isinstance(result[2], TimeoutError)
+            yield result
+    finally:
+        # 途中で消費が打ち切られた場合は未着手のチャンクを取り消す
+        for _, future in pending:
+            future.cancel()
+        if timed_out:
+            _terminate_workers(executor)
+        executor.shutdown(wait=not timed_out, cancel_futures=True)
+
+
+def _terminate_workers(executor: concurrent.futures.Executor) -> None:
+    """タイムアウトしたチャンクを処理中のワーカープロセスを強制終了"""
+    if not isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+        return
+    # ProcessPoolExecutor は実行中のタスクを止める公開APIを持たない
+    processes = getattr(executor, "_processes", None) or {}
+    for process in list(processes.values()):
+        if process.is_alive():
+            process.terminate()
+
+
+def _process_pool(max_workers: int) -> concurrent.futures.ProcessPoolExecutor:
+    """ワーカープロセスプールを作成
+
+    スレッド実行中のプロセスを fork すると子プロセスがロックを握ったまま
+    複製されうるため、利用可能なら forkserver で起動する。
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+
+
+def _pop_ordered(
+    pending: Deque[Tuple[ChunkInfo, "concurrent.futures.Future[List[Any]]"]],
+    timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+) -> Tuple[ChunkInfo, List[Any], Optional[Exception]]:
+    """先頭チャンクの完了を待って取り出す"""
+    if deadline is not None:
+        remaining = max(deadline - time.perf_counter(), 0.0)
+        timeout = remaining if timeout is None else min(timeout, remaining)
+    chunk, future = pending.popleft()
+    try:
+        return chunk, future.result(timeout=timeout), None
+    except Exception as e:
+        future.cancel()
+        return chunk, [], e
+
+
+def run_chunk(
+    chunk: ChunkInfo,
+    processing_func: Callable[[ChunkInfo], Any],
+    drop_empty: bool = False,
+) -> List[Any]:
+    """1チャンクを処理して結果をリスト化（ワーカープロセスで実行可能）"""
+    if drop_empty:
+        return [result for result in processing_func(chunk) if result]
+    return list(processing_func(chunk))
+
+
+# ワーカープロセス内で開いた共有バッファ（source → バッファ保持オブジェクト）
+_worker_sources: Dict[Tuple[str, str], Any] = {}
+
+
+def _process_descriptor(
+    descriptor: ChunkDescriptor,
+    processing_func: Callable[[ChunkInfo], Any],
+    drop_empty: bool = False,
+) -> List[Any]:
+    """ワーカープロセス: 記述子からチャンクを復元して処理"""
+    return run_chunk(load_chunk(descriptor), processing_func, drop_empty)
+
+
+def load_chunk(descriptor: ChunkDescriptor) -> ChunkInfo:
+    """記述子が示す範囲を読み出して ChunkInfo を復元"""
+    buffer = _open_source(descriptor.source_kind, descriptor.source)
+    data = buffer[descriptor.offset : descriptor.offset + descriptor.length]
+
+    if descriptor.line_count == 0:
+        lines: List[str] = []
+    elif descriptor.source_kind == SOURCE_FILE:
+        lines = decode_chunk_lines(data, descriptor.encoding)
+    else:
+        lines = str(data, descriptor.encoding).split("\n")
+
+    return ChunkInfo(
+        chunk_id=descriptor.chunk_id,
+        start_line=descriptor.start_line,
+        end_line=descriptor.end_line,
+        lines=lines,
+        file_position=descriptor.file_position,
+    )
+
+
+def _open_source(source_kind: str, source: str) -> Any:
+    """共有バッファを開く（プロセス内で再利用）"""
+    key = (source_kind, source)
+    holder = _worker_sources.get(key)
+    if holder is None:
+        if source_kind == SOURCE_FILE:
+            reader = MappedTextReader(source)
+            reader.open()
+            holder = reader
+        else:
+            holder = _attach_shared_memory(source)
+        _worker_sources[key] = holder
+
+    if isinstance(holder, MappedTextReader):
+        return holder.buffer
+    return holder.buf
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """既存の共有メモリに接続（解放は作成元が行う）"""
+    try:
+        # Python 3.13+: 接続側ではリソーストラッカーに登録しない
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
@@ -4,12 +4,22 @@ processor_core.py分割版 - 高度なパフォーマンス最適化専用モジ
 """
 
 import concurrent.futures
+import functools
 import logging
 import os
 import threading
-from typing import Any, Callable, Dict, Iterator, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from ..types import ChunkInfo
+from .memory_admission import MemoryAdmissionController, SpilledResults
+from .process_backend import (
+    BACKEND_AUTO,
+    BACKEND_PROCESS,
+    SharedChunkBuffer,
+    iter_as_completed,
+    iter_process_results,
+    select_backend,
+)
 
 # Optional dependency
 try:
@@ -21,10 +31,23 @@ except ImportError:
 class ProcessingOptimized:
     """並列処理最適化クラス"""
 
-    def __init__(self, max_workers: Optional[int] = None):
-        """並列処理最適化初期化"""
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        memory_limit_mb: Optional[float] = None,
+    ):
+        """並列処理最適化初期化
+
+        Args:
+            max_workers: ワーカー数上限
+            memory_limit_mb: メモリ予算（MB）。指定時は予算に応じて
+                ワーカー数・チャンク投入を制限し、未返却の結果を退避する
+        """
         self.logger = logging.getLogger(__name__)
         self.max_workers = max_workers
+        self.admission = (
+            MemoryAdmissionController(memory_limit_mb) if memory_limit_mb else None
+        )
         self._lock = threading.RLock()
         self._results_lock = threading.RLock()
 
@@ -33,6 +56,7 @@ class ProcessingOptimized:
         chunks: List[ChunkInfo],
         processing_func: Callable[[ChunkInfo], Iterator[Any]],
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        backend: str = BACKEND_AUTO,
     ) -> Iterator[Any]:
         """
         最適化されたチャンクリスト並列処理（Issue #727 パフォーマンス最適化対応）
@@ -40,13 +64,17 @@ class ProcessingOptimized:
         改善点:
         - CPU効率最大化: ワーカー数動的調整
         - メモリ効率向上: 結果ストリーミング
-        - 順序保証: チャンクIDベース結果ソート
+        - 順序保証: チャンクID順のリオーダーバッファ（先頭から連続して完了した
+          チャンクの結果を即座に返し、未返却分のみ保持）
         - エラー耐性強化: 個別チャンクエラーでも継続
 
         Args:
             chunks: 処理対象チャンクリスト
             processing_func: チャンク処理関数
             progress_callback: プログレス更新コールバック
+            backend: "thread" / "process" / "auto"（処理量から選択）。
+                process はワーカープロセスで処理するため、processing_func は
+                モジュールレベル関数などpickle可能である必要がある
 
         Yields:
             Any: 処理結果（順序保証付き）
@@ -61,9 +89,13 @@ class ProcessingOptimized:
         # 動的ワーカー数計算（CPU効率最大化）
         optimal_workers = self.calculate_optimal_workers(len(chunks))
 
-        # 結果収集用の順序保証辞書
-        results_dict = {}
+        # 結果収集用の順序保証バッファ（未返却のチャンクのみ保持、
+        # メモリ予算逼迫時は一時ファイルへ退避）
+        results_dict = SpilledResults(self.admission)
         errors_dict = {}
+        chunk_order = sorted(chunk.chunk_id for chunk in chunks)
+        next_index = 0
+        success_count = 0
 
         # パフォーマンス監視（簡易版）
         class SimplePerformanceMonitor:
@@ -85,63 +117,121 @@ class ProcessingOptimized:
             ) -> None:
                 pass
 
+        if backend == BACKEND_AUTO:
+            backend = select_backend(
+                sum(len(chunk.lines) for chunk in chunks),
+                len(chunks),
+                optimal_workers,
+                processing_func,
+            )
+
         with SimplePerformanceMonitor("parallel_chunk_processing") as perf_monitor:
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=optimal_workers
-            ) as executor:
-
-                # 全チャンクを並列で開始（最適化されたsubmit）
-                future_to_chunk = {}
-                for chunk in chunks:
-                    future = executor.submit(
-                        self.process_single_chunk_optimized,
-                        chunk,
-                        processing_func,
-                        perf_monitor,
-                    )
-                    future_to_chunk[future] = chunk
-
-                completed_chunks = 0
-
-                # 完了順に結果を収集
-                for future in concurrent.futures.as_completed(future_to_chunk):
-                    chunk = future_to_chunk[future]
-
-                    try:
-                        results = future.result()
-                        results_dict[chunk.chunk_id] = results
-
-                        completed_chunks += 1
-
-                        # プログレス更新（最適化）
-                        if (
-                            progress_callback and completed_chunks % 5 == 0
-                        ):  # 更新頻度調整
-                            progress_info = self.create_progress_info_optimized(
-                                completed_chunks, len(chunks), chunk
-                            )
-                            progress_callback(progress_info)
-
-                    except Exception as e:
-                        error_msg = f"Chunk {chunk.chunk_id} processing failed: {e}"
-                        self.logger.error(error_msg)
-                        errors_dict[chunk.chunk_id] = error_msg
-                        # エラーでも処理継続
-
-                # 順序保証付き結果出力
-                for chunk_id in sorted(results_dict.keys()):
-                    for result in results_dict[chunk_id]:
-                        yield result
+            if backend == BACKEND_PROCESS:
+                completed = self._iter_process_completed(
+                    chunks, processing_func, optimal_workers, perf_monitor
+                )
+            else:
+                completed = self._iter_thread_completed(
+                    chunks, processing_func, optimal_workers, perf_monitor
+                )
+
+            completed_chunks = 0
+
+            # 完了順に結果を収集
+            for chunk, results, error in completed:
+                if error is None:
+                    results_dict.put(chunk.chunk_id, results)
+                    success_count += 1
+
+                    completed_chunks += 1
+
+                    # プログレス更新（最適化）
+                    if progress_callback and completed_chunks % 5 == 0:  # 更新頻度調整
+                        progress_info = self.create_progress_info_optimized(
+                            completed_chunks, len(chunks), chunk
+                        )
+                        progress_callback(progress_info)
+                else:
+                    error_msg = f"Chunk {chunk.chunk_id} processing failed: {error}"
+                    self.logger.error(error_msg)
+                    errors_dict[chunk.chunk_id] = error_msg
+                    # エラーでも処理継続
+                    results_dict.put(chunk.chunk_id, [])
+
+                # 順序保証付き結果出力（先頭から連続して完了した分）
+                while (
+                    next_index < len(chunk_order)
+                    and chunk_order[next_index] in results_dict
+                ):
+                    yield from results_dict.pop(chunk_order[next_index])
+                    next_index += 1
+
+        results_dict.close()
 
         # 最終レポート
-        success_count = len(results_dict)
         error_count = len(errors_dict)
         self.logger.info(
             f"Optimized parallel processing completed: "
             f"{success_count} success, {error_count} errors, "
+            f"{perf_monitor.items_processed} items, "
             f"efficiency: {(success_count/(success_count+error_count)*100):.1f}%"
         )
 
+    def _iter_thread_completed(
+        self,
+        chunks: List[ChunkInfo],
+        processing_func: Callable[[ChunkInfo], Iterator[Any]],
+        workers: int,
+        perf_monitor: Any,
+    ) -> Iterator[Tuple[ChunkInfo, List[Any], Optional[Exception]]]:
+        """スレッドプールで処理し、完了順に (チャンク, 結果, 例外) を返す"""
+        worker = functools.partial(
+            self.process_single_chunk_optimized,
+            processing_func=processing_func,
+            perf_monitor=perf_monitor,
+        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            # メモリ予算に余裕がある範囲でチャンクを投入
+            for chunk, results, error in iter_as_completed(
+                executor, chunks, worker, self.admission, workers
+            ):
+                yield chunk, results or [], error
+
+    def _iter_process_completed(
+        self,
+        chunks: List[ChunkInfo],
+        processing_func: Callable[[ChunkInfo], Iterator[Any]],
+        workers: int,
+        perf_monitor: Any,
+    ) -> Iterator[Tuple[ChunkInfo, List[Any], Optional[Exception]]]:
+        """プロセスプールで処理し、完了順に (チャンク, 結果, 例外) を返す
+
+        行データは共有メモリに1度だけ書き込み、ワーカーには記述子のみ渡す。
+        共有メモリを確保できない場合はスレッドプールで処理する。
+        """
+        try:
+            buffer = SharedChunkBuffer(chunks)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Process backend unavailable, using threads: {e}")
+            yield from self._iter_thread_completed(
+                chunks, processing_func, workers, perf_monitor
+            )
+            return
+
+        chunk_by_id = {chunk.chunk_id: chunk for chunk in chunks}
+        with buffer:
+            for descriptor, results, error in iter_process_results(
+                buffer.descriptors,
+                processing_func,
+                workers,
+                drop_empty=True,
+                admission=self.admission,
+            ):
+                # ワーカープロセス内の記録は戻らないため、返却された結果で記録
+                for _ in results or []:
+                    perf_monitor.record_item_processed()
+                yield chunk_by_id[descriptor.chunk_id], results or [], error
+
     def process_single_chunk_optimized(
         self,
         chunk: ChunkInfo,
@@ -205,6 +295,10 @@ class ProcessingOptimized:
         except ImportError:
             pass  # psutil未利用環境では無視
 
+        # メモリ予算の残りに収まるワーカー数に制限
+        if self.admission is not None:
+            optimal = self.admission.recommended_workers(optimal)
+
         self.logger.info(
             f"Calculated optimal workers: {optimal} "
             f"(chunks: {chunk_count}, CPU: {cpu_count})"
@@ -234,6 +328,9 @@ class ProcessingOptimized:
             "cpu_count": os.cpu_count(),
             "memory_info": self._get_memory_info(),
             "thread_count": threading.active_count(),
+            "memory_admission": (
+                self.admission.get_statistics() if self.admission else None
+            ),
         }
 
     def _get_memory_info(self) -> Dict[str, Any]:
@@ -1,4 +1,5 @@
-from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import Tuple, Union
 
 """
 並列チャンク処理コア - 軽量化版
@@ -6,12 +7,27 @@ from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 """
 
 import concurrent.futures
+import functools
 import logging
+import os
 import threading
 from pathlib import Path
 
 # Delayed import to avoid circular dependency
 from ..types import ChunkInfo
+from .memory_admission import SpilledResults
+from .process_backend import (
+    BACKEND_AUTO,
+    BACKEND_PROCESS,
+    BACKEND_THREAD,
+    SharedChunkBuffer,
+    describe_file_chunks,
+    iter_as_completed,
+    iter_ordered_results,
+    iter_process_results,
+    run_chunk,
+    select_backend,
+)
 from .processing_optimized import ProcessingOptimized
 
 
@@ -45,7 +61,12 @@ class ParallelChunkProcessor:
 
         # P1: 親からの設定をCoreManagerへ伝播
         self.core_manager = CoreManager(config or {})
-        self.processing_optimized = ProcessingOptimized(max_workers=max_workers)
+        # memory_limit_mb: 並列処理全体（親＋ワーカー）のメモリ予算
+        self.processing_optimized = ProcessingOptimized(
+            max_workers=max_workers,
+            memory_limit_mb=(config or {}).get("memory_limit_mb"),
+        )
+        self.admission = self.processing_optimized.admission
 
     # ===== 基本的な並列処理メソッド =====
 
@@ -54,6 +75,7 @@ class ParallelChunkProcessor:
         chunks: List[ChunkInfo],
         processing_func: Callable[[ChunkInfo], Iterator[Any]],
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        backend: str = BACKEND_AUTO,
     ) -> Iterator[Any]:
         """
         チャンクリストを並列処理
@@ -62,58 +84,241 @@ class ParallelChunkProcessor:
             chunks: 処理対象チャンクリスト
             processing_func: チャンク処理関数
             progress_callback: プログレス更新コールバック
+            backend: "thread" / "process" / "auto"（処理量から選択）
 
         Yields:
             Any: 処理結果
         """
         self.logger.info(f"Starting parallel processing of {len(chunks)} chunks")
 
-        # 並列処理実行
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.max_workers
-        ) as executor:
-            # 全チャンクを並列で開始
-            future_to_chunk = {
-                executor.submit(
-                    self._process_single_chunk, chunk, processing_func
-                ): chunk
-                for chunk in chunks
-            }
-
-            completed_chunks = 0
-
-            # 完了順に結果を取得
-            for future in concurrent.futures.as_completed(future_to_chunk):
-                chunk = future_to_chunk[future]
-
-                try:
-                    results = future.result()
-
-                    # 結果をyield（順序は保証されない）
-                    for result in results:
-                        yield result
-
-                    completed_chunks += 1
-
-                    # プログレス更新
-                    if progress_callback:
-                        progress_info = {
-                            "completed_chunks": completed_chunks,
-                            "total_chunks": len(chunks),
-                            "chunk_id": chunk.chunk_id,
-                            "progress_percent": (completed_chunks / len(chunks)) * 100,
-                        }
-                        progress_callback(progress_info)
-
-                except Exception as e:
-                    self.logger.error(f"Chunk {chunk.chunk_id} processing failed: {e}")
-                    # エラーチャンクはスキップして継続
-                    continue
+        if backend == BACKEND_AUTO:
+            backend = select_backend(
+                sum(len(chunk.lines) for chunk in chunks),
+                len(chunks),
+                self.max_workers or os.cpu_count() or 1,
+                processing_func,
+            )
+
+        completed_chunks = 0
+
+        # 完了順に結果を取得
+        for chunk, results, error in self._iter_completed(
+            chunks, processing_func, backend
+        ):
+            if error is not None:
+                self.logger.error(f"Chunk {chunk.chunk_id} processing failed: {error}")
+                # エラーチャンクはスキップして継続
+                continue
+
+            # 結果をyield（順序は保証されない）
+            for result in results:
+                yield result
+
+            completed_chunks += 1
+
+            # プログレス更新
+            if progress_callback:
+                progress_info = {
+                    "completed_chunks": completed_chunks,
+                    "total_chunks": len(chunks),
+                    "chunk_id": chunk.chunk_id,
+                    "progress_percent": (completed_chunks / len(chunks)) * 100,
+                }
+                progress_callback(progress_info)
 
         self.logger.info(
             f"Parallel processing completed: {completed_chunks}/{len(chunks)} chunks"
         )
 
+    def process_chunks_ordered(
+        self,
+        chunks: Iterable[ChunkInfo],
+        processing_func: Callable[[ChunkInfo], Iterator[Any]],
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        backend: str = BACKEND_AUTO,
+        window: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        チャンクを並列処理し、結果をチャンク順にストリーミング
+
+        チャンク N の結果はチャンク 0..N が完了した時点で返す。未返却の
+        チャンクは window 個までに制限するため、iter_chunks_from_file() 等の
+        ジェネレータを渡せば入力全体を保持せずに処理できる。
+
+        Args:
+            chunks: 処理対象チャンク（チャンク順、ジェネレータ可）
+            processing_func: チャンク処理関数
+            progress_callback: プログレス更新コールバック
+            backend: "thread" / "process" / "auto"（リスト入力時のみ処理量から選択、
+                ジェネレータ入力では thread）
+            window: 未返却チャンク数の上限（省略時はワーカー数の2倍）
+
+        Yields:
+            Any: 処理結果（チャンク順）
+        """
+        workers = self.max_workers or os.cpu_count() or 1
+        if backend == BACKEND_AUTO:
+            backend = (
+                select_backend(
+                    sum(len(chunk.lines) for chunk in chunks),
+                    len(chunks),
+                    workers,
+                    processing_func,
+                )
+                if isinstance(chunks, Sequence)
+                else BACKEND_THREAD
+            )
+
+        worker: Callable[[ChunkInfo], List[Any]]
+        if backend == BACKEND_PROCESS:
+            worker = functools.partial(run_chunk, processing_func=processing_func)
+        else:
+            worker = functools.partial(
+                self._process_single_chunk, processing_func=processing_func
+            )
+
+        completed_chunks = 0
+        for chunk, results, error in iter_ordered_results(
+            chunks, worker, workers, backend, window, admission=self.admission
+        ):
+            if error is not None:
+                self.logger.error(f"Chunk {chunk.chunk_id} processing failed: {error}")
+                # エラーチャンクはスキップして継続
+                continue
+
+            yield from results
+
+            completed_chunks += 1
+            if progress_callback:
+                progress_callback(
+                    {
+                        "completed_chunks": completed_chunks,
+                        "chunk_id": chunk.chunk_id,
+                        "current_lines": f"{chunk.start_line}-{chunk.end_line}",
+                    }
+                )
+
+        self.logger.info(
+            f"Ordered parallel processing completed: {completed_chunks} chunks"
+        )
+
+    def process_file_parallel(
+        self,
+        file_path: Union[str, Path],
+        processing_func: Callable[[ChunkInfo], Iterator[Any]],
+        encoding: str = "utf-8",
+        chunk_size: Optional[int] = None,
+        backend: str = BACKEND_AUTO,
+    ) -> Iterator[Any]:
+        """
+        入力ファイルをチャンク分割して並列処理（結果はチャンク順）
+
+        プロセスバックエンドではファイルをメモリマップし、ワーカーへは
+        チャンクのバイト範囲のみを渡す（親プロセスは行リストを生成しない）。
+
+        Args:
+            file_path: 入力ファイルパス
+            processing_func: チャンク処理関数
+            encoding: 入力エンコーディング
+            chunk_size: チャンクサイズ（省略時は self.chunk_size）
+            backend: "thread" / "process" / "auto"（処理量から選択）
+
+        Yields:
+            Any: 処理結果
+        """
+        size = chunk_size or self.chunk_size
+        workers = self.max_workers or os.cpu_count() or 1
+        completed: Optional[Iterator[Tuple[Any, List[Any], Optional[Exception]]]]
+        completed = None
+
+        if backend != BACKEND_THREAD:
+            try:
+                descriptors, total_lines = describe_file_chunks(
+                    file_path, size, encoding
+                )
+            except ValueError as e:
+                self.logger.warning(f"Process backend unavailable, using threads: {e}")
+            else:
+                if backend == BACKEND_AUTO:
+                    backend = select_backend(
+                        total_lines, len(descriptors), workers, processing_func
+                    )
+                if backend == BACKEND_PROCESS:
+                    completed = (
+                        (descriptor, results or [], error)
+                        for descriptor, results, error in iter_process_results(
+                            descriptors,
+                            processing_func,
+                            workers,
+                            admission=self.admission,
+                        )
+                    )
+
+        if completed is None:
+            # スレッドではチャンクを順に読み出してストリーミング処理する
+            yield from self.process_chunks_ordered(
+                self.iter_chunks_from_file(file_path, encoding, size),
+                processing_func,
+                backend=BACKEND_THREAD,
+            )
+            return
+
+        # メモリ予算逼迫時は一時ファイルへ退避
+        results_by_id = SpilledResults(self.admission)
+        chunk_ids = []
+        for chunk, results, error in completed:
+            if error is not None:
+                self.logger.error(f"Chunk {chunk.chunk_id} processing failed: {error}")
+                continue
+            results_by_id.put(chunk.chunk_id, results)
+            chunk_ids.append(chunk.chunk_id)
+
+        try:
+            for chunk_id in sorted(chunk_ids):
+                yield from results_by_id.pop(chunk_id)
+        finally:
+            results_by_id.close()
+
+    def _iter_completed(
+        self,
+        chunks: List[ChunkInfo],
+        processing_func: Callable[[ChunkInfo], Iterator[Any]],
+        backend: str,
+    ) -> Iterator[Tuple[ChunkInfo, List[Any], Optional[Exception]]]:
+        """選択したバックエンドで処理し、完了順に (チャンク, 結果, 例外) を返す"""
+        if backend == BACKEND_PROCESS:
+            try:
+                buffer = SharedChunkBuffer(chunks)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Process backend unavailable, using threads: {e}")
+            else:
+                chunk_by_id = {chunk.chunk_id: chunk for chunk in chunks}
+                with buffer:
+                    for descriptor, results, error in iter_process_results(
+                        buffer.descriptors,
+                        processing_func,
+                        self.max_workers or os.cpu_count() or 1,
+                        admission=self.admission,
+                    ):
+                        yield chunk_by_id[descriptor.chunk_id], results or [], error
+                return
+
+        # 並列処理実行（メモリ予算に余裕がある範囲でチャンクを投入）
+        worker = functools.partial(
+            self._process_single_chunk, processing_func=processing_func
+        )
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            for chunk, results, error in iter_as_completed(
+                executor,
+                chunks,
+                worker,
+                self.admission,
+                self.max_workers or os.cpu_count() or 1,
+            ):
+                yield chunk, results or [], error
+
     def _process_single_chunk(
         self, chunk: ChunkInfo, processing_func: Callable[[ChunkInfo], Iterator[Any]]
     ) -> List[Any]:
@@ -144,10 +349,11 @@ class ParallelChunkProcessor:
         chunks: List[ChunkInfo],
         processing_func: Callable[[ChunkInfo], Iterator[Any]],
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        backend: str = BACKEND_AUTO,
     ) -> Iterator[Any]:
         """最適化並列処理（委譲）"""
         return self.processing_optimized.process_chunks_parallel_optimized(
-            chunks, processing_func, progress_callback
+            chunks, processing_func, progress_callback, backend
         )
 
     def get_parallel_metrics(self) -> Dict[str, Any]:
@@ -175,11 +381,20 @@ class ParallelChunkProcessor:
     def create_chunks_from_file(
         self, file_path: Union[str, Path], encoding: str = "utf-8"
     ) -> List[ChunkInfo]:
-        """ファイルからチャンク作成（委譲）"""
+        """ファイルからチャンクのリストを作成（委譲、全チャンクを保持する）"""
         # Union[str, Path]をPathに変換
         path_obj = Path(file_path) if isinstance(file_path, str) else file_path
         return self.core_manager.create_chunks_from_file(path_obj, encoding)
 
+    def iter_chunks_from_file(
+        self,
+        file_path: Union[str, Path],
+        encoding: str = "utf-8",
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[ChunkInfo]:
+        """ファイルからチャンクを順に生成（委譲）"""
+        return self.core_manager.iter_chunks_from_file(file_path, encoding, chunk_size)
+
     def merge_chunks(self, chunks: List[ChunkInfo]) -> ChunkInfo:
         """チャンクマージ（委譲）"""
         return self.core_manager.merge_chunks(chunks)
@@ -0,0 +1,212 @@
+"""CSS アセット - 共有スタイルシートの生成・書き出し
+
+完全HTML文書ごとに <style> を埋め込む代わりに、テンプレートの partials
+（templates/partials/*.css）・テーマCSS（CSSThemes）・Kumihan文書の基本
+スタイルを1度だけ連結・最小化し、内容ハッシュ付きのファイル
+kumihan.<hash>.css として書き出す。文書側は <link> タグで参照する。
+
+内容が変わるとファイル名も変わるため、ブラウザは長期キャッシュできる。
+"""
+
+import functools
+import hashlib
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Union
+
+# context["css_mode"] の値
+CSS_MODE_INLINE = "inline"
+CSS_MODE_LINK = "link"
+
+# 連結する partials（テンプレートの include 順）
+CSS_PARTIALS = (
+    "base-styles.css",
+    "blocks.css",
+    "custom-markers.css",
+    "collapsible.css",
+    "responsive.css",
+    "navigation.css",
+    "graceful-errors.css",
+)
+
+# Kumihan文書（MainRenderer 組み込み文書）の基本スタイル
+KUMIHAN_DOCUMENT_CSS = """        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+        .error {
+            color: #d32f2f;
+            background: #ffebee;
+            padding: 10px;
+            border-radius: 4px;
+            border-left: 4px solid #d32f2f;
+        }
+        .kumihan-block {
+            margin: 16px 0;
+            padding: 12px 16px;
+            border-radius: 6px;
+            border-left: 4px solid;
+        }
+        .kumihan-block.important {
+            background-color: #fff3e0;
+            border-color: #f57c00;
+            color: #e65100;
+        }
+        .kumihan-block.info {
+            background-color: #e3f2fd;
+            border-color: #1976d2;
+            color: #0d47a1;
+        }
+        .kumihan-block.warning {
+            background-color: #fff8e1;
+            border-color: #f9a825;
+            color: #f57f17;
+        }
+        .kumihan-block.note {
+            background-color: #f3e5f5;
+            border-color: #7b1fa2;
+            color: #4a148c;
+        }
+        h1, h2, h3, h4, h5, h6 {
+            margin: 24px 0 16px 0;
+            font-weight: 600;
+        }
+        p {
+            margin: 16px 0;
+        }
+        ul, ol {
+            margin: 16px 0;
+            padding-left: 32px;
+        }
+        li {
+            margin: 4px 0;
+        }
+        strong {
+            font-weight: 600;
+        }
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def _read_umask() -> int:
+    """プロセスの umask を取得（os.umask は設定と取得を兼ねるため戻す）"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# 書き出すスタイルシートの権限（通常のファイル作成と同じく umask を適用）。
+# umask の一時変更が他スレッドのファイル作成と競合しないよう読み込み時に1度だけ取得
+_ASSET_FILE_MODE = 0o666 & ~_read_umask()
+
+
+@dataclass(frozen=True)
+class CSSAsset:
+    """内容ハッシュ付きのスタイルシート
+
+    Attributes:
+        filename: ファイル名（kumihan.<hash>.css）
+        content: 最小化済みのCSS
+    """
+
+    filename: str
+    content: str
+
+    def link_tag(self, href: str = "") -> str:
+        """<link> タグ（href 省略時はファイル名）"""
+        return f'<link rel="stylesheet" href="{href or self.filename}">'
+
+
+def build_css_asset(theme: str = "default") -> CSSAsset:
+    """partials・テーマ・文書スタイルを連結・最小化したアセットを構築
+
+    テーマごとにプロセス内で1度だけ構築する。未知のテーマ名はデフォルトに
+    寄せ、任意のテーマ名でキャッシュが増えないようにする。
+    """
+    from .css_themes import CSSThemes
+
+    if theme not in CSSThemes().get_available_themes():
+        theme = "default"
+    return _build_css_asset(theme)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_css_asset(theme: str) -> CSSAsset:
+    """既知のテーマ名のアセットを構築（テーマごとにキャッシュ）"""
+    from ..templates.template_engine import get_template_engine
+    from .css_themes import CSSThemes
+    from .css_utilities import minify_css
+
+    engine = get_template_engine()
+    css_parts = [
+        engine.render(f"partials/{name}", {"css_vars": {}}) for name in CSS_PARTIALS
+    ]
+    css_parts.append(CSSThemes().generate_theme_styles(theme))
+    css_parts.append(KUMIHAN_DOCUMENT_CSS)
+
+    content = minify_css("\n".join(css_parts))
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    return CSSAsset(f"kumihan.{digest}.css", content)
+
+
+def write_css_asset(directory: Union[str, Path], asset: CSSAsset) -> Path:
+    """アセットをディレクトリへ書き出す
+
+    同名ファイル（=同じ内容）が既にあれば書き込まない。並列に変換する
+    ワーカーが同時に書いても壊れないよう、一時ファイル経由で置き換える。
+    一時ファイルは 0600 で作成されるため、置き換え前に HTML と同じく umask を
+    適用した権限にする（別ユーザーの Web サーバーからも配信できるように）。
+    """
+    path = Path(directory) / asset.filename
+    data = asset.content.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data):
+            return path
+    except OSError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_name, _ASSET_FILE_MODE)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    logger.debug(f"CSS asset written: {path}")
+    return path
+
+
+def emit_css_asset(context: Mapping[str, Any]) -> CSSAsset:
+    """link モードのアセットを取得（context["css_dir"] 指定時は書き出す）
+
+    Args:
+        context: レンダリングコンテキスト
+            - theme: テーマ名（既定 "default"）
+            - css_dir: アセットの書き出し先ディレクトリ
+    """
+    asset = build_css_asset(context.get("theme") or "default")
+    css_dir = context.get("css_dir")
+    if css_dir:
+        write_css_asset(css_dir, asset)
+    return asset
+
+
+__all__ = [
+    "CSS_MODE_INLINE",
+    "CSS_MODE_LINK",
+    "CSSAsset",
+    "build_css_asset",
+    "emit_css_asset",
+    "write_css_asset",
+]
@@ -4,7 +4,10 @@ HTMLFormatterの分割版 - CSS処理モジュール
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# (クラス, テーマ名, レスポンシブ有無, 最小化) → 完全なCSS（カスタムスタイル無し）
+_COMPLETE_CSS_CACHE: Dict[Tuple[type, str, bool, bool], str] = {}
 
 
 class CSSProcessor:
@@ -134,9 +137,17 @@ body {
 }
 """
 
-    def generate_theme_styles(self, theme_name: str = "default") -> str:
+    def generate_theme_styles(
+        self, theme_name: str = "default", minify: bool = False
+    ) -> str:
         """テーマスタイル生成（委譲）"""
-        return self.themes.generate_theme_styles(theme_name)
+        return self.themes.generate_theme_styles(theme_name, minify)
+
+    def get_theme_bytes(
+        self, theme_name: str = "default", minify: bool = True
+    ) -> bytes:
+        """テーマスタイルの UTF-8 バイト列取得（委譲）"""
+        return self.themes.get_theme_bytes(theme_name, minify)
 
     def process_custom_styles(self, custom_css: Union[str, Dict[str, str]]) -> str:
         """カスタムスタイル処理（委譲）"""
@@ -173,7 +184,32 @@ body {
         custom_styles: Optional[Union[str, Dict[str, str]]] = None,
         minify: bool = False,
     ) -> str:
-        """完全なCSS生成（統合メソッド）"""
+        """完全なCSS生成（統合メソッド）
+
+        カスタムスタイルを含まない場合は、テーマ・オプションごとに
+        初回のみ構築してキャッシュする。
+        """
+        if custom_styles:
+            return self._build_complete_css(
+                theme, include_responsive, custom_styles, minify
+            )
+
+        key = (type(self), theme, include_responsive, minify)
+        css = _COMPLETE_CSS_CACHE.get(key)
+        if css is None:
+            css = self._build_complete_css(theme, include_responsive, None, minify)
+            if theme in self.get_available_themes():
+                _COMPLETE_CSS_CACHE[key] = css
+        return css
+
+    def _build_complete_css(
+        self,
+        theme: str,
+        include_responsive: bool,
+        custom_styles: Optional[Union[str, Dict[str, str]]],
+        minify: bool,
+    ) -> str:
+        """完全なCSSを構築"""
         css_parts = []
 
         # 基本スタイル
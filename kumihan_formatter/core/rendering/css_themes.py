@@ -1,12 +1,22 @@
-from typing import Dict
+from typing import Dict, Tuple
 
 """
 CSSテーマ生成機能
 CSSProcessor分割版 - テーマシステム専用モジュール
+
+テーマCSSはテーマ名・最小化有無ごとに1度だけ構築してプロセス内で共有する
+（リクエストごとにレンダリングするサーバーでも文字列を作り直さない）。
 """
 
 import logging
 
+from .css_utilities import minify_css
+
+# (クラス, テーマ名, 最小化) → CSS
+_THEME_CACHE: Dict[Tuple[type, str, bool], str] = {}
+# (クラス, テーマ名, 最小化) → UTF-8 バイト列
+_THEME_BYTES_CACHE: Dict[Tuple[type, str, bool], bytes] = {}
+
 
 class CSSThemes:
     """CSS テーマ生成クラス"""
@@ -25,8 +35,41 @@ class CSSThemes:
             "academic": "アカデミックテーマ",
         }
 
-    def generate_theme_styles(self, theme_name: str = "default") -> str:
-        """指定テーマのスタイル生成"""
+    def generate_theme_styles(
+        self, theme_name: str = "default", minify: bool = False
+    ) -> str:
+        """指定テーマのスタイル生成（未知のテーマはデフォルト）
+
+        テーマ名・最小化有無ごとに初回のみ構築し、以降はキャッシュを返す。
+        """
+        key = self._cache_key(theme_name, minify)
+        css = _THEME_CACHE.get(key)
+        if css is None:
+            css = self._build_theme_styles(key[1])
+            if minify:
+                css = minify_css(css)
+            _THEME_CACHE[key] = css
+        return css
+
+    def get_theme_bytes(
+        self, theme_name: str = "default", minify: bool = True
+    ) -> bytes:
+        """指定テーマのスタイルを書き込み用の UTF-8 バイト列で取得"""
+        key = self._cache_key(theme_name, minify)
+        data = _THEME_BYTES_CACHE.get(key)
+        if data is None:
+            data = self.generate_theme_styles(key[1], minify).encode("utf-8")
+            _THEME_BYTES_CACHE[key] = data
+        return data
+
+    def _cache_key(self, theme_name: str, minify: bool) -> Tuple[type, str, bool]:
+        """キャッシュキー（未知のテーマ名はデフォルトに寄せてキーを増やさない）"""
+        if theme_name not in self.get_available_themes():
+            theme_name = "default"
+        return (type(self), theme_name, minify)
+
+    def _build_theme_styles(self, theme_name: str) -> str:
+        """テーマのスタイルを構築"""
         theme_methods = {
             "default": self.generate_default_theme,
             "dark": self.generate_dark_theme,
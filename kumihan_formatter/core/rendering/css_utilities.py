@@ -7,6 +7,23 @@ import logging
 import re
 from typing import Any, Dict, List, Optional, Union
 
+# minify_css の置換規則（コメント除去 → 空白の畳み込み → 記号前後の空白除去）
+_MINIFY_RULES = (
+    (re.compile(r"/\*.*?\*/", re.DOTALL), ""),
+    (re.compile(r"\s+"), " "),
+    (re.compile(r"\s*{\s*"), "{"),
+    (re.compile(r"\s*;?\s*}\s*"), "}"),
+    (re.compile(r":\s+"), ":"),
+    (re.compile(r";\s+"), ";"),
+)
+
+
+def minify_css(css: str) -> str:
+    """CSS最小化（コメント・改行・余分な空白を除去）"""
+    for pattern, replacement in _MINIFY_RULES:
+        css = pattern.sub(replacement, css)
+    return css.strip()
+
 
 class CSSUtilities:
     """CSS ユーティリティクラス"""
@@ -17,18 +34,7 @@ class CSSUtilities:
 
     def minify_css(self, css: str) -> str:
         """CSS最小化"""
-        # コメント除去
-        css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
-
-        # 改行・余分な空白除去
-        css = re.sub(r"\s+", " ", css)
-        css = re.sub(r";\s*}", "}", css)
-        css = re.sub(r"{\s+", "{", css)
-        css = re.sub(r"}\s+", "}", css)
-        css = re.sub(r":\s+", ":", css)
-        css = re.sub(r";\s+", ";", css)
-
-        return css.strip()
+        return minify_css(css)
 
     def validate_css(self, css: str) -> List[str]:
         """CSS検証（基本）"""
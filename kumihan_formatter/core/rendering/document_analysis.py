@@ -0,0 +1,259 @@
+"""DocumentAnalysis - 見出しID・目次・脚注・画像参照の一括解析
+
+AST（Node のリスト）またはパーサー辞書結果の elements を1回だけ走査し、
+次の情報をまとめて収集する。
+
+- 見出し: 安定したアンカーID（見出しテキストのスラッグ、重複時は -2, -3 …）
+- 目次: TOCEntry の階層ツリー（TOCFormatter にそのまま渡せる）
+- 脚注・画像参照
+
+既存の id 属性は変更せず、生成IDとの重複も避ける。
+"""
+
+import functools
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from ..ast_nodes.traversal import walk_preorder
+from .toc_generator import TOCEntry
+
+# スラッグ生成（タグ除去 → 記号除去 → 区切り正規化）
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_SLUG_STRIP_PATTERN = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATOR_PATTERN = re.compile(r"[\s_-]+")
+
+# スラッグが空になる見出しのID
+_DEFAULT_SLUG = "heading"
+
+_HEADING_LEVELS = {f"h{level}": level for level in range(1, 6)}
+_HEADING_ELEMENT_PREFIX = "heading_"
+
+
+@functools.lru_cache(maxsize=4096)
+def slugify_heading(text: str) -> str:
+    """見出しテキストからアンカーIDのスラッグを生成
+
+    HTMLタグと記号を除き、空白・アンダースコア・ハイフンの連続を
+    "-" 1文字にまとめる。日本語などの文字はそのまま残す。
+    """
+    slug = _SLUG_STRIP_PATTERN.sub("", _TAG_PATTERN.sub("", text).lower())
+    slug = _SLUG_SEPARATOR_PATTERN.sub("-", slug).strip("-")
+    return slug or _DEFAULT_SLUG
+
+
+class HeadingIdAllocator:
+    """重複しない見出しIDの割り当て
+
+    同じスラッグの2つ目以降には -2, -3 … を付ける。
+    reserve() 済みのIDは生成IDとして使わない。
+    """
+
+    def __init__(self) -> None:
+        self._used: Set[str] = set()
+        self._next_suffix: Dict[str, int] = {}
+
+    def reserve(self, heading_id: str) -> None:
+        """既存のIDを使用済みとして登録"""
+        self._used.add(heading_id)
+
+    def allocate(self, title: str) -> str:
+        """見出しテキストから未使用のIDを割り当て"""
+        base = slugify_heading(title)
+        heading_id = base
+        if heading_id in self._used:
+            suffix = self._next_suffix.get(base, 2)
+            heading_id = f"{base}-{suffix}"
+            while heading_id in self._used:
+                suffix += 1
+                heading_id = f"{base}-{suffix}"
+            self._next_suffix[base] = suffix + 1
+        self._used.add(heading_id)
+        return heading_id
+
+
+@dataclass(frozen=True)
+class FootnoteReference:
+    """脚注参照（ID・本文・元ノード）"""
+
+    footnote_id: str
+    content: str
+    node: Any
+
+
+@dataclass(frozen=True)
+class ImageReference:
+    """画像参照（ファイル名・代替テキスト・元ノード）"""
+
+    src: str
+    alt: str
+    node: Any
+
+
+@dataclass(frozen=True)
+class DocumentAnalysis:
+    """文書解析の結果
+
+    headings は HeadingCollector と同じ形式（level / id / title / node）。
+    """
+
+    headings: List[Dict[str, Any]] = field(default_factory=list)
+    toc: List[TOCEntry] = field(default_factory=list)
+    footnotes: List[FootnoteReference] = field(default_factory=list)
+    images: List[ImageReference] = field(default_factory=list)
+
+    @property
+    def has_toc(self) -> bool:
+        """目次を出力するか（見出しが2個以上）"""
+        return len(self.headings) >= 2
+
+
+def _heading_level(item: Any) -> Optional[int]:
+    """Node（type / tag）または要素辞書（heading_N）の見出しレベル"""
+    if isinstance(item, dict):
+        element_type = item.get("type", "")
+        if not element_type.startswith(_HEADING_ELEMENT_PREFIX):
+            return None
+        level = (item.get("attributes") or {}).get(
+            "level", element_type[len(_HEADING_ELEMENT_PREFIX) :]
+        )
+        try:
+            return int(level)
+        except (TypeError, ValueError):
+            return None
+
+    heading_level = _HEADING_LEVELS.get(getattr(item, "type", ""))
+    if heading_level is None:
+        tag = getattr(item, "tag", None)
+        if isinstance(tag, str):
+            heading_level = _HEADING_LEVELS.get(tag.lower())
+    return heading_level
+
+
+def _text_of(item: Any) -> str:
+    if isinstance(item, dict):
+        content = item.get("content", "")
+        return content if isinstance(content, str) else str(content)
+    get_text_content = getattr(item, "get_text_content", None)
+    if get_text_content is not None:
+        return str(get_text_content())
+    content = getattr(item, "content", "")
+    return content if isinstance(content, str) else str(content)
+
+
+def _attribute_of(item: Any, key: str) -> Any:
+    if isinstance(item, dict):
+        return (item.get("attributes") or {}).get(key)
+    return (getattr(item, "attributes", None) or {}).get(key)
+
+
+def _set_id(item: Any, heading_id: str) -> None:
+    if isinstance(item, dict):
+        attributes = item.get("attributes")
+        if not isinstance(attributes, dict):
+            attributes = item["attributes"] = {}
+        attributes["id"] = heading_id
+    else:
+        item.add_attribute("id", heading_id)
+
+
+def _build_toc(headings: List[Dict[str, Any]]) -> List[TOCEntry]:
+    """見出しの並びからレベルに応じた TOCEntry ツリーを構築"""
+    roots: List[TOCEntry] = []
+    stack: List[TOCEntry] = []
+    for heading in headings:
+        entry = TOCEntry(
+            level=heading["level"],
+            title=heading["title"],
+            heading_id=heading["id"],
+            node=heading["node"],
+        )
+        while stack and stack[-1].level >= entry.level:
+            stack.pop()
+        if stack:
+            stack[-1].add_child(entry)
+        else:
+            roots.append(entry)
+        stack.append(entry)
+    return roots
+
+
+def analyze_document(nodes: List[Any], assign_ids: bool = True) -> DocumentAnalysis:
+    """文書を1回走査して見出し・目次・脚注・画像参照を収集
+
+    Args:
+        nodes: Node のリスト、またはパーサー辞書結果の elements
+        assign_ids: id 属性の無い見出しに生成IDを設定するか
+
+    Returns:
+        DocumentAnalysis: 解析結果
+    """
+    allocator = HeadingIdAllocator()
+    headings: List[Dict[str, Any]] = []
+    pending: List[Dict[str, Any]] = []
+    footnote_nodes: List[Any] = []
+    images: List[ImageReference] = []
+
+    # 深い入れ子でも再帰しないよう明示的なスタックで前順走査
+    for item in walk_preorder(nodes):
+        level = _heading_level(item)
+        if level is not None:
+            heading = {
+                "level": level,
+                "id": _attribute_of(item, "id"),
+                "title": _text_of(item),
+                "node": item,
+            }
+            headings.append(heading)
+            if heading["id"]:
+                allocator.reserve(heading["id"])
+            else:
+                pending.append(heading)
+        else:
+            item_type = (
+                item.get("type")
+                if isinstance(item, dict)
+                else getattr(item, "type", None)
+            )
+            if item_type == "footnote":
+                footnote_nodes.append(item)
+            elif item_type == "image":
+                images.append(
+                    ImageReference(
+                        src=_text_of(item),
+                        alt=_attribute_of(item, "alt") or "",
+                        node=item,
+                    )
+                )
+
+    # 既存IDをすべて登録してから生成IDを割り当て（後方の既存IDとも衝突しない）
+    for heading in pending:
+        heading["id"] = allocator.allocate(heading["title"])
+        if assign_ids:
+            _set_id(heading["node"], heading["id"])
+
+    footnotes = [
+        FootnoteReference(
+            footnote_id=_attribute_of(node, "id") or f"footnote-{number}",
+            content=_text_of(node),
+            node=node,
+        )
+        for number, node in enumerate(footnote_nodes, start=1)
+    ]
+
+    return DocumentAnalysis(
+        headings=headings,
+        toc=_build_toc(headings),
+        footnotes=footnotes,
+        images=images,
+    )
+
+
+__all__ = [
+    "DocumentAnalysis",
+    "FootnoteReference",
+    "HeadingIdAllocator",
+    "ImageReference",
+    "analyze_document",
+    "slugify_heading",
+]
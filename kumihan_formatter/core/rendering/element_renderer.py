@@ -0,0 +1,163 @@
+"""ElementRenderer - 要素辞書のテーブル駆動レンダリング
+
+パーサー辞書結果（elements）の各要素を、要素タイプをキーにした
+ディスパッチ表で描画する。見出し・Kumihanブロックの開始/終了タグは
+事前に構築し、エスケープはモジュール共通の escape_html を使う。
+
+render_elements() は elements 全体を1回の join で連結する一括描画の入口。
+"""
+
+import functools
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+from ..parsing.grammar import get_grammar
+from ..utilities.logger import get_logger
+
+# 未知の装飾・既定の Kumihan ブロッククラス
+_DEFAULT_BLOCK_CLASS = "note"
+
+
+def escape_html(text: str) -> str:
+    """HTML エスケープ（& < > " ' の5文字）
+
+    CPython では置換対象の無い文字列に対する str.replace が複製を作らず、
+    str.translate（1文字ずつの表引き）より速いため、置換の連鎖で実装する。
+    """
+    if not text:
+        return ""
+
+    return (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&#39;")
+    )
+
+
+def _build_heading_tags() -> Dict[Any, Tuple[str, str]]:
+    tags: Dict[Any, Tuple[str, str]] = {}
+    for level in range(1, 7):
+        pair = (f"<h{level}>", f"</h{level}>")
+        tags[level] = tags[str(level)] = pair
+    return tags
+
+
+@functools.lru_cache(maxsize=256)
+def _block_open_tag(decoration: str) -> str:
+    """装飾名 → Kumihanブロックの開始タグ（装飾名ごとに1度だけ構築）"""
+    css_class = get_grammar().decoration_classes.get(
+        decoration.lower().strip(), _DEFAULT_BLOCK_CLASS
+    )
+    return f'<div class="kumihan-block {css_class}">'
+
+
+_HEADING_TAGS = _build_heading_tags()
+
+
+def _render_kumihan_block(content: Any, attributes: Mapping[str, Any]) -> str:
+    open_tag = _block_open_tag(attributes.get("decoration", ""))
+    return f"{open_tag}{escape_html(content)}</div>"
+
+
+def _render_heading(content: Any, attributes: Mapping[str, Any]) -> str:
+    level = attributes.get("level", "1")
+    tags = _HEADING_TAGS.get(level)
+    if tags is None:
+        tags = (f"<h{level}>", f"</h{level}>")
+    heading_id = attributes.get("id")
+    if heading_id:
+        # 文書解析（目次出力時）で付与されたアンカーID
+        return (
+            f'<h{level} id="{escape_html(heading_id)}">{escape_html(content)}{tags[1]}'
+        )
+    return f"{tags[0]}{escape_html(content)}{tags[1]}"
+
+
+def _render_paragraph(content: Any, attributes: Mapping[str, Any]) -> str:
+    # contentはインライン書式処理済み
+    return f"<p>{content}</p>"
+
+
+def _render_list_item(content: Any, attributes: Mapping[str, Any]) -> str:
+    return f"<li>{escape_html(content)}</li>"
+
+
+_Handler = Callable[[Any, Mapping[str, Any]], str]
+
+# attributes の無い要素に渡す空の属性（要素ごとに辞書を作らない）
+_NO_ATTRIBUTES: Mapping[str, Any] = MappingProxyType({})
+
+_HANDLERS: Dict[str, _Handler] = {
+    "kumihan_block": _render_kumihan_block,
+    "paragraph": _render_paragraph,
+    "list_item": _render_list_item,
+}
+
+
+class ElementRenderer:
+    """要素辞書のテーブル駆動レンダラー
+
+    ディスパッチ表は要素タイプ → 描画関数。"heading_*" やその他の
+    タイプは初回出現時に描画関数を決定して表に追加する。
+    """
+
+    def __init__(self) -> None:
+        self.logger = get_logger(__name__)
+        self._handlers: Dict[str, _Handler] = dict(_HANDLERS)
+
+    def _handler_for(self, element_type: str) -> _Handler:
+        handler = self._handlers.get(element_type)
+        if handler is None:
+            if element_type.startswith("heading_"):
+                handler = _render_heading
+            else:
+                open_tag = f'<div class="element-{element_type}">'
+
+                def handler(content: Any, attributes: Mapping[str, Any]) -> str:
+                    return f"{open_tag}{escape_html(content)}</div>"
+
+            self._handlers[element_type] = handler
+        return handler
+
+    def render(self, element: Dict[str, Any]) -> str:
+        """単一要素のHTMLレンダリング（失敗時はエラー表示のHTML）"""
+        try:
+            handler = self._handler_for(element.get("type", ""))
+            return handler(
+                element.get("content", ""), element.get("attributes", _NO_ATTRIBUTES)
+            )
+        except Exception as e:
+            self.logger.error(f"Single element rendering failed: {e}")
+            return f'<div class="error">要素レンダリングエラー: {str(e)}</div>'
+
+    def render_elements(self, elements: Iterable[Dict[str, Any]]) -> str:
+        """要素列を描画し、空でない断片を改行区切りで1回の join で連結
+
+        描画に失敗する要素を含む場合は要素ごとに render() で描き直し、
+        失敗した要素のみエラー表示にする。
+        """
+        if not isinstance(elements, list):
+            elements = list(elements)
+
+        handlers = self._handlers
+        parts: List[str] = []
+        append = parts.append
+        try:
+            for element in elements:
+                element_type = element.get("type", "")
+                handler = handlers.get(element_type) or self._handler_for(element_type)
+                html_part = handler(
+                    element.get("content", ""),
+                    element.get("attributes", _NO_ATTRIBUTES),
+                )
+                if html_part:
+                    append(html_part)
+
+        except Exception:
+            parts = [html_part for html_part in map(self.render, elements) if html_part]
+        return "\n".join(parts)
+
+
+__all__ = ["ElementRenderer", "escape_html"]
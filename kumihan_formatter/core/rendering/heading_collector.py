@@ -7,12 +7,13 @@ to reduce the size of main_renderer.py and maintain the 300-line limit.
 from typing import Any, List
 
 from ..ast_nodes import Node
+from .document_analysis import analyze_document
 
 
 class HeadingCollector:
     """Handles collection of headings for TOC generation"""
 
-    MAX_DEPTH = 50  # Prevent infinite recursion
+    MAX_DEPTH = 50  # 互換用（走査は再帰しないため未使用）
 
     def __init__(self) -> None:
         """Initialize heading collector"""
@@ -24,42 +25,18 @@ class HeadingCollector:
         """
         Collect all headings from nodes for TOC generation
 
+        入れ子の見出しも含めて1回の走査で収集し、id 属性の無い見出しには
+        見出しテキストから重複しないIDを付与する。
+
         Args:
             nodes: List of nodes to search
-            depth: Current recursion depth (prevents infinite recursion)
+            depth: 互換用（走査は再帰しないため深さ制限は不要）
 
         Returns:
             list[Dict]: List of heading information
         """
-        headings: List[dict[str, Any]] = []
-
-        if depth > self.MAX_DEPTH:
-            return headings
-
-        for node in nodes:
-            if node.is_heading():
-                level = node.get_heading_level()
-                if level:
-                    heading_id = node.get_attribute("id")
-                    if not heading_id:
-                        self.heading_counter += 1
-                        heading_id = f"heading-{self.heading_counter}"
-                        node.add_attribute("id", heading_id)
-
-                    headings.append(
-                        {
-                            "level": level,
-                            "id": heading_id,
-                            "title": node.get_text_content(),
-                            "node": node,
-                        }
-                    )
-
-                # Recursively search in content with depth tracking
-                if isinstance(node.content, list):
-                    child_headings = self.collect_headings(node.content, depth + 1)
-                    headings.extend(child_headings)
-
+        headings = analyze_document(nodes).headings
+        self.heading_counter += len(headings)
         return headings
 
     def reset_counters(self) -> None:
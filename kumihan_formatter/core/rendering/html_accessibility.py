@@ -7,6 +7,8 @@ HTMLFormatter分割により抽出 (Phase3最適化)
 import re
 from typing import Dict, List, Tuple
 
+from .document_analysis import slugify_heading
+
 
 class HTMLAccessibilityProcessor:
     """HTMLアクセシビリティ処理専用クラス"""
@@ -82,25 +84,8 @@ class HTMLAccessibilityProcessor:
         return "画像"
 
     def _generate_heading_id(self, content: str) -> str:
-        """見出しテキストからID属性を生成"""
-        # HTML タグを除去
-        clean_content = re.sub(r"<[^>]+>", "", content)
-
-        # 日本語文字を含む場合の処理
-        if re.search(r"[ひらがなカタカナ漢字]", clean_content):
-            # 日本語の場合は英数字のみ抽出して使用
-            alphanumeric = re.findall(r"[a-zA-Z0-9]+", clean_content)
-            if alphanumeric:
-                id_text = "-".join(alphanumeric[:3])  # 最初の3つの英数字グループ
-            else:
-                id_text = "heading"
-        else:
-            # 英語の場合は通常の処理
-            id_text = clean_content.lower()
-            id_text = re.sub(r"[^a-z0-9\s-]", "", id_text)
-            id_text = re.sub(r"\s+", "-", id_text.strip())
-
-        return id_text[:50]  # 長さ制限
+        """見出しテキストからID属性を生成（文書解析と共通のスラッグ）"""
+        return slugify_heading(content)[:50]  # 長さ制限
 
     def validate_html(self, html_content: str) -> Tuple[bool, List[str]]:
         """HTMLの基本的なアクセシビリティ検証"""
@@ -6,6 +6,8 @@ CSS関連の処理をすべて統合
 
 from typing import Any, Dict, Optional
 
+from ..parsing.grammar import get_grammar
+
 
 class HTMLCSSProcessor:
     """HTML CSS処理専用クラス"""
@@ -70,25 +72,7 @@ class HTMLCSSProcessor:
             return ""
 
         # 日本語キーワードマッピング
-        jp_keyword_map = {
-            "太字": "bold",
-            "ボールド": "bold",
-            "イタリック": "italic",
-            "斜体": "italic",
-            "見出し": "heading",
-            "ヘッダー": "header",
-            "タイトル": "title",
-            "脚注": "footnote",
-            "注釈": "annotation",
-            "リンク": "link",
-            "画像": "image",
-            "図": "figure",
-            "コード": "code",
-            "引用": "quote",
-            "リスト": "list",
-            "テーブル": "table",
-            "表": "table",
-        }
+        jp_keyword_map = get_grammar().keyword_classes
 
         # 日本語キーワードを英語に変換
         keyword_lower = keyword.lower().strip()
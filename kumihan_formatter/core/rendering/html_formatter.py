@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional
 
 from kumihan_formatter.core.ast_nodes.node import Node
 from .css_processor import CSSProcessor
+from .document_analysis import analyze_document
 from .html_utilities import HTMLUtilities
 from .html_formatter_core import HTMLFormatterCore, HTMLValidator
 from .html_footnote_processor import FootnoteManager
@@ -105,25 +106,8 @@ class HtmlFormatter:
 
     # 目次生成
     def generate_toc(self, nodes: List[Node]) -> str:
-        """目次生成"""
-        headings = []
-
-        # ノードから見出し要素を抽出
-        for node in nodes:
-            if hasattr(node, "tag") and node.tag.lower() in [
-                "h1",
-                "h2",
-                "h3",
-                "h4",
-                "h5",
-                "h6",
-            ]:
-                level = int(node.tag[1])
-                title = getattr(node, "content", "")
-                heading_id = self.utilities.generate_heading_id(title)
-
-                headings.append({"level": level, "title": title, "id": heading_id})
-
+        """目次生成（見出しの収集・ID付与は1回の文書走査で行う）"""
+        headings = analyze_document(nodes).headings
         return self.utilities.generate_toc_from_headings(headings)
 
     # 拡張機能
@@ -5,6 +5,7 @@ HTMLFormatterCore - HTMLフォーマッター中核処理
 Issue #1215対応: 不足していたHTMLFormatterCoreクラスの実装
 """
 
+import html
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -141,8 +142,6 @@ class HTMLFormatterCore:
 
     def _escape_html(self, text: str) -> str:
         """HTML文字列のエスケープ"""
-        import html
-
         return html.escape(str(text))
 
     def get_renderer_info(self) -> Dict[str, Any]:
@@ -9,6 +9,8 @@ import html
 import re
 from typing import Any, Dict, List, Optional
 
+from .document_analysis import slugify_heading
+
 
 class HTMLUtilities:
     """HTML処理ユーティリティクラス - 基本実装"""
@@ -51,16 +53,8 @@ class HTMLUtilities:
         Returns:
             生成されたID
         """
-        # 基本的なID生成（英数字とハイフンのみ）
-        clean_title = re.sub(r"[^\w\s-]", "", title.lower())
-        clean_title = re.sub(r"[\s_-]+", "-", clean_title)
-        clean_title = clean_title.strip("-")
-
-        if not clean_title:
-            clean_title = "heading"
-
         self._heading_counter += 1
-        return f"{clean_title}-{self._heading_counter}"
+        return f"{slugify_heading(title)}-{self._heading_counter}"
 
     def generate_toc_from_headings(self, headings: List[Dict[str, Any]]) -> str:
         """
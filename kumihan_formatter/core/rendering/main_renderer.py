@@ -1,10 +1,53 @@
 """MainRenderer - 統合レンダラーシステム緊急実装 (Issue #1221対応)"""
 
 from ...core.utilities.logger import get_logger
+from ..parsing.grammar import get_grammar
+from .css_assets import CSS_MODE_LINK, KUMIHAN_DOCUMENT_CSS, emit_css_asset
+from .document_analysis import analyze_document
+from .element_renderer import ElementRenderer, escape_html
 from .markdown_renderer import MarkdownRenderer
 from .simple_compat_renderer import SimpleCompatRenderer
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from ..templates.template_engine import TemplateSplit
+
+# 完全HTML文書のフッタ部（_render_kumihan_elements / render_to_stream 共通）
+_KUMIHAN_DOCUMENT_TAIL = "\n</body>\n</html>"
+
+
+def _with_heading_ids(nodes: List[Any], headings: List[Dict[str, Any]]) -> List[Any]:
+    """解析済みの見出しIDを反映したノード列
+
+    Node には id 属性を設定し、要素辞書は元の辞書を変更せず複製する。
+    """
+    heading_ids = {id(heading["node"]): heading["id"] for heading in headings}
+    result: List[Any] = []
+    for node in nodes:
+        heading_id = heading_ids.get(id(node))
+        if heading_id is not None and isinstance(node, dict):
+            attributes = node.get("attributes") or {}
+            if attributes.get("id") != heading_id:
+                node = {**node, "attributes": {**attributes, "id": heading_id}}
+        result.append(node)
+    for heading in headings:
+        node = heading["node"]
+        if not isinstance(node, dict) and not node.get_attribute("id"):
+            node.add_attribute("id", heading["id"])
+    return result
 
 
 class MainRenderer:
@@ -46,6 +89,8 @@ class MainRenderer:
         self._element_delegate: Optional[Any] = None
         # Simple互換出力を専用モジュールに委譲
         self._simple_renderer = SimpleCompatRenderer()
+        # 要素辞書の描画（テーブル駆動）
+        self.element_renderer = ElementRenderer()
 
     def _create_html_formatter(self) -> Any:
         """HTML formatter placeholder for compatibility"""
@@ -61,8 +106,12 @@ class MainRenderer:
                         if element.type == "p":
                             html_parts.append(f"<p>{str(element.content)}</p>")
                         elif element.type.startswith("h"):
+                            heading_id = (
+                                getattr(element, "attributes", None) or {}
+                            ).get("id")
+                            id_attr = f' id="{heading_id}"' if heading_id else ""
                             html_parts.append(
-                                f"<{element.type}>{str(element.content)}</{element.type}>"
+                                f"<{element.type}{id_attr}>{str(element.content)}</{element.type}>"
                             )
                         else:
                             html_parts.append(
@@ -184,6 +233,8 @@ class MainRenderer:
             template: テンプレート名（contextに統合、後方互換性維持）
             context: レンダリングコンテキスト
                 - template: テンプレート名
+                - css_mode: "link" で <style> の代わりに共有スタイルシートを参照
+                  （css_dir 省略時は出力先ディレクトリへ書き出す）
                 - その他レンダリングオプション
 
         Returns:
@@ -209,6 +260,8 @@ class MainRenderer:
             if template:
                 context["template"] = template
                 self.logger.debug(f"Template specified: {template}")
+            if context.get("css_mode") == CSS_MODE_LINK:
+                context.setdefault("css_dir", str(output_path.parent))
 
             # メインレンダリング処理実行
             self.logger.debug("Starting file rendering process")
@@ -242,6 +295,57 @@ class MainRenderer:
             self.logger.error(error_detail, exc_info=True)
             return False
 
+    def render_to_stream(
+        self,
+        parsed_result: Any,
+        fp: TextIO,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        ストリーム出力レンダリング - 生成しながら書き込み
+
+        Args:
+            parsed_result: パーサーからの解析結果（renderメソッドと同様）
+            fp: 書き込み先テキストストリーム（open(..., "w") 等）
+            context: レンダリングコンテキスト
+
+        Returns:
+            int: 書き込んだ文字数
+
+        Raises:
+            OSError: 書き込み失敗時（レンダリングエラーはrender同様にエラーHTML化）
+
+        Notes:
+            - パーサー辞書結果は要素ごとに書き込むため、文書全体の文字列を
+              保持せず、レンダリングも1回だけ実行されます。
+            - その他の型は render() の結果をそのまま書き込みます。
+        """
+        context = context or {}
+
+        if not (isinstance(parsed_result, dict) and "elements" in parsed_result):
+            html_content = self.render(parsed_result, context)
+            fp.write(html_content)
+            return len(html_content)
+
+        written = 0
+        try:
+            fragments = self._iter_kumihan_document(parsed_result, context)
+            for fragment in fragments:
+                fp.write(fragment)
+                written += len(fragment)
+        except OSError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Kumihan elements rendering failed: {e}")
+            error_html = (
+                f'<div class="error">Kumihan要素レンダリングエラー: {str(e)}</div>'
+            )
+            fp.write(error_html)
+            written += len(error_html)
+
+        self.logger.info(f"Stream rendering completed: {written} chars")
+        return written
+
     def get_renderer_info(self) -> Dict[str, Any]:
         """レンダラー情報取得"""
         return {
@@ -266,14 +370,31 @@ class MainRenderer:
     ) -> str:
         """完全なHTML文書生成"""
         try:
-            context = context or {}
+            nodes, context = self._with_document_analysis(nodes, context or {})
 
             # コンテンツ部分をレンダリング
             body_content = self.html_formatter.render(nodes, context)
 
+            # context["template"] に .j2 テンプレートが指定されていれば使用
+            split = self._template_split(context)
+            if split is not None:
+                return split.join(body_content)
+
+            # 目次・脚注（context["toc"] 指定時のみ）
+            toc_html, footnotes_html = self._document_sections(context)
+            body_content = "\n".join(
+                part for part in (toc_html, body_content, footnotes_html) if part
+            )
+
             # ページタイトル決定
             title = context.get("title", "Kumihan文書")
 
+            # 共有スタイルシート参照（css_mode="link"）
+            stylesheet_link = self._stylesheet_link(context)
+            if stylesheet_link is not None:
+                head = self._kumihan_document_head(title, stylesheet_link)
+                return f"{head}{body_content}{_KUMIHAN_DOCUMENT_TAIL}"
+
             # 完全HTML文書テンプレート
             complete_html = f"""<!DOCTYPE html>
 <html lang="ja">
@@ -315,168 +436,213 @@ class MainRenderer:
     ) -> str:
         """Kumihan要素専用レンダリング"""
         try:
-            context = context or {}
             elements = parsed_dict.get("elements", [])
+            elements, context = self._with_document_analysis(elements, context or {})
 
-            # 個別要素をHTMLに変換
-            html_parts = []
-            for element in elements:
-                html_part = self._render_single_element(element)
-                if html_part:
-                    html_parts.append(html_part)
+            # 要素全体を1回の join で描画し、ヘッダ・フッタで挟む
+            body = self.element_renderer.render_elements(elements)
+            return "".join(self._iter_document_parts((body,), context))
 
-            # 完全HTML文書として組み立て
-            body_content = "\n".join(html_parts)
+        except Exception as e:
+            self.logger.error(f"Kumihan elements rendering failed: {e}")
+            return f'<div class="error">Kumihan要素レンダリングエラー: {str(e)}</div>'
+
+    def _iter_kumihan_document(
+        self, parsed_dict: Dict[str, Any], context: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """Kumihan要素を完全HTML文書の断片として順に生成
+
+        ヘッダ部・要素ごとのHTML・フッタ部を生成順に返すため、
+        呼び出し側は文書全体を保持せずに出力先へ書き込める。
+        """
+        elements = parsed_dict.get("elements", [])
+        elements, context = self._with_document_analysis(elements, context or {})
+        yield from self.render_iter(elements, context)
 
+    def render_iter(
+        self,
+        elements: Iterable[Dict[str, Any]],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """要素辞書の反復から完全HTML文書の断片を順に生成
+
+        要素は受け取るたびにレンダリングして返すため、MainParser.parse_iter
+        と組み合わせると入力・出力とも全体を保持せずに変換できる。
+        断片を連結した結果は同じ要素の辞書結果に対する render() と同一。
+
+        Args:
+            elements: 要素辞書の反復（parse_simple_kumihan の elements と同形式）
+            context: レンダリングコンテキスト
+
+        Yields:
+            str: ヘッダ部・要素ごとのHTML・フッタ部
+        """
+        html_parts = (self._render_single_element(element) for element in elements)
+        yield from self._iter_document_parts(html_parts, context)
+
+    def _iter_document_parts(
+        self, html_parts: Iterable[str], context: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """要素ごとのHTML断片をヘッダ・フッタで挟んで順に生成"""
+        context = context or {}
+
+        split = self._template_split(context)
+        if split is not None:
+            yield split.prefix
+        else:
             # ページタイトル決定
             title = context.get("title", "Kumihan文書")
+            yield self._kumihan_document_head(title, self._stylesheet_link(context))
+
+            # 目次・脚注（context["toc"] 指定時のみ）を本文の前後に置く
+            toc_html, footnotes_html = self._document_sections(context)
+            if toc_html or footnotes_html:
+                html_parts = chain((toc_html,), html_parts, (footnotes_html,))
+
+        # 空要素はスキップ、要素間は改行区切り
+        first = True
+        for html_part in html_parts:
+            if not html_part:
+                continue
+            if first:
+                first = False
+                yield html_part
+            else:
+                yield "\n" + html_part
 
-            # 完全HTML文書テンプレート（Kumihanスタイル付き）
-            complete_html = f"""<!DOCTYPE html>
+        yield split.suffix if split is not None else _KUMIHAN_DOCUMENT_TAIL
+
+    def _with_document_analysis(
+        self, nodes: List[Any], context: Dict[str, Any]
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """context["toc"] 指定時、文書解析の結果をコンテキストに追加
+
+        文書を1回だけ走査して見出しにアンカーIDを付与し、目次・脚注の
+        HTMLを has_toc / toc_html / has_footnotes / footnotes_html として渡す。
+        要素辞書はキャッシュ共有され得るため、ID付きの見出しは複製して返す。
+        未指定時や解析に失敗した場合は nodes・context をそのまま返す。
+        """
+        if not context.get("toc"):
+            return nodes, context
+
+        try:
+            from .html_footnote_processor import FootnoteManager
+            from .toc_formatter import TOCFormatter
+
+            analysis = analyze_document(nodes, assign_ids=False)
+            nodes = _with_heading_ids(nodes, analysis.headings)
+
+            footnote_manager = FootnoteManager()
+            for footnote in analysis.footnotes:
+                footnote_manager.add_footnote(
+                    escape_html(footnote.footnote_id), escape_html(footnote.content)
+                )
+
+            return nodes, {
+                **context,
+                "has_toc": analysis.has_toc,
+                "toc_html": (
+                    TOCFormatter().format_html(analysis.toc) if analysis.has_toc else ""
+                ),
+                "has_footnotes": bool(analysis.footnotes),
+                "footnotes_html": footnote_manager.get_footnotes_html(),
+            }
+        except Exception as e:
+            self.logger.error(f"Document analysis failed: {e}")
+            return nodes, context
+
+    def _document_sections(self, context: Dict[str, Any]) -> Tuple[str, str]:
+        """組み込み文書の本文前後に置く目次・脚注のHTML"""
+        if not context.get("toc"):
+            return "", ""
+        toc_html = context.get("toc_html", "") if context.get("has_toc") else ""
+        return toc_html, context.get("footnotes_html", "")
+
+    def _template_split(self, context: Dict[str, Any]) -> Optional["TemplateSplit"]:
+        """context["template"] の .j2 テンプレートを本文の前後で分割
+
+        テンプレートはプロセス内で1度だけコンパイルされ、本文以外の
+        コンテキストが同じ文書では分割結果を再利用する。
+        組み込み文書（"default" 等）や読み込めないテンプレートは None。
+        """
+        from ..templates.template_engine import get_template_engine
+
+        engine = get_template_engine()
+        template_name = engine.resolve(context.get("template"))
+        if template_name is None:
+            return None
+
+        try:
+            template = engine.get_template(template_name)
+            return template.split({"title": "Kumihan文書", "css_vars": {}, **context})
+        except Exception as e:
+            self.logger.error(f"Template rendering failed ({template_name}): {e}")
+            return None
+
+    def render_element(self, element: Dict[str, Any]) -> str:
+        """単一要素をHTML断片にレンダリング（インクリメンタル変換用）"""
+        return self._render_single_element(element)
+
+    def assemble_kumihan_document(
+        self, html_parts: Iterable[str], context: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """レンダリング済み要素断片から完全HTML文書を組み立て
+
+        render() が辞書結果に対して生成する文書と同一の形式になる。
+        """
+        return "".join(self._iter_document_parts(html_parts, context))
+
+    def _kumihan_document_head(
+        self, title: str, stylesheet_link: Optional[str] = None
+    ) -> str:
+        """完全HTML文書のヘッダ部（Kumihanスタイル付き）
+
+        stylesheet_link 指定時は <style> の代わりに <link> タグを出力する。
+        """
+        if stylesheet_link is None:
+            styles = f"<style>\n{KUMIHAN_DOCUMENT_CSS}    </style>"
+        else:
+            styles = stylesheet_link
+        return f"""<!DOCTYPE html>
 <html lang="ja">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        .error {{
-            color: #d32f2f;
-            background: #ffebee;
-            padding: 10px;
-            border-radius: 4px;
-            border-left: 4px solid #d32f2f;
-        }}
-        .kumihan-block {{
-            margin: 16px 0;
-            padding: 12px 16px;
-            border-radius: 6px;
-            border-left: 4px solid;
-        }}
-        .kumihan-block.important {{
-            background-color: #fff3e0;
-            border-color: #f57c00;
-            color: #e65100;
-        }}
-        .kumihan-block.info {{
-            background-color: #e3f2fd;
-            border-color: #1976d2;
-            color: #0d47a1;
-        }}
-        .kumihan-block.warning {{
-            background-color: #fff8e1;
-            border-color: #f9a825;
-            color: #f57f17;
-        }}
-        .kumihan-block.note {{
-            background-color: #f3e5f5;
-            border-color: #7b1fa2;
-            color: #4a148c;
-        }}
-        h1, h2, h3, h4, h5, h6 {{
-            margin: 24px 0 16px 0;
-            font-weight: 600;
-        }}
-        p {{
-            margin: 16px 0;
-        }}
-        ul, ol {{
-            margin: 16px 0;
-            padding-left: 32px;
-        }}
-        li {{
-            margin: 4px 0;
-        }}
-        strong {{
-            font-weight: 600;
-        }}
-    </style>
+    {styles}
 </head>
 <body>
-{body_content}
-</body>
-</html>"""
+"""
 
-            return complete_html
+    def _stylesheet_link(self, context: Dict[str, Any]) -> Optional[str]:
+        """css_mode="link" のときの共有スタイルシート <link> タグ
 
+        context["css_dir"] 指定時は kumihan.<hash>.css を書き出す。
+        href は context["css_href"]（省略時はファイル名）。
+        アセットを用意できない場合は None（<style> 埋め込みに戻す）。
+        """
+        if context.get("css_mode") != CSS_MODE_LINK:
+            return None
+
+        try:
+            asset = emit_css_asset(context)
+            return asset.link_tag(context.get("css_href") or "")
         except Exception as e:
-            self.logger.error(f"Kumihan elements rendering failed: {e}")
-            return f'<div class="error">Kumihan要素レンダリングエラー: {str(e)}</div>'
+            self.logger.error(f"CSS asset emission failed: {e}")
+            return None
 
     def _render_single_element(self, element: Dict[str, Any]) -> str:
         """単一要素のHTMLレンダリング"""
-        try:
-            element_type = element.get("type", "")
-            content = element.get("content", "")
-            attributes = element.get("attributes", {})
-
-            if element_type == "kumihan_block":
-                # Kumihanブロックの特別処理
-                decoration = attributes.get("decoration", "").lower()
-                css_class = self._get_kumihan_css_class(decoration)
-                return f'<div class="kumihan-block {css_class}">{self._escape_html(content)}</div>'
-
-            elif element_type.startswith("heading_"):
-                # 見出しレンダリング
-                level = attributes.get("level", "1")
-                return f"<h{level}>{self._escape_html(content)}</h{level}>"
-
-            elif element_type == "paragraph":
-                # 段落レンダリング（インライン書式対応）
-                return f"<p>{content}</p>"  # contentは既にprocessed
-
-            elif element_type == "list_item":
-                # リスト項目レンダリング
-                return f"<li>{self._escape_html(content)}</li>"
-
-            else:
-                # その他の要素
-                return f'<div class="element-{element_type}">{self._escape_html(content)}</div>'
-
-        except Exception as e:
-            self.logger.error(f"Single element rendering failed: {e}")
-            return f'<div class="error">要素レンダリングエラー: {str(e)}</div>'
+        return self.element_renderer.render(element)
 
     def _get_kumihan_css_class(self, decoration: str) -> str:
         """Kumihan装飾からCSS class取得"""
         decoration = decoration.lower().strip()
-
-        # 装飾名のマッピング
-        decoration_map = {
-            "重要": "important",
-            "情報": "info",
-            "注意": "warning",
-            "注目": "warning",
-            "メモ": "note",
-            "覚書": "note",
-            # 英語版
-            "important": "important",
-            "info": "info",
-            "warning": "warning",
-            "note": "note",
-        }
-
-        return decoration_map.get(decoration, "note")
+        return get_grammar().decoration_classes.get(decoration, "note")
 
     def _escape_html(self, text: str) -> str:
         """HTML エスケープ処理"""
-        if not text:
-            return ""
-
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&#39;")
-        )
+        return escape_html(text)
 
     def render_simple_parsed_data(self, parsed_data: Dict[str, Any]) -> str:
         """SimpleHTMLRendererとの互換性確保（統合版）
@@ -10,6 +10,8 @@ from __future__ import annotations
 from typing import Any, Dict, List
 
 from ...core.utilities.logger import get_logger
+from ..parsing.grammar import get_grammar
+from .element_renderer import escape_html
 
 
 class SimpleCompatRenderer:
@@ -104,15 +106,7 @@ class SimpleCompatRenderer:
         return f'<{tag} class="list-{list_type}"><li>{self._escape_html(content)}</li></{tag}>'
 
     def _get_simple_decoration_class(self, decoration: str) -> str:
-        decoration_map = {
-            "重要": "important",
-            "注意": "warning",
-            "情報": "info",
-            "引用": "quote",
-            "コード": "code",
-            "例": "example",
-        }
-        return decoration_map.get(decoration, "default")
+        return get_grammar().simple_decoration_classes.get(decoration, "default")
 
     def _wrap_in_simple_html_document(self, body_content: str) -> str:
         from datetime import datetime
@@ -260,17 +254,8 @@ class SimpleCompatRenderer:
             font-size: 0.9em;
         }"""
 
-    # Local escape (MainRendererの _escape_html と同等の挙動)
     def _escape_html(self, text: str) -> str:
-        if not text:
-            return ""
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&#39;")
-        )
+        return escape_html(text)
 
 
 __all__ = ["SimpleCompatRenderer"]
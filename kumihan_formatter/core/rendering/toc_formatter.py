@@ -1,10 +1,12 @@
-from typing import Any, TYPE_CHECKING
-
 """TOC Formatter class for Kumihan-Formatter
 
 This module contains the TOC formatting logic.
 """
 
+from __future__ import annotations
+
+from typing import Any, TYPE_CHECKING
+
 if TYPE_CHECKING:
     from .toc_generator import TOCEntry
 
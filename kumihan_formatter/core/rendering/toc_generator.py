@@ -53,46 +53,12 @@ class TOCGenerator:
     """Minimal TOC generator (P1)
 
     入力ノード列から h1〜h5 の見出しを抽出し、階層化した TOCEntry ツリーを構築する。
+    走査とID付与は document_analysis.analyze_document に委譲する。
     """
 
     SUPPORTED = {"h1", "h2", "h3", "h4", "h5"}
 
     def generate_from_nodes(self, nodes: list[Node]) -> list[TOCEntry]:
-        stack: list[TOCEntry] = []
-        roots: list[TOCEntry] = []
-
-        for n in nodes:
-            # ノードのレベル判定（type または tag）
-            t = getattr(n, "type", None)
-            tag = getattr(n, "tag", None)
-            heading = None
-            if isinstance(t, str) and t in self.SUPPORTED:
-                heading = t
-            elif isinstance(tag, str) and tag.lower() in self.SUPPORTED:
-                heading = tag.lower()
-            if not heading:
-                continue
-
-            level = int(heading[1])
-            title = (
-                getattr(n, "content", "")
-                if isinstance(getattr(n, "content", ""), str)
-                else str(getattr(n, "content", ""))
-            )
-            entry = TOCEntry(
-                level=level,
-                title=title,
-                heading_id=f"h-{len(roots)+len(stack)+1}",
-                node=n,
-            )
-
-            # スタックをレベルに合わせて調整
-            while stack and stack[-1].level >= level:
-                stack.pop()
-            if stack:
-                stack[-1].add_child(entry)
-            else:
-                roots.append(entry)
-            stack.append(entry)
-
-        return roots
+        from .document_analysis import analyze_document
+
+        return analyze_document(nodes).toc
@@ -65,12 +65,17 @@ class SyntaxReporter:
                 ]
                 continue
 
-            errors = SyntaxReporter._validate_text(text)
+            errors = SyntaxReporter.check_text(text)
             if errors:
                 results[str(file_path)] = errors
 
         return results
 
+    @staticmethod
+    def check_text(text: str) -> list[SyntaxError]:
+        """テキストの最小構文検証を実行し、エラー一覧を返す（ルールは check_files と同じ）"""
+        return SyntaxReporter._validate_text(text)
+
     @staticmethod
     def _validate_text(text: str) -> list[SyntaxError]:
         errors: list[SyntaxError] = []
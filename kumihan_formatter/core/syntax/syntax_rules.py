@@ -11,44 +11,48 @@ class SyntaxRules:
     """Defines syntax rules and keyword validation for Kumihan markup"""
 
     # Valid keywords
-    VALID_KEYWORDS: set[str] = {
-        "太字",
-        "イタリック",
-        "下線",
-        "取り消し線",
-        "コード",
-        "引用",
-        "枠線",
-        "ハイライト",
-        "見出し1",
-        "見出し2",
-        "見出し3",
-        "見出し4",
-        "見出し5",
-        "折りたたみ",
-        "ネタバレ",
-        "中央寄せ",
-        "注意",
-        "情報",
-        "コードブロック",
-        "テスト",
-        "ルビ",
-        "脚注",
-        "リスト",
-        "画像",
-        "動画",
-        "音声",
-        # "目次" - Issue #799: 目次記法完全廃止、自動生成のみに変更
-    }
+    VALID_KEYWORDS: frozenset[str] = frozenset(
+        {
+            "太字",
+            "イタリック",
+            "下線",
+            "取り消し線",
+            "コード",
+            "引用",
+            "枠線",
+            "ハイライト",
+            "見出し1",
+            "見出し2",
+            "見出し3",
+            "見出し4",
+            "見出し5",
+            "折りたたみ",
+            "ネタバレ",
+            "中央寄せ",
+            "注意",
+            "情報",
+            "コードブロック",
+            "テスト",
+            "ルビ",
+            "脚注",
+            "リスト",
+            "画像",
+            "動画",
+            "音声",
+            # "目次" - Issue #799: 目次記法完全廃止、自動生成のみに変更
+        }
+    )
 
     # Keywords that accept color attribute
-    COLOR_KEYWORDS: set[str] = {"ハイライト"}
+    COLOR_KEYWORDS: frozenset[str] = frozenset({"ハイライト"})
 
     # alt属性は削除されました（Phase 1）
-    ALT_KEYWORDS: set[str] = set()
+    ALT_KEYWORDS: frozenset[str] = frozenset()
 
     # Heading keywords for conflict detection
-    HEADING_KEYWORDS: set[str] = {"見出し1", "見出し2", "見出し3", "見出し4", "見出し5"}
+    HEADING_KEYWORDS: frozenset[str] = frozenset(
+        {"見出し1", "見出し2", "見出し3", "見出し4", "見出し5"}
+    )
 
     @classmethod
     def is_valid_keyword(cls, keyword: str) -> bool:
@@ -153,7 +157,7 @@ class SyntaxRules:
         return sorted(cls.VALID_KEYWORDS)
 
     @staticmethod
-    def get_all_rules() -> dict[str, set[str]]:
+    def get_all_rules() -> dict[str, frozenset[str]]:
         """すべての構文ルールを辞書形式で返す（テスト互換性のため）
 
         Returns:
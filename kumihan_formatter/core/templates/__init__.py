@@ -5,6 +5,12 @@ Issue #1217対応: ディレクトリ構造最適化によるテンプレート
 
 # テンプレート関連クラス・関数の公開
 from .template_context import TemplateContext, RenderContext
+from .template_engine import (
+    CompiledTemplate,
+    TemplateEngine,
+    TemplateSyntaxError,
+    get_template_engine,
+)
 from .template_filters import TemplateFilters
 from .template_selector import TemplateSelector
 
@@ -16,4 +22,9 @@ __all__ = [
     "TemplateFilters",
     # テンプレートセレクタ
     "TemplateSelector",
+    # テンプレートエンジン
+    "TemplateEngine",
+    "CompiledTemplate",
+    "TemplateSyntaxError",
+    "get_template_engine",
 ]
@@ -0,0 +1,568 @@
+"""Template Engine - 同梱 .j2 テンプレートのコンパイル・キャッシュ
+
+kumihan_formatter/templates/ の .j2 テンプレート（Jinja2 互換のサブセット）を
+Python のコードオブジェクトにコンパイルし、プロセス内で1度だけ読み込む。
+
+- 対応構文: ``{{ 式 }}`` / ``{{ 式 | フィルタ }}`` / ``{% if %}`` ``{% elif %}``
+  ``{% else %}`` ``{% endif %}`` / ``{% include "パス" %}`` / ``{# コメント #}``
+- 式: 変数・属性参照（``css_vars.font_family``）、文字列・数値リテラル、
+  ``==`` ``!=`` ``and`` ``or`` ``not``、括弧
+- 出力は自動エスケープ（``| safe`` で無効化）。未定義の変数は空文字列として扱う
+- コンパイル結果は環境変数 KUMIHAN_TEMPLATE_CACHE_DIR（または cache_dir 引数）が
+  指定された場合のみ marshal 形式でディスクにも保存し、テンプレート（include 先を
+  含む）の mtime・サイズが変わると再コンパイルする。キャッシュはコードとして実行
+  されるため、現在のユーザーが所有し、グループ・他者が書き込めないディレクトリ・
+  ファイルのみ読み込む
+- body_content 以外のコンテキストが同じレンダリングは、本文の前後を
+  静的なプレフィックス・サフィックスとして分割・保持し、本文の連結のみで出力する
+"""
+
+import hashlib
+import html
+import importlib.util
+import json
+import logging
+import marshal
+import os
+import re
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+from .template_filters import TemplateFilters
+
+# テンプレート名 "default" は MainRenderer 組み込みの文書を使う
+BUILTIN_TEMPLATE = "default"
+
+# コンパイル済みテンプレートのディスクキャッシュ保存先（環境変数）
+TEMPLATE_CACHE_DIR_ENV_VAR = "KUMIHAN_TEMPLATE_CACHE_DIR"
+
+_TEMPLATE_DIR = Path(__file__).parent.parent.parent / "templates"
+_CACHE_FORMAT = 1
+_SPLIT_CACHE_SIZE = 32
+# 本文位置の目印（HTML エスケープの対象にならない文字で囲む）
+_BODY_SENTINEL = "\x00kumihan-body\x00"
+
+_TAG_PATTERN = re.compile(r"({{.*?}}|{%.*?%}|{#.*?#})", re.DOTALL)
+_EXPR_TOKEN_PATTERN = re.compile(
+    r"\s*(?:(?P<string>'[^']*'|\"[^\"]*\")|(?P<number>\d+(?:\.\d+)?)"
+    r"|(?P<name>[A-Za-z_]\w*)|(?P<op>==|!=|[.|()]))"
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TemplateSyntaxError(ValueError):
+    """テンプレート構文エラー"""
+
+
+class _Undefined(str):
+    """未定義値（空文字列として出力され、属性参照も未定義値を返す）"""
+
+
+_UNDEFINED = _Undefined()
+
+
+class _Markup(str):
+    """エスケープ済み文字列"""
+
+
+def _lookup(context: Mapping[str, Any], name: str, *attributes: str) -> Any:
+    """変数・属性参照（辞書キーと属性の両方を参照）"""
+    value = context.get(name, _UNDEFINED)
+    for attribute in attributes:
+        if isinstance(value, Mapping):
+            value = value.get(attribute, _UNDEFINED)
+        else:
+            value = getattr(value, attribute, _UNDEFINED)
+    return _UNDEFINED if value is None else value
+
+
+def _escape(value: Any) -> str:
+    if isinstance(value, _Markup):
+        return value
+    return html.escape(str(value), quote=True)
+
+
+def _safe(value: Any) -> _Markup:
+    return _Markup(value)
+
+
+def _filters() -> Dict[str, Callable[[Any], Any]]:
+    filters: Dict[str, Callable[[Any], Any]] = {
+        name: func
+        for name, func in TemplateFilters.get_all_filters().items()
+        if name != "highlight_keywords"
+    }
+    filters["safe"] = _safe
+    filters["e"] = filters["escape"] = lambda value: _Markup(_escape(value))
+    return filters
+
+
+class _ExpressionCompiler:
+    """式を Python 式のソースに変換（再帰下降）"""
+
+    def __init__(self, source: str, template_name: str) -> None:
+        self.template_name = template_name
+        self.tokens: List[Tuple[str, str]] = []
+        position = 0
+        source = source.strip()
+        while position < len(source):
+            match = _EXPR_TOKEN_PATTERN.match(source, position)
+            if not match or match.end() == position:
+                raise TemplateSyntaxError(
+                    f"{template_name}: 解釈できない式です: {source!r}"
+                )
+            kind = match.lastgroup or ""
+            self.tokens.append((kind, match.group(kind)))
+            position = match.end()
+        self.index = 0
+
+    def compile(self) -> str:
+        expression = self._filtered()
+        if self.index != len(self.tokens):
+            raise TemplateSyntaxError(
+                f"{self.template_name}: 式の末尾が不正です: {self.tokens[self.index:]}"
+            )
+        return expression
+
+    def _peek(self) -> Tuple[str, str]:
+        if self.index < len(self.tokens):
+            return self.tokens[self.index]
+        return ("", "")
+
+    def _take(self) -> Tuple[str, str]:
+        token = self._peek()
+        if not token[0]:
+            raise TemplateSyntaxError(f"{self.template_name}: 式が途中で終わっています")
+        self.index += 1
+        return token
+
+    def _filtered(self) -> str:
+        expression = self._or()
+        while self._peek() == ("op", "|"):
+            self._take()
+            kind, name = self._take()
+            if kind != "name":
+                raise TemplateSyntaxError(f"{self.template_name}: フィルタ名が必要です")
+            expression = f"_filters[{name!r}]({expression})"
+        return expression
+
+    def _or(self) -> str:
+        expression = self._and()
+        while self._peek() == ("name", "or"):
+            self._take()
+            expression = f"({expression} or {self._and()})"
+        return expression
+
+    def _and(self) -> str:
+        expression = self._not()
+        while self._peek() == ("name", "and"):
+            self._take()
+            expression = f"({expression} and {self._not()})"
+        return expression
+
+    def _not(self) -> str:
+        if self._peek() == ("name", "not"):
+            self._take()
+            return f"(not {self._not()})"
+        return self._compare()
+
+    def _compare(self) -> str:
+        expression = self._atom()
+        if self._peek() in (("op", "=="), ("op", "!=")):
+            operator = self._take()[1]
+            expression = f"({expression} {operator} {self._atom()})"
+        return expression
+
+    def _atom(self) -> str:
+        kind, value = self._take()
+        if kind in ("string", "number"):
+            return value
+        if (kind, value) == ("op", "("):
+            expression = self._or()
+            if self._take() != ("op", ")"):
+                raise TemplateSyntaxError(f"{self.template_name}: ')' が必要です")
+            return expression
+        if kind != "name":
+            raise TemplateSyntaxError(f"{self.template_name}: 不正な式: {value!r}")
+        if value in ("true", "True", "false", "False", "none", "None"):
+            return value.capitalize()
+        path = [value]
+        while self._peek() == ("op", "."):
+            self._take()
+            attribute_kind, attribute = self._take()
+            if attribute_kind != "name":
+                raise TemplateSyntaxError(f"{self.template_name}: 属性名が必要です")
+            path.append(attribute)
+        return f"_lookup(ctx, {', '.join(repr(p) for p in path)})"
+
+
+@dataclass
+class _CompileState:
+    lines: List[str] = field(default_factory=lambda: ["def render(ctx, _out):"])
+    depth: int = 1
+    blocks: List[str] = field(default_factory=list)
+
+    def emit(self, line: str) -> None:
+        self.lines.append("    " * self.depth + line)
+
+
+@dataclass(frozen=True)
+class TemplateSplit:
+    """本文の前後で分割したレンダリング結果"""
+
+    prefix: str
+    suffix: str
+
+    def join(self, body: str) -> str:
+        return self.prefix + body + self.suffix
+
+
+class CompiledTemplate:
+    """コンパイル済みテンプレート
+
+    Attributes:
+        name: テンプレート名（テンプレートディレクトリからの相対パス）
+        dependencies: (ファイルパス, mtime_ns, サイズ) のタプル（include 先を含む）
+    """
+
+    def __init__(
+        self,
+        name: str,
+        code: CodeType,
+        dependencies: Tuple[Tuple[str, int, int], ...],
+    ) -> None:
+        self.name = name
+        self.dependencies = dependencies
+        namespace: Dict[str, Any] = {
+            "_lookup": _lookup,
+            "_escape": _escape,
+            "_filters": _filters(),
+        }
+        exec(code, namespace)
+        self._render: Callable[[Mapping[str, Any], Callable[[str], None]], None] = (
+            namespace["render"]
+        )
+        self._splits: "OrderedDict[str, Optional[TemplateSplit]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_current(self) -> bool:
+        """テンプレートファイルが更新されていないか"""
+        return _dependencies_current(self.dependencies)
+
+    def render(self, context: Mapping[str, Any]) -> str:
+        """コンテキストを適用して文字列を生成"""
+        parts: List[str] = []
+        self._render(context, parts.append)
+        return "".join(parts)
+
+    def split(self, context: Mapping[str, Any]) -> Optional[TemplateSplit]:
+        """body_content の前後で分割したレンダリング結果
+
+        body_content 以外のコンテキストが同じ呼び出しでは分割結果を再利用する。
+        本文がちょうど1回出力されないテンプレートでは None を返す。
+        """
+        static_context = {k: v for k, v in context.items() if k != "body_content"}
+        key = json.dumps(static_context, sort_keys=True, default=str)
+        with self._lock:
+            if key in self._splits:
+                self._splits.move_to_end(key)
+                return self._splits[key]
+
+        rendered = self.render({**static_context, "body_content": _BODY_SENTINEL})
+        pieces = rendered.split(_BODY_SENTINEL)
+        split = None
+        if len(pieces) == 2:
+            prefix, suffix = pieces
+            split = TemplateSplit(prefix, suffix)
+
+        with self._lock:
+            self._splits[key] = split
+            if len(self._splits) > _SPLIT_CACHE_SIZE:
+                self._splits.popitem(last=False)
+        return split
+
+
+def _dependencies_current(dependencies: Tuple[Tuple[str, int, int], ...]) -> bool:
+    for path, mtime_ns, size in dependencies:
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return False
+        if file_stat.st_mtime_ns != mtime_ns or file_stat.st_size != size:
+            return False
+    return True
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """現在のユーザーが所有し、グループ・他者が書き込めないか"""
+    getuid = getattr(os, "getuid", None)
+    if getuid is None:  # Windows: POSIX の所有者・権限ビットは使えない
+        return True
+    return st.st_uid == getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+class TemplateEngine:
+    """テンプレートの読み込み・コンパイル・キャッシュ
+
+    Args:
+        template_dir: テンプレートディレクトリ（省略時は同梱テンプレート）
+        cache_dir: コンパイル結果の保存先（省略時は環境変数
+            KUMIHAN_TEMPLATE_CACHE_DIR、未設定ならディスクキャッシュを使わない）。
+            False を指定すると環境変数があってもディスクキャッシュを使わない
+    """
+
+    def __init__(
+        self,
+        template_dir: Optional[Union[str, Path]] = None,
+        cache_dir: Optional[Union[str, Path, bool]] = None,
+    ) -> None:
+        self.template_dir = Path(template_dir or _TEMPLATE_DIR).resolve()
+        if cache_dir is False:
+            self.cache_dir: Optional[Path] = None
+        elif cache_dir is None or cache_dir is True:
+            env_dir = os.environ.get(TEMPLATE_CACHE_DIR_ENV_VAR)
+            self.cache_dir = Path(env_dir) if env_dir else None
+        else:
+            self.cache_dir = Path(cache_dir)
+        self._templates: Dict[str, CompiledTemplate] = {}
+        self._lock = threading.Lock()
+        self.compiled = 0
+        self.disk_hits = 0
+
+    def resolve(self, name: Optional[str]) -> Optional[str]:
+        """テンプレート名をテンプレートディレクトリ内のファイル名に解決
+
+        "base" / "base.html" / "base.html.j2" のいずれでも指定できる。
+        組み込み（"default"）や存在しない名前は None。
+        """
+        if not name or name == BUILTIN_TEMPLATE or Path(name).name != name:
+            return None
+        for candidate in (name, f"{name}.j2", f"{name}.html.j2"):
+            if (self.template_dir / candidate).is_file():
+                return candidate
+        return None
+
+    def get_template(self, name: str) -> CompiledTemplate:
+        """コンパイル済みテンプレートを取得（更新されていれば再コンパイル）
+
+        Raises:
+            FileNotFoundError: テンプレートが存在しない場合
+            TemplateSyntaxError: 未対応の構文を含む場合
+        """
+        template = self._templates.get(name)
+        if template is not None and template.is_current():
+            return template
+
+        with self._lock:
+            template = self._templates.get(name)
+            if template is None or not template.is_current():
+                template = self._load(name)
+                self._templates[name] = template
+            return template
+
+    def render(self, name: str, context: Mapping[str, Any]) -> str:
+        """テンプレートをレンダリング"""
+        return self.get_template(name).render(context)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            "template_dir": str(self.template_dir),
+            "cache_dir": str(self.cache_dir) if self.cache_dir else None,
+            "loaded": sorted(self._templates),
+            "compiled": self.compiled,
+            "disk_hits": self.disk_hits,
+        }
+
+    def _cache_path(self, name: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        source_id = hashlib.sha1(
+            str(self.template_dir / name).encode("utf-8")
+        ).hexdigest()[:16]
+        return self.cache_dir / f"{Path(name).stem}-{source_id}.kfc"
+
+    def _load(self, name: str) -> CompiledTemplate:
+        cache_path = self._cache_path(name)
+        if cache_path is not None:
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                self.disk_hits += 1
+                return CompiledTemplate(name, *cached)
+
+        code, dependencies = self._compile(name)
+        self.compiled += 1
+        if cache_path is not None:
+            self._write_cache(cache_path, code, dependencies)
+        return CompiledTemplate(name, code, dependencies)
+
+    def _read_cache(
+        self, cache_path: Path
+    ) -> Optional[Tuple[CodeType, Tuple[Tuple[str, int, int], ...]]]:
+        try:
+            if not _is_private(os.stat(cache_path.parent)):
+                logger.warning(
+                    f"テンプレートキャッシュを使用しません（所有者・権限が不正）: "
+                    f"{cache_path.parent}"
+                )
+                return None
+            with open(cache_path, "rb") as f:
+                if not _is_private(os.fstat(f.fileno())):
+                    logger.warning(
+                        f"テンプレートキャッシュを使用しません（所有者・権限が不正）: "
+                        f"{cache_path}"
+                    )
+                    return None
+                magic, cache_format, dependencies, code = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if (
+            magic != importlib.util.MAGIC_NUMBER
+            or cache_format != _CACHE_FORMAT
+            or not isinstance(code, CodeType)
+            or not _dependencies_current(dependencies)
+        ):
+            return None
+        return code, dependencies
+
+    def _write_cache(
+        self,
+        cache_path: Path,
+        code: CodeType,
+        dependencies: Tuple[Tuple[str, int, int], ...],
+    ) -> None:
+        """コンパイル結果を保存（一時ファイル経由で置き換え、失敗は無視）"""
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not _is_private(os.stat(cache_path.parent)):
+                logger.warning(
+                    f"テンプレートキャッシュを保存しません（所有者・権限が不正）: "
+                    f"{cache_path.parent}"
+                )
+                return
+            fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    marshal.dump(
+                        (
+                            importlib.util.MAGIC_NUMBER,
+                            _CACHE_FORMAT,
+                            dependencies,
+                            code,
+                        ),
+                        f,
+                    )
+                os.replace(tmp_name, cache_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            logger.debug(f"テンプレートキャッシュを保存できません: {cache_path}: {e}")
+
+    def _compile(self, name: str) -> Tuple[CodeType, Tuple[Tuple[str, int, int], ...]]:
+        state = _CompileState()
+        dependencies: List[Tuple[str, int, int]] = []
+        self._compile_source(name, state, dependencies, include_stack=())
+        if state.blocks:
+            raise TemplateSyntaxError(f"{name}: {{% endif %}} がありません")
+        state.emit("pass")
+        code = compile("\n".join(state.lines), f"<template {name}>", "exec")
+        return code, tuple(dependencies)
+
+    def _compile_source(
+        self,
+        name: str,
+        state: _CompileState,
+        dependencies: List[Tuple[str, int, int]],
+        include_stack: Tuple[str, ...],
+    ) -> None:
+        if name in include_stack:
+            raise TemplateSyntaxError(f"{name}: include が循環しています")
+        path = (self.template_dir / name).resolve()
+        if self.template_dir not in path.parents:
+            raise TemplateSyntaxError(f"{name}: テンプレートディレクトリ外です")
+        file_stat = path.stat()
+        dependencies.append((str(path), file_stat.st_mtime_ns, file_stat.st_size))
+        source = path.read_text(encoding="utf-8")
+        # Jinja2 既定（keep_trailing_newline=False）と同様に末尾の改行1つを除く
+        if source.endswith("\n"):
+            source = source[:-1]
+
+        for token in _TAG_PATTERN.split(source):
+            if not token:
+                continue
+            if token.startswith("{{"):
+                expression = _ExpressionCompiler(token[2:-2], name).compile()
+                state.emit(f"_out(_escape({expression}))")
+            elif token.startswith("{%"):
+                self._compile_statement(
+                    token[2:-2].strip(), name, state, dependencies, include_stack
+                )
+            elif token.startswith("{#"):
+                continue
+            else:
+                state.emit(f"_out({token!r})")
+
+    def _compile_statement(
+        self,
+        statement: str,
+        name: str,
+        state: _CompileState,
+        dependencies: List[Tuple[str, int, int]],
+        include_stack: Tuple[str, ...],
+    ) -> None:
+        keyword, _, argument = statement.partition(" ")
+        if keyword == "if":
+            state.emit(f"if {_ExpressionCompiler(argument, name).compile()}:")
+            state.depth += 1
+            state.emit("pass")
+            state.blocks.append("if")
+        elif keyword in ("elif", "else"):
+            if not state.blocks:
+                raise TemplateSyntaxError(f"{name}: 対応する {{% if %}} がありません")
+            state.depth -= 1
+            if keyword == "elif":
+                condition = _ExpressionCompiler(argument, name).compile()
+                state.emit(f"elif {condition}:")
+            else:
+                state.emit("else:")
+            state.depth += 1
+            state.emit("pass")
+        elif keyword == "endif":
+            if not state.blocks:
+                raise TemplateSyntaxError(f"{name}: 対応する {{% if %}} がありません")
+            state.blocks.pop()
+            state.depth -= 1
+        elif keyword == "include":
+            included = argument.strip()
+            if (
+                len(included) < 2
+                or included[0] not in "'\""
+                or included[-1] != included[0]
+            ):
+                raise TemplateSyntaxError(f"{name}: include には文字列を指定します")
+            self._compile_source(
+                included[1:-1], state, dependencies, include_stack + (name,)
+            )
+        else:
+            raise TemplateSyntaxError(f"{name}: 未対応の構文です: {{% {keyword} %}}")
+
+
+_engine: Optional[TemplateEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_template_engine() -> TemplateEngine:
+    """同梱テンプレート用のプロセス共通エンジンを取得"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = TemplateEngine()
+    return _engine
@@ -6,41 +6,62 @@ KumihanFormatterクラスの便利関数とラッパー関数を提供します
 unified_api.pyから分離してファイルサイズ最適化に貢献します。
 """
 
+import os
 from typing import Dict, List, Optional, Union, Any
 from pathlib import Path
 
-# 統合importでリファクタリング - 8個の重複import削除
-from ...unified_api import KumihanFormatter
+# KumihanFormatter（Manager群・パーサー・レンダラー）は使用時に読み込み、
+# `kumihan --version` などでは変換系のサブシステムをインポートしない
+
+# CLIの永続キャッシュ既定ディレクトリを指定する環境変数
+CACHE_DIR_ENV_VAR = "KUMIHAN_CACHE_DIR"
 
 
 def quick_convert(
-    input_file: Union[str, Path], output_file: Optional[Union[str, Path]] = None
+    input_file: Union[str, Path],
+    output_file: Optional[Union[str, Path]] = None,
+    template: str = "default",
+    cache_dir: Optional[Union[str, Path]] = None,
 ) -> Dict[str, Any]:
-    """クイック変換関数（統合システム）"""
-    with KumihanFormatter() as formatter:
-        return formatter.convert(input_file, output_file)
+    """クイック変換関数（統合システム）
+
+    cache_dir を指定すると、入力・テンプレート・設定・バージョンが同一の
+    変換は前回の出力を再利用する。
+    """
+    from ...unified_api import KumihanFormatter
+
+    with KumihanFormatter(cache_dir=cache_dir) as formatter:
+        return formatter.convert(input_file, output_file, template)
 
 
 def quick_parse(text: str) -> Dict[str, Any]:
     """クイック解析関数（統合ParsingManager）"""
+    from ...unified_api import KumihanFormatter
+
     with KumihanFormatter() as formatter:
         return formatter.parse_text(text)
 
 
 def unified_parse(text: str, parser_type: str = "auto") -> Dict[str, Any]:
     """統合パーサーシステムによる最適化解析"""
+    from ...unified_api import KumihanFormatter
+
     with KumihanFormatter() as formatter:
         return formatter.parse_text(text, parser_type)
 
 
 def validate_kumihan_syntax(text: str) -> Dict[str, Any]:
     """Kumihan記法構文の詳細検証（統合検証システム）"""
+    from ...unified_api import KumihanFormatter
+
     with KumihanFormatter() as formatter:
         return formatter.validate_syntax(text)
 
 
 def get_parser_system_info() -> Dict[str, Any]:
     """統合Managerシステムの詳細情報取得"""
+    from ...unified_api import KumihanFormatter
+
     with KumihanFormatter() as formatter:
         return formatter.get_system_info()
 
@@ -50,18 +71,24 @@ def optimized_quick_convert(
     input_file: Union[str, Path], output_file: Optional[Union[str, Path]] = None
 ) -> Dict[str, Any]:
     """最適化クイック変換関数（高性能版）"""
+    from ...unified_api import KumihanFormatter
+
     with KumihanFormatter(performance_mode="optimized") as formatter:
         return formatter.convert(input_file, output_file)
 
 
 def optimized_quick_parse(text: str) -> Dict[str, Any]:
     """最適化クイック解析関数（高性能版）"""
+    from ...unified_api import KumihanFormatter
+
     with KumihanFormatter(performance_mode="optimized") as formatter:
         return formatter.parse_text(text)
 
 
 def optimized_convert_text(text: str, template: str = "default") -> str:
     """最適化テキスト変換関数（高性能版）"""
+    from ...unified_api import KumihanFormatter
+
     with KumihanFormatter(performance_mode="optimized") as formatter:
         return formatter.convert_text(text, template)
 
@@ -71,11 +98,99 @@ parse = unified_parse
 validate = validate_kumihan_syntax
 
 
+def batch_main(argv: List[str]) -> int:
+    """`kumihan batch` サブコマンド: 複数ファイルをプロセス並列で一括変換
+
+    Returns:
+        終了コード（全ファイル成功で0、失敗を含めば1）
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="kumihan batch",
+        description="複数のテキストファイルをHTMLに一括変換",
+    )
+    parser.add_argument("inputs", nargs="+", help="入力ファイルパス（複数可）")
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default=None,
+        help="出力ディレクトリ（省略時は各入力と同じ場所）",
+    )
+    parser.add_argument(
+        "-t",
+        "--template",
+        default="default",
+        help="使用テンプレート名（既定: default）",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="ワーカープロセス数（既定: CPU数）",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="1タスクあたりのファイル数（既定: 自動）",
+    )
+    parser.add_argument(
+        "--css",
+        choices=["inline", "link"],
+        default="inline",
+        help=(
+            "スタイルの出力方法（inline: 各HTMLに埋め込み / "
+            "link: 共有の kumihan.<hash>.css を出力先に書き出して参照）"
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.environ.get(CACHE_DIR_ENV_VAR),
+        help=f"変換結果キャッシュの保存先（既定: 環境変数 {CACHE_DIR_ENV_VAR}）",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="変換結果キャッシュを使用しない",
+    )
+    args = parser.parse_args(argv)
+    cache_dir = None if args.no_cache else args.cache_dir
+    options = {"css_mode": args.css} if args.css != "inline" else None
+
+    failures = 0
+    from ...unified_api import KumihanFormatter
+
+    with KumihanFormatter(cache_dir=cache_dir) as formatter:
+        for result in formatter.convert_many(
+            args.inputs,
+            args.output_dir,
+            args.template,
+            workers=args.workers,
+            chunksize=args.chunksize,
+            options=options,
+        ):
+            if result.get("status") == "success":
+                print(f"変換完了: {result['output_file']}")
+            else:
+                failures += 1
+                err = result.get("error", "unknown error")
+                print(f"変換エラー: {result.get('input_file')}: {err}")
+
+    print(f"一括変換: {len(args.inputs) - failures}/{len(args.inputs)} 件成功")
+    return 1 if failures else 0
+
+
 def main() -> None:
     """CLI エントリーポイント（argparse対応）"""
     import sys
     import argparse
 
+    # サブコマンド: kumihan batch <inputs...>
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        sys.exit(batch_main(sys.argv[2:]))
+
     parser = argparse.ArgumentParser(
         prog="kumihan",
         description="Kumihan-Formatter: テキストをHTMLに自動組版するCLI",
@@ -94,6 +209,16 @@ def main() -> None:
         action="store_true",
         help="詳細ログを有効化（将来拡張用）",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.environ.get(CACHE_DIR_ENV_VAR),
+        help=f"変換結果キャッシュの保存先（既定: 環境変数 {CACHE_DIR_ENV_VAR}）",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="変換結果キャッシュを使用しない",
+    )
     parser.add_argument(
         "--version",
         action="store_true",
@@ -123,9 +248,10 @@ def main() -> None:
 
     input_file = args.input
     output_file = args.output
+    cache_dir = None if args.no_cache else args.cache_dir
 
     try:
-        result = quick_convert(input_file, output_file)
+        result = quick_convert(input_file, output_file, args.template, cache_dir)
         if result.get("status") == "success":
             print(f"変換完了: {result['output_file']}")
             sys.exit(0)
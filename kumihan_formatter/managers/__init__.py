@@ -8,14 +8,41 @@
 3. PluginManager - プラグイン機能
 
 統合前: 6個のManager → 統合後: 3個のManager（50%削減達成）
+
+各Managerは初回アクセス時に読み込む（遅延インポート）。
 """
 
-from .core_manager import CoreManager
-from .processing_manager import ProcessingManager
-from .plugin_manager import PluginManager
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .core_manager import CoreManager
+    from .plugin_manager import PluginManager
+    from .processing_manager import ProcessingManager
+
+# 公開名 → 定義モジュール
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "CoreManager": ".core_manager",
+    "ProcessingManager": ".processing_manager",
+    "PluginManager": ".plugin_manager",
+}
 
 __all__ = [
     "CoreManager",
     "ProcessingManager",
     "PluginManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Managerクラスの遅延インポート"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 """
 CoreManager - コア機能統合管理クラス
@@ -7,8 +7,11 @@ ResourceManager + ChunkManager の機能を統合
 
 import logging
 import os
+import sys
 from pathlib import Path
 
+from kumihan_formatter.core.caching.lru_cache import ByteBudgetLRUCache
+from kumihan_formatter.core.io.mapped_reader import MappedTextReader
 from kumihan_formatter.core.io.operations import FileOperations, PathOperations
 from kumihan_formatter.core.templates.template_context import TemplateContext
 from kumihan_formatter.core.templates.template_selector import TemplateSelector
@@ -53,8 +56,15 @@ class CoreManager:
         # 配布管理設定 (DistributionManager統合)
         self.distribution_config = self.config.get("distribution", {})
 
-        # シンプルなキャッシュ
-        self._file_cache: Dict[str, str] = {}
+        # ファイルキャッシュ: 絶対パス → ((mtime_ns, size, inode), 内容)
+        # stat() で変更を検出し、合計バイト数の上限でLRU追い出し
+        file_cache_max_bytes = int(
+            self.config.get("file_cache_max_mb", 64) * 1024 * 1024
+        )
+        self._file_cache = ByteBudgetLRUCache(
+            file_cache_max_bytes, size_estimator=lambda entry: sys.getsizeof(entry[1])
+        )
+        self._file_cache_stats = {"hits": 0, "misses": 0, "revalidations": 0}
         self._template_cache: Dict[str, str] = {}
 
         # 配布管理コンポーネント (遅延初期化)
@@ -78,18 +88,28 @@ class CoreManager:
             ファイル内容、エラー時はNone
         """
         try:
-            path_str = str(file_path)
-
-            # キャッシュチェック
-            if use_cache and self.cache_enabled and path_str in self._file_cache:
-                return self._file_cache[path_str]
+            path_str = os.path.abspath(file_path)
+            caching = use_cache and self.cache_enabled
+
+            # キャッシュチェック（stat結果が一致する場合のみ再利用）
+            signature = None
+            if caching:
+                signature = self._file_signature(path_str)
+                found, entry = self._file_cache.lookup(path_str)
+                if not found:
+                    self._file_cache_stats["misses"] += 1
+                elif entry[0] == signature:
+                    self._file_cache_stats["hits"] += 1
+                    return str(entry[1])
+                else:
+                    self._file_cache_stats["revalidations"] += 1
 
             # ファイル読み込み
             content = self.file_ops.read_text(Path(file_path))
 
-            # キャッシュ保存
-            if use_cache and self.cache_enabled:
-                self._file_cache[path_str] = content
+            # キャッシュ保存（読み込み前のstat結果を使い、読み込み中の変更は次回検出）
+            if caching:
+                self._file_cache.put(path_str, (signature, content))
 
             return content
 
@@ -124,7 +144,10 @@ class CoreManager:
 
             # キャッシュ更新
             if success and self.cache_enabled:
-                self._file_cache[str(file_path)] = content
+                path_str = os.path.abspath(file_path)
+                self._file_cache.put(
+                    path_str, (self._file_signature(path_str), content)
+                )
 
             return success
 
@@ -132,6 +155,12 @@ class CoreManager:
             self.logger.error(f"ファイル書き込み中にエラー: {file_path}, {e}")
             return False
 
+    @staticmethod
+    def _file_signature(path_str: str) -> tuple[int, int, int]:
+        """キャッシュ検証用のファイル識別情報 (mtime_ns, size, inode)"""
+        stat = os.stat(path_str)
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
     # ========== テンプレート機能 ==========
 
     def load_template(
@@ -233,6 +262,13 @@ class CoreManager:
         if total_lines == 0:
             return []
 
+        adaptive_chunk_size = self._adaptive_chunk_size(total_lines, target_chunk_count)
+        return self.create_chunks_from_lines(lines, adaptive_chunk_size)
+
+    def _adaptive_chunk_size(
+        self, total_lines: int, target_chunk_count: Optional[int] = None
+    ) -> int:
+        """総行数から適応的チャンクサイズを決定"""
         # チャンクサイズの決定
         cpu_count = self._get_cpu_count()
         if target_chunk_count is None:
@@ -250,35 +286,28 @@ class CoreManager:
             f"Adaptive chunking: {total_lines} lines → {target_chunk_count} chunks "
             f"(size: ~{adaptive_chunk_size})"
         )
-
-        return self.create_chunks_from_lines(lines, adaptive_chunk_size)
+        return adaptive_chunk_size
 
     def create_chunks_from_file(
-        self, file_path: Path, encoding: str = "utf-8"
+        self, file_path: Union[str, Path], encoding: str = "utf-8"
     ) -> List[ChunkInfo]:
         """
-        ファイルからチャンク作成（メモリ効率版）
+        ファイルからチャンクのリストを作成
+
+        iter_chunks_from_file() の結果をすべてリスト化する薄いラッパー。
+        全チャンクを同時に保持するため常駐メモリはファイルサイズに比例する。
+        大きなファイルは iter_chunks_from_file() で順に処理すること。
         """
+        file_path = Path(file_path)
         try:
             self.logger.info(f"Creating chunks from file: {file_path}")
 
-            # ファイル全体を読み込み
-            with open(file_path, "r", encoding=encoding) as file:
-                lines = file.readlines()
-
-            # 行末の改行コードを除去
-            lines = [line.rstrip("\n\r") for line in lines]
-
-            # 適応的チャンク作成
-            chunks = self.create_chunks_adaptive(lines)
-
-            # ファイル位置情報を更新
-            for chunk in chunks:
-                chunk.file_position = chunk.start_line - 1
+            chunks = list(self.iter_chunks_from_file(file_path, encoding))
 
             self.logger.info(
                 f"File chunking completed: {len(chunks)} chunks "
-                f"from {len(lines)} lines in {file_path.name}"
+                f"from {chunks[-1].end_line if chunks else 0} lines "
+                f"in {file_path.name}"
             )
 
             return chunks
@@ -287,6 +316,54 @@ class CoreManager:
             self.logger.error(f"Error creating chunks from file {file_path}: {e}")
             raise
 
+    def iter_chunks_from_file(
+        self,
+        file_path: Union[str, Path],
+        encoding: str = "utf-8",
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[ChunkInfo]:
+        """ファイルからチャンクを順に生成（常駐メモリはチャンク1つ分）
+
+        ファイルをメモリマップし、改行位置からチャンク境界を求めて
+        チャンクごとにデコードする。ファイル全体のテキスト・行リストは生成しない。
+        単独CR改行や改行バイトを文字内に含みうるエンコーディングの場合は
+        通常の読み込みにフォールバックする。
+
+        Args:
+            file_path: 入力ファイルパス
+            encoding: 入力エンコーディング
+            chunk_size: チャンク行数（省略時は総行数から適応的に決定）
+        """
+        with MappedTextReader(file_path, encoding) as reader:
+            if not reader.supports_mapping():
+                with open(file_path, "r", encoding=encoding) as file:
+                    lines = [line.rstrip("\n\r") for line in file]
+                if chunk_size is None:
+                    chunks = self.create_chunks_adaptive(lines)
+                else:
+                    chunks = self.create_chunks_from_lines(lines, chunk_size)
+                yield from chunks
+                return
+
+            total_lines = reader.count_lines()
+            if total_lines == 0:
+                return
+            if chunk_size is None:
+                chunk_size = self._adaptive_chunk_size(total_lines)
+
+            for mapped_chunk in reader.iter_chunks(chunk_size):
+                try:
+                    chunk_lines = mapped_chunk.lines()
+                finally:
+                    mapped_chunk.release()
+                yield ChunkInfo(
+                    chunk_id=mapped_chunk.chunk_id,
+                    start_line=mapped_chunk.start_line,
+                    end_line=mapped_chunk.end_line,
+                    lines=chunk_lines,
+                    file_position=mapped_chunk.start_line - 1,
+                )
+
     def merge_chunks(self, chunks: List[ChunkInfo]) -> ChunkInfo:
         """チャンクをマージ"""
         if not chunks:
@@ -528,6 +605,12 @@ class CoreManager:
         """コア統計情報を取得"""
         return {
             "file_cache_size": len(self._file_cache),
+            "file_cache": {
+                **self._file_cache_stats,
+                "evictions": self._file_cache.evictions,
+                "current_bytes": self._file_cache.current_bytes,
+                "max_bytes": self._file_cache.max_bytes,
+            },
             "template_cache_size": len(self._template_cache),
             "cache_enabled": self.cache_enabled,
             "template_dir": str(self.template_dir),
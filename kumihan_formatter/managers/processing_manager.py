@@ -1,8 +1,10 @@
 from typing import Any, Dict, List, Optional, Union, Callable
 import logging
 import time
+import copy
 import inspect
-from functools import wraps
+import os
+from functools import partial, wraps
 
 """
 ProcessingManager - 解析・最適化処理統合管理クラス (Issue #1253対応)
@@ -16,7 +18,23 @@ from kumihan_formatter.parsers.unified_list_parser import UnifiedListParser
 from kumihan_formatter.parsers.unified_keyword_parser import UnifiedKeywordParser
 from kumihan_formatter.parsers.unified_markdown_parser import UnifiedMarkdownParser
 from kumihan_formatter.core.ast_nodes.node import Node
+from kumihan_formatter.core.parsing.core_marker_parser import (
+    SIMPLE_PARSER_NAME,
+    simple_element_category,
+    simple_segments_independent,
+)
 from kumihan_formatter.core.processing.chunking import Chunker
+from kumihan_formatter.core.types import ChunkInfo
+from kumihan_formatter.core.caching.digest import content_digest
+from kumihan_formatter.core.caching.lru_cache import ByteBudgetLRUCache
+
+# チャンク結合時にチャンク開始位置分ずらす行番号の属性名
+_LINE_KEYS = ("line_number", "line")
+
+
+def _parse_chunk_text(chunk: ChunkInfo, parser_func: Callable[[str], Any]) -> List[Any]:
+    """1チャンクを解析（ワーカープロセスで実行可能）"""
+    return [parser_func("\n".join(chunk.lines))]
 
 
 class PerformanceMetrics:
@@ -66,12 +84,22 @@ class ProcessingManager:
         # 最適化設定（旧OptimizationManager）
         self.enable_caching = self.config.get("enable_caching", True)
         self.enable_parallel = self.config.get("enable_parallel", True)
+        # 大容量解析のチャンク並列バックエンド（"thread" / "process" / "auto"）。
+        # 純Pythonのパーサーはスレッドでは GIL により直列化されコア数に応じて
+        # 速くならないため、"thread" ではチャンクを逐次解析する。"process" /
+        # "auto" は pickle 可能なパーサー関数（モジュールレベル関数や
+        # MainParser.bind() 等）のみワーカープロセスで解析する。プロセス実行には
+        # __main__ ガードが必要なため既定は "thread"
+        self.parallel_backend = self.config.get("parallel_backend", "thread")
         self.memory_limit = self.config.get("memory_limit_mb", 512)
         self.performance_monitoring = self.config.get("performance_monitoring", True)
 
         # パフォーマンス測定
         self._metrics: List[PerformanceMetrics] = []
-        self._operation_cache: Dict[str, Any] = {}
+
+        # 解析結果キャッシュ（内容ダイジェスト＋パーサー名キー、バイト予算付きLRU）
+        cache_max_mb = self.config.get("parse_cache_max_mb", 64)
+        self._parse_cache = ByteBudgetLRUCache(int(cache_max_mb * 1024 * 1024))
 
     # ========== パーシング機能（旧ParsingManager） ==========
 
@@ -172,37 +200,34 @@ class ProcessingManager:
             start_time = time.time()
 
             # コンテンツサイズチェック
-            if isinstance(content, str):
-                input_size = len(content)
-                content_hash = hash(content)
-            else:
-                input_size = sum(len(line) for line in content)
-                content_hash = hash(str(content))
+            content_str = content if isinstance(content, str) else "\n".join(content)
+            input_size = len(content_str)
 
             # キャッシュチェック
-            cache_key = f"parse_{content_hash}_{parser_func.__name__}"
-            if self.enable_caching and cache_key in self._operation_cache:
-                self.logger.debug(f"キャッシュヒット: {parser_func.__name__}")
-                cached_result = self._operation_cache[cache_key]
-
-                # メトリクス記録
-                execution_time = time.time() - start_time
-                self._record_metrics(
-                    "parse_cached", execution_time, 0, input_size, True
-                )
+            parser_name = self._get_parser_name(parser_func)
+            cache_key = content_digest(content_str, parser_name)
+            if self.enable_caching:
+                found, cached_result = self._parse_cache.lookup(cache_key)
+                if found:
+                    self.logger.debug(f"キャッシュヒット: {parser_name}")
+
+                    # メトリクス記録
+                    execution_time = time.time() - start_time
+                    self._record_metrics(
+                        "parse_cached", execution_time, 0, input_size, True
+                    )
 
-                return cached_result
+                    return cached_result
 
             # 最適化されたパーシング実行
-            content_str = content if isinstance(content, str) else "\n".join(content)
             if input_size > 50000:  # 大きなコンテンツの場合
                 result = self._optimize_large_parsing(content_str, parser_func)
             else:
                 result = parser_func(content_str)
 
-            # キャッシュ保存
-            if self.enable_caching:
-                self._operation_cache[cache_key] = result
+            # キャッシュ保存（予算超過分はLRUで追い出し）
+            if self.enable_caching and result is not None:
+                self._parse_cache.put(cache_key, result)
 
             # メトリクス記録
             execution_time = time.time() - start_time
@@ -225,35 +250,185 @@ class ProcessingManager:
     def _optimize_large_parsing(
         self, content: Union[str, List[str]], parser_func: Callable[[str], Any]
     ) -> Any:
-        """大きなコンテンツの最適化パーシング"""
+        """大きなコンテンツの最適化パーシング
+
+        ブロック境界（`#キーワード#`〜`##`）を跨がない位置でチャンク分割し、
+        各チャンクを解析した後、`elements` を文書順に結合する。パーサー関数は
+        全チャンクに同じものを適用するため、自動選択ではなくパーサー種類を
+        固定した関数（MainParser.bind() 等）を渡す。
+        チャンク結果が結合できない形式の場合は全体を一括解析する。
+        """
         try:
             if isinstance(content, str):
                 lines = content.split("\n")
             else:
                 lines = content
 
-            # チャンク分割による並列処理（簡易版）
             chunk_size = self.config.get("large_parse_chunk_size", 1000)
-            chunks = Chunker().create_chunks(lines, chunk_size)
+            chunks = Chunker().create_block_aligned_chunks(lines, chunk_size)
 
-            results = []
-            for chunk in chunks:
-                chunk_str = "\n".join(chunk)
-                chunk_result = parser_func(chunk_str)
-                if chunk_result:
-                    results.append(chunk_result)
+            if len(chunks) <= 1:
+                return parser_func("\n".join(lines))
 
-            # 結果統合（簡易版）
-            if results:
-                return results[0]  # 最初の有効な結果を使用
+            results = self._parse_chunks(chunks, parser_func)
+            merged = self._merge_chunk_results(results, chunks)
+            if merged is not None:
+                self.logger.debug(
+                    f"チャンク並列解析完了: {len(chunks)}チャンク, {len(lines)}行"
+                )
+                return merged
 
-            return None
+            self.logger.info("チャンク結果を結合できないため一括解析に切り替え")
+            return parser_func("\n".join(lines))
 
         except Exception as e:
             self.logger.warning(f"大容量パーシング最適化に失敗、フォールバック: {e}")
             content_str = content if isinstance(content, str) else "\n".join(content)
             return parser_func(content_str)
 
+    def _parse_chunks(
+        self, chunks: List[ChunkInfo], parser_func: Callable[[str], Any]
+    ) -> List[Any]:
+        """チャンクを解析し、チャンク順の結果リストを返す
+
+        ワーカープロセスで解析するのは parallel_backend が "process" / "auto" で
+        パーサー関数を pickle できる場合のみで、それ以外は逐次解析する
+        （スレッドでは GIL により速くならない）。並列時は memory_limit_mb を
+        予算とする投入制御を行い、予算に近づくと同時に解析するチャンク数を絞る。
+        """
+        if not self.enable_parallel:
+            return [parser_func("\n".join(chunk.lines)) for chunk in chunks]
+
+        # 並列実行系（multiprocessing等）は大容量解析時のみ読み込む
+        from kumihan_formatter.core.processing.memory_admission import (
+            MemoryAdmissionController,
+        )
+        from kumihan_formatter.core.processing.process_backend import (
+            BACKEND_AUTO,
+            BACKEND_PROCESS,
+            is_picklable,
+            iter_ordered_results,
+            select_backend,
+        )
+
+        max_workers = self.config.get("max_workers") or min(
+            len(chunks), os.cpu_count() or 1
+        )
+        backend = self.parallel_backend
+        if backend == BACKEND_AUTO:
+            total_lines = sum(len(chunk.lines) for chunk in chunks)
+            backend = select_backend(total_lines, len(chunks), max_workers, parser_func)
+        if backend != BACKEND_PROCESS or not is_picklable(parser_func):
+            return [parser_func("\n".join(chunk.lines)) for chunk in chunks]
+
+        results: List[Any] = []
+        for _, result, error in iter_ordered_results(
+            chunks,
+            partial(_parse_chunk_text, parser_func=parser_func),
+            max_workers,
+            backend,
+            admission=MemoryAdmissionController(self.memory_limit),
+        ):
+            if error is not None:
+                raise error
+            results.extend(result)
+        return results
+
+    def _merge_chunk_results(self, results: List[Any], chunks: List[ChunkInfo]) -> Any:
+        """チャンクごとの解析結果を `elements` 単位で文書順に結合
+
+        Args:
+            results: チャンク順の解析結果
+            chunks: 解析に使用したチャンク
+
+        Returns:
+            結合済み結果。辞書結果同士・同種Node結果同士以外はNone。
+            parse_simple_kumihan の結果は一括解析と同じ区分順に並べ直し、
+            記法がチャンク境界をまたぐ場合はNone
+        """
+        if not results or any(result is None for result in results):
+            return None
+
+        first = results[0]
+        merged_elements: List[Any] = []
+
+        if all(isinstance(r, dict) and "elements" in r for r in results):
+            simple_mode = all(r.get("parser") == SIMPLE_PARSER_NAME for r in results)
+            chunk_texts = ["\n".join(chunk.lines) for chunk in chunks]
+            if simple_mode and not simple_segments_independent(
+                "\n".join(chunk_texts), chunk_texts
+            ):
+                return None
+            for result, chunk in zip(results, chunks):
+                merged_elements.extend(
+                    self._offset_elements(result["elements"], chunk.file_position)
+                )
+            if simple_mode:
+                # 一括解析は装飾ブロック→見出し→行要素の順（区分内は文書順）
+                merged_elements.sort(key=simple_element_category)
+            merged = dict(first)
+            merged["elements"] = merged_elements
+            merged["total_elements"] = len(merged_elements)
+            if any(r.get("status", "success") != "success" for r in results):
+                merged["status"] = "error"
+            merged["chunk_count"] = len(chunks)
+            return merged
+
+        if all(
+            isinstance(r, Node)
+            and r.type == first.type
+            and isinstance(r.get_attribute("elements"), list)
+            for r in results
+        ):
+            for result, chunk in zip(results, chunks):
+                merged_elements.extend(
+                    self._offset_elements(
+                        result.get_attribute("elements"), chunk.file_position
+                    )
+                )
+            attributes = dict(first.attributes or {})
+            attributes["elements"] = merged_elements
+            attributes["total_elements"] = len(merged_elements)
+            attributes["chunk_count"] = len(chunks)
+            content = "\n".join("\n".join(chunk.lines) for chunk in chunks)
+            return Node(type=first.type, content=content, attributes=attributes)
+
+        return None
+
+    def _offset_elements(self, elements: List[Any], line_offset: int) -> List[Any]:
+        """要素の行番号をチャンク開始位置分ずらす（行番号を持つ要素のみ）
+
+        辞書要素はキー、Node 要素は属性の line_number / line を対象とし、
+        元の要素は変更せずコピーを返す。
+        """
+        if not line_offset:
+            return list(elements)
+
+        shifted: List[Any] = []
+        for element in elements:
+            if isinstance(element, dict):
+                element = self._offset_line_keys(element, line_offset)
+            elif isinstance(element, Node) and element.attributes:
+                attributes = self._offset_line_keys(element.attributes, line_offset)
+                if attributes is not element.attributes:
+                    element = copy.copy(element)
+                    element.attributes = attributes
+            shifted.append(element)
+        return shifted
+
+    def _offset_line_keys(
+        self, mapping: Dict[str, Any], line_offset: int
+    ) -> Dict[str, Any]:
+        """行番号キーをずらした辞書（対象キーがなければ元の辞書）"""
+        keys = [
+            key
+            for key in _LINE_KEYS
+            if isinstance(mapping.get(key), int) and not isinstance(mapping[key], bool)
+        ]
+        if not keys:
+            return mapping
+        return {**mapping, **{key: mapping[key] + line_offset for key in keys}}
+
     # ========== バリデーション機能（旧ParsingManager） ==========
 
     def validate_node(
@@ -416,6 +591,27 @@ class ProcessingManager:
         self, node: Node, result: Dict[str, Any], context: Dict[str, Any]
     ) -> None:
         """ノードコンテンツの検証"""
+        self._validate_content_text(node, result)
+
+        # 子ノードの検証（validate_node(child) と同じく、子自身の構造・コンテンツの
+        # 検証でエラーまたは例外があれば問題とする。孫以降の問題は子の valid に
+        # 影響しないため子孫は辿らない）
+        children = getattr(node, "children", [])
+        if children:
+            for i, child in enumerate(children):
+                child_result: Dict[str, Any] = {"errors": [], "warnings": []}
+                try:
+                    # validate_node の node_info 生成と同じ参照（content=None 等で失敗）
+                    getattr(child, "content", "")[:100]
+                    self._validate_node_structure(child, child_result)
+                    self._validate_content_text(child, child_result)
+                except Exception as e:
+                    child_result["errors"].append(str(e))
+                if child_result["errors"]:
+                    result["warnings"].append(f"子ノード{i}に問題があります")
+
+    def _validate_content_text(self, node: Node, result: Dict[str, Any]) -> None:
+        """ノード自身のテキストコンテンツの検証"""
         content = getattr(node, "content", "")
 
         if isinstance(content, str):
@@ -429,14 +625,6 @@ class ProcessingManager:
                     f"コンテンツが非常に長いです: {len(content)}文字"
                 )
 
-        # 子ノードの検証
-        children = getattr(node, "children", [])
-        if children:
-            for i, child in enumerate(children):
-                child_result = self.validate_node(child, context)
-                if not child_result["valid"]:
-                    result["warnings"].append(f"子ノード{i}に問題があります")
-
     def _check_line_syntax(
         self, line: str, line_num: int, result: Dict[str, Any]
     ) -> None:
@@ -532,16 +720,13 @@ class ProcessingManager:
             最適化結果
         """
         try:
-            initial_cache_size = len(self._operation_cache)
+            initial_cache_size = len(self._parse_cache)
 
-            # 古いキャッシュエントリの削除（簡易版LRU）
-            if len(self._operation_cache) > 100:
-                # 最近使用されたもの以外を削除
-                cache_items = list(self._operation_cache.items())
-                recent_items = cache_items[-50:]  # 最新50項目を保持
-                self._operation_cache = dict(recent_items)
+            # 最近使用されていないエントリの削除（最新50項目を保持）
+            if initial_cache_size > 100:
+                self._parse_cache.trim(50)
 
-            optimized_size = len(self._operation_cache)
+            optimized_size = len(self._parse_cache)
 
             return {
                 "cache_cleaned": True,
@@ -623,8 +808,14 @@ class ProcessingManager:
 
     def get_optimization_statistics(self) -> Dict[str, Any]:
         """最適化統計情報を取得"""
+        cache_stats = self._parse_cache.get_statistics()
         if not self._metrics:
-            return {"total_operations": 0, "optimization_rate": 0.0}
+            return {
+                "total_operations": 0,
+                "optimization_rate": 0.0,
+                "cache_size": cache_stats["entries"],
+                "cache": cache_stats,
+            }
 
         total_ops = len(self._metrics)
         optimized_ops = sum(1 for m in self._metrics if m.optimization_applied)
@@ -636,20 +827,30 @@ class ProcessingManager:
             "optimized_operations": optimized_ops,
             "optimization_rate": optimized_ops / total_ops,
             "avg_execution_time": avg_execution_time,
-            "cache_size": len(self._operation_cache),
+            "cache_size": cache_stats["entries"],
+            "cache": cache_stats,
             "config": {
                 "caching_enabled": self.enable_caching,
                 "parallel_enabled": self.enable_parallel,
                 "memory_limit_mb": self.memory_limit,
+                "parse_cache_max_bytes": self._parse_cache.max_bytes,
             },
         }
 
     def clear_optimization_cache(self) -> None:
         """最適化キャッシュをクリア"""
-        self._operation_cache.clear()
+        self._parse_cache.clear()
         self._metrics.clear()
         self.logger.info("最適化キャッシュをクリアしました")
 
+    def _get_parser_name(self, parser_func: Callable[[str], Any]) -> str:
+        """キャッシュキー用のパーサー識別名（モジュール＋修飾名）"""
+        module = getattr(parser_func, "__module__", None) or ""
+        name = getattr(parser_func, "__qualname__", None) or getattr(
+            parser_func, "__name__", type(parser_func).__name__
+        )
+        return f"{module}.{name}"
+
     def _estimate_memory_usage(self, obj: Any) -> int:
         """オブジェクトのメモリ使用量推定（簡易版）"""
         try:
@@ -16,6 +16,8 @@ import warnings
 from typing import Any, Dict, List, Optional
 
 from ..core.ast_nodes import Node, error_node
+from ..core.parsing.parallel_parsing import ParallelParseMetrics, iter_parallel_chunks
+from ..core.types import ChunkInfo
 from ..core.utilities.logger import get_logger
 
 
@@ -77,6 +79,10 @@ class ParallelProcessingConfig:
                 cfg.parallel_threshold_lines = int(v)
             if v := os.getenv("KUMIHAN_PARALLEL_THRESHOLD_SIZE"):
                 cfg.parallel_threshold_size = int(v)
+            if v := os.getenv("KUMIHAN_PARALLEL_CHUNKS_PER_CORE"):
+                cfg.target_chunks_per_core = int(v)
+            if v := os.getenv("KUMIHAN_PARALLEL_CHUNK_TIMEOUT"):
+                cfg.chunk_timeout_seconds = int(v)
             if v := os.getenv("KUMIHAN_MEMORY_LIMIT_MB"):
                 mem = int(v)
                 cfg.memory_critical_threshold_mb = mem
@@ -118,6 +124,11 @@ class ParallelProcessingConfig:
         return min(ideal_chunk_size, self.max_chunk_size)
 
 
+def _count_chunk_lines(chunk: ChunkInfo) -> List[int]:
+    """チャンクの処理行数（ワーカープロセスで実行可能）"""
+    return [len(chunk.lines)]
+
+
 class Parser:
     """統合版Parserクラス（parser_core.py + legacy_parser.py統合）
 
@@ -144,8 +155,9 @@ class Parser:
         self.graceful_errors = self.config.get("graceful_errors", True)
         self.graceful_syntax_errors = self.config.get("graceful_syntax_errors", True)
 
-        # 並列処理設定
-        self.parallel_config = ParallelProcessingConfig()
+        # 並列処理設定（KUMIHAN_PARALLEL_* 等の環境変数を反映）
+        self.parallel_config = ParallelProcessingConfig.from_environment()
+        self.parallel_metrics = ParallelParseMetrics()
 
         # パーサー統合機能（legacy_parser.pyから継承）
         try:
@@ -239,10 +251,37 @@ class Parser:
                 raise
 
     def parse_parallel_streaming(self, lines: List[str]) -> Node:
-        """並列ストリーミング処理（プレースホルダー）"""
-        # 実装は必要に応じて詳細化
+        """並列ストリーミング処理
+
+        parallel_config に基づくチャンクに分割して並列に処理し、
+        _stream_process_lines() と同じ形式の結果ノードを返す。
+        """
+        if not lines:
+            return error_node("No lines to process")
+
         self.logger.info(f"並列処理: {len(lines)}行を処理中")
-        return self._parse_sequential_optimized(lines)
+        self.parallel_metrics = ParallelParseMetrics()
+        processed_count = 0
+        for chunk, counts, error in iter_parallel_chunks(
+            lines,
+            _count_chunk_lines,
+            self.parallel_config,
+            self.parallel_metrics,
+            is_cancelled=lambda: self._cancelled,
+            max_workers=self.config.get("max_workers"),
+        ):
+            if error is not None:
+                self.add_error(
+                    f"Chunk {chunk.start_line}-{chunk.end_line} failed: {error!r}"
+                )
+                continue
+            processed_count += sum(counts)
+
+        return Node(
+            type="parsed_content",
+            content=f"Processed {processed_count} lines",
+            attributes={"line_number": processed_count, "column": 1},
+        )
 
     def cancel_parsing(self) -> None:
         """パース処理のキャンセル"""
@@ -258,8 +297,11 @@ class Parser:
         }
 
     def get_parallel_processing_metrics(self) -> Dict[str, Any]:
-        """並列処理メトリクス取得"""
-        return {"parallel_config": self.parallel_config.__dict__}
+        """並列処理メトリクス取得（設定と直近の実行状況）"""
+        return {
+            "parallel_config": self.parallel_config.__dict__,
+            "last_run": self.parallel_metrics.to_dict(),
+        }
 
     def _parse_line(self, line: str) -> Node:
         """行単位パース処理"""
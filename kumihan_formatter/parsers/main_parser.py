@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 """
 MainParser - 統合パーサーシステム
@@ -13,7 +13,11 @@ from typing import cast
 from kumihan_formatter.parsers.unified_list_parser import UnifiedListParser
 from kumihan_formatter.parsers.unified_keyword_parser import UnifiedKeywordParser
 from kumihan_formatter.parsers.unified_markdown_parser import UnifiedMarkdownParser
-from kumihan_formatter.core.parsing.core_marker_parser import CoreMarkerParser
+from kumihan_formatter.core.parsing.core_marker_parser import (
+    KUMIHAN_BLOCK_PATTERN,
+    CoreMarkerParser,
+)
+from kumihan_formatter.core.processing.chunking import Chunker
 from kumihan_formatter.core.processing.parsing_coordinator import ParsingCoordinator
 
 
@@ -151,6 +155,77 @@ class MainParser:
             self.logger.error(f"パーシング中にエラー: {e}")
             return self._emergency_fallback(content)
 
+    def select_parser_type(self, content: Union[str, List[str]]) -> str:
+        """自動選択で使われるパーサー種類を本解析なしで決定
+
+        _auto_parse と同じ順序で判定し、Kumihanブロックを含めば "simple"、
+        それ以外はコーディネーターの推奨パーサーを返す。推奨パーサーが
+        登録されておらず順次試行となる場合は "auto" を返す。
+        文書を分割して解析する際に、全分割へ同じパーサーを適用するために使う。
+
+        Args:
+            content (Union[str, List[str]]): 文書全体
+
+        Returns:
+            str: parse() の parser_type に指定するパーサー種類
+        """
+        content_str = content if isinstance(content, str) else "\n".join(content)
+        if "##" in content_str and KUMIHAN_BLOCK_PATTERN.search(content_str):
+            return "simple"
+        recommended_type = self.coordinator.recommend_parser(content)
+        return recommended_type if recommended_type in self._parsers else "auto"
+
+    def bind(self, parser_type: str) -> "BoundParser":
+        """パーサー種類を固定した解析関数を取得
+
+        Args:
+            parser_type (str): parse() の parser_type
+
+        Returns:
+            BoundParser: content を受け取り parse(content, parser_type) を返す
+                関数オブジェクト（ワーカープロセスへ pickle 可能）
+        """
+        return BoundParser(self, parser_type)
+
+    def parse_iter(self, stream: Union[str, Iterable[str]]) -> Iterator[Dict[str, Any]]:
+        """ストリーミングパーシング
+
+        入力をトップレベルブロック（空行区切り、複数行の装飾ブロックは一括）
+        単位で読み進め、ブロックごとにシンプルKumihan記法で解析した要素辞書を
+        順に返す。保持するのは処理中のブロックのみで、入力サイズに依らず
+        メモリ使用量は一定となる。
+
+        要素はブロック内では parse_simple_kumihan と同じ区分順
+        （装飾ブロック → 見出し → 行要素）、ブロック間では文書順に並ぶ。
+
+        Args:
+            stream (Union[str, Iterable[str]]): テキストファイル等の行の反復、
+                または文書全体の文字列
+
+        Yields:
+            Dict[str, Any]: 要素辞書（parse_simple_kumihan の elements と同形式）
+
+        Examples:
+            >>> with open("input.txt", encoding="utf-8") as f:
+            ...     for element in parser.parse_iter(f):
+            ...         print(element["type"])
+        """
+        lines: Iterable[str] = (
+            stream.split("\n")
+            if isinstance(stream, str)
+            else (line[:-1] if line.endswith("\n") else line for line in stream)
+        )
+
+        for segment in Chunker().iter_top_level_segments(lines):
+            result = self.marker_parser.parse_simple_kumihan("\n".join(segment.lines))
+            if result.get("status") != "success":
+                self.logger.warning(
+                    f"ストリーミング解析失敗（{segment.start_line}行目〜）: "
+                    f"{result.get('error')}"
+                )
+                continue
+            yield from result["elements"]
+
     def _auto_parse(
         self, content: Union[str, List[str]]
     ) -> Optional[Union[Node, Dict[str, Any]]]:
@@ -158,6 +233,8 @@ class MainParser:
 
         コンテンツを解析し、最適なパーサーを自動選択して実行。
         Kumihanブロック検出 → コーディネーター推奨 → 順次試行の順序で動作。
+        ブロック検出は正規表現の探索、推奨判定は先頭行のサンプルのみで行い、
+        各パーサーの本解析は高々1回となる。
 
         Args:
             content (Union[str, List[str]]): 解析対象コンテンツ
@@ -165,50 +242,58 @@ class MainParser:
         Returns:
             Optional[Union[Node, Dict[str, Any]]]: 解析結果
         """
+        content_str = content if isinstance(content, str) else "\n".join(content)
         try:
             # Kumihanブロックの存在チェック（優先）
-            content_str = content if isinstance(content, str) else "\n".join(content)
-            if "##" in content_str and "#" in content_str:
-                # Kumihanブロック記法を検出した場合は直接SimpleKumihanParserを試行
-                try:
-                    result = self.marker_parser.parse_simple_kumihan(content_str)
-                    if result and result.get("elements"):
-                        # Kumihanブロックが含まれている場合は辞書結果を返す
-                        has_kumihan_blocks = any(
-                            elem.get("type") == "kumihan_block"
-                            for elem in result.get("elements", [])
-                        )
-                        if has_kumihan_blocks:
-                            self.logger.info(
-                                "Auto-parse: SimpleKumihanParser成功 - Kumihanブロックを検出"
-                            )
-                            return result
-                except Exception as e:
-                    self.logger.debug(f"Auto-parse SimpleKumihanParser試行失敗: {e}")
+            result = self._try_kumihan_block_parsing(content_str)
+            if result is not None:
+                self.logger.info(
+                    "Auto-parse: SimpleKumihanParser成功 - Kumihanブロックを検出"
+                )
+                return result
 
             # コーディネーターによる自動選択（Kumihanブロックが検出されなかった場合）
-            coordinator_result = self.coordinator.parse_document(content)
-            if (
-                coordinator_result
-                and isinstance(coordinator_result, dict)
-                and "parser_type" in coordinator_result
-            ):
-                recommended_type = coordinator_result["parser_type"]
-
+            recommended_type = self.coordinator.recommend_parser(content)
+            if recommended_type in self._parsers:
                 # 推奨パーサーで実行
-                if recommended_type in self._parsers:
-                    parser_func = self._parsers[recommended_type]
-                    return parser_func(content)  # type: ignore
+                parser_func = self._parsers[recommended_type]
+                return parser_func(content)  # type: ignore
 
-            # 順次試行戦略
-            return self._sequential_try_parsing(content)
+            # 順次試行戦略（ブロック検出は実施済み）
+            return self._sequential_try_parsing(content, content_str)
 
         except Exception as e:
             self.logger.error(f"自動パーシング中にエラー: {e}")
-            return self._sequential_try_parsing(content)
+            return self._sequential_try_parsing(content, content_str)
+
+    def _try_kumihan_block_parsing(self, content_str: str) -> Optional[Dict[str, Any]]:
+        """Kumihanブロックを含む場合のみSimpleKumihanParserで解析
+
+        ブロックの有無は正規表現の探索（最初の一致で終了）で判定し、
+        含まない文書では本解析を行わない。
+
+        Args:
+            content_str (str): 解析対象テキスト
+
+        Returns:
+            Optional[Dict[str, Any]]: Kumihanブロックを含む解析結果。含まない場合はNone
+        """
+        if "##" not in content_str or not KUMIHAN_BLOCK_PATTERN.search(content_str):
+            return None
+
+        try:
+            result = self.marker_parser.parse_simple_kumihan(content_str)
+            if any(
+                elem.get("type") == "kumihan_block"
+                for elem in result.get("elements", [])
+            ):
+                return result
+        except Exception as e:
+            self.logger.debug(f"SimpleKumihanParser試行失敗: {e}")
+        return None
 
     def _sequential_try_parsing(
-        self, content: Union[str, List[str]]
+        self, content: Union[str, List[str]], content_str: Optional[str] = None
     ) -> Optional[Union[Node, Dict[str, Any]]]:
         """順次パーサー試行
 
@@ -216,29 +301,19 @@ class MainParser:
 
         Args:
             content (Union[str, List[str]]): 解析対象コンテンツ
+            content_str (Optional[str]): 結合済みテキスト。指定時はKumihanブロック
+                検出を実施済みとして省略する
 
         Returns:
             Optional[Union[Node, Dict[str, Any]]]: 最初に成功した解析結果
         """
-        # Kumihanブロックの存在チェック
-        content_str = content if isinstance(content, str) else "\n".join(content)
-        if "##" in content_str and "#" in content_str:
-            # Kumihanブロック記法を検出した場合は直接SimpleKumihanParserを試行
-            try:
-                result = self.marker_parser.parse_simple_kumihan(content_str)
-                if result and result.get("elements"):
-                    # Kumihanブロックが含まれている場合は辞書結果を返す
-                    has_kumihan_blocks = any(
-                        elem.get("type") == "kumihan_block"
-                        for elem in result.get("elements", [])
-                    )
-                    if has_kumihan_blocks:
-                        self.logger.info(
-                            "SimpleKumihanParser成功: Kumihanブロックを検出"
-                        )
-                        return result
-            except Exception as e:
-                self.logger.debug(f"SimpleKumihanParser試行失敗: {e}")
+        if content_str is None:
+            # Kumihanブロック記法を検出した場合は直接SimpleKumihanParserを使用
+            content_str = content if isinstance(content, str) else "\n".join(content)
+            block_result = self._try_kumihan_block_parsing(content_str)
+            if block_result is not None:
+                self.logger.info("SimpleKumihanParser成功: Kumihanブロックを検出")
+                return block_result
 
         # 通常の順次試行（Kumihanブロックが検出されなかった場合）
         try_order = ["keyword", "list", "markdown", "marker", "simple"]
@@ -493,3 +568,31 @@ class MainParser:
                 }
 
         return results
+
+
+def _rebuild_bound_parser(config: Dict[str, Any], parser_type: str) -> "BoundParser":
+    """pickle から BoundParser を復元（ワーカープロセスで MainParser を再生成）"""
+    return BoundParser(MainParser(config), parser_type)
+
+
+class BoundParser:
+    """パーサー種類を固定した MainParser.parse
+
+    pickle 時は MainParser の設定とパーサー種類のみを渡し、復元先で
+    MainParser を再生成する。カスタム登録パーサーは復元先に引き継がれない。
+    """
+
+    def __init__(self, parser: MainParser, parser_type: str) -> None:
+        self.parser = parser
+        self.parser_type = parser_type
+        # キャッシュキー・メトリクス用の識別名（関数と同じ属性）
+        self.__name__ = "parse"
+        self.__qualname__ = f"MainParser.parse[{parser_type}]"
+
+    def __call__(
+        self, content: Union[str, List[str]]
+    ) -> Optional[Union[Node, Dict[str, Any]]]:
+        return self.parser.parse(content, self.parser_type)
+
+    def __reduce__(self) -> Any:
+        return (_rebuild_bound_parser, (self.parser.config, self.parser_type))
@@ -7,6 +7,7 @@ import re
 import logging
 from typing import Any, Dict, List, Optional
 from ..core.ast_nodes import Node, create_node
+from ..core.parsing.grammar import get_grammar
 
 
 class UnifiedMarkdownParser:
@@ -19,17 +20,8 @@ class UnifiedMarkdownParser:
     def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
 
-        # 詳細なMarkdownパターン (core版から移植)
-        self.patterns = {
-            "heading": re.compile(r"^(#{1,6})\s+(.+)$"),
-            "bold": re.compile(r"\*\*([^*]+)\*\*"),
-            "italic": re.compile(r"\*([^*]+)\*"),
-            "code": re.compile(r"`([^`]+)`"),
-            "list_item": re.compile(r"^[\s]*[-*+]\s+(.+)$"),
-            "numbered_list": re.compile(r"^[\s]*\d+\.\s+(.+)$"),
-            "link": re.compile(r"\[([^\]]+)\]\(([^)]+)\)"),
-            "image": re.compile(r"!\[([^\]]*)\]\(([^)]+)\)"),
-        }
+        # 詳細なMarkdownパターン (core版から移植、共有レジストリを参照)
+        self.patterns = get_grammar().markdown
 
     def parse(self, content: str, context: Optional[Any] = None) -> Node:
         """マークダウン内容を解析 (統合版・詳細機能付き)"""
@@ -167,8 +159,7 @@ class UnifiedMarkdownParser:
         return "\n".join(result_lines)
 
     def _generate_heading_id(self, heading_text: str) -> str:
-        """見出しID生成 (core版から移植)"""
-        # 英数字とハイフンのみの安全なID生成
-        safe_id = re.sub(r"[^\w\s-]", "", heading_text.lower())
-        safe_id = re.sub(r"[\s_-]+", "-", safe_id)
-        return safe_id.strip("-") or "heading"  # 基本実装
+        """見出しID生成（文書解析と共通のスラッグ）"""
+        from ..core.rendering.document_analysis import slugify_heading
+
+        return slugify_heading(heading_text)
@@ -70,6 +70,9 @@ class ConsoleUI:
     def watch_file_changed(self, path: str) -> None:
         self.info(f"変更を検出: {path}")
 
+    def watch_updated(self, output_path: str, elapsed_ms: float) -> None:
+        self.success("差分更新完了", f"{output_path} ({elapsed_ms:.1f}ms)")
+
 
 _ui_singleton: ConsoleUI | None = None
 
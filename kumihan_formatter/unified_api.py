@@ -23,7 +23,7 @@
     - 同じエラーハンドリング
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
 from pathlib import Path
 
 # 新しい責任分離アーキテクチャ
@@ -38,9 +38,10 @@ class KumihanFormatter:
         self,
         config_path: Optional[Union[str, Path]] = None,
         performance_mode: str = "standard",
+        cache_dir: Optional[Union[str, Path]] = None,
     ):
         # 新しい責任分離アーキテクチャによる初期化
-        self._api = FormatterAPI(config_path, performance_mode)
+        self._api = FormatterAPI(config_path, performance_mode, cache_dir)
 
     # 公開APIメソッド群（完全後方互換）
 
@@ -54,6 +55,30 @@ class KumihanFormatter:
         """統合Managerシステムによる最適化変換"""
         return self._api.convert(input_file, output_file, template, options)
 
+    def convert_streaming(
+        self,
+        input_file: Union[str, Path],
+        output_file: Optional[Union[str, Path]] = None,
+        template: str = "default",
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """ストリーミング変換（ブロック単位で読み込み・書き込み）"""
+        return self._api.convert_streaming(input_file, output_file, template, options)
+
+    def convert_many(
+        self,
+        input_files: Sequence[Union[str, Path]],
+        output_dir: Optional[Union[str, Path]] = None,
+        template: str = "default",
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """複数ファイル一括変換（プロセス並列・完了順に結果を返す）"""
+        return self._api.convert_many(
+            input_files, output_dir, template, workers, chunksize, options
+        )
+
     def convert_text(self, text: str, template: str = "default") -> str:
         """テキスト→HTML変換（統合Managerシステム対応）"""
         return self._api.convert_text(text, template)
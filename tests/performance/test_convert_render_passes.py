@@ -0,0 +1,107 @@
+"""
+convert() のレンダリング回数回帰ベンチマーク
+
+FormatterCore.convert_file が1回の変換で文書全体を1回だけレンダリングし、
+結果を直接ファイルへ書き込むことを検証します。
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from kumihan_formatter import KumihanFormatter
+from kumihan_formatter.core.rendering.main_renderer import MainRenderer
+from kumihan_formatter.parsers.main_parser import MainParser
+
+SCENARIO_BLOCK = """# 重要 #重要な情報です##
+
+## 見出し
+
+段落のテキストです。**太字**を含みます。
+
+- リスト項目
+"""
+
+
+class _RenderCallCounter:
+    """MainRendererのレンダリング系メソッド呼び出し回数を数える"""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.counts = {"render": 0, "render_to_file": 0, "documents": 0, "elements": 0}
+
+        original_render = MainRenderer.render
+        original_render_to_file = MainRenderer.render_to_file
+        original_iter_document = MainRenderer._iter_kumihan_document
+        original_single = MainRenderer._render_single_element
+
+        def render(renderer, *args, **kwargs):
+            self.counts["render"] += 1
+            return original_render(renderer, *args, **kwargs)
+
+        def render_to_file(renderer, *args, **kwargs):
+            self.counts["render_to_file"] += 1
+            return original_render_to_file(renderer, *args, **kwargs)
+
+        def iter_document(renderer, *args, **kwargs):
+            self.counts["documents"] += 1
+            return original_iter_document(renderer, *args, **kwargs)
+
+        def single(renderer, *args, **kwargs):
+            self.counts["elements"] += 1
+            return original_single(renderer, *args, **kwargs)
+
+        monkeypatch.setattr(MainRenderer, "render", render)
+        monkeypatch.setattr(MainRenderer, "render_to_file", render_to_file)
+        monkeypatch.setattr(MainRenderer, "_iter_kumihan_document", iter_document)
+        monkeypatch.setattr(MainRenderer, "_render_single_element", single)
+
+
+class TestConvertRenderPasses:
+    """1回のconvert()あたりのレンダリング回数"""
+
+    def test_convert_renders_document_once(self, monkeypatch, temp_dir):
+        """文書全体のレンダリングは1回だけ"""
+        input_file = temp_dir / "scenario.txt"
+        input_file.write_text(SCENARIO_BLOCK * 20, encoding="utf-8")
+        output_file = temp_dir / "scenario.html"
+
+        counter = _RenderCallCounter(monkeypatch)
+        with KumihanFormatter() as formatter:
+            result = formatter.convert(input_file, output_file)
+
+        assert result["status"] == "success"
+        assert counter.counts["render"] == 0
+        assert counter.counts["render_to_file"] == 0
+        assert counter.counts["documents"] == 1
+        expected = MainParser().parse(SCENARIO_BLOCK * 20, "auto")
+        assert counter.counts["elements"] == len(expected["elements"])
+
+    def test_streamed_output_matches_render(self, temp_dir):
+        """ストリーム出力はrender()と同一のHTML"""
+        input_file = temp_dir / "scenario.txt"
+        input_file.write_text(SCENARIO_BLOCK * 5, encoding="utf-8")
+        output_file = temp_dir / "scenario.html"
+
+        with KumihanFormatter() as formatter:
+            result = formatter.convert(input_file, output_file)
+            expected = formatter.convert_text(SCENARIO_BLOCK * 5)
+
+        assert result["status"] == "success"
+        assert Path(output_file).read_text(encoding="utf-8") == expected
+
+    @pytest.mark.slow
+    def test_large_convert_time_budget(self, temp_dir):
+        """大きなシナリオでも1パスで変換（時間予算付き）"""
+        input_file = temp_dir / "large.txt"
+        input_file.write_text(SCENARIO_BLOCK * 2000, encoding="utf-8")
+        output_file = temp_dir / "large.html"
+
+        with KumihanFormatter() as formatter:
+            start = time.perf_counter()
+            result = formatter.convert(input_file, output_file)
+            elapsed = time.perf_counter() - start
+
+        assert result["status"] == "success"
+        assert output_file.stat().st_size > 0
+        assert elapsed < 10.0
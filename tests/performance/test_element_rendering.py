@@ -0,0 +1,76 @@
+"""
+要素描画のマイクロベンチマーク
+
+ElementRenderer.render_elements が 10k / 100k / 1M 要素を要素ごとの描画と
+同一の結果で描画し、処理時間が要素数にほぼ線形に増えることを検証します。
+"""
+
+import time
+
+import pytest
+
+from kumihan_formatter.core.rendering.element_renderer import ElementRenderer
+
+SCENARIO_ELEMENTS = [
+    {
+        "type": "kumihan_block",
+        "content": "重要な情報です",
+        "attributes": {"decoration": "重要"},
+    },
+    {"type": "heading_2", "content": "見出し", "attributes": {"level": 2}},
+    {"type": "paragraph", "content": "段落 <strong>太字</strong>", "attributes": {}},
+    {"type": "list_item", "content": "項目 & <x>", "attributes": {}},
+]
+
+
+def _elements(count: int) -> list:
+    return SCENARIO_ELEMENTS * (count // len(SCENARIO_ELEMENTS))
+
+
+def _elapsed(renderer: ElementRenderer, elements: list, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        renderer.render_elements(elements)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+class TestElementRendering:
+    """一括描画の性能"""
+
+    def test_batch_matches_per_element_10k(self):
+        """10k要素: 一括描画と要素ごとの描画が同一"""
+        renderer = ElementRenderer()
+        elements = _elements(10_000)
+
+        expected = "\n".join(renderer.render(e) for e in elements)
+
+        assert renderer.render_elements(elements) == expected
+        assert _elapsed(renderer, elements) < 1.0
+
+    @pytest.mark.slow
+    def test_linear_scaling_100k(self):
+        """10k→100k要素で処理時間がほぼ線形に増加"""
+        renderer = ElementRenderer()
+        small, large = _elements(10_000), _elements(100_000)
+
+        _elapsed(renderer, small, repeat=1)  # ウォームアップ
+        small_time = _elapsed(renderer, small)
+        large_time = _elapsed(renderer, large)
+
+        assert large_time < small_time * 30
+        assert large_time < 5.0
+
+    @pytest.mark.slow
+    def test_1m_elements(self):
+        """1M要素を1回の join で描画"""
+        renderer = ElementRenderer()
+        elements = _elements(1_000_000)
+
+        start = time.perf_counter()
+        html = renderer.render_elements(elements)
+        elapsed = time.perf_counter() - start
+
+        assert html.count("\n") == len(elements) - 1
+        assert elapsed < 30.0
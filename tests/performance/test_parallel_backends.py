@@ -0,0 +1,55 @@
+"""
+スレッド / プロセス並列バックエンドのベンチマーク
+
+CPU律速のチャンク解析を 1 / 4 / 16 ワーカーで処理し、両バックエンドが
+同一結果を返すことと、コア数が足りる環境ではプロセスプールがスレッドより
+速いこと（GIL により直列化されないこと）を検証します。
+"""
+
+import os
+import time
+
+import pytest
+
+from kumihan_formatter.core.parsing.core_marker_parser import CoreMarkerParser
+from kumihan_formatter.core.processing.processor_core import ParallelChunkProcessor
+
+SCENARIO = "# 重要 #情報です##\n## 見出し\n段落 **太字** です\n- 項目\n1. 番号\n"
+
+
+def _parse_chunk(chunk):
+    """チャンクを解析し要素数を返す（ワーカーへ渡すためモジュールレベル）"""
+    result = CoreMarkerParser().parse_simple_kumihan("\n".join(chunk.lines))
+    yield chunk.chunk_id, len(result["elements"])
+
+
+def _elapsed(processor, chunks, backend):
+    start = time.perf_counter()
+    results = list(
+        processor.process_chunks_parallel_optimized(
+            chunks, _parse_chunk, backend=backend
+        )
+    )
+    return time.perf_counter() - start, results
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("workers", [1, 4, 16])
+def test_process_backend_scales_with_cores(workers):
+    lines = (SCENARIO * 8000).split("\n")
+    processor = ParallelChunkProcessor(max_workers=workers)
+    chunks = processor.create_chunks_from_lines(lines, len(lines) // 32)
+
+    thread_time, thread_results = _elapsed(processor, chunks, "thread")
+    process_time, process_results = _elapsed(processor, chunks, "process")
+
+    print(
+        f"\nworkers={workers} cpus={os.cpu_count()}: "
+        f"thread={thread_time:.3f}s process={process_time:.3f}s"
+    )
+    assert process_results == thread_results
+    if workers < 4:
+        pytest.skip("速度比較は4ワーカー以上でのみ行う")
+    if (os.cpu_count() or 1) < workers:
+        pytest.skip(f"速度比較には{workers}コア以上が必要（{os.cpu_count()}コア）")
+    assert process_time < thread_time
@@ -0,0 +1,73 @@
+"""
+parse_simple_kumihan の線形スケーリングベンチマーク
+
+行数を倍にしたとき処理時間がほぼ倍に収まること（O(行数 × マッチ数) に
+戻っていないこと）と、従来実装と同一の要素を生成することを検証します。
+"""
+
+import time
+
+import pytest
+
+from kumihan_formatter.core.parsing.core_marker_parser import CoreMarkerParser
+
+SCENARIO_LINES = (
+    "# 重要 #情報です##\n## 見出し\n段落 **太字** です\n- 項目\n1. 番号\n\n"
+)
+
+
+def _elapsed(parser: CoreMarkerParser, text: str) -> float:
+    start = time.perf_counter()
+    result = parser.parse_simple_kumihan(text)
+    elapsed = time.perf_counter() - start
+    assert result["status"] == "success"
+    return elapsed
+
+
+class TestSimpleParserScaling:
+    """シンプル記法パーサーの計算量"""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            # 閉じ ## から始まる見出しマッチは装飾ブロックと重なるため除外
+            (
+                "#注意#\n##\n\n# 見出し #",
+                [("kumihan_block", ""), ("paragraph", "# 見出し #")],
+            ),
+            # 前後空白・タブ付きの行
+            (
+                "  - 項目  \n\t段落 *強調*\n",
+                [("list_item", "項目"), ("paragraph", "段落 <em>強調</em>")],
+            ),
+            # 装飾ブロック → 見出し → 行要素 の順
+            (
+                "# 見出し #中身##\n## 見出し2\n1. 一",
+                [
+                    ("kumihan_block", "中身"),
+                    ("heading_2", "見出し2"),
+                    ("list_item", "一"),
+                ],
+            ),
+        ],
+    )
+    def test_elements_unchanged(self, text, expected):
+        """従来実装と同一の要素を生成"""
+        elements = CoreMarkerParser().parse_simple_kumihan(text)["elements"]
+
+        assert [(e["type"], e["content"]) for e in elements] == expected
+
+    @pytest.mark.slow
+    def test_linear_scaling_50k_lines(self):
+        """25k行→50k行で処理時間がほぼ線形に増加"""
+        parser = CoreMarkerParser()
+        lines_per_block = SCENARIO_LINES.count("\n")
+        half = SCENARIO_LINES * (25_000 // lines_per_block)
+        full = SCENARIO_LINES * (50_000 // lines_per_block)
+
+        _elapsed(parser, half)  # ウォームアップ
+        half_time = min(_elapsed(parser, half) for _ in range(3))
+        full_time = min(_elapsed(parser, full) for _ in range(3))
+
+        assert full_time < half_time * 3
+        assert full_time < 5.0
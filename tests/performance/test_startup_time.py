@@ -0,0 +1,83 @@
+"""
+CLI 起動時間の回帰ベンチマーク
+
+`python -X importtime` の出力から kumihan_formatter 配下の累積インポート時間を
+集計し、`kumihan --version` と小さなファイル1件の変換がそれぞれの予算内に
+収まること、不要なサブシステム（Manager群・プロセスプール）を読み込まない
+ことを検証します。
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+import kumihan_formatter
+
+PROJECT_ROOT = Path(kumihan_formatter.__file__).resolve().parent.parent
+
+# 累積インポート時間の予算（秒）。計測環境のばらつきを見込んだ上限
+VERSION_IMPORT_BUDGET = 0.15
+CONVERT_IMPORT_BUDGET = 0.6
+
+CLI = (
+    "import sys; sys.argv = ['kumihan', *sys.argv[1:]]; "
+    "from kumihan_formatter.core.utilities.api_utils import main; main()"
+)
+
+
+def _run_cli(args: List[str], cwd: Path) -> Dict[str, float]:
+    """CLI を -X importtime 付きで実行し、モジュール → 累積秒 を返す"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CLI, *args],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT)},
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    cumulative: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        if cumulative_us.strip().isdigit():
+            cumulative[name.strip()] = int(cumulative_us) / 1_000_000
+    return cumulative
+
+
+def _top_level_import_time(cumulative: Dict[str, float]) -> float:
+    """CLI から直接読み込まれた kumihan_formatter モジュールの累積時間合計"""
+    return cumulative.get("kumihan_formatter.core.utilities.api_utils", 0.0) + (
+        cumulative.get("kumihan_formatter.unified_api", 0.0)
+    )
+
+
+@pytest.mark.slow
+def test_version_startup_budget(tmp_path):
+    cumulative = _run_cli(["--version"], tmp_path)
+
+    assert not any(name.startswith("kumihan_formatter.managers") for name in cumulative)
+    assert "kumihan_formatter.unified_api" not in cumulative
+    assert _top_level_import_time(cumulative) < VERSION_IMPORT_BUDGET
+    # --version でログディレクトリ等を作成しない
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.slow
+def test_small_conversion_startup_budget(tmp_path):
+    (tmp_path / "input.txt").write_text(
+        "# 太字 #テスト##\n本文です\n", encoding="utf-8"
+    )
+
+    cumulative = _run_cli(["input.txt", "output.html"], tmp_path)
+
+    assert (tmp_path / "output.html").exists()
+    # 並列実行系は大容量・一括変換時のみ読み込む
+    assert "concurrent.futures.process" not in cumulative
+    assert "kumihan_formatter.core.processing.process_backend" not in cumulative
+    assert _top_level_import_time(cumulative) < CONVERT_IMPORT_BUDGET
@@ -0,0 +1,130 @@
+"""
+一括変換のテスト
+
+KumihanFormatter.convert_many と `kumihan batch` サブコマンドを検証します。
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from kumihan_formatter import KumihanFormatter
+from kumihan_formatter.core.utilities import api_utils
+
+SCENARIO = "# 重要 #重要な情報です##\n\n## 見出し{n}\n\n段落{n}のテキストです。\n"
+
+
+def _write_inputs(directory, count):
+    paths = []
+    for n in range(count):
+        path = directory / f"scenario_{n}.txt"
+        path.write_text(SCENARIO.format(n=n), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+class TestConvertMany:
+    """convert_many のテスト"""
+
+    def test_process_pool_matches_single_convert(self, temp_dir):
+        """プロセス並列の出力は単体変換と同一"""
+        inputs = _write_inputs(temp_dir, 6)
+        out_dir = temp_dir / "out"
+
+        with KumihanFormatter() as formatter:
+            results = list(
+                formatter.convert_many(inputs, out_dir, workers=2, chunksize=2)
+            )
+            expected = {
+                path.stem: formatter.convert_text(SCENARIO.format(n=n))
+                for n, path in enumerate(inputs)
+            }
+
+        assert len(results) == 6
+        assert all(r["status"] == "success" for r in results)
+        assert {r["input_file"] for r in results} == {str(p) for p in inputs}
+        for stem, html in expected.items():
+            assert (out_dir / f"{stem}.html").read_text(encoding="utf-8") == html
+
+    def test_serial_with_single_worker(self, temp_dir):
+        """workers=1 はプロセスプールを使わず入力順に変換"""
+        inputs = _write_inputs(temp_dir, 3)
+
+        with KumihanFormatter() as formatter:
+            results = list(formatter.convert_many(inputs, temp_dir, workers=1))
+
+        assert [r["input_file"] for r in results] == [str(p) for p in inputs]
+        assert all((temp_dir / f"{p.stem}.html").exists() for p in inputs)
+
+    def test_missing_file_reported_per_file(self, temp_dir):
+        """失敗したファイルのみエラー結果になる"""
+        inputs = _write_inputs(temp_dir, 2) + [temp_dir / "missing.txt"]
+
+        with KumihanFormatter() as formatter:
+            results = list(formatter.convert_many(inputs, temp_dir / "out", workers=2))
+
+        statuses = {r["input_file"]: r["status"] for r in results}
+        assert statuses[str(temp_dir / "missing.txt")] == "error"
+        assert list(statuses.values()).count("success") == 2
+
+    def test_same_stem_keeps_relative_directories(self, temp_dir):
+        """別ディレクトリの同名ファイルは相対構造を保って出力する"""
+        inputs = []
+        for n, name in enumerate(["a", "b"]):
+            (temp_dir / name).mkdir()
+            path = temp_dir / name / "intro.txt"
+            path.write_text(SCENARIO.format(n=n), encoding="utf-8")
+            inputs.append(path)
+        out_dir = temp_dir / "out"
+
+        with KumihanFormatter() as formatter:
+            results = list(formatter.convert_many(inputs, out_dir, workers=1))
+            expected = [formatter.convert_text(SCENARIO.format(n=n)) for n in (0, 1)]
+
+        assert all(r["status"] == "success" for r in results)
+        for name, html in zip(["a", "b"], expected):
+            assert (out_dir / name / "intro.html").read_text(encoding="utf-8") == html
+        assert sorted(r["output_file"] for r in results) == [
+            str(out_dir / name / "intro.html") for name in ("a", "b")
+        ]
+
+    def test_duplicate_output_reported(self, temp_dir):
+        """出力先が重複する入力はエラー結果になり上書きしない"""
+        (path,) = _write_inputs(temp_dir, 1)
+        other = temp_dir / "scenario_0.md"
+        other.write_text("別内容\n", encoding="utf-8")
+
+        with KumihanFormatter() as formatter:
+            results = list(
+                formatter.convert_many([path, other], temp_dir / "out", workers=1)
+            )
+
+        statuses = {r["input_file"]: r["status"] for r in results}
+        assert statuses == {str(path): "success", str(other): "error"}
+        html = (temp_dir / "out" / "scenario_0.html").read_text(encoding="utf-8")
+        assert "見出し0" in html
+
+
+class TestBatchCli:
+    """`kumihan batch` サブコマンドのテスト"""
+
+    @pytest.mark.parametrize("extra, expected_code", [([], 0), (["missing.txt"], 1)])
+    def test_exit_code(self, temp_dir, monkeypatch, capsys, extra, expected_code):
+        """全件成功で0、失敗を含めば1で終了"""
+        inputs = _write_inputs(temp_dir, 2)
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["kumihan", "batch", *map(str, inputs), *extra, "-o", "out", "-j", "1"],
+        )
+
+        with pytest.raises(SystemExit) as exc:
+            api_utils.main()
+
+        assert exc.value.code == expected_code
+        assert (temp_dir / "out" / "scenario_0.html").exists()
+        out = capsys.readouterr().out
+        assert "一括変換:" in out
+        assert f"変換完了: {Path('out') / 'scenario_0.html'}" in out
@@ -0,0 +1,78 @@
+"""CoreManagerファイルキャッシュテスト
+
+stat() による鮮度検証とバイト上限付きLRUのテスト
+"""
+
+import os
+
+from kumihan_formatter.managers.core_manager import CoreManager
+
+
+def _file_cache_stats(manager: CoreManager) -> dict:
+    return manager.get_core_statistics()["file_cache"]
+
+
+class TestCoreManagerFileCache:
+    """ファイルキャッシュの鮮度・上限テスト"""
+
+    def test_unchanged_file_served_from_cache(self, temp_dir):
+        """変更のないファイルはキャッシュから返す"""
+        manager = CoreManager()
+        path = temp_dir / "a.txt"
+        path.write_text("内容", encoding="utf-8")
+
+        assert manager.read_file(path) == "内容"
+        assert manager.read_file(path) == "内容"
+
+        stats = _file_cache_stats(manager)
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_modified_file_revalidated(self, temp_dir):
+        """ファイル変更後は再読み込みする"""
+        manager = CoreManager()
+        path = temp_dir / "a.txt"
+        path.write_text("old", encoding="utf-8")
+        assert manager.read_file(path) == "old"
+
+        # 同サイズでもmtimeの変化で検出できること
+        path.write_text("new", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert manager.read_file(path) == "new"
+        assert _file_cache_stats(manager)["revalidations"] == 1
+
+    def test_relative_and_absolute_paths_share_entry(self, temp_dir, monkeypatch):
+        """相対パスと絶対パスは同一エントリ"""
+        manager = CoreManager()
+        (temp_dir / "a.txt").write_text("x", encoding="utf-8")
+        monkeypatch.chdir(temp_dir)
+
+        manager.read_file("a.txt")
+        manager.read_file(temp_dir / "a.txt")
+
+        assert _file_cache_stats(manager)["hits"] == 1
+
+    def test_byte_budget_evicts(self, temp_dir):
+        """合計バイト数上限を超えると古いエントリを追い出す"""
+        manager = CoreManager({"file_cache_max_mb": 0.01})
+        for i in range(10):
+            path = temp_dir / f"{i}.txt"
+            path.write_text("x" * 4000, encoding="utf-8")
+            manager.read_file(path)
+
+        stats = _file_cache_stats(manager)
+        assert stats["evictions"] > 0
+        assert stats["current_bytes"] <= stats["max_bytes"]
+
+    def test_write_file_updates_cache(self, temp_dir):
+        """write_file後の読み込みは書き込んだ内容を返す"""
+        manager = CoreManager()
+        path = temp_dir / "a.txt"
+        path.write_text("old", encoding="utf-8")
+        manager.read_file(path)
+
+        assert manager.write_file(path, "written")
+        assert manager.read_file(path) == "written"
+        assert _file_cache_stats(manager)["revalidations"] == 0
@@ -0,0 +1,145 @@
+"""
+共有スタイルシート（CSSアセット）のテスト
+
+partials・テーマCSSを連結・最小化した kumihan.<hash>.css の生成と書き出し、
+css_mode="link" での <link> 出力、一括変換での共有を検証します。
+"""
+
+import os
+import re
+import sys
+
+import pytest
+
+from kumihan_formatter import KumihanFormatter
+from kumihan_formatter.core.rendering import css_assets
+from kumihan_formatter.core.rendering.css_assets import (
+    build_css_asset,
+    emit_css_asset,
+    write_css_asset,
+)
+from kumihan_formatter.core.rendering.main_renderer import MainRenderer
+from kumihan_formatter.core.utilities import api_utils
+
+PARSED = {"elements": [{"type": "paragraph", "content": "本文"}]}
+SCENARIO = "# 重要 #重要な情報です##\n\n段落{n}のテキストです。\n"
+
+
+def test_build_css_asset():
+    asset = build_css_asset()
+
+    assert re.fullmatch(r"kumihan\.[0-9a-f]{12}\.css", asset.filename)
+    assert ".kumihan-block.important" in asset.content
+    assert ".kumihan-nav" in asset.content  # partials
+    assert "/*" not in asset.content and "\n" not in asset.content
+    assert build_css_asset() is asset
+    assert build_css_asset("dark").filename != asset.filename
+    # 未知のテーマはデフォルトに寄せ、キャッシュを増やさない
+    assert build_css_asset("unknown-theme") is asset
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX の権限ビットが必要")
+def test_write_css_asset_applies_umask(temp_dir, monkeypatch):
+    """一時ファイルの 0600 ではなく umask 022 相当の 0644 で書き出す"""
+    monkeypatch.setattr(css_assets, "_ASSET_FILE_MODE", 0o666 & ~0o022)
+
+    path = write_css_asset(temp_dir, build_css_asset())
+
+    assert path.stat().st_mode & 0o777 == 0o644
+
+
+def test_write_css_asset(temp_dir):
+    asset = build_css_asset()
+
+    path = write_css_asset(temp_dir, asset)
+    mtime = path.stat().st_mtime_ns
+    write_css_asset(temp_dir, asset)
+
+    assert path.read_text(encoding="utf-8") == asset.content
+    assert path.stat().st_mtime_ns == mtime
+    assert [p.name for p in temp_dir.iterdir()] == [asset.filename]
+
+
+def test_emit_without_css_dir_does_not_write(temp_dir, monkeypatch):
+    monkeypatch.chdir(temp_dir)
+
+    asset = emit_css_asset({"css_mode": "link"})
+
+    assert not (temp_dir / asset.filename).exists()
+
+
+class TestMainRendererLinkMode:
+    def test_link_tag_replaces_style(self, temp_dir):
+        renderer = MainRenderer()
+        asset = build_css_asset()
+
+        html = renderer.render(
+            PARSED, {"css_mode": "link", "css_dir": str(temp_dir), "css_href": "a/"}
+        )
+
+        assert '<link rel="stylesheet" href="a/">' in html
+        assert "<style>" not in html
+        assert html.endswith("<p>本文</p>\n</body>\n</html>")
+        assert (temp_dir / asset.filename).exists()
+
+    def test_node_list_document(self):
+        from kumihan_formatter.core.ast_nodes import Node
+
+        html = MainRenderer().render([Node("p", "本文")], {"css_mode": "link"})
+
+        assert f'href="{build_css_asset().filename}"' in html
+        assert "<style>" not in html
+
+    def test_inline_is_default(self):
+        renderer = MainRenderer()
+
+        html = renderer.render(PARSED, {"css_mode": "inline"})
+
+        assert html == renderer.render(PARSED)
+        assert "<style>" in html and "<link" not in html
+
+
+class TestBatchLinkMode:
+    def _inputs(self, directory, count):
+        paths = []
+        for n in range(count):
+            path = directory / f"page_{n}.txt"
+            path.write_text(SCENARIO.format(n=n), encoding="utf-8")
+            paths.append(path)
+        return paths
+
+    def test_pages_share_one_stylesheet(self, temp_dir):
+        inputs = self._inputs(temp_dir, 3)
+        out_dir = temp_dir / "out"
+        asset = build_css_asset()
+
+        with KumihanFormatter() as formatter:
+            results = list(
+                formatter.convert_many(
+                    inputs, out_dir, workers=1, options={"css_mode": "link"}
+                )
+            )
+            inline = formatter.convert_text(SCENARIO.format(n=0))
+
+        assert all(r["status"] == "success" for r in results)
+        assert sorted(p.name for p in out_dir.glob("*.css")) == [asset.filename]
+        page = (out_dir / "page_0.html").read_text(encoding="utf-8")
+        assert f'<link rel="stylesheet" href="{asset.filename}">' in page
+        assert len(page) < len(inline)
+
+    def test_cli_option(self, temp_dir, monkeypatch):
+        inputs = self._inputs(temp_dir, 2)
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["kumihan", "batch", *map(str, inputs), "-o", "out", "-j", "1"]
+            + ["--css", "link", "--no-cache"],
+        )
+
+        with pytest.raises(SystemExit) as exc:
+            api_utils.main()
+
+        assert exc.value.code == 0
+
+        assert (temp_dir / "out" / build_css_asset().filename).exists()
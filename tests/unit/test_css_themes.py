@@ -0,0 +1,72 @@
+"""
+テーマCSSキャッシュのテスト
+
+CSSThemes / CSSProcessor がテーマ・オプションごとに1度だけCSSを構築し、
+整形版・最小化版・UTF-8 バイト列を再利用することを検証します。
+"""
+
+import pytest
+
+from kumihan_formatter.core.rendering.css_processor import CSSProcessor
+from kumihan_formatter.core.rendering.css_themes import CSSThemes
+from kumihan_formatter.core.rendering.css_utilities import minify_css
+
+
+def test_minify_css():
+    css = "/* c */\n* {\n  margin: 0;\n}\na > b { color: red ; }\n"
+
+    assert minify_css(css) == "*{margin:0}a > b{color:red}"
+
+
+@pytest.mark.parametrize("theme", ["default", "dark", "sepia", "minimal", "academic"])
+def test_theme_built_once(theme):
+    themes = CSSThemes()
+
+    pretty = themes.generate_theme_styles(theme)
+    minified = themes.generate_theme_styles(theme, minify=True)
+
+    assert CSSThemes().generate_theme_styles(theme) is pretty
+    assert themes.generate_theme_styles(theme, minify=True) is minified
+    assert minified == minify_css(themes._build_theme_styles(theme))
+    assert themes.get_theme_bytes(theme) == minified.encode("utf-8")
+    assert themes.get_theme_bytes(theme) is themes.get_theme_bytes(theme)
+
+
+def test_unknown_theme_uses_default():
+    themes = CSSThemes()
+
+    assert themes.generate_theme_styles("missing") is themes.generate_theme_styles()
+    assert themes.get_theme_bytes("missing") is themes.get_theme_bytes("default")
+
+
+def test_subclass_overrides_are_not_shared():
+    class CustomThemes(CSSThemes):
+        def generate_default_theme(self):
+            return "body { color: red; }"
+
+    assert CustomThemes().generate_theme_styles() == "body { color: red; }"
+    assert CSSThemes().generate_theme_styles() != "body { color: red; }"
+
+
+class TestCSSProcessorCache:
+    def test_complete_css_cached_per_options(self):
+        processor = CSSProcessor()
+
+        css = processor.generate_complete_css("dark", minify=True)
+
+        assert CSSProcessor().generate_complete_css("dark", minify=True) is css
+        assert css == processor._build_complete_css("dark", True, None, True)
+        assert processor.generate_complete_css("dark", include_responsive=False) != css
+
+    def test_custom_styles_not_cached(self):
+        processor = CSSProcessor()
+
+        first = processor.generate_complete_css(custom_styles={".a": "color: red"})
+        second = processor.generate_complete_css(custom_styles={".a": "color: blue"})
+
+        assert first != second
+
+    def test_theme_bytes(self):
+        assert CSSProcessor().get_theme_bytes("sepia") == CSSThemes().get_theme_bytes(
+            "sepia"
+        )
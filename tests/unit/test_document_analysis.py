@@ -0,0 +1,178 @@
+"""
+文書解析（見出しID・目次・脚注・画像参照の一括収集）のテスト
+
+analyze_document の1回の走査での収集結果、重複しない安定した見出しID、
+TOCFormatter への受け渡し、既存コンポーネントの委譲、
+MainRenderer での context["toc"] の反映を検証します。
+"""
+
+import pytest
+
+from kumihan_formatter.core.ast_nodes import Node
+from kumihan_formatter.core.rendering.document_analysis import (
+    HeadingIdAllocator,
+    analyze_document,
+    slugify_heading,
+)
+from kumihan_formatter.core.rendering.heading_collector import HeadingCollector
+from kumihan_formatter.core.rendering.main_renderer import MainRenderer
+from kumihan_formatter.core.rendering.toc_formatter import TOCFormatter
+from kumihan_formatter.core.rendering.toc_generator import TOCGenerator
+
+
+def _document():
+    return [
+        Node("h1", "はじめに"),
+        Node(
+            "div",
+            [
+                Node("h2", "Setup & Use"),
+                "テキスト",
+                Node("footnote", "補足", {"id": "fn-a"}),
+                Node("image", "map.png", {"alt": "地図"}),
+            ],
+        ),
+        Node("h2", "Setup & Use"),
+        Node("h3", "詳細", {"id": "setup-use-3"}),
+        Node("h2", "Setup & Use"),
+        Node("footnote", "出典"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Hello, World!", "hello-world"),
+        ("第1章 はじめに", "第1章-はじめに"),
+        ("<em>強調</em> 見出し", "強調-見出し"),
+        ("a_b--c", "a-b-c"),
+        ("!!!", "heading"),
+    ],
+)
+def test_slugify_heading(text, expected):
+    assert slugify_heading(text) == expected
+
+
+def test_allocator_deduplicates():
+    allocator = HeadingIdAllocator()
+    allocator.reserve("intro-2")
+
+    ids = [allocator.allocate(title) for title in ["Intro", "Intro", "Intro"]]
+
+    assert ids == ["intro", "intro-3", "intro-4"]
+
+
+def test_analyze_document():
+    nodes = _document()
+
+    analysis = analyze_document(nodes)
+
+    assert [(h["level"], h["id"]) for h in analysis.headings] == [
+        (1, "はじめに"),
+        (2, "setup-use"),
+        (2, "setup-use-2"),
+        (3, "setup-use-3"),
+        (2, "setup-use-4"),
+    ]
+    assert nodes[0].get_attribute("id") == "はじめに"
+    assert [(f.footnote_id, f.content) for f in analysis.footnotes] == [
+        ("fn-a", "補足"),
+        ("footnote-2", "出典"),
+    ]
+    assert [(i.src, i.alt) for i in analysis.images] == [("map.png", "地図")]
+
+    root = analysis.toc[0]
+    assert [e.heading_id for e in root.children] == [
+        "setup-use",
+        "setup-use-2",
+        "setup-use-4",
+    ]
+    assert root.children[1].children[0].heading_id == "setup-use-3"
+
+
+def test_ids_are_stable():
+    first = analyze_document(_document(), assign_ids=False)
+    second = analyze_document(_document())
+
+    assert [h["id"] for h in first.headings] == [h["id"] for h in second.headings]
+
+
+def test_element_dicts_and_deep_nesting():
+    elements = [
+        {"type": "heading_1", "content": "A", "attributes": {"level": 1}},
+        {"type": "paragraph", "content": "x"},
+        {"type": "heading_2", "content": "A"},
+    ]
+    deep = node = Node("div", [])
+    for _ in range(5000):
+        child = Node("div", [])
+        node.content.append(child)
+        node = child
+    node.content.append(Node("h2", "深い"))
+
+    analysis = analyze_document(elements, assign_ids=False)
+
+    assert [h["id"] for h in analysis.headings] == ["a", "a-2"]
+    assert "id" not in elements[0]["attributes"]
+    assert analyze_document([deep]).headings[0]["id"] == "深い"
+
+
+def test_feeds_toc_formatter():
+    analysis = analyze_document(_document())
+
+    html = TOCFormatter().format_html(analysis.toc)
+
+    assert '<a href="#はじめに">はじめに</a>' in html
+    assert '<a href="#setup-use-2">Setup &amp; Use</a>' in html
+
+
+def test_existing_components_delegate():
+    headings = HeadingCollector().collect_headings(_document())
+    toc = TOCGenerator().generate_from_nodes(_document())
+
+    assert [h["id"] for h in headings][:2] == ["はじめに", "setup-use"]
+    assert len(toc) == 1 and len(toc[0].children) == 3
+
+
+class TestMainRendererToc:
+    ELEMENTS = [
+        {"type": "heading_1", "content": "概要", "attributes": {"level": 1}},
+        {"type": "paragraph", "content": "本文"},
+        {"type": "heading_2", "content": "詳細", "attributes": {"level": 2}},
+    ]
+
+    def test_toc_option(self):
+        renderer = MainRenderer()
+
+        html = renderer.render({"elements": self.ELEMENTS}, {"toc": True})
+
+        assert '<div class="toc">' in html
+        assert '<h1 id="概要">概要</h1>' in html
+        assert '<a href="#詳細">詳細</a>' in html
+        assert "id" not in self.ELEMENTS[0]["attributes"]
+
+    def test_stream_matches_render(self):
+        renderer = MainRenderer()
+        parsed = {"elements": self.ELEMENTS}
+
+        streamed = "".join(renderer._iter_kumihan_document(parsed, {"toc": True}))
+
+        assert streamed == renderer.render(parsed, {"toc": True})
+
+    def test_template_receives_toc(self):
+        html = MainRenderer().render(
+            {"elements": self.ELEMENTS}, {"toc": True, "template": "base"}
+        )
+
+        assert '<nav class="toc-content">' in html
+        assert '<a href="#概要">概要</a>' in html
+
+    def test_default_output_unchanged(self):
+        renderer = MainRenderer()
+        parsed = {"elements": self.ELEMENTS}
+
+        html = renderer.render(parsed)
+
+        assert "<h1>概要</h1>" in html
+        assert '<div class="toc">' not in html
+        assert html == renderer.render(parsed, {"toc": False})
@@ -0,0 +1,81 @@
+"""
+テーブル駆動の要素レンダラーのテスト
+
+ElementRenderer の要素タイプ別の出力、エスケープ、一括描画と
+要素ごとの描画の一致、失敗要素のエラー表示を検証します。
+"""
+
+import pytest
+
+from kumihan_formatter.core.rendering.element_renderer import (
+    ElementRenderer,
+    escape_html,
+)
+from kumihan_formatter.core.rendering.main_renderer import MainRenderer
+
+ELEMENTS = [
+    {"type": "kumihan_block", "content": "a<b", "attributes": {"decoration": "重要"}},
+    {"type": "kumihan_block", "content": "x", "attributes": {"decoration": " 不明 "}},
+    {"type": "heading_2", "content": "見出し", "attributes": {"level": 2}},
+    {"type": "heading_9", "content": "深い", "attributes": {"level": "9"}},
+    {"type": "paragraph", "content": "段落 <strong>太字</strong>"},
+    {"type": "list_item", "content": "項目 & 'q'"},
+    {"type": "custom", "content": '"c"'},
+    {"type": "paragraph", "content": ""},
+]
+
+
+def test_escape_html():
+    assert escape_html("<a href=\"x\">'&'</a>") == (
+        "&lt;a href=&quot;x&quot;&gt;&#39;&amp;&#39;&lt;/a&gt;"
+    )
+    assert escape_html("") == ""
+
+
+@pytest.mark.parametrize(
+    "element, expected",
+    [
+        (ELEMENTS[0], '<div class="kumihan-block important">a&lt;b</div>'),
+        (ELEMENTS[1], '<div class="kumihan-block note">x</div>'),
+        (ELEMENTS[2], "<h2>見出し</h2>"),
+        (ELEMENTS[3], "<h9>深い</h9>"),
+        (ELEMENTS[4], "<p>段落 <strong>太字</strong></p>"),
+        (ELEMENTS[5], "<li>項目 &amp; &#39;q&#39;</li>"),
+        (ELEMENTS[6], '<div class="element-custom">&quot;c&quot;</div>'),
+    ],
+)
+def test_render(element, expected):
+    assert ElementRenderer().render(element) == expected
+
+
+def test_render_elements_matches_per_element():
+    renderer = ElementRenderer()
+
+    expected = "\n".join(
+        part for part in (renderer.render(e) for e in ELEMENTS) if part
+    )
+
+    assert renderer.render_elements(ELEMENTS) == expected
+    assert renderer.render_elements(iter(ELEMENTS)) == expected
+
+
+def test_render_elements_isolates_failures():
+    renderer = ElementRenderer()
+    elements = [
+        {"type": "list_item", "content": "ok"},
+        {"type": "list_item", "content": 1},
+    ]
+
+    html = renderer.render_elements(elements)
+
+    assert html.startswith("<li>ok</li>\n")
+    assert '<div class="error">要素レンダリングエラー' in html
+
+
+def test_main_renderer_uses_batch():
+    renderer = MainRenderer()
+    parsed = {"elements": ELEMENTS}
+
+    streamed = "".join(renderer.render_iter(ELEMENTS))
+
+    assert renderer.render(parsed) == streamed
@@ -0,0 +1,58 @@
+"""
+共有記法レジストリのテスト
+
+get_grammar() が1度だけ構築され、各パーサー・プロセッサーが同じ
+コンパイル済みパターンを参照すること、レジストリが不変であることを検証します。
+"""
+
+import dataclasses
+
+import pytest
+
+from kumihan_formatter.core.parsing.core_marker_parser import CoreMarkerParser
+from kumihan_formatter.core.parsing.grammar import get_grammar
+from kumihan_formatter.core.syntax.syntax_rules import SyntaxRules
+from kumihan_formatter.parsers.main_parser import MainParser
+from kumihan_formatter.parsers.unified_markdown_parser import UnifiedMarkdownParser
+
+
+def test_registry_is_built_once():
+    assert get_grammar() is get_grammar()
+
+
+def test_parsers_share_compiled_patterns():
+    first, second = CoreMarkerParser(), CoreMarkerParser()
+
+    assert first.marker_pattern is second.marker_pattern
+    assert (
+        first.new_format_processor.new_format_pattern
+        is second.new_format_processor.new_format_pattern
+    )
+    assert first.ruby_format_processor.ruby_pattern is get_grammar().ruby["basic"]
+    assert first.inline_processor.inline_patterns is get_grammar().inline
+    assert UnifiedMarkdownParser().patterns is UnifiedMarkdownParser().patterns
+
+
+def test_registry_is_immutable():
+    grammar = get_grammar()
+
+    with pytest.raises(TypeError):
+        grammar.inline["strong"] = None  # type: ignore[index]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        grammar.marker = None  # type: ignore[misc]
+    assert isinstance(SyntaxRules.VALID_KEYWORDS, frozenset)
+    assert grammar.valid_keywords is SyntaxRules.VALID_KEYWORDS
+
+
+def test_keyword_lookup():
+    grammar = get_grammar()
+
+    assert grammar.is_valid_keyword("太字")
+    assert not grammar.is_valid_keyword("目次")
+    assert grammar.decoration_classes["注意"] == "warning"
+
+
+def test_main_parser_construction_reuses_registry():
+    parser = MainParser()
+
+    assert parser.markdown_parser.patterns is get_grammar().markdown
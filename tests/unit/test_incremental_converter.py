@@ -0,0 +1,139 @@
+"""
+インクリメンタル変換のテスト
+
+IncrementalConverter の差分再変換と ConvertWatcher の差分更新を検証します。
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from kumihan_formatter.commands.convert_watcher import ConvertWatcher
+from kumihan_formatter.core.processing.chunking import Chunker
+from kumihan_formatter.core.processing.incremental_converter import (
+    IncrementalConverter,
+)
+from kumihan_formatter.core.rendering.main_renderer import MainRenderer
+from kumihan_formatter.parsers.main_parser import MainParser
+
+BLOCK = (
+    "# 重要 #重要な情報{n}##\n\n## 見出し{n}\n\n段落{n}のテキスト。**太字**\n\n"
+    "#注意#\n複数行{n}\n\nブロック\n##\n\n- リスト項目{n}\n"
+)
+
+
+def _full_convert(text: str) -> str:
+    return MainRenderer().render(MainParser().parse(text, "auto"))
+
+
+class TestTopLevelSegments:
+    """トップレベルブロック分割のテスト"""
+
+    def test_blank_lines_split_outside_blocks_only(self):
+        """空行で分割し、複数行ブロック内の空行では分割しない"""
+        lines = "見出し\n\n#注意#\n行1\n\n行2\n##\n\n\n段落".split("\n")
+        segments = Chunker().create_top_level_segments(lines)
+
+        assert [s.lines for s in segments] == [
+            ["見出し", ""],
+            ["#注意#", "行1", "", "行2", "##", "", ""],
+            ["段落"],
+        ]
+        assert [s.file_position for s in segments] == [0, 2, 9]
+
+
+class TestIncrementalConverter:
+    """差分再変換のテスト"""
+
+    def test_edit_reparses_only_changed_block(self):
+        """編集したブロックのみ再解析し、出力は一括変換と同一"""
+        converter = IncrementalConverter()
+        blocks = [BLOCK.format(n=n) for n in range(20)]
+        converter.convert("\n".join(blocks))
+
+        blocks[7] = blocks[7].replace("段落7", "編集後の段落")
+        text = "\n".join(blocks)
+        before = converter.get_statistics()
+        html = converter.convert(text)
+        after = converter.get_statistics()
+
+        assert html == _full_convert(text)
+        assert after["incremental_updates"] == 2
+        assert after["segments_reparsed"] - before["segments_reparsed"] == 1
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            # 閉じ ## の直後の行が見出しになる（ブロックをまたぐ見出しマッチ）
+            "#注意#\n##\n\n# 見出し #",
+            # 装飾ブロックが無い文書は別パーサーが選ばれる
+            "## 見出し\n\n段落",
+            # 行途中から始まり空行をまたぐ装飾ブロック
+            "テキスト #注意\n\n#本文##",
+        ],
+    )
+    def test_falls_back_when_blocks_not_independent(self, text):
+        """ブロック単位で扱えない文書は一括変換と同一結果"""
+        converter = IncrementalConverter()
+
+        assert converter.convert(text) == _full_convert(text)
+        assert converter.get_statistics()["full_conversions"] == 1
+
+    def test_elements_in_parser_order(self):
+        """要素は一括解析と同じ区分順（装飾ブロック→見出し→行要素）"""
+        text = "\n".join(BLOCK.format(n=n) for n in range(3))
+        converter = IncrementalConverter()
+        converter.convert(text)
+
+        assert converter.elements == MainParser().parse(text, "auto")["elements"]
+
+
+class TestConvertWatcherIncremental:
+    """ConvertWatcher の差分更新テスト"""
+
+    def test_convert_changed_file(self, temp_dir):
+        """変更ファイルを差分更新で出力ディレクトリへ書き出す"""
+        input_file = temp_dir / "scenario.txt"
+        input_file.write_text(BLOCK.format(n=1), encoding="utf-8")
+        watcher = ConvertWatcher(Mock(), Mock())
+
+        output_path = watcher.convert_changed_file(input_file, str(temp_dir), None)
+        input_file.write_text(BLOCK.format(n=2), encoding="utf-8")
+        output_path = watcher.convert_changed_file(input_file, str(temp_dir), None)
+
+        assert output_path == temp_dir / "scenario.html"
+        assert output_path.read_text(encoding="utf-8") == _full_convert(
+            BLOCK.format(n=2)
+        )
+
+    def test_supports_incremental(self):
+        """ソース表示・テストケース表示・設定ファイル指定時は通常変換を使う"""
+        watcher = ConvertWatcher(Mock(), Mock())
+
+        assert watcher.supports_incremental({"include_source": False})
+        assert not watcher.supports_incremental({"include_source": True})
+        assert not watcher.supports_incremental({"show_test_cases": True})
+        assert watcher.supports_incremental({"syntax_check": True})
+        assert not watcher.supports_incremental({"config": object()})
+        assert not ConvertWatcher(
+            Mock(), Mock(), incremental=False
+        ).supports_incremental({})
+
+    def test_syntax_check_runs_with_incremental(self, temp_dir, capsys):
+        """構文チェック有効時も差分更新で変換し、問題を報告する"""
+        input_file = temp_dir / "scenario.txt"
+        text = "#注意#\n本文\n##\n\n##\n"
+        input_file.write_text(text, encoding="utf-8")
+        watcher = ConvertWatcher(Mock(), Mock())
+        config = watcher._build_handler_config(
+            str(input_file), str(temp_dir), None, False, None, False, True
+        )
+
+        watcher.process_change(input_file, lambda: False, config)
+
+        watcher.processor.process_file_change.assert_not_called()
+        stats = watcher._incremental_converters[input_file].get_statistics()
+        assert stats["incremental_updates"] == 1
+        output_path = temp_dir / "scenario.html"
+        assert output_path.read_text(encoding="utf-8") == _full_convert(text)
+        assert "Line 5: 対応する開始行のない終了マーカーです" in capsys.readouterr().out
@@ -40,3 +40,42 @@ class TestCoreInit:
 
         # モジュール自体のimportが成功することを確認
         assert kumihan_formatter.core is not None
+
+
+class TestLazyPackageInit:
+    """公開APIの遅延インポートテスト"""
+
+    def test_import_does_not_load_subsystems(self):
+        """`import kumihan_formatter` では変換系のサブシステムを読み込まない"""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, kumihan_formatter; "
+            "print(sorted(m for m in sys.modules if m.startswith("
+            "('kumihan_formatter.unified_api', 'kumihan_formatter.managers'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_public_names_resolve_lazily(self):
+        """公開名は初回アクセス時に解決され、__dir__ にも現れる"""
+        import kumihan_formatter
+        from kumihan_formatter.unified_api import KumihanFormatter
+
+        assert kumihan_formatter.KumihanFormatter is KumihanFormatter
+        assert callable(kumihan_formatter.quick_convert)
+        assert set(kumihan_formatter.__all__) <= set(dir(kumihan_formatter))
+        with pytest.raises(AttributeError):
+            kumihan_formatter.NoSuchName  # noqa: B018
+
+    def test_managers_resolve_lazily(self):
+        """managers パッケージのクラスも遅延インポートで解決される"""
+        from kumihan_formatter.managers import ProcessingManager
+        from kumihan_formatter.managers.processing_manager import (
+            ProcessingManager as Direct,
+        )
+
+        assert ProcessingManager is Direct
@@ -0,0 +1,86 @@
+"""
+MainParser 自動パーサー選択のテスト
+
+_auto_parse が各パーサーの本解析を重複して実行しないことを検証します。
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from kumihan_formatter.core.processing.parsing_coordinator import ParsingCoordinator
+from kumihan_formatter.parsers.main_parser import MainParser
+
+
+def _count_calls(parser, *names):
+    """指定パーサーの呼び出し回数を記録するラッパーを登録"""
+    counts = {name: 0 for name in names}
+    for name in names:
+        original = parser._parsers[name]
+
+        def wrapper(content, _name=name, _original=original):
+            counts[_name] += 1
+            return _original(content)
+
+        parser._parsers[name] = wrapper
+    return counts
+
+
+class TestAutoParseSinglePass:
+    """_auto_parse のパーサー実行回数テスト"""
+
+    def test_block_document_parsed_once(self):
+        """Kumihanブロックを含む文書は SimpleKumihanParser 1回のみ"""
+        parser = MainParser()
+        text = "# 重要 #重要な情報##\n\n## 見出し\n\n段落"
+
+        with (
+            patch.object(
+                parser.marker_parser,
+                "parse_simple_kumihan",
+                wraps=parser.marker_parser.parse_simple_kumihan,
+            ) as simple,
+            patch.object(parser.coordinator, "recommend_parser") as recommend,
+        ):
+            result = parser.parse(text, "auto")
+
+        assert result["elements"][0]["type"] == "kumihan_block"
+        assert simple.call_count == 1
+        recommend.assert_not_called()
+
+    @pytest.mark.parametrize("content", ["## 見出し\n\n段落##", ["## 見出し", "段落"]])
+    def test_no_block_skips_speculative_simple_parse(self, content):
+        """ブロックを含まない文書では SimpleKumihanParser を先行実行しない"""
+        parser = MainParser()
+        counts = _count_calls(parser, "keyword", "list", "markdown", "marker", "simple")
+
+        with patch.object(
+            parser.marker_parser,
+            "parse_simple_kumihan",
+            wraps=parser.marker_parser.parse_simple_kumihan,
+        ) as simple:
+            parser.parse(content, "auto")
+
+        # 登録済み "simple" 以外からの SimpleKumihanParser 呼び出しは無い
+        assert simple.call_count == 0
+        assert all(count <= 1 for count in counts.values())
+
+
+class TestRecommendParser:
+    """ParsingCoordinator.recommend_parser のテスト"""
+
+    def test_matches_full_scoring_for_short_documents(self):
+        """サンプル行数以内の文書は全行スコアリングと同じ判定"""
+        coordinator = ParsingCoordinator()
+        for content in ["# リスト #\n- a", "**太字**\n本文", "#注意#\n内容\n##", ""]:
+            expected = coordinator.parse_document(content)["parser_type"]
+            assert coordinator.recommend_parser(content) == expected
+
+    def test_samples_only_prefix(self):
+        """先頭のサンプル行のみで判定する"""
+        coordinator = ParsingCoordinator({"auto_detect_sample_lines": 2})
+        content = "**太字**\n本文\n" + "# リスト #\n" * 100
+
+        assert coordinator.recommend_parser(content) == "markdown"
+        assert coordinator.recommend_parser(content, sample_lines=0) == "list"
+        assert coordinator.recommend_parser([]) == "empty"
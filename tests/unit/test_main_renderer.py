@@ -267,3 +267,44 @@ class TestMainRenderer:
         assert renderer is not None
         # configがNoneでも初期化できることを確認
         assert renderer.config is None or isinstance(renderer.config, dict)
+
+    def test_render_to_stream_matches_render(self):
+        """ストリーム出力がrender()と同一内容になることのテスト"""
+        import io
+
+        renderer = MainRenderer()
+        parsed = {
+            "elements": [
+                {
+                    "type": "kumihan_block",
+                    "content": "重要な内容",
+                    "attributes": {"decoration": "重要"},
+                },
+                {
+                    "type": "heading_2",
+                    "content": "見出し",
+                    "attributes": {"level": "2"},
+                },
+                {"type": "paragraph", "content": "段落"},
+            ]
+        }
+
+        buffer = io.StringIO()
+        written = renderer.render_to_stream(parsed, buffer, {"title": "T"})
+
+        assert buffer.getvalue() == renderer.render(parsed, {"title": "T"})
+        assert written == len(buffer.getvalue())
+
+    def test_render_to_stream_non_dict_input(self):
+        """辞書以外の入力はrender()結果をそのまま書き込むテスト"""
+        import io
+
+        renderer = MainRenderer()
+        buffer = io.StringIO()
+
+        with patch.object(renderer, "render", return_value="<p>x</p>") as mock_render:
+            written = renderer.render_to_stream("text", buffer)
+
+        mock_render.assert_called_once_with("text", {})
+        assert buffer.getvalue() == "<p>x</p>"
+        assert written == len("<p>x</p>")
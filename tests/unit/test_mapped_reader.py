@@ -0,0 +1,96 @@
+"""
+メモリマップ入力リーダーのテスト
+
+MappedTextReader と CoreManager のファイルチャンク生成を検証します。
+"""
+
+import pytest
+
+from kumihan_formatter.core.io import mapped_reader
+from kumihan_formatter.core.io.mapped_reader import MappedTextReader
+from kumihan_formatter.core.io.operations import FileOperations
+from kumihan_formatter.managers.core_manager import CoreManager
+
+
+def _readlines_chunks(path, chunk_size):
+    """従来実装（readlines + rstrip）によるチャンク"""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line.rstrip("\n\r") for line in f.readlines()]
+    return CoreManager().create_chunks_from_lines(lines, chunk_size)
+
+
+class TestMappedTextReader:
+    """MappedTextReader のテスト"""
+
+    def test_chunks_are_lazy_views(self, temp_dir):
+        """チャンクはマップへの memoryview で、参照時にデコードする"""
+        path = temp_dir / "input.txt"
+        path.write_text("行1\r\n行2\n\n行4", encoding="utf-8")
+
+        with MappedTextReader(path) as reader:
+            assert reader.supports_mapping()
+            assert reader.count_lines() == 4
+            chunks = list(reader.iter_chunks(2))
+
+            assert [(c.start_line, c.end_line) for c in chunks] == [(1, 2), (3, 4)]
+            assert isinstance(chunks[0].view, memoryview)
+            assert chunks[0].lines() == ["行1", "行2"]
+            assert chunks[1].lines() == ["", "行4"]
+            for chunk in chunks:
+                chunk.release()
+
+    @pytest.mark.parametrize(
+        "data, encoding",
+        [(b"a\rb\r", "utf-8"), ("あ\nい".encode("utf-16"), "utf-16")],
+    )
+    def test_unsupported_inputs(self, temp_dir, data, encoding):
+        """単独CR改行・UTF-16 はマップ上で行分割しない"""
+        path = temp_dir / "input.txt"
+        path.write_bytes(data)
+
+        with MappedTextReader(path, encoding) as reader:
+            assert not reader.supports_mapping()
+
+    @pytest.mark.parametrize(
+        "encoding", ["latin-1", "latin1", "ISO-8859-1", "UTF8", "sjis", "eucjp"]
+    )
+    def test_encoding_aliases_supported(self, temp_dir, encoding):
+        """エンコーディング名の別名でもマップ上で行分割する"""
+        path = temp_dir / "input.txt"
+        path.write_bytes(b"a\nb\n")
+
+        with MappedTextReader(path, encoding) as reader:
+            assert reader.supports_mapping()
+
+    def test_open_mapped_validates_path(self, temp_dir):
+        with pytest.raises(FileNotFoundError):
+            FileOperations().open_mapped(temp_dir / "missing.txt")
+
+
+class TestCoreManagerFileChunks:
+    """CoreManager のファイルチャンク生成テスト"""
+
+    @pytest.mark.parametrize(
+        "text",
+        ["", "\n", "行1\n行2", "行1\r\n\r\n行3\r\n", "a\rb\nc", "あ" * 5 + "\n" * 250],
+    )
+    def test_matches_readlines(self, temp_dir, monkeypatch, text):
+        """マップ経由のチャンクは従来の readlines 実装と同一"""
+        # 窓境界をまたぐ改行も検証するため走査窓を縮小
+        monkeypatch.setattr(mapped_reader, "_SCAN_WINDOW_BYTES", 5)
+        path = temp_dir / "input.txt"
+        path.write_bytes(text.encode("utf-8"))
+        manager = CoreManager()
+        total_lines = len(text.splitlines())
+
+        chunks = manager.create_chunks_from_file(str(path))
+
+        expected = (
+            _readlines_chunks(path, manager._adaptive_chunk_size(total_lines))
+            if total_lines
+            else []
+        )
+        assert chunks == expected
+        assert list(manager.iter_chunks_from_file(path, chunk_size=3)) == (
+            _readlines_chunks(path, 3)
+        )
@@ -0,0 +1,143 @@
+"""
+メモリ予算による投入制御のテスト
+
+MemoryAdmissionController の段階判定と投入可否、ワーカー数の推奨値、
+SpilledResults の一時ファイル退避、投入数を絞った並列処理を検証します。
+"""
+
+import concurrent.futures
+import threading
+import time
+
+from kumihan_formatter.core.processing.memory_admission import (
+    STATE_CRITICAL,
+    STATE_OK,
+    STATE_WARNING,
+    MemoryAdmissionController,
+    SpilledResults,
+    read_rss_mb,
+)
+from kumihan_formatter.core.processing.process_backend import iter_as_completed
+
+
+class _FakeProbe:
+    """自プロセスの常駐メモリとして指定値を返す"""
+
+    def __init__(self, usage_mb):
+        self.usage_mb = usage_mb
+
+    def __call__(self, pid):
+        return self.usage_mb if pid is None else None
+
+
+def _controller(usage_mb, limit_mb=100):
+    return MemoryAdmissionController(
+        limit_mb, sample_interval=0, probe=_FakeProbe(usage_mb)
+    )
+
+
+class TestMemoryAdmissionController:
+    def test_states(self):
+        assert _controller(10).state() == STATE_OK
+        assert _controller(85).state() == STATE_WARNING
+        assert _controller(120).state() == STATE_CRITICAL
+
+    def test_admit_by_state(self):
+        ok = _controller(10)
+        assert ok.admit(in_flight=7, capacity=4)
+
+        warning = _controller(85)
+        assert warning.admit(in_flight=1, capacity=4)
+        assert not warning.admit(in_flight=2, capacity=4)
+        assert warning.throttled == 1
+
+        critical = _controller(120)
+        assert not critical.admit(in_flight=1, capacity=4)
+        assert critical.admit(in_flight=0, capacity=4)
+        assert critical.serialized == 1
+
+    def test_peak_and_statistics(self):
+        probe = _FakeProbe(40)
+        controller = MemoryAdmissionController(100, sample_interval=0, probe=probe)
+        controller.usage_mb()
+        probe.usage_mb = 20
+        controller.usage_mb()
+
+        stats = controller.get_statistics()
+        assert stats["peak_mb"] == 40
+        assert stats["usage_mb"] == 20
+        assert stats["warning_mb"] == 80
+
+    def test_recommended_workers(self):
+        # 残り予算 64MB / 既定見積り 32MB → 2ワーカー
+        assert _controller(36).recommended_workers(8) == 2
+        assert _controller(0).recommended_workers(2) == 2
+        assert _controller(120).recommended_workers(8) == 1
+
+
+class TestSpilledResults:
+    def test_spills_under_pressure(self):
+        probe = _FakeProbe(10)
+        controller = MemoryAdmissionController(100, sample_interval=0, probe=probe)
+        store = SpilledResults(controller)
+
+        store.put(0, ["a"])
+        probe.usage_mb = 90
+        store.put(1, ["b", {"c": 1}])
+        store.put(2, [lambda: None])  # pickle できない結果はメモリに保持
+
+        assert len(store) == 3 and 1 in store
+        assert controller.spilled_chunks == 1
+        assert store.pop(1) == ["b", {"c": 1}]
+        assert store.pop(0) == ["a"]
+        assert 1 not in store
+        store.close()
+        assert len(store) == 0
+
+    def test_without_controller(self):
+        store = SpilledResults(None)
+        store.put(3, [1, 2])
+        assert store.pop(3) == [1, 2]
+
+
+class TestIterAsCompleted:
+    def test_throttles_in_flight(self):
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def worker(n):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.005)
+            with lock:
+                running[0] -= 1
+            return [n]
+
+        controller = _controller(120)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                iter_as_completed(executor, range(8), worker, controller, capacity=4)
+            )
+
+        assert sorted(r[1][0] for r in results) == list(range(8))
+        assert all(r[2] is None for r in results)
+        assert peak[0] == 1
+
+    def test_reports_errors(self):
+        def worker(n):
+            if n == 1:
+                raise ValueError("boom")
+            return [n]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            results = {r[0]: r for r in iter_as_completed(executor, range(3), worker)}
+
+        assert isinstance(results[1][2], ValueError)
+        assert results[2][1] == [2]
+
+
+def test_read_rss_mb():
+    usage = read_rss_mb()
+    assert usage is not None and usage > 0
@@ -0,0 +1,82 @@
+"""
+ASTノードの省メモリ表現のテスト
+
+CompactNode の遅延確保と NodeArena / ArenaNodeView の Node 互換性を検証します。
+"""
+
+import pytest
+
+from kumihan_formatter.core.ast_nodes import (
+    CompactNode,
+    Node,
+    NodeArena,
+    create_node,
+)
+from kumihan_formatter.core.parsing.parser_core import Parser
+
+
+class TestCompactNode:
+    """CompactNode のテスト"""
+
+    def test_no_instance_dict_and_lazy_containers(self):
+        """__dict__ を持たず、属性・子ノードは必要になるまで確保しない"""
+        node = CompactNode("text", "本文")
+
+        assert not hasattr(node, "__dict__")
+        assert not hasattr(Node("text", "本文"), "__dict__")
+        assert node.attributes is None and node.children is None
+        assert node.get_attribute("class") is None
+
+        node.add_attribute("class", "box")
+        assert node.attributes == {"class": "box"}
+        assert node.children is None
+
+    def test_equals_eager_node(self):
+        """同内容の Node と等しい"""
+        assert CompactNode("text", "本文") == create_node("text", "本文")
+        assert create_node("text", "本文") == CompactNode("text", "本文")
+        assert CompactNode("text", "本文") != Node("text", "別")
+
+
+class TestNodeArena:
+    """NodeArena / ArenaNodeView のテスト"""
+
+    def test_tree_view_matches_nodes(self):
+        """親子関係・内容・属性を Node と同様に参照できる"""
+        source = "見出し\n本文"
+        arena = NodeArena(source)
+        root = arena.add("div", attributes={"class": "box"})
+        arena.add("h2", 0, 3, parent=root)
+        arena.add("text", 4, 6, parent=root)
+        arena.add_value("image", "a.png")
+
+        box, image = arena.roots()
+        assert box.get_attribute("class") == "box"
+        assert [child.content for child in box.content] == ["見出し", "本文"]
+        assert box.children[0].is_heading()
+        assert box.children[1].parent == box
+        assert [view.type for view in box.walk()] == ["div", "h2", "text"]
+        assert box.get_text_content() == "見出し 本文"
+        assert image.content == "a.png"
+        assert arena.to_nodes() == [
+            Node(
+                "div",
+                [Node("h2", "見出し"), Node("text", "本文")],
+                {"class": "box"},
+            ),
+            Node("image", "a.png"),
+        ]
+
+    def test_index_out_of_range(self):
+        with pytest.raises(IndexError):
+            NodeArena().node(0)
+
+    @pytest.mark.parametrize(
+        "text", ["行1\n\n  行2  \r\n\t\n行3", "a\rb\x0cc d", "\n\n", "末尾改行\n"]
+    )
+    def test_parser_arena_matches_parse(self, text):
+        """Parser.parse_to_arena は parse() と同じテキストノードを生成"""
+        arena = Parser().parse_to_arena(text)
+
+        assert arena.to_nodes() == Parser().parse(text)
+        assert arena.get_statistics()["nodes"] == len(arena)
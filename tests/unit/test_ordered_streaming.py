@@ -0,0 +1,92 @@
+"""
+順序付きストリーミング並列処理のテスト
+
+リオーダーバッファによるチャンク順の出力と、未返却チャンク数の上限
+（背圧）を検証します。
+"""
+
+import threading
+import time
+
+from kumihan_formatter.core.processing.processor_core import ParallelChunkProcessor
+from kumihan_formatter.core.types import ChunkInfo
+
+
+def _chunks(count):
+    for n in range(count):
+        yield ChunkInfo(
+            chunk_id=n,
+            start_line=n + 1,
+            end_line=n + 1,
+            lines=[f"行{n}"],
+            file_position=n,
+        )
+
+
+def _reverse_delay(chunk):
+    """後ろのチャンクほど早く完了させる"""
+    time.sleep(0.002 * (8 - chunk.chunk_id % 8))
+    yield from chunk.lines
+
+
+class TestProcessChunksOrdered:
+    """process_chunks_ordered のテスト"""
+
+    def test_results_in_chunk_order(self):
+        processor = ParallelChunkProcessor(max_workers=4)
+
+        results = list(processor.process_chunks_ordered(_chunks(40), _reverse_delay))
+
+        assert results == [f"行{n}" for n in range(40)]
+
+    def test_window_bounds_consumed_input(self):
+        """先頭の結果を返す前に読み進めるチャンクは window 個まで"""
+        pulled = []
+
+        def source():
+            for chunk in _chunks(1000):
+                pulled.append(chunk.chunk_id)
+                yield chunk
+
+        processor = ParallelChunkProcessor(max_workers=2)
+        stream = processor.process_chunks_ordered(
+            source(), lambda chunk: iter(chunk.lines), window=3
+        )
+
+        assert next(stream) == "行0"
+        assert len(pulled) <= 3
+        stream.close()
+
+    def test_failed_chunk_is_skipped(self):
+        def fail_on_two(chunk):
+            if chunk.chunk_id == 2:
+                raise ValueError("broken")
+            yield from chunk.lines
+
+        processor = ParallelChunkProcessor(max_workers=2)
+
+        results = list(processor.process_chunks_ordered(_chunks(5), fail_on_two))
+
+        assert results == ["行0", "行1", "行3", "行4"]
+
+
+class TestOptimizedStreaming:
+    """process_chunks_parallel_optimized の逐次出力テスト"""
+
+    def test_head_results_before_all_chunks_finish(self):
+        """先頭チャンクの結果は残りのチャンクの完了を待たずに返す"""
+        release_last = threading.Event()
+
+        def block_last(chunk):
+            if chunk.chunk_id == 5:
+                assert release_last.wait(5)
+            yield from chunk.lines
+
+        processor = ParallelChunkProcessor(max_workers=4)
+        stream = processor.process_chunks_parallel_optimized(
+            list(_chunks(6)), block_last, backend="thread"
+        )
+
+        assert next(stream) == "行0"
+        release_last.set()
+        assert list(stream) == [f"行{n}" for n in range(1, 6)]
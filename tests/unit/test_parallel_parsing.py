@@ -0,0 +1,206 @@
+"""
+並列解析パスのテスト
+
+ParallelProcessingConfig のしきい値による並列解析への切り替え、
+タイムアウト・キャンセル・メモリ超過時の挙動とメトリクスを検証します。
+"""
+
+import time
+
+import pytest
+
+from kumihan_formatter.core.parsing.parallel_parsing import (
+    ParallelParseMetrics,
+    iter_parallel_chunks,
+)
+from kumihan_formatter.core.parsing.parser_core import (
+    ParallelProcessingConfig,
+    ParallelProcessingError,
+    Parser,
+)
+from kumihan_formatter.core.processing.memory_admission import (
+    MemoryAdmissionController,
+)
+from kumihan_formatter.parsers.core_parser import Parser as CoreParser
+
+TEXT = "\n".join(f"行{i}" if i % 3 else "" for i in range(500))
+
+
+def _chunk_ids(chunk):
+    return [chunk.chunk_id]
+
+
+def _slow_first_chunk(chunk):
+    if chunk.chunk_id == 0:
+        time.sleep(0.5)
+    return [chunk.chunk_id]
+
+
+def _run(lines, func, config=None, **kwargs):
+    metrics = ParallelParseMetrics()
+    results = list(
+        iter_parallel_chunks(
+            lines, func, config or ParallelProcessingConfig(), metrics, **kwargs
+        )
+    )
+    return results, metrics
+
+
+class TestParserParallelPath:
+    """Parser.parse の並列解析パス"""
+
+    def test_parallel_matches_sequential(self):
+        parser = Parser({"max_workers": 2})
+        parser.parallel_config.parallel_threshold_lines = 100
+        parser.parallel_config.backend = "process"
+
+        parallel = parser.parse(TEXT)
+        metrics = parser.get_parallel_processing_metrics()
+
+        assert parallel == parser.parse(TEXT, use_parallel=False)
+        assert metrics["parallel_processing"] == "enabled"
+        assert metrics["last_run"]["mode"] == "parallel"
+        assert metrics["last_run"]["total_chunks"] == 4
+        assert metrics["last_run"]["completed_chunks"] == 4
+
+    def test_environment_thresholds(self, monkeypatch):
+        """KUMIHAN_PARALLEL_* 環境変数でしきい値・チャンク数が変わる"""
+        monkeypatch.setenv("KUMIHAN_PARALLEL_THRESHOLD_LINES", "100")
+        monkeypatch.setenv("KUMIHAN_PARALLEL_CHUNKS_PER_CORE", "5")
+        monkeypatch.setenv("KUMIHAN_PARALLEL_BACKEND", "process")
+        parser = Parser({"max_workers": 2})
+        parser.parse(TEXT)
+
+        last_run = parser.get_parallel_processing_metrics()["last_run"]
+        assert last_run["mode"] == "parallel"
+        assert last_run["chunk_size"] == 50
+
+        monkeypatch.setenv("KUMIHAN_PARALLEL_THRESHOLD_LINES", "100000")
+        parser = Parser()
+        parser.parse(TEXT)
+        assert parser.get_parallel_processing_metrics()["last_run"]["mode"] == (
+            "sequential"
+        )
+
+    def test_large_input_sequential_by_default(self):
+        """スレッドでは速くならないため、既定では大きな入力も逐次解析する"""
+        text = "\n".join(f"行{i}" if i % 3 else "" for i in range(40000))
+        parser = Parser({"max_workers": 2})
+
+        parser.parse(text)
+
+        assert parser.parallel_metrics.mode == "sequential"
+
+    def test_auto_backend_parallel_only_with_processes(self):
+        """auto ではプロセスが選ばれる場合のみ並列解析する"""
+        parser = Parser({"max_workers": 2})
+        parser.parallel_config.backend = "auto"
+        parser.parallel_config.parallel_threshold_lines = 100
+
+        parser.parse(TEXT)
+        assert parser.parallel_metrics.mode == "sequential"
+
+        text = "\n".join(f"行{i}" if i % 3 else "" for i in range(40000))
+        parallel = parser.parse(text)
+        assert parser.parallel_metrics.mode == "parallel"
+        assert parser.parallel_metrics.backend == "process"
+        assert parallel == parser.parse(text, use_parallel=False)
+
+    def test_process_backend_opt_in(self, monkeypatch):
+        """KUMIHAN_PARALLEL_BACKEND=process ではワーカープロセスで解析しても同一結果"""
+        monkeypatch.setenv("KUMIHAN_PARALLEL_BACKEND", "process")
+        text = "\n".join(f"行{i}" if i % 3 else "" for i in range(40000))
+        parser = Parser({"max_workers": 2})
+
+        parallel = parser.parse(text)
+
+        assert parser.parallel_metrics.backend == "process"
+        assert parallel == parser.parse(text, use_parallel=False)
+
+    def test_legacy_core_parser(self):
+        parser = CoreParser({"max_workers": 2})
+        parser.parallel_config.parallel_threshold_lines = 100
+        parser.parallel_threshold_lines = 100
+
+        result = parser.parse(TEXT)
+
+        assert result.content == "Processed 500 lines"
+        assert parser.get_parallel_processing_metrics()["last_run"]["mode"] == (
+            "parallel"
+        )
+
+
+class TestIterParallelChunks:
+    """iter_parallel_chunks のタイムアウト・キャンセル・メモリ監視"""
+
+    LINES = TEXT.split("\n")
+
+    def test_chunk_timeout(self):
+        config = ParallelProcessingConfig()
+        config.chunk_timeout_seconds = 0.05
+
+        results, metrics = _run(self.LINES, _slow_first_chunk, config, max_workers=2)
+
+        assert isinstance(results[0][2], TimeoutError)
+        assert [r[1] for r in results[1:]] == [[1], [2], [3]]
+        assert metrics.timed_out_chunks == 1
+
+    def test_cancellation_stops_remaining_chunks(self):
+        seen = []
+
+        def record(chunk):
+            seen.append(chunk.chunk_id)
+            return [chunk.chunk_id]
+
+        config = ParallelProcessingConfig()
+        config.target_chunks_per_core = 5
+        metrics = ParallelParseMetrics()
+        stream = iter_parallel_chunks(
+            self.LINES,
+            record,
+            config,
+            metrics,
+            is_cancelled=lambda: bool(seen),
+            max_workers=1,
+        )
+
+        assert [r[1] for r in stream] == [[0]]
+        assert metrics.cancelled
+        assert metrics.total_chunks == 5
+
+    def test_memory_pressure_serializes_chunks(self):
+        admission = MemoryAdmissionController(limit_mb=100, probe=lambda pid: 500.0)
+        config = ParallelProcessingConfig()
+
+        metrics = ParallelParseMetrics()
+        stream = iter_parallel_chunks(
+            self.LINES,
+            _chunk_ids,
+            config,
+            metrics,
+            max_workers=2,
+            admission=admission,
+        )
+
+        # 予算超過中は先頭チャンクの完了を待ってから次を投入する
+        assert [r[1] for r in stream] == [[0], [1], [2], [3]]
+        assert metrics.memory_throttled > 0
+        assert metrics.peak_memory_mb >= 500.0
+
+    def test_processing_timeout(self):
+        config = ParallelProcessingConfig()
+        config.processing_timeout_seconds = 0
+
+        with pytest.raises(ParallelProcessingError):
+            _run(self.LINES, _chunk_ids, config, max_workers=2)
+
+    def test_processing_timeout_while_waiting_for_head_chunk(self):
+        """先頭チャンクの完了待ちでも全体の上限で打ち切る"""
+        config = ParallelProcessingConfig()
+        config.processing_timeout_seconds = 0.1
+
+        start = time.perf_counter()
+        with pytest.raises(ParallelProcessingError):
+            _run(self.LINES, _slow_first_chunk, config, max_workers=2)
+
+        assert time.perf_counter() - start < 0.5
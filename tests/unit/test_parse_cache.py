@@ -0,0 +1,128 @@
+"""
+解析結果キャッシュのテスト
+
+content_digest・ByteBudgetLRUCache と ProcessingManager のキャッシュ統合を
+検証します。
+"""
+
+from kumihan_formatter.core.caching.digest import content_digest
+from kumihan_formatter.core.caching.lru_cache import ByteBudgetLRUCache, estimate_size
+from kumihan_formatter.managers.processing_manager import ProcessingManager
+
+
+class TestContentDigest:
+    """ダイジェスト生成のテスト"""
+
+    def test_stable_and_distinct(self):
+        """同一入力は同一キー、構成要素の区切りも区別される"""
+        assert content_digest("abc", "p") == content_digest("abc", "p")
+        assert content_digest("abc", "p") != content_digest("abc", "q")
+        assert content_digest("ab", "c") != content_digest("a", "bc")
+        assert len(content_digest("x")) == 64
+
+
+class TestByteBudgetLRUCache:
+    """バイト予算付きLRUキャッシュのテスト"""
+
+    def test_hit_and_miss_counters(self):
+        """ヒット・ミスが計上される"""
+        cache = ByteBudgetLRUCache(1000, size_estimator=lambda v: 10)
+        cache.put("a", 1)
+
+        assert cache.lookup("a") == (True, 1)
+        assert cache.lookup("b") == (False, None)
+        stats = cache.get_statistics()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_evicts_least_recently_used_over_budget(self):
+        """予算超過時は最も古く使われたエントリから追い出す"""
+        cache = ByteBudgetLRUCache(30, size_estimator=lambda v: 10)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        cache.lookup("a")  # a を最新化
+        cache.put("d", 4)
+
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache and "d" in cache
+        assert cache.current_bytes == 30
+        assert cache.get_statistics()["evictions"] == 1
+
+    def test_oversized_value_not_stored(self):
+        """単体で予算を超える値は保存しない"""
+        cache = ByteBudgetLRUCache(5, size_estimator=lambda v: 10)
+
+        assert cache.put("a", 1) is False
+        assert len(cache) == 0
+
+    def test_trim_keeps_most_recent(self):
+        """trimは最新エントリを残す"""
+        cache = ByteBudgetLRUCache(1000, size_estimator=lambda v: 1)
+        for i in range(10):
+            cache.put(i, i)
+
+        assert cache.trim(3) == 7
+        assert [k for k in range(10) if k in cache] == [7, 8, 9]
+
+    def test_estimate_size_counts_nested(self):
+        """ネストしたコンテナの中身も推定に含める"""
+        flat = estimate_size({"elements": []})
+        nested = estimate_size({"elements": [{"content": "x" * 1000}]})
+
+        assert nested > flat + 1000
+
+
+class TestProcessingManagerParseCache:
+    """ProcessingManagerのキャッシュ統合テスト"""
+
+    def test_repeated_parse_hits_cache(self):
+        """同一内容・同一パーサーはキャッシュヒット"""
+        manager = ProcessingManager()
+        calls = []
+
+        def parser(text):
+            calls.append(text)
+            return {"elements": [text]}
+
+        first = manager.optimize_parsing("本文", parser)
+        second = manager.optimize_parsing("本文", parser)
+
+        assert first is second
+        assert len(calls) == 1
+        cache_stats = manager.get_optimization_statistics()["cache"]
+        assert cache_stats["hits"] == 1
+        assert cache_stats["misses"] == 1
+
+    def test_key_includes_parser(self):
+        """パーサーが異なれば別エントリ"""
+        manager = ProcessingManager()
+
+        def parser_a(text):
+            return {"elements": ["a"]}
+
+        def parser_b(text):
+            return {"elements": ["b"]}
+
+        assert manager.optimize_parsing("x", parser_a)["elements"] == ["a"]
+        assert manager.optimize_parsing("x", parser_b)["elements"] == ["b"]
+
+    def test_byte_budget_from_config(self):
+        """設定したバイト予算を超えるとエントリが追い出される"""
+        manager = ProcessingManager({"parse_cache_max_mb": 0.01})
+
+        for i in range(50):
+            manager.optimize_parsing(f"{i}" * 500, lambda t: {"elements": [t]})
+
+        stats = manager.get_optimization_statistics()
+        assert stats["cache"]["current_bytes"] <= stats["cache"]["max_bytes"]
+        assert stats["cache"]["evictions"] > 0
+
+    def test_clear_optimization_cache(self):
+        """キャッシュクリアでエントリが空になる"""
+        manager = ProcessingManager()
+        manager.optimize_parsing("x", lambda t: {"elements": [t]})
+
+        manager.clear_optimization_cache()
+
+        assert manager.get_optimization_statistics()["cache_size"] == 0
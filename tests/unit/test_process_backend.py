@@ -0,0 +1,185 @@
+"""
+プロセスプール並列処理バックエンドのテスト
+
+バックエンド選択と、スレッド / プロセスで同一結果になることを検証します。
+"""
+
+import multiprocessing
+import time
+
+import pytest
+
+from kumihan_formatter.core.processing import process_backend
+from kumihan_formatter.core.processing.process_backend import (
+    SharedChunkBuffer,
+    iter_ordered_results,
+    load_chunk,
+    select_backend,
+)
+from kumihan_formatter.core.processing.processor_core import ParallelChunkProcessor
+
+
+def _upper_lines(chunk):
+    """ワーカープロセスへ渡すためモジュールレベルで定義"""
+    for line in chunk.lines:
+        yield line.upper() if line else ""
+
+
+def _hang_first_chunk(chunk):
+    """先頭チャンクだけ応答しない処理"""
+    if chunk.chunk_id == 0:
+        time.sleep(60)
+    return [chunk.chunk_id]
+
+
+class TestSelectBackend:
+    """select_backend のテスト"""
+
+    @pytest.mark.parametrize(
+        "total_lines, chunk_count, workers, expected",
+        [
+            (100000, 10, 4, "process"),
+            (100000, 10, 1, "thread"),
+            (100000, 1, 4, "thread"),
+            (1000, 10, 4, "thread"),
+            (100000, 1000, 4, "thread"),
+        ],
+    )
+    def test_selects_by_size(self, total_lines, chunk_count, workers, expected):
+        assert (
+            select_backend(total_lines, chunk_count, workers, _upper_lines) == expected
+        )
+
+    def test_unpicklable_function_uses_threads(self):
+        assert select_backend(100000, 10, 4, lambda chunk: iter(())) == "thread"
+
+
+class TestSharedChunkBuffer:
+    """SharedChunkBuffer のテスト"""
+
+    def test_descriptors_restore_chunks(self):
+        """記述子から元の ChunkInfo を復元できる"""
+        processor = ParallelChunkProcessor()
+        chunks = processor.create_chunks_from_lines(["行1", "", "行3", ""], 3)
+
+        with SharedChunkBuffer(chunks) as buffer:
+            restored = [load_chunk(d) for d in buffer.descriptors]
+            process_backend._worker_sources.clear()
+
+        assert restored == chunks
+
+    def test_rejects_embedded_newlines(self):
+        chunks = ParallelChunkProcessor().create_chunks_from_lines(["a\nb"], 1)
+
+        with pytest.raises(ValueError):
+            SharedChunkBuffer(chunks)
+
+
+class TestProcessBackend:
+    """プロセスバックエンドの処理結果テスト"""
+
+    LINES = [f"行{i} abc" if i % 7 else "" for i in range(200)]
+
+    def test_optimized_results_match_threads(self):
+        """順序保証付き処理はバックエンドによらず同一"""
+        processor = ParallelChunkProcessor(max_workers=2)
+        chunks = processor.create_chunks_from_lines(self.LINES, 30)
+
+        threaded = list(
+            processor.process_chunks_parallel_optimized(
+                chunks, _upper_lines, backend="thread"
+            )
+        )
+        processed = list(
+            processor.process_chunks_parallel_optimized(
+                chunks, _upper_lines, backend="process"
+            )
+        )
+
+        assert processed == threaded
+        assert processed == [line.upper() for line in self.LINES if line]
+
+    def test_items_recorded_for_both_backends(self, caplog):
+        """処理件数の記録はバックエンドによらず同一"""
+        processor = ParallelChunkProcessor(max_workers=2)
+        chunks = processor.create_chunks_from_lines(self.LINES, 30)
+        expected = f"{sum(1 for line in self.LINES if line)} items"
+
+        for backend in ("thread", "process"):
+            caplog.clear()
+            with caplog.at_level("INFO"):
+                list(
+                    processor.process_chunks_parallel_optimized(
+                        chunks, _upper_lines, backend=backend
+                    )
+                )
+            assert expected in caplog.text
+
+    def test_unordered_results_match_threads(self):
+        processor = ParallelChunkProcessor(max_workers=2)
+        chunks = processor.create_chunks_from_lines(self.LINES, 30)
+
+        processed = processor.process_chunks_parallel(
+            chunks, _upper_lines, backend="process"
+        )
+
+        assert sorted(processed) == sorted(line.upper() for line in self.LINES)
+
+    def test_file_results_in_chunk_order(self, temp_dir):
+        """ファイル入力はマップ上の範囲をワーカーで読み出す"""
+        path = temp_dir / "input.txt"
+        path.write_bytes("\r\n".join(self.LINES).encode("utf-8"))
+        processor = ParallelChunkProcessor(max_workers=2, chunk_size=30)
+
+        processed = list(
+            processor.process_file_parallel(path, _upper_lines, backend="process")
+        )
+
+        assert processed == [line.upper() for line in self.LINES]
+        assert processed == list(
+            processor.process_file_parallel(path, _upper_lines, backend="thread")
+        )
+
+
+class TestOrderedTimeout:
+    """iter_ordered_results のタイムアウト"""
+
+    def _chunks(self):
+        processor = ParallelChunkProcessor()
+        return processor.create_chunks_from_lines([f"行{i}" for i in range(4)], 1)
+
+    def test_chunk_timeout_terminates_workers(self):
+        start = time.perf_counter()
+        stream = iter_ordered_results(
+            self._chunks(), _hang_first_chunk, 2, backend="process", timeout=2
+        )
+
+        results = list(stream)
+
+        assert isinstance(results[0][2], TimeoutError)
+        assert [r[1] for r in results[1:]] == [[1], [2], [3]]
+        assert time.perf_counter() - start < 30
+        # 応答しないワーカーも強制終了され、終了処理を妨げない
+        for _ in range(50):
+            if not multiprocessing.active_children():
+                break
+            time.sleep(0.1)
+        assert multiprocessing.active_children() == []
+
+    def test_deadline_bounds_head_wait(self):
+        start = time.perf_counter()
+        stream = iter_ordered_results(
+            self._chunks(),
+            _hang_first_chunk,
+            2,
+            backend="process",
+            timeout=30,
+            deadline=time.perf_counter() + 2,
+        )
+
+        chunk, results, error = next(stream)
+        stream.close()
+
+        assert chunk.chunk_id == 0
+        assert isinstance(error, TimeoutError)
+        assert time.perf_counter() - start < 30
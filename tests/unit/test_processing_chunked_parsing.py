@@ -0,0 +1,246 @@
+"""
+大容量チャンク解析のテスト
+
+Chunker.create_block_aligned_chunks と
+ProcessingManager._optimize_large_parsing の結合処理、
+FormatterCore.convert_file からのチャンク解析を検証します。
+"""
+
+import pickle
+from collections import Counter
+
+from kumihan_formatter import KumihanFormatter
+from kumihan_formatter.core.ast_nodes import Node
+from kumihan_formatter.core.parsing.core_marker_parser import CoreMarkerParser
+from kumihan_formatter.core.processing.chunking import Chunker
+from kumihan_formatter.managers.processing_manager import ProcessingManager
+from kumihan_formatter.parsers.main_parser import MainParser
+
+NUMBERED_TEXT = "\n".join(f"行{i}\n" for i in range(20))
+
+
+def _numbered(chunk: str):
+    """行番号付き要素を返すパーサー（ワーカープロセスへ渡すためモジュールレベル）"""
+    return {
+        "status": "success",
+        "elements": [
+            {"type": "paragraph", "content": line, "line_number": n}
+            for n, line in enumerate(chunk.split("\n"), 1)
+            if line
+        ],
+    }
+
+
+BLOCK_DOCUMENT = "# 重要 #情報##\n\n## 見出し\n\n#注意#\n複数行\nブロック\n##\n\n段落\n"
+
+
+class TestBlockAlignedChunks:
+    """ブロック境界を考慮したチャンク分割のテスト"""
+
+    def test_small_input_single_chunk(self):
+        """チャンクサイズ以下の入力は1チャンク"""
+        chunks = Chunker().create_block_aligned_chunks(["a", "b"], 10)
+
+        assert len(chunks) == 1
+        assert chunks[0].lines == ["a", "b"]
+        assert chunks[0].file_position == 0
+
+    def test_block_never_split(self):
+        """複数行ブロックはチャンク境界で分割されない"""
+        lines = (BLOCK_DOCUMENT * 50).split("\n")
+        chunks = Chunker().create_block_aligned_chunks(lines, 7)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            opened = 0
+            for line in chunk.lines:
+                if line == "#注意#":
+                    opened += 1
+                elif line == "##":
+                    opened -= 1
+            assert opened == 0
+
+    def test_chunks_cover_all_lines_in_order(self):
+        """全行が順序通りに含まれ、位置情報が連続する"""
+        lines = (BLOCK_DOCUMENT * 30).split("\n")
+        chunks = Chunker().create_block_aligned_chunks(lines, 10)
+
+        rebuilt = [line for chunk in chunks for line in chunk.lines]
+        assert rebuilt == lines
+        for i, chunk in enumerate(chunks):
+            assert chunk.chunk_id == i
+            assert chunk.start_line == chunk.file_position + 1
+            assert chunk.end_line == chunk.file_position + len(chunk.lines)
+
+
+class TestLargeParsingMerge:
+    """大容量解析の結合処理テスト"""
+
+    def test_all_chunks_merged(self):
+        """全チャンクの要素が結合される（先頭チャンクのみにならない）"""
+        manager = ProcessingManager({"large_parse_chunk_size": 20})
+        parser = MainParser()
+        text = BLOCK_DOCUMENT * 40
+
+        result = manager._optimize_large_parsing(text, lambda c: parser.parse(c))
+        full = parser.parse(text)
+
+        assert result["chunk_count"] > 1
+        assert result["total_elements"] == len(full["elements"])
+        assert Counter(map(str, result["elements"])) == Counter(
+            map(str, full["elements"])
+        )
+
+    def test_sequential_when_parallel_disabled(self):
+        """並列無効時も同じ結合結果"""
+        parser = MainParser()
+        text = BLOCK_DOCUMENT * 20
+        parallel = ProcessingManager({"large_parse_chunk_size": 20})
+        sequential = ProcessingManager(
+            {"large_parse_chunk_size": 20, "enable_parallel": False}
+        )
+
+        a = parallel._optimize_large_parsing(text, lambda c: parser.parse(c))
+        b = sequential._optimize_large_parsing(text, lambda c: parser.parse(c))
+
+        assert a["elements"] == b["elements"]
+
+    def test_line_numbers_offset(self):
+        """行番号を持つ要素はチャンク開始位置分ずらされる"""
+        manager = ProcessingManager({"large_parse_chunk_size": 5})
+        text = "\n".join(f"行{i}\n" for i in range(20))
+
+        def numbered(chunk: str):
+            return {
+                "status": "success",
+                "elements": [
+                    {"type": "paragraph", "content": line, "line_number": n}
+                    for n, line in enumerate(chunk.split("\n"), 1)
+                    if line
+                ],
+            }
+
+        result = manager._optimize_large_parsing(text, numbered)
+        lines = text.split("\n")
+
+        for element in result["elements"]:
+            assert lines[element["line_number"] - 1] == element["content"]
+
+    def test_unmergeable_results_fall_back(self):
+        """結合できない結果の場合は一括解析にフォールバック"""
+        manager = ProcessingManager({"large_parse_chunk_size": 5})
+        calls = []
+
+        def opaque(chunk: str):
+            calls.append(chunk)
+            return object()
+
+        text = "\n".join(f"行{i}\n" for i in range(20))
+        manager._optimize_large_parsing(text, opaque)
+
+        assert calls[-1] == text
+
+    def test_node_line_numbers_offset(self):
+        """Node 要素の行番号属性もずらされる"""
+        manager = ProcessingManager({"large_parse_chunk_size": 5})
+
+        def numbered_nodes(chunk: str):
+            elements = [
+                Node("paragraph", line, {"line_number": n})
+                for n, line in enumerate(chunk.split("\n"), 1)
+                if line
+            ]
+            return Node("document", chunk, {"elements": elements})
+
+        result = manager._optimize_large_parsing(NUMBERED_TEXT, numbered_nodes)
+        lines = NUMBERED_TEXT.split("\n")
+
+        elements = result.get_attribute("elements")
+        assert len(elements) == 20
+        for element in elements:
+            assert lines[element.get_attribute("line_number") - 1] == element.content
+
+    def test_process_backend_for_picklable_parser(self):
+        """parallel_backend="process" でもスレッドと同じ結合結果"""
+        threaded = ProcessingManager({"large_parse_chunk_size": 5, "max_workers": 2})
+        process = ProcessingManager(
+            {
+                "large_parse_chunk_size": 5,
+                "max_workers": 2,
+                "parallel_backend": "process",
+            }
+        )
+
+        expected = threaded._optimize_large_parsing(NUMBERED_TEXT, _numbered)
+
+        assert process._optimize_large_parsing(NUMBERED_TEXT, _numbered) == expected
+        assert expected["chunk_count"] > 1
+
+    def test_simple_parser_matches_full_parse_order(self):
+        """シンプル記法のチャンク結果は一括解析と同じ要素順に結合される"""
+        manager = ProcessingManager({"large_parse_chunk_size": 20})
+        parser = MainParser()
+        text = BLOCK_DOCUMENT * 40
+
+        result = manager._optimize_large_parsing(text, parser.bind("simple"))
+
+        assert result["chunk_count"] > 1
+        assert result["elements"] == parser.parse(text, "auto")["elements"]
+
+    def test_block_across_chunks_falls_back(self):
+        """チャンク境界をまたぐ装飾ブロックがあれば一括解析と同一結果"""
+        manager = ProcessingManager({"large_parse_chunk_size": 5})
+        parser = MainParser()
+        text = "\n".join(f"行{i}\n" for i in range(6)) + "テキスト #注意\n\n#本文##\n"
+
+        result = manager._optimize_large_parsing(text, parser.bind("simple"))
+
+        assert "chunk_count" not in result
+        assert result["elements"] == parser.parse(text, "auto")["elements"]
+
+    def test_bound_parser_on_process_backend(self):
+        """MainParser.bind() のパーサーは pickle でき、プロセスで解析される"""
+        parser = MainParser()
+        bound = parser.bind("simple")
+        manager = ProcessingManager(
+            {
+                "large_parse_chunk_size": 20,
+                "max_workers": 2,
+                "parallel_backend": "process",
+            }
+        )
+        text = BLOCK_DOCUMENT * 40
+
+        assert pickle.loads(pickle.dumps(bound))(text) == bound(text)
+        result = manager._optimize_large_parsing(text, bound)
+        assert result["elements"] == parser.parse(text, "auto")["elements"]
+
+
+class TestConvertFileChunkedParsing:
+    """convert（FormatterCore.convert_file）経由の大容量解析テスト"""
+
+    def test_one_parse_per_chunk(self, temp_dir, monkeypatch):
+        """パーサーは文書全体で1回選択し、各チャンクを1回ずつ解析する"""
+        calls = []
+        original = CoreMarkerParser.parse_simple_kumihan
+
+        def counting(self, text):
+            calls.append(text)
+            return original(self, text)
+
+        # MainParser は生成時にメソッドを登録するため、生成前に差し替える
+        monkeypatch.setattr(CoreMarkerParser, "parse_simple_kumihan", counting)
+        # 装飾ブロックは先頭付近のみ（後半のチャンク単独では別パーサーが選ばれる）
+        text = BLOCK_DOCUMENT * 100 + "".join(
+            f"## 見出し{i}\n\n段落{i}のテキスト。\n\n" for i in range(3000)
+        )
+        input_file = temp_dir / "large.txt"
+        input_file.write_text(text, encoding="utf-8")
+        chunks = Chunker().create_block_aligned_chunks(text.split("\n"), 1000)
+
+        with KumihanFormatter() as formatter:
+            result = formatter.convert(input_file, temp_dir / "large.html")
+
+        assert len(text) > 50000 and len(chunks) > 1
+        assert result["status"] == "success"
+        assert calls == ["\n".join(chunk.lines) for chunk in chunks]
@@ -0,0 +1,123 @@
+"""
+永続レンダリングキャッシュのテスト
+
+PersistentRenderCache と quick_convert / CLI のキャッシュ統合を検証します。
+"""
+
+import os
+import sys
+
+import pytest
+
+from kumihan_formatter.core.caching.disk_cache import PersistentRenderCache
+from kumihan_formatter.core.rendering.main_renderer import MainRenderer
+from kumihan_formatter.core.utilities import api_utils
+from kumihan_formatter.core.utilities.api_utils import quick_convert
+
+SCENARIO = "# 重要 #重要な情報です##\n\n## 見出し\n\n段落のテキストです。\n"
+
+
+class TestPersistentRenderCache:
+    """ディスクキャッシュ単体のテスト"""
+
+    def test_key_depends_on_all_inputs(self, temp_dir):
+        """内容・テンプレート・設定のいずれかが違えば別キー"""
+        cache = PersistentRenderCache(temp_dir)
+        base = cache.make_key("本文", "default", {"a": 1})
+
+        assert base == cache.make_key("本文", "default", {"a": 1})
+        assert base != cache.make_key("本文2", "default", {"a": 1})
+        assert base != cache.make_key("本文", "minimal", {"a": 1})
+        assert base != cache.make_key("本文", "default", {"a": 2})
+
+    def test_store_and_copy(self, temp_dir):
+        """保存したHTMLとメタデータを出力先へ復元できる"""
+        cache = PersistentRenderCache(temp_dir / "cache")
+        source = temp_dir / "out.html"
+        source.write_text("<p>x</p>", encoding="utf-8")
+        key = cache.make_key("x", "default")
+
+        assert cache.copy_to(key, temp_dir / "restored.html") is None
+        assert cache.store(key, source, {"elements_count": 3})
+        meta = cache.copy_to(key, temp_dir / "restored.html")
+
+        assert meta == {"elements_count": 3}
+        assert (temp_dir / "restored.html").read_text(encoding="utf-8") == "<p>x</p>"
+        assert cache.get_statistics()["hits"] == 1
+
+    def test_size_limit_evicts_oldest(self, temp_dir):
+        """合計サイズ上限を超えると古いエントリから削除"""
+        cache = PersistentRenderCache(temp_dir / "cache", max_bytes=250)
+        source = temp_dir / "out.html"
+        source.write_text("x" * 100, encoding="utf-8")
+
+        keys = [cache.make_key(str(i), "default") for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.store(key, source)
+            # mtime解像度に依存しないよう使用時刻を明示
+            html_path, _meta_path = cache._entry_paths(key)
+            os.utime(html_path, (1000 + i, 1000 + i))
+        cache.enforce_size_limit()
+
+        assert cache.lookup(keys[0]) is None
+        assert cache.lookup(keys[2]) is not None
+
+
+class TestQuickConvertCache:
+    """quick_convert / CLI のキャッシュ統合テスト"""
+
+    def test_second_run_skips_render(self, temp_dir, monkeypatch):
+        """2回目の変換はレンダリングせず同一出力"""
+        input_file = temp_dir / "scenario.txt"
+        input_file.write_text(SCENARIO, encoding="utf-8")
+        output_file = temp_dir / "scenario.html"
+        cache_dir = temp_dir / "cache"
+
+        first = quick_convert(input_file, output_file, cache_dir=cache_dir)
+        expected = output_file.read_text(encoding="utf-8")
+        output_file.unlink()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("render should not run on cache hit")
+
+        monkeypatch.setattr(MainRenderer, "render_to_stream", fail)
+        second = quick_convert(input_file, output_file, cache_dir=cache_dir)
+
+        assert first["cache_hit"] is False
+        assert second["cache_hit"] is True
+        assert second["elements_count"] == first["elements_count"]
+        assert output_file.read_text(encoding="utf-8") == expected
+
+    def test_without_cache_dir_result_unchanged(self, temp_dir):
+        """キャッシュ未指定時は結果にcache_hitを含めない"""
+        input_file = temp_dir / "scenario.txt"
+        input_file.write_text(SCENARIO, encoding="utf-8")
+
+        result = quick_convert(input_file, temp_dir / "scenario.html")
+
+        assert result["status"] == "success"
+        assert "cache_hit" not in result
+
+    @pytest.mark.parametrize(
+        "extra_args, expect_cache", [([], True), (["--no-cache"], False)]
+    )
+    def test_cli_cache_flags(self, temp_dir, monkeypatch, extra_args, expect_cache):
+        """--cache-dir / --no-cache がquick_convertへ渡される"""
+        calls = []
+
+        def fake_quick_convert(input_file, output_file, template, cache_dir):
+            calls.append(cache_dir)
+            return {"status": "success", "output_file": "out.html"}
+
+        monkeypatch.setattr(api_utils, "quick_convert", fake_quick_convert)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["kumihan", "in.txt", "--cache-dir", str(temp_dir), *extra_args],
+        )
+
+        with pytest.raises(SystemExit) as exc:
+            api_utils.main()
+
+        assert exc.value.code == 0
+        assert calls == [str(temp_dir) if expect_cache else None]
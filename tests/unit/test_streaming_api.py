@@ -0,0 +1,98 @@
+"""
+ストリーミングAPIのテスト
+
+MainParser.parse_iter / MainRenderer.render_iter と
+KumihanFormatter.convert_streaming を検証します。
+"""
+
+import io
+import itertools
+
+from kumihan_formatter import KumihanFormatter
+from kumihan_formatter.core.processing.chunking import Chunker
+from kumihan_formatter.core.rendering.main_renderer import MainRenderer
+from kumihan_formatter.parsers.main_parser import MainParser
+
+BLOCK = "# 重要 #重要な情報{n}##\n\n## 見出し{n}\n\n#注意#\n複数行\n\nブロック\n##\n\n- 項目{n}\n"
+
+
+class TestParseIter:
+    """parse_iter のテスト"""
+
+    def test_single_block_matches_parse(self):
+        """1ブロックの文書は一括解析と同じ要素"""
+        text = "# 重要 #情報##\n## 見出し\n段落 **太字**\n- 項目"
+        elements = list(MainParser().parse_iter(io.StringIO(text)))
+
+        assert elements == MainParser().parse(text, "auto")["elements"]
+
+    def test_elements_in_document_order_per_block(self):
+        """ブロックごとに解析し、ブロック間は文書順に並ぶ"""
+        text = "\n".join(BLOCK.format(n=n) for n in range(3))
+        parser = MainParser()
+        expected = [
+            element
+            for segment in Chunker().create_top_level_segments(text.split("\n"))
+            for element in parser.marker_parser.parse_simple_kumihan(
+                "\n".join(segment.lines)
+            )["elements"]
+        ]
+
+        assert list(parser.parse_iter(io.StringIO(text))) == expected
+        assert list(parser.parse_iter(text)) == expected
+
+    def test_lazy_consumption(self):
+        """先頭ブロックの要素は入力を読み切る前に返される"""
+        consumed = []
+
+        def lines():
+            for n in itertools.count():
+                consumed.append(n)
+                yield f"段落{n}\n"
+                yield "\n"
+
+        first = next(MainParser().parse_iter(lines()))
+
+        assert first["content"] == "段落0"
+        assert len(consumed) <= 2
+
+
+class TestRenderIter:
+    """render_iter のテスト"""
+
+    def test_joined_fragments_match_render(self):
+        """断片の連結は辞書結果の render() と同一"""
+        parsed = MainParser().parse("\n".join(BLOCK.format(n=n) for n in range(3)))
+        renderer = MainRenderer()
+
+        fragments = list(renderer.render_iter(iter(parsed["elements"])))
+
+        assert len(fragments) == len(parsed["elements"]) + 2
+        assert "".join(fragments) == renderer.render(parsed)
+
+
+class TestConvertStreaming:
+    """convert_streaming のテスト"""
+
+    def test_writes_streamed_document(self, temp_dir):
+        """ブロック単位の解析結果を完全HTML文書として書き出す"""
+        input_file = temp_dir / "large.txt"
+        text = "\n".join(BLOCK.format(n=n) for n in range(50))
+        input_file.write_text(text, encoding="utf-8")
+        output_file = temp_dir / "large.html"
+
+        with KumihanFormatter() as formatter:
+            result = formatter.convert_streaming(input_file, output_file)
+
+        expected_elements = list(MainParser().parse_iter(text))
+        assert result["status"] == "success"
+        assert result["elements_count"] == len(expected_elements)
+        assert output_file.read_text(encoding="utf-8") == "".join(
+            MainRenderer().render_iter(expected_elements)
+        )
+
+    def test_missing_input(self, temp_dir):
+        with KumihanFormatter() as formatter:
+            result = formatter.convert_streaming(temp_dir / "missing.txt")
+
+        assert result["status"] == "error"
@@ -0,0 +1,205 @@
+"""
+テンプレートエンジンのテスト
+
+.j2 テンプレートのコンパイル結果（条件分岐・include・自動エスケープ）、
+ディスクキャッシュの再利用と mtime による無効化、本文前後の分割、
+MainRenderer での context["template"] の反映を検証します。
+"""
+
+import os
+
+import pytest
+
+from kumihan_formatter.core.rendering.main_renderer import MainRenderer
+from kumihan_formatter.core.templates.template_engine import (
+    TemplateEngine,
+    TemplateSyntaxError,
+    get_template_engine,
+)
+
+PAGE = """<title>{{ title }}</title>
+{# コメント #}{% if has_toc %}<nav>{{ toc_html | safe }}</nav>{% else %}<p>no toc</p>{% endif %}
+{% include "partials/style.css" %}
+<main>{{ body_content | safe }}</main>
+<pre>{{ source_filename or "sample.txt" }}</pre>
+"""
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    directory = tmp_path / "templates"
+    (directory / "partials").mkdir(parents=True)
+    (directory / "page.html.j2").write_text(PAGE, encoding="utf-8")
+    (directory / "partials" / "style.css").write_text(
+        "{% if css_vars.theme == 'dark' %}body{color:#fff}{% endif %}\n",
+        encoding="utf-8",
+    )
+    return directory
+
+
+def _engine(template_dir, tmp_path):
+    return TemplateEngine(template_dir, cache_dir=tmp_path / "cache")
+
+
+def test_render(template_dir, tmp_path):
+    engine = _engine(template_dir, tmp_path)
+
+    html = engine.render(
+        "page.html.j2",
+        {
+            "title": "<見出し>",
+            "has_toc": True,
+            "toc_html": "<ul></ul>",
+            "css_vars": {"theme": "dark"},
+            "body_content": "<p>本文</p>",
+        },
+    )
+
+    assert html == (
+        "<title>&lt;見出し&gt;</title>\n"
+        "<nav><ul></ul></nav>\n"
+        "body{color:#fff}\n"
+        "<main><p>本文</p></main>\n"
+        "<pre>sample.txt</pre>"
+    )
+    assert "<p>no toc</p>" in engine.render("page.html.j2", {})
+
+
+def test_resolve(template_dir, tmp_path):
+    engine = _engine(template_dir, tmp_path)
+
+    assert engine.resolve("page") == "page.html.j2"
+    assert engine.resolve("page.html") == "page.html.j2"
+    assert engine.resolve("page.html.j2") == "page.html.j2"
+    assert engine.resolve("default") is None
+    assert engine.resolve("missing") is None
+    assert engine.resolve("../templates/page.html.j2") is None
+
+
+def test_compiled_once_per_process(template_dir, tmp_path):
+    engine = _engine(template_dir, tmp_path)
+
+    first = engine.get_template("page.html.j2")
+    assert engine.get_template("page.html.j2") is first
+    assert engine.compiled == 1
+
+
+def test_disk_cache_reused_and_invalidated(template_dir, tmp_path):
+    _engine(template_dir, tmp_path).get_template("page.html.j2")
+
+    engine = _engine(template_dir, tmp_path)
+    engine.get_template("page.html.j2")
+    assert (engine.compiled, engine.disk_hits) == (0, 1)
+
+    # include 先の更新でも再コンパイルされる
+    partial = template_dir / "partials" / "style.css"
+    partial.write_text("body{margin:0}\n", encoding="utf-8")
+    stat = partial.stat()
+    os.utime(partial, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert "body{margin:0}" in engine.render("page.html.j2", {})
+    assert engine.compiled == 1
+    assert "body{margin:0}" in _engine(template_dir, tmp_path).render(
+        "page.html.j2", {}
+    )
+
+
+def test_disk_cache_opt_in(template_dir, tmp_path, monkeypatch):
+    monkeypatch.delenv("KUMIHAN_TEMPLATE_CACHE_DIR", raising=False)
+    assert TemplateEngine(template_dir).cache_dir is None
+
+    monkeypatch.setenv("KUMIHAN_TEMPLATE_CACHE_DIR", str(tmp_path / "env"))
+    assert TemplateEngine(template_dir).cache_dir == tmp_path / "env"
+    assert TemplateEngine(template_dir, cache_dir=False).cache_dir is None
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX の権限ビットが必要")
+def test_disk_cache_rejects_writable_by_others(template_dir, tmp_path):
+    engine = _engine(template_dir, tmp_path)
+    engine.get_template("page.html.j2")
+    cache_dir = tmp_path / "cache"
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+    (cache_file,) = cache_dir.glob("*.kfc")
+
+    cache_file.chmod(0o666)
+    engine = _engine(template_dir, tmp_path)
+    engine.get_template("page.html.j2")
+    assert (engine.compiled, engine.disk_hits) == (1, 0)
+
+    cache_file.chmod(0o600)
+    cache_dir.chmod(0o777)
+    engine = _engine(template_dir, tmp_path)
+    engine.get_template("page.html.j2")
+    assert (engine.compiled, engine.disk_hits) == (1, 0)
+
+
+def test_split_matches_full_render(template_dir, tmp_path):
+    engine = _engine(template_dir, tmp_path)
+    template = engine.get_template("page.html.j2")
+    context = {"title": "T", "has_toc": False}
+
+    split = template.split(context)
+
+    assert split is not None
+    assert split.join("<p>x</p>") == template.render(
+        {**context, "body_content": "<p>x</p>"}
+    )
+    assert template.split({**context, "body_content": "other"}) is split
+
+
+def test_split_without_body(template_dir, tmp_path):
+    (template_dir / "static.j2").write_text("<p>{{ title }}</p>", encoding="utf-8")
+
+    engine = _engine(template_dir, tmp_path)
+
+    assert engine.get_template("static.j2").split({}) is None
+
+
+def test_syntax_error(template_dir, tmp_path):
+    (template_dir / "broken.j2").write_text("{% for x in y %}{% endfor %}")
+
+    with pytest.raises(TemplateSyntaxError):
+        _engine(template_dir, tmp_path).get_template("broken.j2")
+
+
+@pytest.mark.parametrize("name", ["base", "docs", "base-with-source-toggle"])
+def test_bundled_templates(name):
+    engine = get_template_engine()
+    template = engine.get_template(engine.resolve(name))
+
+    html = template.render(
+        {"title": "文書", "css_vars": {}, "body_content": "<p>本文</p>"}
+    )
+
+    assert html.startswith("<!DOCTYPE html>")
+    assert "<title>文書" in html
+    assert "<p>本文</p>" in html
+
+
+class TestMainRendererTemplate:
+    def test_template_from_context(self):
+        renderer = MainRenderer()
+        parsed = {"elements": [{"type": "paragraph", "content": "本文"}]}
+
+        html = renderer.render(parsed, {"template": "docs", "title": "T"})
+
+        expected = get_template_engine().render(
+            "docs.html.j2",
+            {"title": "T", "css_vars": {}, "body_content": "<p>本文</p>"},
+        )
+        assert html == expected
+        assert (
+            renderer.assemble_kumihan_document(
+                ["<p>本文</p>"], {"template": "docs", "title": "T"}
+            )
+            == expected
+        )
+
+    def test_default_template_unchanged(self):
+        renderer = MainRenderer()
+        parsed = {"elements": [{"type": "paragraph", "content": "本文"}]}
+
+        html = renderer.render(parsed, {"template": "default"})
+
+        assert html == renderer.render(parsed, {})
+        assert html.endswith("<p>本文</p>\n</body>\n</html>")
@@ -0,0 +1,113 @@
+"""
+AST走査ユーティリティのテスト
+
+明示的なスタックによる前順・後順・タイプ指定の走査と、
+それを使う Node.walk / get_text_content / contains_text などが
+再帰上限を超える深さの文書でも動作することを検証します。
+"""
+
+import sys
+from types import SimpleNamespace
+
+from kumihan_formatter.core.ast_nodes import Node, NodeArena
+from kumihan_formatter.core.ast_nodes.traversal import (
+    walk_by_type,
+    walk_postorder,
+    walk_preorder,
+)
+from kumihan_formatter.core.ast_nodes.utilities import find_all_headings
+from kumihan_formatter.managers.processing_manager import ProcessingManager
+
+DEPTH = sys.getrecursionlimit() * 3
+
+
+def _tree():
+    return Node(
+        "div",
+        [
+            Node("h1", "見出し"),
+            "テキスト",
+            Node("p", [Node("strong", "太字"), Node("em", "斜体")]),
+        ],
+    )
+
+
+def _deep(depth=DEPTH):
+    root = node = Node("div", [])
+    for _ in range(depth):
+        child = Node("div", [])
+        node.content.append(child)
+        node = child
+    node.content.extend(["末端", Node("h2", "深い見出し")])
+    return root
+
+
+def test_preorder_and_postorder():
+    tree = _tree()
+
+    assert [n.type for n in walk_preorder(tree)] == ["div", "h1", "p", "strong", "em"]
+    assert [n.type for n in walk_postorder(tree)] == ["h1", "strong", "em", "p", "div"]
+    assert [n.type for n in walk_preorder([tree, Node("hr", "")])][-1] == "hr"
+    assert [n.type for n in tree.walk()] == [n.type for n in walk_preorder(tree)]
+
+
+def test_walk_by_type():
+    tree = _tree()
+
+    found = list(walk_by_type(tree, {"strong", "h1"}))
+
+    assert [n.content for n in found] == ["見出し", "太字"]
+
+
+def test_custom_children():
+    arena = NodeArena("見出し本文")
+    box = arena.add("div")
+    arena.add("h2", 0, 3, parent=box)
+    arena.add("text", 3, 5, parent=box)
+
+    types = [v.type for v in walk_postorder(arena.roots(), lambda v: v.children)]
+
+    assert types == ["h2", "text", "div"]
+
+
+def test_text_content_matches_nested_join():
+    node = Node("p", ["a", Node("span", []), Node("em", ["b", Node("x", "c")]), "d"])
+
+    assert node.get_text_content() == "a  b c d"
+    assert Node("p", [Node("span", ["  "])]).contains_text() is False
+    assert Node("p", [Node("span", [Node("em", "x")])]).contains_text() is True
+
+
+def test_deep_document_does_not_recurse():
+    root = _deep()
+
+    assert sum(1 for _ in root.walk()) == DEPTH + 2
+    assert root.get_text_content().strip() == "末端 深い見出し"
+    assert root.contains_text()
+    assert [n.content for n in find_all_headings([root])] == ["深い見出し"]
+
+
+def test_validate_node_checks_direct_children_only():
+    root = node = Node("div", "本文")
+    for _ in range(DEPTH):
+        child = Node("div", "子")
+        node.children.append(child)
+        node = child
+
+    result = ProcessingManager({}).validate_node(root)
+
+    # Node は tag を持たないため子ノード1件の警告になる
+    assert "子ノード0に問題があります" in result["warnings"]
+    assert "バリデーション処理エラー" not in " ".join(result["errors"])
+
+
+def test_validate_node_flags_child_with_unsliceable_content():
+    """子の content 参照で例外になる場合も従来どおり問題とする"""
+    valid_child = SimpleNamespace(tag="div", content="子", children=[])
+    broken_child = SimpleNamespace(tag="div", content=None, children=[])
+    root = Node("div", "本文", children=[valid_child, broken_child])
+
+    result = ProcessingManager({}).validate_node(root)
+
+    assert "子ノード0に問題があります" not in result["warnings"]
+    assert "子ノード1に問題があります" in result["warnings"]
@@ -0,0 +1,165 @@
+"""
+監視イベントスケジューラーのテスト
+
+DebouncedScheduler のデバウンス・集約・陳腐化判定と、ConvertWatcher の
+スケジューラー経由の変換を検証します。
+"""
+
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from kumihan_formatter.commands.convert_watcher import ConvertWatcher
+from kumihan_formatter.commands.watch_scheduler import DebouncedScheduler
+
+SCENARIO = "# 重要 #情報##\n\n段落{n}\n"
+
+
+class TestDebouncedScheduler:
+    """デバウンス・集約のテスト"""
+
+    def test_burst_coalesced_into_single_run(self):
+        """連続イベントは1回の処理にまとめられる"""
+        calls = []
+        scheduler = DebouncedScheduler(
+            lambda path, is_obsolete: calls.append(path), debounce_seconds=0.05
+        )
+        scheduler.start()
+        try:
+            for _ in range(5):
+                scheduler.schedule(Path("a.txt"))
+            scheduler.schedule(Path("b.txt"))
+            assert scheduler.wait_idle()
+        finally:
+            scheduler.stop()
+
+        assert sorted(calls) == [Path("a.txt"), Path("b.txt")]
+        stats = scheduler.get_statistics()
+        assert stats["events"] == 6
+        assert stats["coalesced"] == 4
+
+    def test_newer_event_marks_running_conversion_obsolete(self):
+        """実行中に新しいイベントが届くと実行中の変換は陳腐化する"""
+        started = threading.Event()
+        release = threading.Event()
+        results = []
+
+        def callback(path, is_obsolete):
+            if not started.is_set():
+                started.set()
+                release.wait(2)
+            results.append(is_obsolete())
+
+        scheduler = DebouncedScheduler(callback, debounce_seconds=0.01)
+        scheduler.start()
+        try:
+            scheduler.schedule(Path("a.txt"))
+            assert started.wait(2)
+            scheduler.schedule(Path("a.txt"))
+            release.set()
+            assert scheduler.wait_idle()
+        finally:
+            scheduler.stop()
+
+        assert results == [True, False]
+        assert scheduler.get_statistics()["obsolete"] == 1
+
+    def test_errors_routed_to_handler(self):
+        """変換処理の例外はエラーハンドラーへ渡される"""
+        errors = []
+
+        def callback(path, is_obsolete):
+            raise ValueError("boom")
+
+        scheduler = DebouncedScheduler(
+            callback, debounce_seconds=0.01, error_handler=errors.append
+        )
+        scheduler.start()
+        try:
+            scheduler.schedule(Path("a.txt"))
+            assert scheduler.wait_idle()
+        finally:
+            scheduler.stop()
+
+        assert [str(e) for e in errors] == ["boom"]
+
+
+class TestConvertWatcherScheduling:
+    """ConvertWatcher のスケジューラー経由変換のテスト"""
+
+    def test_directory_tree_outputs_mirror_structure(self, temp_dir):
+        """ディレクトリ監視では相対構造を保って出力する"""
+        source = temp_dir / "src"
+        (source / "sub").mkdir(parents=True)
+        nested = source / "sub" / "scene.txt"
+        nested.write_text(SCENARIO.format(n=1), encoding="utf-8")
+
+        watcher = ConvertWatcher(Mock(), Mock(), debounce_seconds=0.01)
+        config = {
+            "input_file": source,
+            "output": str(temp_dir / "out"),
+            "template_name": None,
+            "include_source": False,
+            "show_test_cases": False,
+        }
+        scheduler = watcher.create_scheduler(config)
+        scheduler.start()
+        try:
+            scheduler.schedule(nested)
+            assert scheduler.wait_idle()
+        finally:
+            scheduler.stop()
+
+        assert (temp_dir / "out" / "sub" / "scene.html").exists()
+
+    def test_obsolete_conversion_skips_write(self, temp_dir):
+        """陳腐化した変換は出力を書き込まない"""
+        input_file = temp_dir / "scene.txt"
+        input_file.write_text(SCENARIO.format(n=1), encoding="utf-8")
+        watcher = ConvertWatcher(Mock(), Mock())
+
+        result = watcher.convert_changed_file(
+            input_file, str(temp_dir), None, is_obsolete=lambda: True
+        )
+
+        assert result is None
+        assert not (temp_dir / "scene.html").exists()
+
+    def test_non_incremental_uses_processor(self):
+        """差分更新を使わない設定では従来のprocessorで変換する"""
+        processor = Mock()
+        watcher = ConvertWatcher(processor, Mock(), incremental=False)
+
+        watcher.process_change(Path("a.txt"), lambda: False, {})
+
+        processor.process_file_change.assert_called_once_with()
+
+    def test_directory_watch_rejects_non_incremental(self, temp_dir):
+        """ディレクトリ監視では設定済み入力の再変換にフォールバックしない"""
+        processor = Mock()
+        watcher = ConvertWatcher(processor, Mock(), incremental=False)
+
+        with pytest.raises(ValueError):
+            watcher.process_change(
+                temp_dir / "a.txt", lambda: False, {"input_file": temp_dir}
+            )
+
+        processor.process_file_change.assert_not_called()
+
+    def test_directory_watch_applies_skip_filter(self, temp_dir):
+        """ディレクトリ監視でも processor の除外判定を適用する"""
+        processor = Mock()
+        processor.should_skip_event.return_value = False
+        watcher = ConvertWatcher(processor, Mock())
+        config = {"input_file": temp_dir}
+
+        def event(name):
+            return Mock(is_directory=False, src_path=str(temp_dir / name))
+
+        assert watcher._is_watch_target(event("a.txt"), config)
+        assert not watcher._is_watch_target(event("a.html"), config)
+
+        processor.should_skip_event.return_value = True
+        assert not watcher._is_watch_target(event("a.txt"), config)